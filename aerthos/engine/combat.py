@@ -9,6 +9,21 @@ from ..entities.character import Character
 from ..entities.player import Weapon
 from ..constants import D20_MAX, CRITICAL_HIT, CRITICAL_MISS, INITIATIVE_DIE
 from ..systems.monster_ai import MonsterTargetingAI
+from .combat_events import (
+    ATTACK, HIT, CRITICAL, FUMBLE, KILLED, CombatEvent, CombatEventStream, LazyResult, render_event
+)
+
+
+def _attack_result(event: CombatEvent, critical: Optional[str]) -> Dict:
+    """attack_roll() result dict; the narrative is rendered from the event on first read"""
+    return LazyResult({'narrative': lambda result: render_event(result['event'])}, {
+        'hit': bool(event.flags & HIT),
+        'roll': event.roll,
+        'damage': event.damage,
+        'defender_died': bool(event.flags & KILLED),
+        'critical': critical,
+        'event': event
+    })
 
 
 class DiceRoller:
@@ -86,14 +101,65 @@ class DiceRoller:
         return random.randint(1, 100)
 
 
+class CombatSide:
+    """
+    One side of a combat round
+
+    Keeps the targetable combatants in a list with an id -> position index,
+    so a death is an O(1) swap-remove and elimination is a counter check
+    instead of a rescan of the whole side.
+
+    A side is eliminated when all its members are dead. Incapacitated
+    members (require_active=True) cannot be targeted but still count as
+    standing.
+    """
+
+    __slots__ = ('targets', '_positions', 'standing')
+
+    def __init__(self, members: List[Character], require_active: bool = False):
+        """
+        Build the side
+
+        Args:
+            members: All combatants on this side
+            require_active: Exclude incapacitated members from the targets
+        """
+        living = [member for member in members if member.is_alive]
+        if require_active:
+            self.targets = [member for member in living if not member.is_incapacitated()]
+        else:
+            self.targets = living
+        self._positions = {id(member): index for index, member in enumerate(self.targets)}
+        self.standing = len(living)
+
+    @property
+    def eliminated(self) -> bool:
+        """True once every member is dead"""
+        return self.standing <= 0
+
+    def remove(self, member: Character) -> None:
+        """Drop a member that has died"""
+        index = self._positions.pop(id(member), None)
+        if index is None:
+            return
+
+        last = self.targets.pop()
+        if last is not member:
+            self.targets[index] = last
+            self._positions[id(last)] = index
+        self.standing -= 1
+
+
 class CombatResolver:
     """Handles combat resolution using THAC0 system"""
 
     def __init__(self):
         self.dice_roller = DiceRoller()
+        self.targeting_ai = MonsterTargetingAI()  # Shared by every monster attack
 
     def attack_roll(self, attacker: Character, defender: Character,
-                    weapon: Optional[Weapon] = None) -> Dict:
+                    weapon: Optional[Weapon] = None,
+                    events: Optional[CombatEventStream] = None) -> Dict:
         """
         Resolve a single attack using THAC0
 
@@ -103,42 +169,30 @@ class CombatResolver:
             attacker: The attacking character
             defender: The defending character
             weapon: Optional weapon being used (None = unarmed/default)
+            events: Optional stream to record the attack event in
 
         Returns:
-            Dict with: hit, roll, damage, narrative, defender_died
+            Dict with: hit, roll, damage, narrative, defender_died, critical, event
+            (narrative is rendered from the event only when read)
         """
 
         # Roll d20
         roll = self.dice_roller.roll_d20()
+        event = CombatEvent(ATTACK, attacker.name, defender.name, roll=roll)
+        if events is not None:
+            events.emit(event)
 
         # Critical miss
         if roll == CRITICAL_MISS:
-            return {
-                'hit': False,
-                'roll': 1,
-                'damage': 0,
-                'narrative': f"{attacker.name} fumbles the attack!",
-                'defender_died': False,
-                'critical': 'miss'
-            }
+            event.flags = FUMBLE
+            return _attack_result(event, 'miss')
 
         # Critical hit
         if roll == CRITICAL_HIT:
-            damage = self._calculate_damage(attacker, defender, weapon, critical=True)
-            died = defender.take_damage(damage)
-
-            narrative = f"{attacker.name} scores a CRITICAL HIT on {defender.name} for {damage} damage!"
-            if died:
-                narrative += f" {defender.name} falls dead!"
-
-            return {
-                'hit': True,
-                'roll': 20,
-                'damage': damage,
-                'narrative': narrative,
-                'defender_died': died,
-                'critical': 'hit'
-            }
+            event.damage = self._calculate_damage(attacker, defender, weapon, critical=True)
+            died = defender.take_damage(event.damage)
+            event.flags = HIT | CRITICAL | (KILLED if died else 0)
+            return _attack_result(event, 'hit')
 
         # Normal THAC0 calculation
         # Target number = THAC0 - defender's AC
@@ -153,12 +207,10 @@ class CombatResolver:
             to_hit_bonus += weapon.magic_bonus
 
         # Check weapon proficiency and apply non-proficiency penalty
-        if hasattr(attacker, 'weapon_proficiencies') and weapon:
-            from ..systems.weapon_proficiency import WeaponProficiencySystem
-            prof_system = WeaponProficiencySystem()
-
-            if not prof_system.is_proficient(attacker.weapon_proficiencies, weapon.name):
-                penalty = prof_system.get_non_proficiency_penalty(attacker.char_class)
+        if hasattr(attacker, 'is_proficient_with') and weapon:
+            if not attacker.is_proficient_with(weapon.name):
+                from ..systems.weapon_proficiency import get_weapon_proficiency_system
+                penalty = get_weapon_proficiency_system().get_non_proficiency_penalty(attacker.char_class)
                 to_hit_bonus += penalty  # Add penalty (it's negative)
 
         # Handle special weapon to-hit bonuses
@@ -177,33 +229,15 @@ class CombatResolver:
 
         adjusted_roll = roll + to_hit_bonus
 
-        hit = adjusted_roll >= target_number
-
-        if hit:
-            damage = self._calculate_damage(attacker, defender, weapon)
-            died = defender.take_damage(damage)
+        event.target_number = target_number
+        event.modifier = to_hit_bonus
 
-            narrative = f"{attacker.name} hits {defender.name} for {damage} damage!"
-            if died:
-                narrative += f" {defender.name} is slain!"
+        if adjusted_roll >= target_number:
+            event.damage = self._calculate_damage(attacker, defender, weapon)
+            died = defender.take_damage(event.damage)
+            event.flags = HIT | (KILLED if died else 0)
 
-            return {
-                'hit': True,
-                'roll': roll,
-                'damage': damage,
-                'narrative': narrative,
-                'defender_died': died,
-                'critical': None
-            }
-        else:
-            return {
-                'hit': False,
-                'roll': roll,
-                'damage': 0,
-                'narrative': f"{attacker.name} misses {defender.name}.",
-                'defender_died': False,
-                'critical': None
-            }
+        return _attack_result(event, None)
 
     def _calculate_damage(self, attacker: Character, defender: Character,
                          weapon: Optional[Weapon] = None,
@@ -285,74 +319,73 @@ class CombatResolver:
 
     def resolve_combat_round(self, party: List[Character],
                             monsters: List[Character],
-                            party_obj=None) -> Dict:
+                            party_obj=None,
+                            events: Optional[CombatEventStream] = None) -> Dict:
         """
         Resolve a full combat round with individual initiative
 
-        Args:
-            party: List of party member Characters
-            monsters: List of Monster Characters
-            party_obj: Optional Party object for formation-aware targeting
-
         In AD&D 1e, initiative can be:
         - Side-based (d6 per side)
         - Individual (d6 + weapon speed factor + dexterity modifier)
         This implementation uses individual initiative for more tactical depth
 
+        Each side's living combatants are tracked incrementally (CombatSide),
+        so a round costs one pass over the combatants however many there are.
+
         Args:
             party: List of party members (PCs)
             monsters: List of monsters
+            party_obj: Optional Party object for formation-aware targeting
+            events: Optional stream to record attack events in (a private
+                    stream is used otherwise)
 
         Returns:
-            Dict with round results
+            Dict with party_won, monsters_won, events, and actions (the
+            narrated events, rendered on first read)
         """
-
-        # Build initiative order for all combatants
-        all_combatants = []
-
-        for character in party:
-            if character.is_alive and not character.is_incapacitated():
-                init_value = self._calculate_initiative(character)
-                all_combatants.append({
-                    'character': character,
-                    'initiative': init_value,
-                    'side': 'party',
-                    'attacks_remaining': getattr(character, 'attacks_per_round', 1.0)
-                })
-
-        for monster in monsters:
-            if monster.is_alive:
-                init_value = self._calculate_initiative(monster)
-                all_combatants.append({
-                    'character': monster,
-                    'initiative': init_value,
-                    'side': 'monster',
-                    'attacks_remaining': getattr(monster, 'attacks_per_round', 1.0)
-                })
-
-        # Sort by initiative (lower is better in AD&D 1e)
-        all_combatants.sort(key=lambda x: x['initiative'])
-
-        results = {
-            'actions': [],
+        party_side = CombatSide(party, require_active=True)
+        monster_side = CombatSide(monsters)
+
+        # Build initiative order once for the round (lower is better in AD&D 1e)
+        order = [(self._calculate_initiative(character), character, monster_side)
+                 for character in party_side.targets]
+        order.extend((self._calculate_initiative(monster), monster, party_side)
+                     for monster in monster_side.targets)
+        order.sort(key=lambda entry: entry[0])
+
+        if events is None:
+            events = CombatEventStream(max_events=0)
+        mark = events.mark()
+        end = None  # Set when the round returns, so later rounds aren't rendered
+
+        results = LazyResult({'actions': lambda _: events.render(since=mark, until=end)}, {
             'party_won': False,
-            'monsters_won': False
-        }
+            'monsters_won': False,
+            'events': events
+        })
+
+        self._fight_round(order, party_side, monster_side, party_obj, events, results)
+        end = events.mark()
+
+        return results
+
+    def _fight_round(self, order: List, party_side: CombatSide, monster_side: CombatSide,
+                     party_obj, events: CombatEventStream, results: Dict) -> None:
+        """Attacks in initiative order, until the round ends or a side is eliminated"""
 
         # Process attacks in initiative order
         # Handle fractional attacks (1.5, 2.0, etc.)
         attack_segments = [1, 2]  # Two attack segments per round
 
         for segment in attack_segments:
-            for combatant in all_combatants:
-                char = combatant['character']
+            for _, char, enemies in order:
 
                 # Skip if dead or incapacitated
                 if not char.is_alive or char.is_incapacitated():
                     continue
 
                 # Determine if this character attacks this segment
-                attacks_per_round = combatant['attacks_remaining']
+                attacks_per_round = getattr(char, 'attacks_per_round', 1.0)
 
                 # 1 attack per round = attack on first segment only
                 # 1.5 attacks per round = attack both segments alternately (every other round)
@@ -369,26 +402,15 @@ class CombatResolver:
                     # 1 attack per round = first segment only
                     should_attack = True
 
-                if not should_attack:
+                if not should_attack or not enemies.targets:
                     continue
 
-                # Find target
-                if combatant['side'] == 'party':
-                    targets = [m for m in monsters if m.is_alive]
-                else:
-                    targets = [p for p in party if p.is_alive and not p.is_incapacitated()]
-
-                if not targets:
-                    break
-
                 # Select target using formation-aware AI for monsters
-                if combatant['side'] == 'monster' and party_obj is not None:
-                    # Use AI targeting for monsters attacking party
-                    ai = MonsterTargetingAI()
-                    target = ai.select_target(char, party_obj, targets)
+                if enemies is party_side and party_obj is not None:
+                    target = self.targeting_ai.select_target(char, party_obj, enemies.targets)
                 else:
                     # Random targeting for player attacks or solo play
-                    target = random.choice(targets)
+                    target = random.choice(enemies.targets)
 
                 # Get weapon
                 weapon = None
@@ -396,19 +418,65 @@ class CombatResolver:
                     weapon = char.equipment.weapon
 
                 # Make attack
-                result = self.attack_roll(char, target, weapon)
-                results['actions'].append(result['narrative'])
+                self.attack_roll(char, target, weapon, events)
+
+                if not target.is_alive:
+                    enemies.remove(target)
 
                 # Check for combat end
-                if all(not m.is_alive for m in monsters):
+                if monster_side.eliminated:
                     results['party_won'] = True
-                    return results
+                    return
 
-                if all(not p.is_alive for p in party):
+                if party_side.eliminated:
                     results['monsters_won'] = True
-                    return results
+                    return
 
-        return results
+    def resolve_battle(self, party: List[Character], monsters: List[Character],
+                       party_obj=None, max_rounds: int = 100,
+                       events: Optional[CombatEventStream] = None) -> Dict:
+        """
+        Fight rounds until one side is eliminated
+
+        Intended for large battles (lairs, wilderness encounters), where each
+        round stays linear in the number of combatants.
+
+        Args:
+            party: List of party members (PCs)
+            monsters: List of monsters
+            party_obj: Optional Party object for formation-aware targeting
+            max_rounds: Stop after this many rounds even if both sides stand
+            events: Optional stream to record attack events in
+
+        Returns:
+            Dict with rounds fought, party_won, monsters_won, events and
+            actions (rendered on first read)
+        """
+        if events is None:
+            events = CombatEventStream(max_events=0)
+        mark = events.mark()
+        end = None  # Set when the battle is over
+
+        battle = LazyResult({'actions': lambda _: events.render(since=mark, until=end)}, {
+            'rounds': 0, 'party_won': False, 'monsters_won': False, 'events': events
+        })
+
+        while battle['rounds'] < max_rounds:
+            before = events.emitted
+            round_result = self.resolve_combat_round(party, monsters, party_obj, events)
+            battle['rounds'] += 1
+
+            if round_result['party_won'] or round_result['monsters_won']:
+                battle['party_won'] = round_result['party_won']
+                battle['monsters_won'] = round_result['monsters_won']
+                break
+
+            # Nobody could act (e.g. every survivor is held or asleep)
+            if events.emitted == before:
+                break
+
+        end = events.mark()
+        return battle
 
     def _calculate_initiative(self, character: Character) -> int:
         """
@@ -0,0 +1,284 @@
+"""
+Combat Event Stream
+
+Combat, saving throws, spells and traps record what happened as compact
+CombatEvent records (who, against whom, roll, damage, flags). Nothing is
+formatted when an event is recorded; narration is produced by a renderer
+only when a UI reads the events, so headless simulations never pay for
+text they do not display.
+
+Renderers are plain callables taking an event and returning a string.
+render_event() produces the classic one-line narration, and
+DMNarrator.render_event adds flavour text for attacks.
+"""
+
+from collections import deque
+from collections.abc import ItemsView, KeysView, ValuesView
+from typing import Callable, Deque, Dict, Iterator, List, Optional
+
+
+# Event kinds
+ATTACK = 'attack'
+SAVE = 'save'
+SPELL = 'spell'
+TRAP = 'trap'
+
+# Flags (bitmask)
+HIT = 1
+CRITICAL = 2       # Natural 20 on an attack
+FUMBLE = 4         # Natural 1 on an attack
+KILLED = 8         # Target died from this event
+SAVED = 16         # Saving throw succeeded
+NATURAL = 32       # Saving throw was a natural 1 or 20
+
+FLAG_NAMES = {
+    HIT: 'hit',
+    CRITICAL: 'critical',
+    FUMBLE: 'fumble',
+    KILLED: 'killed',
+    SAVED: 'saved',
+    NATURAL: 'natural'
+}
+
+# Default number of events a stream keeps (0 = unbounded)
+DEFAULT_STREAM_SIZE = 500
+
+
+class CombatEvent:
+    """
+    One thing that happened in combat
+
+    Fields by kind:
+        attack: actor attacks target; roll is the d20, target_number the
+                roll needed (THAC0 - AC), modifier the to-hit bonus
+        save:   actor saves vs detail (category); target_number is the base
+                save, modifier the total modifier, damage any damage taken
+        spell:  actor casts detail (spell name) at target; damage is the
+                total dealt, text the spell's own narrative
+        trap:   target triggers detail (trap type) and takes damage
+    """
+
+    __slots__ = ('kind', 'actor', 'target', 'roll', 'damage', 'flags',
+                 'detail', 'target_number', 'modifier', 'text')
+
+    def __init__(self, kind: str, actor: str, target: Optional[str] = None, roll: int = 0,
+                 damage: int = 0, flags: int = 0, detail: str = '', target_number: int = 0,
+                 modifier: int = 0, text: Optional[str] = None):
+        self.kind = kind
+        self.actor = actor
+        self.target = target
+        self.roll = roll
+        self.damage = damage
+        self.flags = flags
+        self.detail = detail
+        self.target_number = target_number
+        self.modifier = modifier
+        self.text = text
+
+    def has(self, flag: int) -> bool:
+        """Check a flag"""
+        return bool(self.flags & flag)
+
+    def to_dict(self) -> Dict:
+        """Machine-readable form (web UI combat log)"""
+        return {
+            'kind': self.kind,
+            'actor': self.actor,
+            'target': self.target,
+            'roll': self.roll,
+            'damage': self.damage,
+            'flags': [name for flag, name in FLAG_NAMES.items() if self.flags & flag],
+            'detail': self.detail,
+            'target_number': self.target_number,
+            'modifier': self.modifier
+        }
+
+    def __repr__(self) -> str:
+        return f"CombatEvent({self.kind!r}, {self.actor!r}, {self.target!r}, roll={self.roll}, damage={self.damage})"
+
+
+def render_event(event: CombatEvent) -> str:
+    """
+    Render an event as the classic one-line narration
+
+    Args:
+        event: Event to describe
+
+    Returns:
+        Narrative string
+    """
+    if event.text is not None:
+        return event.text
+
+    if event.kind == ATTACK:
+        if event.flags & FUMBLE:
+            return f"{event.actor} fumbles the attack!"
+        if event.flags & CRITICAL:
+            text = f"{event.actor} scores a CRITICAL HIT on {event.target} for {event.damage} damage!"
+            if event.flags & KILLED:
+                text += f" {event.target} falls dead!"
+            return text
+        if event.flags & HIT:
+            text = f"{event.actor} hits {event.target} for {event.damage} damage!"
+            if event.flags & KILLED:
+                text += f" {event.target} is slain!"
+            return text
+        return f"{event.actor} misses {event.target}."
+
+    if event.kind == SAVE:
+        return render_save(event.actor, event.detail, event.roll, event.target_number,
+                           event.modifier, bool(event.flags & SAVED))
+
+    if event.kind == SPELL:
+        text = f"{event.actor} casts {event.detail}"
+        return text + (f" on {event.target}!" if event.target else "!")
+
+    if event.kind == TRAP:
+        text = f"{event.target} triggers a {event.detail.replace('_', ' ')} trap"
+        if event.damage:
+            text += f" and takes {event.damage} damage"
+        return text + "!"
+
+    return f"{event.actor}: {event.kind}"
+
+
+def render_save(name: str, category: str, roll: int, base_target: int,
+                total_modifier: int, success: bool) -> str:
+    """Build the narrative line for one saving throw"""
+    if roll == 1:
+        return f"{name} rolls a NATURAL 1! Automatic success!"
+    if roll == 20:
+        return f"{name} rolls a NATURAL 20! Automatic failure!"
+
+    adjusted_target = base_target - total_modifier
+    narrative = f"{name} rolls {roll} vs {category} save"
+
+    # Add target information
+    if total_modifier != 0:
+        narrative += f" (target {base_target}{total_modifier:+d}={adjusted_target})"
+    else:
+        narrative += f" (target {adjusted_target})"
+
+    narrative += ": SUCCESS!" if success else ": FAILURE!"
+    return narrative
+
+
+class CombatEventStream:
+    """
+    Ordered, optionally bounded log of combat events
+
+    Usage:
+        stream = CombatEventStream()
+        mark = stream.mark()
+        resolver.resolve_combat_round(party, monsters, events=stream)
+        lines = stream.render(since=mark)           # Text for a UI
+        log = stream.to_dicts(since=mark)           # JSON for the web UI
+    """
+
+    def __init__(self, max_events: int = DEFAULT_STREAM_SIZE):
+        """
+        Args:
+            max_events: Oldest events are dropped beyond this many (0 = unbounded)
+        """
+        self._events: Deque[CombatEvent] = deque(maxlen=max_events or None)
+        self.emitted = 0  # Total events ever emitted
+
+    def emit(self, event: CombatEvent) -> CombatEvent:
+        """Append an event"""
+        self._events.append(event)
+        self.emitted += 1
+        return event
+
+    def mark(self) -> int:
+        """Position to pass as `since` to read only later events"""
+        return self.emitted
+
+    def events(self, since: int = 0, until: Optional[int] = None) -> List[CombatEvent]:
+        """Events emitted after a mark, up to an optional later mark (those still retained)"""
+        first = self.emitted - len(self._events)
+        start = max(since - first, 0)
+        stop = None if until is None else max(until - first, 0)
+        if start == 0 and stop is None:
+            return list(self._events)
+        return list(self._events)[start:stop]
+
+    def render(self, renderer: Callable[[CombatEvent], str] = render_event,
+               since: int = 0, until: Optional[int] = None) -> List[str]:
+        """Narrate events with a renderer"""
+        return [renderer(event) for event in self.events(since, until)]
+
+    def to_dicts(self, since: int = 0, until: Optional[int] = None) -> List[Dict]:
+        """Events as plain dicts"""
+        return [event.to_dict() for event in self.events(since, until)]
+
+    def clear(self) -> None:
+        """Drop retained events (the emitted count keeps running)"""
+        self._events.clear()
+
+    def __iter__(self) -> Iterator[CombatEvent]:
+        return iter(self._events)
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+
+class LazyResult(dict):
+    """
+    Result dict with keys computed on first access
+
+    Keeps the familiar result-dict interface (result['narrative']) while
+    the text behind it is only rendered if somebody reads it. Lazy keys
+    count as present everywhere a plain dict would show them: iteration,
+    keys()/items()/values(), len(), copies, dict(result), comparisons and
+    json.dumps(); reading their values computes them.
+    """
+
+    def __init__(self, lazy: Dict[str, Callable[['LazyResult'], object]], *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lazy = lazy
+
+    def __missing__(self, key):
+        if key in self._lazy:
+            value = self[key] = self._lazy[key](self)
+            return value
+        raise KeyError(key)
+
+    def __contains__(self, key) -> bool:
+        return dict.__contains__(self, key) or key in self._lazy
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def _pending(self) -> List[str]:
+        """Lazy keys not computed yet"""
+        return [key for key in self._lazy if not dict.__contains__(self, key)]
+
+    def __iter__(self) -> Iterator:
+        yield from dict.__iter__(self)
+        yield from self._pending()
+
+    def __len__(self) -> int:
+        return dict.__len__(self) + len(self._pending())
+
+    def keys(self) -> KeysView:
+        return KeysView(self)
+
+    def items(self) -> ItemsView:
+        return ItemsView(self)
+
+    def values(self) -> ValuesView:
+        return ValuesView(self)
+
+    def copy(self) -> 'LazyResult':
+        return LazyResult(self._lazy, dict.items(self))
+
+    def __eq__(self, other) -> bool:
+        return dict(self.items()) == other
+
+    def __ne__(self, other) -> bool:
+        return not self == other
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
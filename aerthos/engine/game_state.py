@@ -2,11 +2,11 @@
 Central game state manager - coordinates all game systems
 """
 
-import json
 import random
 from typing import Dict, List, Optional, Union
 from pathlib import Path
 
+from ..constants import SPELL_RESTORATION_HOURS, TURNS_PER_HOUR
 from ..entities.player import PlayerCharacter, Item, Weapon, Armor, Shield, LightSource, Spell
 from ..entities.monster import Monster
 from ..world.dungeon import Dungeon
@@ -14,11 +14,15 @@ from ..world.multilevel_dungeon import MultiLevelDungeon
 from ..world.room import Room
 from ..world.encounter import EncounterManager, CombatEncounter, TrapEncounter, PuzzleEncounter
 from ..engine.combat import CombatResolver, DiceRoller
+from ..engine.combat_events import CombatEventStream
+from ..engine.profiling import SessionProfiler
 from ..engine.time_tracker import TimeTracker, RestSystem
 from ..systems.magic import MagicSystem
 from ..systems.skills import SkillResolver
 from ..systems.saving_throws import SavingThrowResolver
 from ..systems.monster_abilities import MonsterSpecialAbilities
+from ..systems.data_cache import DATA_DIR, load_json
+from ..systems.monster_database import MONSTER_SOURCE, get_monster_database
 from ..systems.narrator import DMNarrator, NarrativeContext
 from ..engine.parser import Command
 
@@ -37,28 +41,34 @@ class GameData:
         self.spells = {}
 
     @classmethod
-    def load_all(cls, data_dir: str = "aerthos/data") -> 'GameData':
-        """Load all JSON game data"""
+    def load_all(cls, data_dir: Optional[str] = None) -> 'GameData':
+        """
+        Load all JSON game data
 
-        data = cls()
+        Args:
+            data_dir: Data directory (default: the package's aerthos/data,
+                      wherever the game is started from)
+        """
 
-        # Load JSON files
-        with open(f"{data_dir}/classes.json") as f:
-            data.classes = json.load(f)
+        data = cls()
+        data_dir = Path(data_dir) if data_dir is not None else DATA_DIR
 
-        with open(f"{data_dir}/races.json") as f:
-            data.races = json.load(f)
+        # Load JSON files (pre-parsed copies are served from the data cache)
+        data.classes = load_json(data_dir / 'classes.json')
+        data.races = load_json(data_dir / 'races.json')
 
-        with open(f"{data_dir}/monsters.json") as f:
-            data.monsters = json.load(f)
+        # Package data comes from the shared compiled monster database
+        if data_dir.resolve() == MONSTER_SOURCE.parent.resolve():
+            data.monsters = get_monster_database().records
+        else:
+            data.monsters = load_json(data_dir / 'monsters.json')
 
         # Note: items.json is deprecated - use specific databases:
         # - armor.json (via ArmorSystem)
         # - weapons.json (via weapon system)
         # - equipment.json (for general equipment)
 
-        with open(f"{data_dir}/spells.json") as f:
-            data.spells = json.load(f)
+        data.spells = load_json(data_dir / 'spells.json')
 
         return data
 
@@ -98,11 +108,16 @@ class GameState:
         self.active_monsters: List[Monster] = []
         self.in_combat = False
         self.current_encounter: Optional[CombatEncounter] = None
+        self.save_modifier_cache: Dict = {}  # Standing save modifiers, reset per encounter
+        self.combat_log = CombatEventStream()  # Structured attack/save/spell events
+
+        # Opt-in profiling (AERTHOS_PROFILE / AERTHOS_TRACEMALLOC / AERTHOS_SLOW_COMMAND_MS)
+        self.profiler: Optional[SessionProfiler] = SessionProfiler.from_env()
 
         # Game data
         self.game_data: Optional[GameData] = None
 
-    def load_game_data(self, data_dir: str = "aerthos/data") -> None:
+    def load_game_data(self, data_dir: Optional[str] = None) -> None:
         """Load all game data"""
         self.game_data = GameData.load_all(data_dir)
 
@@ -116,6 +131,41 @@ class GameState:
         Returns:
             Dict with results and narrative
         """
+        if self.profiler is None:
+            return self._dispatch_command(command)
+
+        label = ' '.join(part for part in (command.action, command.target, command.instrument) if part)
+        return self.profiler.call(label, self._dispatch_command, command)
+
+    def enable_profiling(self, cprofile: bool = True, trace_memory: bool = False,
+                         slow_threshold_ms: Optional[float] = None) -> SessionProfiler:
+        """
+        Attach (or reconfigure) this session's profiler
+
+        Args:
+            cprofile: Capture cProfile data for every command
+            trace_memory: Diff tracemalloc snapshots between commands
+            slow_threshold_ms: Log commands slower than this (None = leave unchanged)
+
+        Returns:
+            The session's SessionProfiler
+        """
+        if self.profiler is None:
+            self.profiler = SessionProfiler(cprofile=cprofile, trace_memory=trace_memory,
+                                            slow_threshold_ms=slow_threshold_ms)
+        else:
+            self.profiler.configure(cprofile=cprofile, trace_memory=trace_memory,
+                                    slow_threshold_ms=slow_threshold_ms)
+        return self.profiler
+
+    def disable_profiling(self) -> None:
+        """Detach the profiler and release its data"""
+        if self.profiler is not None:
+            self.profiler.close()
+            self.profiler = None
+
+    def _dispatch_command(self, command: Command) -> Dict:
+        """Route a command to its handler"""
 
         # Commands that are blocked when character is dead
         action_commands = {
@@ -272,7 +322,7 @@ class GameState:
         if weapon_penalty:
             self.player.thac0 -= weapon_penalty  # Lower THAC0 = worse to-hit
 
-        result = self.combat_resolver.attack_roll(self.player, target, weapon)
+        result = self.combat_resolver.attack_roll(self.player, target, weapon, self.combat_log)
 
         # Restore original THAC0
         if weapon_penalty:
@@ -335,11 +385,13 @@ class GameState:
                             if ability_result.damage > 0:
                                 # Check for saving throw
                                 if ability_result.save_allowed:
-                                    save_result = self.save_resolver.make_save(
-                                        self.player,
-                                        ability_result.save_type
-                                    )
-                                    if save_result['success']:
+                                    save_result = self.save_resolver.make_group_save(
+                                        [self.player],
+                                        ability_result.save_type,
+                                        modifier_cache=self.save_modifier_cache,
+                                        events=self.combat_log
+                                    )[0]
+                                    if save_result.success:
                                         # Save for half damage
                                         damage = ability_result.damage // 2
                                         messages.append(f"{self.player.name} makes their save! Damage reduced to {damage}.")
@@ -362,7 +414,7 @@ class GameState:
 
                 # Normal attack if no special ability used
                 if not used_special:
-                    monster_result = self.combat_resolver.attack_roll(monster, self.player)
+                    monster_result = self.combat_resolver.attack_roll(monster, self.player, events=self.combat_log)
                     messages.append(monster_result['narrative'])
 
                     if monster_result['defender_died']:
@@ -398,7 +450,7 @@ class GameState:
         # Monsters attack
         for monster in self.active_monsters:
             if monster.is_alive:
-                monster_result = self.combat_resolver.attack_roll(monster, self.player)
+                monster_result = self.combat_resolver.attack_roll(monster, self.player, events=self.combat_log)
                 messages.append(monster_result['narrative'])
 
                 if monster_result['defender_died']:
@@ -436,7 +488,7 @@ class GameState:
         # Monsters attack
         for monster in self.active_monsters:
             if monster.is_alive:
-                monster_result = self.combat_resolver.attack_roll(monster, self.player)
+                monster_result = self.combat_resolver.attack_roll(monster, self.player, events=self.combat_log)
                 messages.append(monster_result['narrative'])
 
                 if monster_result['defender_died']:
@@ -691,19 +743,16 @@ class GameState:
                                 spell_name = ' '.join(parts[:-1])
                                 break
 
-        # Determine if this is a beneficial spell (healing/buff) or harmful spell
-        # Support abbreviated spell names (e.g., "c" for "cure")
-        spell_name_lower = spell_name.lower()
-        beneficial_spells = ['cure', 'heal', 'bless', 'protection', 'shield', 'aid']
-
-        # Check both directions: "cure" in "cure light wounds" OR "c" in "cure"
-        is_beneficial = any(
-            keyword in spell_name_lower or spell_name_lower in keyword
-            for keyword in beneficial_spells
-        )
+        # Determine if this is a beneficial spell (healing/buff/remedy) or harmful spell
+        # from its compiled plan (abbreviated names resolve like cast_spell does)
+        spell = self.player.get_memorized_spell(spell_name)
+        is_beneficial = bool(spell) and self.magic_system.effects.get_plan(spell).beneficial
 
         # Build targets list
-        if is_beneficial:
+        if not spell:
+            # Not memorized - cast_spell reports it
+            targets = []
+        elif is_beneficial:
             # Beneficial spells should ONLY target party members (or caster if no target specified)
             # They should NEVER target monsters, even in combat
             if target_name and hasattr(self, 'party') and self.party:
@@ -742,7 +791,7 @@ class GameState:
                 # The spell handler will decide if it's area-effect or single-target
                 targets = self.active_monsters
 
-        result = self.magic_system.cast_spell(self.player, spell_name, targets)
+        result = self.magic_system.cast_spell(self.player, spell_name, targets, self.combat_log)
 
         messages = [result['narrative']]
 
@@ -838,7 +887,7 @@ class GameState:
         """Handle opening locked containers"""
 
         # Get encounters for this room
-        room_encounters = self.dungeon.get_room_encounters(self.current_room.id)
+        room_encounters = self._level_dungeon().get_room_encounters(self.current_room.id)
 
         # Look for puzzle encounters (locked chests)
         locked_chest = None
@@ -881,7 +930,7 @@ class GameState:
                 messages.append("\n🔓 Click! The lock opens!")
 
                 # Mark encounter as completed
-                self.current_room.encounters_completed.append(encounter_id)
+                self.current_room.mark_encounter_completed(encounter_id)
 
                 # Give reward
                 reward_id = locked_chest.get('reward')
@@ -916,12 +965,9 @@ class GameState:
         # If rest is successful, advance time by 8 hours (48 turns)
         if result['success']:
             messages = [result['narrative']]
-            # Advance 48 turns (8 hours)
-            for _ in range(48):
-                time_messages = self.time_tracker.advance_turn(self.player)
-                # Only show final time message, not all 48
-                if time_messages and _ == 47:
-                    messages.extend(time_messages)
+            # Advance 48 turns (8 hours), only showing the final turn's messages
+            self.time_tracker.advance(SPELL_RESTORATION_HOURS * TURNS_PER_HOUR - 1, self.player)
+            messages.extend(self.time_tracker.advance_turn(self.player))
             return {'success': True, 'message': '\n'.join(messages)}
 
         return {'success': result['success'], 'message': result['narrative']}
@@ -1303,28 +1349,29 @@ class GameState:
         self.is_active = False
         return {'success': True, 'message': "Thanks for playing Aerthos!"}
 
+    def _level_dungeon(self) -> Dungeon:
+        """The single-level Dungeon the party is on (the current level if multi-level)"""
+        if self.is_multilevel:
+            return self.dungeon.get_current_dungeon()
+        return self.dungeon
+
     def _check_encounters(self, trigger_type: str) -> Optional[str]:
         """Check for and trigger encounters"""
 
-        # Get encounter data from dungeon
-        room_encounter_data = self.dungeon.get_room_encounters(self.current_room.id)
-
-        # Load encounters from room
-        encounters = self.encounter_manager.load_room_encounters(
-            {'id': self.current_room.id, 'encounters': room_encounter_data}
-        )
-
-        # Get triggered encounters
-        triggered = self.encounter_manager.get_triggered_encounters(encounters, trigger_type)
+        # Encounters are compiled per room and trigger when the dungeon loads
+        triggered = self._level_dungeon().encounter_index.triggered_by(self.current_room.id, trigger_type)
+        if not triggered:
+            return None
 
+        completed = self.current_room.encounters_completed
         for encounter in triggered:
             # Check if already completed
-            if encounter.encounter_id in self.current_room.encounters_completed:
+            if not encounter.is_active or encounter.encounter_id in completed:
                 continue
 
             if isinstance(encounter, CombatEncounter):
                 # Mark as completed so it doesn't trigger again
-                self.current_room.encounters_completed.append(encounter.encounter_id)
+                self.current_room.mark_encounter_completed(encounter.encounter_id)
                 return self._start_combat(encounter)
 
         return None
@@ -1341,6 +1388,7 @@ class GameState:
 
         self.in_combat = True
         self.current_encounter = encounter  # Track current encounter
+        self.save_modifier_cache = {}
 
         monster_names = ', '.join(m.name for m in self.active_monsters)
         return f"\n═══ COMBAT ═══\nYou encounter: {monster_names}!\n{self._format_monster_status()}"
@@ -1372,10 +1420,11 @@ class GameState:
         """Award treasure for defeating a boss"""
 
         # Get treasure data from current room
-        if not self.dungeon.room_data or self.current_room.id not in self.dungeon.room_data:
+        level_room_data = self._level_dungeon().room_data
+        if not level_room_data or self.current_room.id not in level_room_data:
             return None
 
-        room_data = self.dungeon.room_data[self.current_room.id]
+        room_data = level_room_data[self.current_room.id]
         treasure = room_data.get('treasure')
 
         if not treasure:
@@ -1439,7 +1488,7 @@ class GameState:
             xp_value=data['xp_value'],  # Will be recalculated dynamically
             movement=data['movement'],
             morale=data['morale'],
-            special_abilities=data.get('special_abilities', []),
+            special_abilities=list(data.get('special_abilities', [])),
             ai_behavior=data.get('ai_behavior', 'aggressive'),
             description=data['description'],
             xp_formula=data.get('xp_formula')  # AD&D 1e XP formula data
@@ -0,0 +1,359 @@
+"""
+Session Profiling Hooks
+
+Opt-in instrumentation for live game sessions, so latency spikes can be
+diagnosed without redeploying with hand-inserted prints:
+
+- cProfile capture of command execution (per session)
+- tracemalloc snapshots diffed between commands
+- slow-command log with a millisecond threshold
+- dumps as a pstats file, a text report or folded stacks for flamegraph tools
+
+Nothing here costs anything unless a SessionProfiler is attached to a
+GameState (GameState.enable_profiling() or the environment variables below);
+cProfile, pstats and tracemalloc are only imported once they are enabled.
+
+Environment variables:
+    AERTHOS_PROFILE=1            cProfile every command
+    AERTHOS_TRACEMALLOC=1        Diff memory allocations between commands
+    AERTHOS_SLOW_COMMAND_MS=250  Log commands slower than this
+"""
+
+import io
+import os
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Callable, Deque, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import cProfile
+    import pstats
+    import tracemalloc
+
+
+ENV_PROFILE = 'AERTHOS_PROFILE'
+ENV_TRACEMALLOC = 'AERTHOS_TRACEMALLOC'
+ENV_SLOW_COMMAND_MS = 'AERTHOS_SLOW_COMMAND_MS'
+
+# Records kept in the slow-command and memory-diff logs
+DEFAULT_HISTORY = 50
+
+# Allocation sites reported per memory diff
+DEFAULT_MEMORY_TOP = 10
+
+# Deepest call stack written to folded output
+MAX_STACK_DEPTH = 64
+
+# cProfile's own bookkeeping, left out of folded stacks
+PROFILER_FRAMES = ("<method 'disable' of '_lsprof.Profiler' objects>",)
+
+
+# tracemalloc is process-wide: profilers tracing memory, and whether one of them
+# started it (it is only stopped once the last of them stops)
+_tracemalloc_users = 0
+_tracemalloc_started = False
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+class SessionProfiler:
+    """
+    Per-session profiler
+
+    Usage:
+        profiler = SessionProfiler(cprofile=True, slow_threshold_ms=100)
+        result = profiler.call('attack orc', game_state._dispatch_command, command)
+        print(profiler.stats_text())
+        profiler.dump_stats('session.prof')        # For snakeviz/pstats
+        open('session.folded', 'w').write(profiler.folded_stacks())
+    """
+
+    def __init__(self, cprofile: bool = False, trace_memory: bool = False,
+                 slow_threshold_ms: Optional[float] = None,
+                 history: int = DEFAULT_HISTORY, memory_top: int = DEFAULT_MEMORY_TOP):
+        """
+        Args:
+            cprofile: Capture cProfile data for every command
+            trace_memory: Diff tracemalloc snapshots between commands
+            slow_threshold_ms: Log commands slower than this (None = off)
+            history: Records kept in the slow-command and memory-diff logs
+            memory_top: Allocation sites reported per memory diff
+        """
+        self.slow_threshold_ms = slow_threshold_ms
+        self.memory_top = memory_top
+
+        self.commands = 0
+        self.total_ms = 0.0
+        self.slow_commands: Deque[Dict] = deque(maxlen=history)
+        self.memory_diffs: Deque[Dict] = deque(maxlen=history)
+
+        self._profile: Optional['cProfile.Profile'] = None
+        self._profiled_commands = 0
+        self._tracing = False
+        self._last_snapshot: Optional['tracemalloc.Snapshot'] = None
+
+        if cprofile:
+            self.enable_cprofile()
+        if trace_memory:
+            self.start_tracing()
+
+    @classmethod
+    def from_env(cls) -> Optional['SessionProfiler']:
+        """Build a profiler from environment variables (None if none are set)"""
+        cprofile = _env_flag(ENV_PROFILE)
+        trace_memory = _env_flag(ENV_TRACEMALLOC)
+
+        slow_threshold_ms = None
+        if os.environ.get(ENV_SLOW_COMMAND_MS):
+            try:
+                slow_threshold_ms = float(os.environ[ENV_SLOW_COMMAND_MS])
+            except ValueError:
+                print(f"Warning: ignoring invalid {ENV_SLOW_COMMAND_MS}={os.environ[ENV_SLOW_COMMAND_MS]!r}")
+
+        if not (cprofile or trace_memory or slow_threshold_ms is not None):
+            return None
+        return cls(cprofile=cprofile, trace_memory=trace_memory, slow_threshold_ms=slow_threshold_ms)
+
+    # ------------------------------------------------------------------
+    # Switches
+    # ------------------------------------------------------------------
+
+    @property
+    def cprofile_enabled(self) -> bool:
+        return self._profile is not None
+
+    @property
+    def tracing(self) -> bool:
+        return self._tracing
+
+    def enable_cprofile(self) -> None:
+        """Start capturing cProfile data (keeps any data already captured)"""
+        if self._profile is None:
+            import cProfile
+            self._profile = cProfile.Profile()
+
+    def disable_cprofile(self) -> None:
+        """Stop capturing and discard cProfile data"""
+        self._profile = None
+        self._profiled_commands = 0
+
+    def start_tracing(self) -> None:
+        """Start diffing memory between commands"""
+        global _tracemalloc_users, _tracemalloc_started
+        if self._tracing:
+            return
+        import tracemalloc
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _tracemalloc_started = True
+        _tracemalloc_users += 1
+        self._tracing = True
+        self._last_snapshot = self._take_snapshot()
+
+    @staticmethod
+    def _take_snapshot() -> 'tracemalloc.Snapshot':
+        """Snapshot without tracemalloc's own bookkeeping"""
+        import tracemalloc
+        return tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)])
+
+    @staticmethod
+    def _tracemalloc_running() -> bool:
+        """Whether tracemalloc is on (code outside the profilers may have stopped it)"""
+        import tracemalloc
+        return tracemalloc.is_tracing()
+
+    def stop_tracing(self) -> None:
+        """Stop memory diffs (and tracemalloc, once no profiler is using it)"""
+        global _tracemalloc_users, _tracemalloc_started
+        if not self._tracing:
+            return
+        self._tracing = False
+        self._last_snapshot = None
+        _tracemalloc_users -= 1
+        if not _tracemalloc_users and _tracemalloc_started:
+            import tracemalloc
+            tracemalloc.stop()
+            _tracemalloc_started = False
+
+    def configure(self, cprofile: Optional[bool] = None, trace_memory: Optional[bool] = None,
+                  slow_threshold_ms: Optional[float] = None) -> None:
+        """
+        Change settings; arguments left as None are unchanged
+
+        Args:
+            cprofile: Enable/disable cProfile capture
+            trace_memory: Enable/disable memory diffs
+            slow_threshold_ms: New slow-command threshold (negative = off)
+        """
+        if cprofile is True:
+            self.enable_cprofile()
+        elif cprofile is False:
+            self.disable_cprofile()
+
+        if trace_memory is True:
+            self.start_tracing()
+        elif trace_memory is False:
+            self.stop_tracing()
+
+        if slow_threshold_ms is not None:
+            self.slow_threshold_ms = slow_threshold_ms if slow_threshold_ms >= 0 else None
+
+    def close(self) -> None:
+        """Release tracemalloc and profile data"""
+        self.stop_tracing()
+        self.disable_cprofile()
+
+    # ------------------------------------------------------------------
+    # Measurement
+    # ------------------------------------------------------------------
+
+    def call(self, label: str, func: Callable, *args, **kwargs):
+        """
+        Run one command under the profiler
+
+        Args:
+            label: Command description used in the logs
+            func: Callable to run
+            *args, **kwargs: Passed to func
+
+        Returns:
+            Whatever func returns
+        """
+        profile = self._profile
+        start = time.perf_counter()
+        try:
+            if profile is not None:
+                self._profiled_commands += 1
+                return profile.runcall(func, *args, **kwargs)
+            return func(*args, **kwargs)
+        finally:
+            self._record(label, (time.perf_counter() - start) * 1000.0)
+
+    def _record(self, label: str, elapsed_ms: float) -> None:
+        self.commands += 1
+        self.total_ms += elapsed_ms
+
+        if self._tracing and self._tracemalloc_running():
+            snapshot = self._take_snapshot()
+            diff = snapshot.compare_to(self._last_snapshot, 'lineno')[:self.memory_top]
+            self._last_snapshot = snapshot
+            self.memory_diffs.append({
+                'command': label,
+                'size_diff': sum(stat.size_diff for stat in diff),
+                'top': [str(stat) for stat in diff]
+            })
+
+        if self.slow_threshold_ms is not None and elapsed_ms >= self.slow_threshold_ms:
+            record = {
+                'command': label,
+                'elapsed_ms': round(elapsed_ms, 3),
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
+            }
+            self.slow_commands.append(record)
+            print(f"Warning: slow command '{label}' took {elapsed_ms:.1f} ms "
+                  f"(threshold {self.slow_threshold_ms:g} ms)")
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+
+    def _stats(self) -> Optional['pstats.Stats']:
+        if self._profile is None or not self._profiled_commands:
+            return None
+        import pstats
+        return pstats.Stats(self._profile)
+
+    def stats_text(self, sort: str = 'cumulative', limit: int = 30) -> str:
+        """pstats report of the captured profile ('' if nothing captured)"""
+        stats = self._stats()
+        if stats is None:
+            return ''
+        stream = io.StringIO()
+        stats.stream = stream
+        stats.sort_stats(sort).print_stats(limit)
+        return stream.getvalue()
+
+    def dump_stats(self, path) -> Optional[Path]:
+        """
+        Write the captured profile as a pstats file (snakeviz, gprof2dot, ...)
+
+        Returns:
+            Path written, or None if nothing was captured
+        """
+        stats = self._stats()
+        if stats is None:
+            return None
+        path = Path(path)
+        stats.dump_stats(str(path))
+        return path
+
+    def folded_stacks(self) -> str:
+        """
+        Captured profile as folded stacks ('a;b;c <microseconds>' per line)
+
+        The format read by flamegraph.pl, speedscope and inferno. cProfile
+        only records caller/callee pairs, so each callee's time is split
+        across its callers in proportion to the time spent under each one.
+        """
+        stats = self._stats()
+        if stats is None:
+            return ''
+        return '\n'.join(f"{stack} {weight}" for stack, weight in _fold(stats.stats)) + '\n'
+
+    def report(self, limit: int = 30) -> Dict:
+        """Summary for the web API"""
+        return {
+            'commands': self.commands,
+            'total_ms': round(self.total_ms, 3),
+            'cprofile': self.cprofile_enabled,
+            'trace_memory': self._tracing,
+            'slow_threshold_ms': self.slow_threshold_ms,
+            'slow_commands': list(self.slow_commands),
+            'memory_diffs': list(self.memory_diffs),
+            'stats': self.stats_text(limit=limit)
+        }
+
+
+def _frame_label(func: Tuple[str, int, str]) -> str:
+    filename, line, name = func
+    if filename == '~':
+        return name  # Built-ins, e.g. <built-in method time.perf_counter>
+    return f"{name} ({Path(filename).name}:{line})"
+
+
+def _fold(raw_stats: Dict) -> List[Tuple[str, int]]:
+    """Expand pstats caller edges into weighted stacks"""
+    children = defaultdict(list)
+    for func, (_, _, _, _, callers) in raw_stats.items():
+        for caller, edge in callers.items():
+            children[caller].append((func, edge[3]))
+
+    folded: Dict[str, float] = defaultdict(float)
+
+    def walk(func, path: List[str], on_path: set, fraction: float) -> None:
+        self_time = raw_stats[func][2]
+        path.append(_frame_label(func))
+        folded[';'.join(path)] += self_time * fraction
+
+        if len(path) < MAX_STACK_DEPTH:
+            on_path.add(func)
+            for child, edge_time in children[func]:
+                child_total = raw_stats[child][3]
+                if child in on_path or not child_total:
+                    continue
+                child_fraction = fraction * edge_time / child_total
+                if child_fraction * child_total >= 1e-6:
+                    walk(child, path, on_path, child_fraction)
+            on_path.discard(func)
+        path.pop()
+
+    for func, (_, _, _, _, callers) in raw_stats.items():
+        if not callers and func[2] not in PROFILER_FRAMES:
+            walk(func, [], set(), 1.0)
+
+    return [(stack, int(weight * 1_000_000)) for stack, weight in folded.items()
+            if int(weight * 1_000_000) > 0]
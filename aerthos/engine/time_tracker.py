@@ -8,6 +8,9 @@ from ..constants import (
     TURNS_PER_HOUR, REST_INTERRUPTION_CHANCE, SPELL_RESTORATION_HOURS
 )
 
+# Hours between hunger warnings
+HUNGER_INTERVAL_HOURS = 8
+
 
 class TimeTracker:
     """
@@ -51,6 +54,69 @@ class TimeTracker:
 
         return messages
 
+    def advance(self, n_turns: int, player: PlayerCharacter) -> List[str]:
+        """
+        Advance time by several turns at once
+
+        Produces the same messages and end state as calling advance_turn()
+        n_turns times, but stretches where nothing can happen (no light
+        warning, burn-out or hunger) are skipped arithmetically, so the
+        cost grows with the number of events rather than the number of turns.
+
+        Args:
+            n_turns: Number of turns to pass
+            player: The player character
+
+        Returns:
+            List of event messages, in the order they happened
+        """
+
+        messages = []
+        end = self.turns_elapsed + n_turns
+
+        while self.turns_elapsed < end:
+            next_event = min(end, self._next_light_event(player), self._next_hunger_turn())
+            self._skip_quiet_turns(next_event - 1 - self.turns_elapsed, player)
+            messages.extend(self.advance_turn(player))
+
+        return messages
+
+    def _next_light_event(self, player: PlayerCharacter) -> float:
+        """Turn on which the equipped light next warns or burns out"""
+
+        light_source = player.equipment.light_source
+        if not light_source:
+            return float('inf')
+
+        remaining = light_source.turns_remaining
+        if remaining > 3:
+            steps = remaining - 3   # "burning low"
+        elif remaining > 1:
+            steps = remaining - 1   # "almost exhausted"
+        else:
+            steps = 1               # burns out
+        return self.turns_elapsed + steps
+
+    def _next_hunger_turn(self) -> int:
+        """Turn on which the next hunger warning is given"""
+
+        next_hour_turn = (self.turns_elapsed // TURNS_PER_HOUR + 1) * TURNS_PER_HOUR
+        hours = HUNGER_INTERVAL_HOURS - self.total_hours % HUNGER_INTERVAL_HOURS
+        return next_hour_turn + (hours - 1) * TURNS_PER_HOUR
+
+    def _skip_quiet_turns(self, n_turns: int, player: PlayerCharacter) -> None:
+        """Pass turns known to produce no events"""
+
+        if n_turns <= 0:
+            return
+
+        if player.equipment.light_source:
+            player.equipment.light_source.turns_remaining -= n_turns
+
+        start = self.turns_elapsed
+        self.turns_elapsed += n_turns
+        self.total_hours += self.turns_elapsed // TURNS_PER_HOUR - start // TURNS_PER_HOUR
+
     def _consume_light(self, player: PlayerCharacter) -> Optional[str]:
         """
         Decrease active light source duration and auto-equip new light sources
@@ -116,7 +182,7 @@ class TimeTracker:
             Hunger warning message
         """
 
-        if self.total_hours % 8 == 0:
+        if self.total_hours % HUNGER_INTERVAL_HOURS == 0:
             return "You're getting hungry and tired. Consider resting and eating soon."
 
         return None
@@ -2,8 +2,8 @@
 PlayerCharacter class - extends Character with inventory, spells, and XP
 """
 
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass, field
+from typing import List, Dict, FrozenSet, Optional, Tuple
+from dataclasses import dataclass, field, replace
 from .character import Character
 
 # AD&D 1e Experience Point Tables
@@ -109,69 +109,154 @@ class SpellSlot:
     is_used: bool = False
 
 
+def _normalize_item_name(name: str) -> str:
+    """Lookup key for item names ('Rope_50ft' and 'rope 50ft' match)"""
+    return name.lower().replace('_', ' ')
+
+
+@dataclass
+class ItemStack:
+    """One inventory entry: an item and how many identical copies are carried"""
+    item: Item
+    quantity: int = 1
+
+
 class Inventory:
-    """Character inventory with encumbrance"""
+    """
+    Character inventory with encumbrance
+
+    Items are kept as stacks in the order they were first added. Identical
+    plain Items (rations, oil flasks, ...) share one stack with a quantity;
+    weapons, armor, shields and light sources are equipped by identity or
+    burn down individually, so each keeps a stack of its own. The carried
+    weight is kept as a running total and names are indexed, so weight
+    checks and lookups no longer scan every item.
+
+    items still lists every unit (a stack of 3 appears 3 times).
+    """
 
     def __init__(self, max_weight: int = 100):
-        self.items: List[Item] = []
         self.max_weight = max_weight
+        self._stacks: Dict[int, ItemStack] = {}   # Insertion sequence -> stack
+        self._by_name: Dict[str, List[int]] = {}  # Normalized name -> sequences
+        self._next_seq = 0
+        self._weight = 0.0
+
+    @property
+    def items(self) -> List[Item]:
+        """Every carried item, one entry per unit"""
+        return [stack.item for stack in self._stacks.values() for _ in range(stack.quantity)]
+
+    @items.setter
+    def items(self, items: List[Item]) -> None:
+        self._stacks.clear()
+        self._by_name.clear()
+        self._weight = 0.0
+        for item in items:
+            self.add_item(item)
+
+    @property
+    def stacks(self) -> List[ItemStack]:
+        """Carried items grouped into stacks (do not modify)"""
+        return list(self._stacks.values())
 
     @property
     def current_weight(self) -> float:
         """Total weight carried"""
-        return sum(item.weight for item in self.items)
+        return self._weight
 
     @property
     def is_encumbered(self) -> bool:
         """Check if over weight limit"""
-        return self.current_weight > self.max_weight
+        return self._weight > self.max_weight
+
+    @staticmethod
+    def _is_stackable(item: Item) -> bool:
+        return type(item) is Item
 
     def add_item(self, item: Item) -> bool:
         """Add item to inventory"""
-        self.items.append(item)
+        key = _normalize_item_name(item.name)
+        seqs = self._by_name.setdefault(key, [])
+        self._weight += item.weight
+
+        if self._is_stackable(item):
+            for seq in seqs:
+                stack = self._stacks[seq]
+                if stack.item == item:
+                    stack.quantity += 1
+                    return True
+
+        seq = self._next_seq
+        self._next_seq += 1
+        self._stacks[seq] = ItemStack(item)
+        seqs.append(seq)
         return True
 
+    def _find(self, item_name: str) -> Optional[int]:
+        """
+        Sequence of the stack matching a name
+
+        Exact name first, then names starting with the search term, then
+        names containing it; ties go to the earliest added item.
+        """
+        search = _normalize_item_name(item_name)
+        seqs = self._by_name.get(search)
+        if seqs:
+            return seqs[0]
+
+        prefix_match = substring_match = None
+        for name, seqs in self._by_name.items():
+            if search in name:
+                if name.startswith(search):
+                    if prefix_match is None or seqs[0] < prefix_match:
+                        prefix_match = seqs[0]
+                elif substring_match is None or seqs[0] < substring_match:
+                    substring_match = seqs[0]
+
+        return prefix_match if prefix_match is not None else substring_match
+
     def remove_item(self, item_name: str) -> Optional[Item]:
         """Remove and return item by name (supports partial matching)"""
-        search_lower = item_name.lower().replace('_', ' ')
+        seq = self._find(item_name)
+        if seq is None:
+            return None
+
+        stack = self._stacks[seq]
+        item = stack.item
+        self._weight -= item.weight
+
+        if stack.quantity > 1:
+            # The stack keeps its item; the removed unit is a copy of it
+            stack.quantity -= 1
+            item = replace(item, properties=dict(item.properties))
+        else:
+            del self._stacks[seq]
+            key = _normalize_item_name(item.name)
+            self._by_name[key].remove(seq)
+            if not self._by_name[key]:
+                del self._by_name[key]
 
-        # First try exact match
-        for item in self.items:
-            item_name_normalized = item.name.lower().replace('_', ' ')
-            if item_name_normalized == search_lower:
-                self.items.remove(item)
-                return item
-
-        # Then try partial match (search term is in item name)
-        for item in self.items:
-            item_name_normalized = item.name.lower().replace('_', ' ')
-            if search_lower in item_name_normalized:
-                self.items.remove(item)
-                return item
+        if not self._stacks:
+            self._weight = 0.0  # Drop accumulated float error
 
-        return None
+        return item
 
     def has_item(self, item_name: str) -> bool:
         """Check if item exists in inventory"""
-        return any(item.name.lower() == item_name.lower() for item in self.items)
+        lowered = item_name.lower()
+        return any(self._stacks[seq].item.name.lower() == lowered
+                   for seq in self._by_name.get(_normalize_item_name(item_name), ()))
 
     def get_item(self, item_name: str) -> Optional[Item]:
         """Get item by name without removing (supports partial matching)"""
-        search_lower = item_name.lower().replace('_', ' ')
+        seq = self._find(item_name)
+        return self._stacks[seq].item if seq is not None else None
 
-        # First try exact match
-        for item in self.items:
-            item_name_normalized = item.name.lower().replace('_', ' ')
-            if item_name_normalized == search_lower:
-                return item
-
-        # Then try partial match (search term is in item name)
-        for item in self.items:
-            item_name_normalized = item.name.lower().replace('_', ' ')
-            if search_lower in item_name_normalized:
-                return item
-
-        return None
+    def quantity(self, item_name: str) -> int:
+        """How many items have exactly this name"""
+        return sum(self._stacks[seq].quantity
+                   for seq in self._by_name.get(_normalize_item_name(item_name), ()))
 
     def get_items_by_type(self, item_type: str) -> List[Item]:
         """Get all items of a specific type"""
@@ -268,6 +353,8 @@ class PlayerCharacter(Character):
 
     # Weapon Proficiencies
     weapon_proficiencies: List[str] = field(default_factory=list)
+    _proficiency_source: Optional[List[str]] = field(default=None, init=False, repr=False, compare=False)
+    _proficient_weapons: FrozenSet[str] = field(default=frozenset(), init=False, repr=False, compare=False)
 
     # Experience
     xp: int = 0
@@ -293,6 +380,24 @@ class PlayerCharacter(Character):
         self.inventory = Inventory(max_weight=max_weight)
         self.equipment = Equipment()
 
+    def get_proficient_weapons(self) -> FrozenSet[str]:
+        """
+        Get every weapon name this character is proficient with
+
+        Weapon groups are expanded once and cached; the cache is rebuilt
+        whenever weapon_proficiencies changes (appended to or reassigned).
+        """
+        if self._proficiency_source != self.weapon_proficiencies:
+            from ..systems.weapon_proficiency import get_weapon_proficiency_system
+            system = get_weapon_proficiency_system()
+            self._proficient_weapons = system.resolve_proficient_weapons(self.weapon_proficiencies)
+            self._proficiency_source = list(self.weapon_proficiencies)
+        return self._proficient_weapons
+
+    def is_proficient_with(self, weapon_name: str) -> bool:
+        """Check weapon proficiency (direct or via weapon group)"""
+        return weapon_name in self.get_proficient_weapons()
+
     def has_light(self) -> bool:
         """Check if character has an active light source"""
         return (self.equipment.light_source is not None and
@@ -390,8 +495,8 @@ class PlayerCharacter(Character):
                 return True
         return False
 
-    def has_spell_memorized(self, spell_name: str) -> bool:
-        """Check if a spell is memorized and available (supports partial matching)"""
+    def _find_spell_slot(self, spell_name: str) -> Optional[SpellSlot]:
+        """Find an unused slot holding a spell (exact name first, then partial match)"""
         search_lower = spell_name.lower()
 
         # First try exact match
@@ -399,38 +504,34 @@ class PlayerCharacter(Character):
             if (slot.spell and
                 slot.spell.name.lower() == search_lower and
                 not slot.is_used):
-                return True
+                return slot
 
         # Then try partial match (search term is in spell name)
         for slot in self.spells_memorized:
             if (slot.spell and
                 search_lower in slot.spell.name.lower() and
                 not slot.is_used):
-                return True
+                return slot
 
-        return False
+        return None
 
-    def use_spell_slot(self, spell_name: str) -> Optional[Spell]:
-        """Use a spell slot, returns the spell if successful (supports partial matching)"""
-        search_lower = spell_name.lower()
+    def has_spell_memorized(self, spell_name: str) -> bool:
+        """Check if a spell is memorized and available (supports partial matching)"""
+        return self._find_spell_slot(spell_name) is not None
 
-        # First try exact match
-        for slot in self.spells_memorized:
-            if (slot.spell and
-                slot.spell.name.lower() == search_lower and
-                not slot.is_used):
-                slot.is_used = True
-                return slot.spell
+    def get_memorized_spell(self, spell_name: str) -> Optional[Spell]:
+        """Get the spell a cast would use, without using the slot (supports partial matching)"""
+        slot = self._find_spell_slot(spell_name)
+        return slot.spell if slot else None
 
-        # Then try partial match (search term is in spell name)
-        for slot in self.spells_memorized:
-            if (slot.spell and
-                search_lower in slot.spell.name.lower() and
-                not slot.is_used):
-                slot.is_used = True
-                return slot.spell
+    def use_spell_slot(self, spell_name: str) -> Optional[Spell]:
+        """Use a spell slot, returns the spell if successful (supports partial matching)"""
+        slot = self._find_spell_slot(spell_name)
+        if not slot:
+            return None
 
-        return None
+        slot.is_used = True
+        return slot.spell
 
     def restore_spells(self) -> None:
         """Restore all spell slots (after rest)"""
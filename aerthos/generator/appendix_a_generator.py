@@ -3,15 +3,48 @@ Appendix A Dungeon Generator
 
 Generates dungeons using authentic AD&D 1e procedural tables from DMG Appendix A.
 Creates classic megadungeons with the feel of Gary Gygax's original method.
+
+Geometry is laid out on a grid of 10' squares. Every room claims its
+footprint (from the chamber size table) and every passage claims the
+squares it runs through, so rooms never overlap and their positions can be
+used directly for mapping.
 """
 
-import json
 import random
 import re
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Set
 from dataclasses import dataclass, field
-from collections import defaultdict
+from collections import defaultdict, deque
+
+from ..systems.data_cache import load_json
+from ..systems.roll_tables import RollTable, compile_roll_table
+
+
+Cell = Tuple[int, int]
+
+GRID_SCALE_FT = 10          # One grid square is 10' x 10'
+PASSAGE_SEGMENT = 3         # Squares of passage dug between periodic checks (30')
+MAX_PASSAGE_CHECKS = 6      # Checks before a passage that found nothing is a dead end
+PASSAGE = "#"               # Occupancy marker for passage squares
+
+# Footprints (in squares) for "unusual" chambers, whose size "varies"
+UNUSUAL_FOOTPRINTS = [(3, 3), (4, 4), (3, 5), (5, 3), (5, 5)]
+
+# Clockwise, so turning is index arithmetic
+COMPASS = ["north", "northeast", "east", "southeast", "south", "southwest", "west", "northwest"]
+DIRECTION_OFFSETS = {
+    "north": (0, -1), "northeast": (1, -1), "east": (1, 0), "southeast": (1, 1),
+    "south": (0, 1), "southwest": (-1, 1), "west": (-1, 0), "northwest": (-1, -1)
+}
+TURN_STEPS = {
+    "left_90": -2, "right_90": 2,
+    "left_45_ahead": -1, "right_45_ahead": 1,
+    "left_45_behind": -3, "right_45_behind": 3
+}
+
+# Walls tried, in order, when a dungeon needs more exits to reach its size
+REOPEN_ORDER = ["north", "east", "south", "west", "northeast", "southeast", "southwest", "northwest"]
 
 
 @dataclass
@@ -28,7 +61,8 @@ class DungeonRoom:
     sounds: List[str] = field(default_factory=list)
     description: str = ""
     light_level: str = "dark"
-    position: Tuple[int, int] = (0, 0)  # For mapping
+    position: Tuple[int, int] = (0, 0)  # Top-left grid square
+    footprint: Tuple[int, int] = (1, 1)  # Width, height in grid squares
     is_entrance: bool = False
 
 
@@ -51,13 +85,18 @@ class AppendixAGenerator:
             base_dir = Path(__file__).parent.parent
             tables_path = base_dir / "data" / "dmg_tables" / "appendix_a_dungeon.json"
 
-        with open(tables_path, 'r') as f:
-            self.tables = json.load(f)
+        self.tables = load_json(tables_path)
+
+        self.roll_tables = self._compile_tables()
 
         self.rooms: Dict[str, DungeonRoom] = {}
         self.room_counter = 0
         self.current_level = 1
 
+        # Spatial layout: grid square -> room id (or PASSAGE)
+        self.occupied: Dict[Cell, str] = {}
+        self.passages: List[Dict] = []
+
     def _roll_table(self, table_name: str, dice_type: str = "d20") -> Dict:
         """
         Roll on a DMG table
@@ -69,7 +108,7 @@ class AppendixAGenerator:
         Returns:
             Matching table entry
         """
-        table = self.tables[table_name]["table"]
+        table = self.roll_tables[table_name]
 
         # Roll appropriate die
         if dice_type == "d20":
@@ -81,23 +120,26 @@ class AppendixAGenerator:
         else:
             roll = random.randint(1, 20)
 
-        # Find matching entry
-        for entry in table:
-            roll_range = entry["roll"]
+        # Fallback - first entry for rolls off the table
+        return table.get(roll, table.entries[0])
 
-            # Handle ranges like "1-2", "11-13", etc.
-            if '-' in roll_range:
-                parts = roll_range.split('-')
-                min_roll = int(parts[0])
-                max_roll = int(parts[1])
-                if min_roll <= roll <= max_roll:
-                    return entry
-            # Handle single values like "17", "20"
-            elif roll == int(roll_range):
-                return entry
+    def _compile_tables(self) -> Dict[str, RollTable]:
+        """
+        Compile every ranged table to a roll -> entry lookup
 
-        # Fallback - return first entry
-        return table[0]
+        Plain tables are keyed by name ("periodic_check"); tables with several
+        columns by name and column ("chamber_size.room_table").
+        """
+        compiled = {}
+        for table_name, table_data in self.tables.items():
+            if not isinstance(table_data, dict):
+                continue
+            for column, entries in table_data.items():
+                if not (isinstance(entries, list) and entries and 'roll' in entries[0]):
+                    continue
+                key = table_name if column == "table" else f"{table_name}.{column}"
+                compiled[key] = compile_roll_table(entries, name=key)
+        return compiled
 
     def _generate_room_id(self) -> str:
         """Generate unique room ID"""
@@ -122,39 +164,38 @@ class AppendixAGenerator:
 
         return 1
 
-    def _create_chamber(self, is_room: bool = False) -> DungeonRoom:
+    def _roll_chamber_size(self, is_room: bool) -> Dict:
+        """Roll on the room or chamber column of the size table"""
+        roll = random.randint(1, 20)
+
+        if is_room:
+            size_table = self.roll_tables["chamber_size.room_table"]
+        else:
+            size_table = self.roll_tables["chamber_size.chamber_table"]
+
+        return size_table.get(roll, size_table.entries[0])
+
+    def _footprint(self, size_data: Dict) -> Tuple[int, int]:
+        """Grid footprint (width, height in squares) for a size table entry"""
+        match = re.match(r'(\d+)x(\d+)', size_data["size"])
+        if match:
+            return (max(1, int(match.group(1)) // GRID_SCALE_FT),
+                    max(1, int(match.group(2)) // GRID_SCALE_FT))
+        return random.choice(UNUSUAL_FOOTPRINTS)
+
+    def _create_chamber(self, is_room: bool = False, size_data: Optional[Dict] = None) -> DungeonRoom:
         """
         Create a chamber or room using size tables
 
         Args:
             is_room: If True, use room table; else use chamber table
+            size_data: Already rolled size entry (None = roll now)
 
         Returns:
             DungeonRoom instance
         """
-        # Roll for size (chamber_size has special structure)
-        roll = random.randint(1, 20)
-
-        if is_room:
-            size_table = self.tables["chamber_size"]["room_table"]
-        else:
-            size_table = self.tables["chamber_size"]["chamber_table"]
-
-        # Find matching entry
-        size_data = None
-        for entry in size_table:
-            roll_range = entry["roll"]
-            if '-' in roll_range:
-                min_r, max_r = map(int, roll_range.split('-'))
-                if min_r <= roll <= max_r:
-                    size_data = entry
-                    break
-            elif roll == int(roll_range):
-                size_data = entry
-                break
-
-        if not size_data:
-            size_data = size_table[0]  # Fallback
+        if size_data is None:
+            size_data = self._roll_chamber_size(is_room)
 
         # Roll for contents
         contents_data = self._roll_table("chamber_contents")
@@ -256,87 +297,55 @@ class AppendixAGenerator:
         self.rooms = {}
         self.room_counter = 0
         self.current_level = start_level
+        self.occupied = {}
+        self.passages = []
 
         # Create entrance
-        entrance = self._create_chamber(is_room=True)
+        size_data = self._roll_chamber_size(is_room=True)
+        entrance = self._create_chamber(is_room=True, size_data=size_data)
         entrance.id = "entrance"
         entrance.is_entrance = True
         entrance.contents = "empty"  # Entrance is always safe
         entrance.description = "The entrance to the dungeon. A passage leads deeper into the darkness."
+        entrance.footprint = self._footprint(size_data)
+        if not entrance.exits:
+            entrance.exits["north"] = None  # The entrance always leads somewhere
+        self._claim(entrance)
         self.rooms[entrance.id] = entrance
 
-        # Track rooms to expand
-        rooms_to_expand = [entrance]
-        rooms_created = 1
+        # Rooms with exits still to explore, and rooms that could take another exit
+        frontier = deque([entrance])
+        reopen = deque([entrance])
+
+        # Generate dungeon by expanding outward from the entrance
+        while len(self.rooms) < target_rooms:
+            if not frontier:
+                # Every passage ended early: open another wall somewhere
+                if not self._reopen_room(reopen, frontier):
+                    break
+                continue
 
-        # Generate dungeon by expanding from entrance
-        while rooms_to_expand and rooms_created < target_rooms:
-            current_room = rooms_to_expand.pop(0)
+            current_room = frontier.popleft()
 
-            # For each exit in current room
+            # For each unexplored exit in current room
             for direction, connection in list(current_room.exits.items()):
                 if connection is not None:
                     continue  # Already connected
 
-                if rooms_created >= target_rooms:
-                    # Dead end
+                if len(self.rooms) >= target_rooms:
                     current_room.exits[direction] = "dead_end"
                     continue
 
-                # Roll periodic check to see what's beyond
-                check_result = self._roll_table("periodic_check")
-                result_type = check_result["result"]
-
-                if result_type == "continue":
-                    # Passage continues - could add passage rooms here
-                    current_room.exits[direction] = "passage"
-
-                elif result_type == "door":
-                    # Door - check what's beyond
-                    door_type = self._create_door()
-                    current_room.doors[direction] = door_type
-
-                    beyond = self._roll_table("door_space_beyond")
-
-                    if beyond["result"] in ["room", "chamber"]:
-                        # Create new room
-                        new_room = self._create_chamber(is_room=(beyond["result"] == "room"))
-                        self.rooms[new_room.id] = new_room
-                        rooms_to_expand.append(new_room)
+                new_room = self._expand_exit(current_room, direction)
+                if new_room is not None:
+                    frontier.append(new_room)
+                    reopen.append(new_room)
 
-                        # Connect rooms
-                        current_room.exits[direction] = new_room.id
-                        opposite_dir = self._opposite_direction(direction)
-                        new_room.exits[opposite_dir] = current_room.id
-                        new_room.doors[opposite_dir] = door_type
-
-                        rooms_created += 1
-
-                elif result_type == "chamber":
-                    # Chamber directly
-                    new_chamber = self._create_chamber(is_room=False)
-                    self.rooms[new_chamber.id] = new_chamber
-                    rooms_to_expand.append(new_chamber)
-
-                    current_room.exits[direction] = new_chamber.id
-                    opposite_dir = self._opposite_direction(direction)
-                    new_chamber.exits[opposite_dir] = current_room.id
-
-                    rooms_created += 1
-
-                elif result_type == "stairs":
-                    # Stairs (future: connect to other levels)
-                    stairs_type = self._roll_table("stairs")
-                    current_room.exits[direction] = f"stairs_{stairs_type['type']}"
-
-                elif result_type == "dead_end":
-                    current_room.exits[direction] = "dead_end"
-
-                elif result_type == "trick_trap":
-                    # Add trap to current room or passage
-                    trap_data = self._roll_table("trick_trap")
-                    current_room.contents = "trick_trap"
-                    current_room.description = f"Trap: {trap_data['description']}"
+        # Exits never explored end in rubble
+        for room in self.rooms.values():
+            for direction, connection in room.exits.items():
+                if connection is None:
+                    room.exits[direction] = "dead_end"
 
         # Generate descriptions for all rooms
         self._generate_room_descriptions()
@@ -364,11 +373,204 @@ class AppendixAGenerator:
                 "dressing": room.dressing,
                 "sounds": room.sounds,
                 "safe_rest": (room.contents == "empty" and not room.sounds),
-                "is_entrance": room.is_entrance
+                "is_entrance": room.is_entrance,
+                "position": list(room.position),
+                "footprint": list(room.footprint)
             }
 
+        # Grid squares of every connecting passage, for map renderers
+        dungeon_dict["grid_scale_ft"] = GRID_SCALE_FT
+        dungeon_dict["passages"] = [
+            {"from": p["from"], "to": p["to"], "cells": [list(cell) for cell in p["cells"]]}
+            for p in self.passages
+        ]
+
         return dungeon_dict
 
+    def _expand_exit(self, room: DungeonRoom, direction: str) -> Optional[DungeonRoom]:
+        """
+        Follow a passage out of a room exit until it reaches a new room
+
+        Digs PASSAGE_SEGMENT squares at a time and rolls the periodic check
+        table after each stretch. Passages that run into existing rooms or
+        passages become dead ends; rooms that would not fit are skipped and
+        the passage carries on past the door.
+
+        Args:
+            room: Room the exit belongs to
+            direction: Exit direction
+
+        Returns:
+            The new room, or None if the exit led nowhere new
+        """
+        heading = direction
+        x, y = self._exit_cell(room, direction)
+        cells: List[Cell] = []
+
+        for _ in range(MAX_PASSAGE_CHECKS):
+            dx, dy = DIRECTION_OFFSETS[heading]
+            for _ in range(PASSAGE_SEGMENT):
+                if (x, y) in self.occupied:
+                    room.exits[direction] = "dead_end"  # Ran into existing geometry
+                    return None
+                self.occupied[(x, y)] = PASSAGE
+                cells.append((x, y))
+                x, y = x + dx, y + dy
+
+            # Roll periodic check to see what's beyond
+            check_result = self._roll_table("periodic_check")
+            result_type = check_result["result"]
+
+            if result_type == "turn":
+                turn = self._roll_table("passage_turn")
+                heading = self._turn(heading, turn["direction"])
+
+            elif result_type == "door":
+                door_type = self._create_door()
+                beyond = self._roll_table("door_space_beyond")
+
+                if beyond["result"] in ["room", "chamber"]:
+                    new_room = self._connect_new_room(room, direction, heading, cells,
+                                                      beyond["result"] == "room", door_type)
+                    if new_room is not None:
+                        return new_room
+
+            elif result_type == "chamber":
+                new_room = self._connect_new_room(room, direction, heading, cells, False, None)
+                if new_room is not None:
+                    return new_room
+
+            elif result_type == "stairs":
+                # Stairs (future: connect to other levels)
+                stairs_type = self._roll_table("stairs")
+                room.exits[direction] = f"stairs_{stairs_type['type']}"
+                return None
+
+            elif result_type == "dead_end":
+                break
+
+            elif result_type == "trick_trap":
+                # Add trap to the room the passage leads from
+                trap_data = self._roll_table("trick_trap")
+                if not room.is_entrance:
+                    room.contents = "trick_trap"
+                    room.description = f"Trap: {trap_data['description']}"
+
+            # continue / side_passage / wandering_monster: keep going
+
+        room.exits[direction] = "dead_end"
+        return None
+
+    def _connect_new_room(self, origin: DungeonRoom, direction: str, heading: str,
+                          cells: List[Cell], is_room: bool,
+                          door_type: Optional[str]) -> Optional[DungeonRoom]:
+        """
+        Place a new room at the end of a passage and link it to its origin
+
+        Returns:
+            The new room, or None if no placement fits the occupancy grid
+        """
+        size_data = self._roll_chamber_size(is_room)
+        footprint = self._footprint(size_data)
+        position = self._find_room_position(cells[-1], heading, footprint)
+        if position is None:
+            return None
+
+        new_room = self._create_chamber(is_room=is_room, size_data=size_data)
+        new_room.position = position
+        new_room.footprint = footprint
+        self._claim(new_room)
+        self.rooms[new_room.id] = new_room
+
+        # Connect rooms (the way back is opposite the final passage heading)
+        back = self._opposite_direction(heading)
+        origin.exits[direction] = new_room.id
+        new_room.exits[back] = origin.id
+        if door_type:
+            origin.doors[direction] = door_type
+            new_room.doors[back] = door_type
+
+        self.passages.append({"from": origin.id, "to": new_room.id, "cells": list(cells)})
+        return new_room
+
+    def _exit_cell(self, room: DungeonRoom, direction: str) -> Cell:
+        """First grid square outside a room wall in the given direction"""
+        x0, y0 = room.position
+        width, height = room.footprint
+        dx, dy = DIRECTION_OFFSETS[direction]
+
+        x = x0 + width if dx > 0 else x0 - 1 if dx < 0 else x0 + width // 2
+        y = y0 + height if dy > 0 else y0 - 1 if dy < 0 else y0 + height // 2
+        return (x, y)
+
+    def _find_room_position(self, end: Cell, heading: str,
+                            footprint: Tuple[int, int]) -> Optional[Cell]:
+        """
+        Find a free top-left square for a room entered from a passage end
+
+        The room sits just beyond the passage end. Along the wall the passage
+        enters, alignments are tried from centred outward, so a room blocked
+        on one side shifts sideways instead of being dropped.
+        """
+        ex, ey = end
+        dx, dy = DIRECTION_OFFSETS[heading]
+        width, height = footprint
+
+        xs = [ex + 1] if dx > 0 else [ex - width] if dx < 0 else self._alignments(ex, width)
+        ys = [ey + 1] if dy > 0 else [ey - height] if dy < 0 else self._alignments(ey, height)
+
+        for x0 in xs:
+            for y0 in ys:
+                if self._is_free(x0, y0, width, height):
+                    return (x0, y0)
+        return None
+
+    @staticmethod
+    def _alignments(center: int, length: int) -> List[int]:
+        """Start squares for a span that still covers `center`, centred first"""
+        start = center - length // 2
+        starts = [start]
+        for offset in range(1, length):
+            starts.extend((start - offset, start + offset))
+        return [s for s in starts if center - length < s <= center]
+
+    def _is_free(self, x0: int, y0: int, width: int, height: int) -> bool:
+        """True if no square of the rectangle is occupied"""
+        occupied = self.occupied
+        return not any((x, y) in occupied
+                       for x in range(x0, x0 + width)
+                       for y in range(y0, y0 + height))
+
+    def _claim(self, room: DungeonRoom):
+        """Mark a room's footprint as occupied"""
+        x0, y0 = room.position
+        width, height = room.footprint
+        for x in range(x0, x0 + width):
+            for y in range(y0, y0 + height):
+                self.occupied[(x, y)] = room.id
+
+    def _turn(self, heading: str, turn: str) -> str:
+        """Apply a passage turn result to a compass heading"""
+        steps = TURN_STEPS.get(turn, 0)
+        return COMPASS[(COMPASS.index(heading) + steps) % len(COMPASS)]
+
+    def _reopen_room(self, reopen: deque, frontier: deque) -> bool:
+        """
+        Give the next room with a free wall a new exit to explore
+
+        Returns:
+            False once no room can take another exit
+        """
+        while reopen:
+            room = reopen.popleft()
+            for direction in REOPEN_ORDER:
+                if direction not in room.exits:
+                    room.exits[direction] = None
+                    frontier.append(room)
+                    reopen.append(room)
+                    return True
+        return False
+
     def _opposite_direction(self, direction: str) -> str:
         """Get opposite compass direction"""
         opposites = {
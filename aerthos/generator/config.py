@@ -2,18 +2,29 @@
 Dungeon Generator Configuration
 """
 
-from dataclasses import dataclass, field
-from typing import List, Optional, Dict
+import hashlib
+import json
+from dataclasses import asdict, dataclass, replace
+from typing import Dict, Optional, Tuple
 from .monster_scaling import MonsterScaler
 
 
-@dataclass
+# Sequence fields, stored as tuples so configs stay immutable
+_TUPLE_FIELDS = ('monster_pool', 'starting_items', 'guaranteed_items')
+
+
+@dataclass(frozen=True)
 class DungeonConfig:
     """
     Configuration for procedural dungeon generation
 
     Controls all aspects of dungeon layout, difficulty, and content.
     Use seed for fixed/reproducible dungeons.
+
+    Configs are immutable, so the presets below can be shared safely.
+    Use derive() to get an adjusted copy:
+
+        config = STANDARD_DUNGEON.derive(party_level=3, seed=42)
     """
 
     # Generation control
@@ -38,9 +49,7 @@ class DungeonConfig:
     lethality_factor: float = 1.0  # Multiplier for encounter difficulty
 
     # Monster selection
-    monster_pool: List[str] = field(default_factory=lambda: [
-        'kobold', 'goblin', 'giant_rat', 'skeleton'
-    ])
+    monster_pool: Tuple[str, ...] = ('kobold', 'goblin', 'giant_rat', 'skeleton')
 
     # Rewards
     treasure_frequency: float = 0.4
@@ -58,11 +67,17 @@ class DungeonConfig:
     dungeon_theme: str = 'mine'  # 'mine', 'crypt', 'cave', 'ruins', 'sewer'
 
     # Item placement
-    starting_items: List[str] = field(default_factory=lambda: ['torch'])
-    guaranteed_items: List[str] = field(default_factory=list)  # Always include these
+    starting_items: Tuple[str, ...] = ('torch',)
+    guaranteed_items: Tuple[str, ...] = ()  # Always include these
 
     def __post_init__(self):
         """Validate configuration"""
+        # Accept lists from callers, keep tuples
+        for name in _TUPLE_FIELDS:
+            value = getattr(self, name)
+            if not isinstance(value, tuple):
+                object.__setattr__(self, name, tuple(value))
+
         if self.num_rooms < 3:
             raise ValueError("Must have at least 3 rooms")
 
@@ -75,6 +90,33 @@ class DungeonConfig:
         if self.treasure_level not in ['low', 'medium', 'high']:
             raise ValueError(f"Invalid treasure_level: {self.treasure_level}")
 
+    def derive(self, **changes) -> 'DungeonConfig':
+        """
+        Copy of this config with some fields changed
+
+        Args:
+            **changes: Field values to replace (validated like the constructor)
+
+        Returns:
+            New DungeonConfig; this one is left untouched
+        """
+        return replace(self, **changes)
+
+    def fingerprint(self) -> str:
+        """
+        Stable hash of everything that shapes a generated dungeon except the seed
+
+        Two configs with the same fingerprint and seed generate the same
+        dungeon, across processes and runs (used as the generation cache key).
+
+        Returns:
+            16-character hex digest
+        """
+        values = asdict(self)
+        del values['seed']
+        canonical = json.dumps(values, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16]
+
     @classmethod
     def for_party(cls, party_level: int, party_size: int = 4, difficulty: str = 'standard', **kwargs):
         """
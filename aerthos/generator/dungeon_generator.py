@@ -8,10 +8,179 @@ Supports fixed (seeded) and random generation.
 import random
 from typing import List, Dict, Set, Tuple, Optional
 from .config import DungeonConfig
-from ..systems.narrator import DMNarrator, NarrativeContext
+from ..systems.narrator import DMNarrator, NarrativeContext, get_narrator
 from ..systems.environment_filter import EnvironmentMonsterFilter, EnvironmentContext
 
 
+# Bump whenever a change alters what generate() produces for a given config
+# and seed; cached dungeons from other versions are then ignored
+GENERATOR_VERSION = 3
+
+
+# Theme-based description templates
+ROOM_THEMES = {
+    'mine': {
+        'titles': [
+            'Abandoned Shaft', 'Mining Tunnel', 'Ore Chamber', 'Cart Storage',
+            'Excavation Site', 'Collapsed Passage', 'Miners\' Rest', 'Tool Room',
+            'Vein Chamber', 'Deep Shaft', 'Crystal Cavern', 'Foreman\'s Office'
+        ],
+        'descriptions': [
+            'Wooden support beams creak ominously as you enter. Mining tools lie scattered about.',
+            'An old mining cart sits rusted on broken tracks. The air is thick with dust.',
+            'Pickaxes and shovels hang on the walls. A faint draft brings the smell of earth.',
+            'Broken lanterns and rope coils litter the floor. The ceiling drips with moisture.',
+            'Precious ore veins glimmer in the darkness. This was once a rich find.',
+            'The passage ahead has partially collapsed, forcing a narrow squeeze through rubble.'
+        ]
+    },
+    'crypt': {
+        'titles': [
+            'Burial Chamber', 'Tomb Entrance', 'Ossuary', 'Catacombs',
+            'Shrine of the Dead', 'Sarcophagus Hall', 'Bone Chapel', 'Crypt Passage',
+            'Memorial Hall', 'Ancient Vault', 'Sepulcher', 'Charnel House'
+        ],
+        'descriptions': [
+            'Stone coffins line the walls, their lids cracked and askew. The dead do not rest easy here.',
+            'Bones are piled in alcoves, sorted by type in macabre organization.',
+            'Faded frescoes of death and mourning cover the walls. Candles burn with unnatural flames.',
+            'The air is cold and still. You can almost hear whispers of those long departed.',
+            'Elaborate tombs bear the names of forgotten nobility. Dust covers everything.',
+            'Skeletal remains litter the floor. Whatever killed them still lurks nearby.'
+        ]
+    },
+    'cave': {
+        'titles': [
+            'Natural Cavern', 'Limestone Grotto', 'Underground Lake', 'Stalactite Chamber',
+            'Crystal Formation', 'Narrow Passage', 'Echo Chamber', 'Bat Roost',
+            'Flowstone Hall', 'Fault Line', 'Cave Pool', 'Fungus Grove'
+        ],
+        'descriptions': [
+            'Stalactites and stalagmites create a forest of stone. Water drips constantly.',
+            'The cave walls are slick with moisture. Strange fungi glow faintly in the darkness.',
+            'The passage narrows here, forcing you to squeeze through gaps in the rock.',
+            'A underground stream rushes past, its source and destination unknown.',
+            'The cave opens into a vast chamber. Bats screech overhead.',
+            'Crystals embedded in the walls catch what little light you have, sparkling mysteriously.'
+        ]
+    },
+    'ruins': {
+        'titles': [
+            'Ruined Hall', 'Collapsed Temple', 'Ancient Library', 'Throne Room',
+            'Armory', 'Fallen Tower', 'Statue Garden', 'Royal Vault',
+            'Forgotten Archive', 'Shattered Dome', 'Courtyard', 'Ceremonial Chamber'
+        ],
+        'descriptions': [
+            'Crumbling stonework and fallen pillars show the grandeur that once was.',
+            'Faded tapestries hang in tatters. Furniture has rotted to dust.',
+            'Shelves that once held countless books now hold only decay and cobwebs.',
+            'Broken statues watch over the room with vacant eyes. Rubble covers the floor.',
+            'The ceiling has partially collapsed, letting in shafts of dim light from above.',
+            'Intricate mosaics on the floor are barely visible under centuries of grime.'
+        ]
+    },
+    'sewer': {
+        'titles': [
+            'Main Sluice', 'Drainage Tunnel', 'Waste Channel', 'Junction Pool',
+            'Overflow Chamber', 'Filter Room', 'Pump Station', 'Cistern',
+            'Grate Chamber', 'Pipe Maze', 'Settling Pool', 'Access Shaft'
+        ],
+        'descriptions': [
+            'The stench is overwhelming. Dark water flows sluggishly through channels.',
+            'Slime covers every surface. You can hear rats skittering in the darkness.',
+            'Iron pipes run along the walls, some corroded and dripping foul liquid.',
+            'A deep pool of stagnant water blocks part of the passage. Who knows what lurks within?',
+            'The walls are carved with ancient drainage runes. They no longer function.',
+            'A rusted grate bars further passage. Something large has forced it open from the other side.'
+        ]
+    }
+}
+
+# Subtle hints appended to descriptions of rooms with a combat encounter
+MONSTER_HINTS = {
+    'kobold': ' You hear high-pitched chattering echoing from within.',
+    'goblin': ' The stench of goblin habitation is unmistakable.',
+    'orc': ' Guttural snoring echoes through the chamber.',
+    'skeleton': ' The air grows cold, and you sense something unnatural ahead.',
+    'giant_rat': ' You hear scratching and squeaking from the darkness.',
+    'ogre': ' Heavy footsteps and a foul stench warn of something massive ahead.'
+}
+DEFAULT_MONSTER_HINT = ' Something dangerous lurks within.'
+
+
+def render_room_description(seed: Dict, narrator: Optional[DMNarrator] = None) -> str:
+    """
+    Render a narrator room description from its description seed
+
+    The seed holds everything the narrator needs (theme, title, feature
+    index, RNG sub-seed, monster hint), so the same seed always renders
+    the same text - whether at generation time or on first visit.
+
+    Args:
+        seed: Description seed from DungeonGenerator
+        narrator: Narrator to render with (default: shared narrator)
+
+    Returns:
+        Description string
+    """
+    narrator = narrator or get_narrator()
+    theme = seed['theme']
+    theme_data = ROOM_THEMES.get(theme, ROOM_THEMES['mine'])
+    feature = theme_data['descriptions'][seed['feature']]
+    rng = random.Random(seed['seed'])
+
+    if seed.get('entrance'):
+        context = NarrativeContext(
+            location_type="dungeon",
+            atmosphere=[theme, "dark", "ancient"],
+            light_level="torch"
+        )
+        return narrator.describe_room_entrance(
+            room_type=f"{theme} entrance",
+            size="",
+            primary_features=[feature],
+            context=context,
+            rng=rng
+        )
+
+    # Determine room size from title
+    title_lower = seed['title'].lower()
+    if any(word in title_lower for word in ['vast', 'huge', 'grand']):
+        size = "vast"
+    elif any(word in title_lower for word in ['large', 'great']):
+        size = "large"
+    else:
+        size = ""
+
+    # Determine atmosphere
+    atmosphere = [theme]
+    if 'abandoned' in title_lower or 'ruined' in title_lower:
+        atmosphere.append('abandoned')
+    if 'dark' in title_lower or 'shadow' in title_lower:
+        atmosphere.append('dark')
+    if 'ancient' in title_lower or 'old' in title_lower:
+        atmosphere.append('ancient')
+
+    context = NarrativeContext(
+        location_type="dungeon",
+        atmosphere=atmosphere,
+        light_level="torch"
+    )
+
+    description = narrator.describe_room_entrance(
+        room_type=title_lower,
+        size=size,
+        primary_features=[feature],
+        context=context,
+        rng=rng
+    )
+
+    if seed.get('hint'):
+        description += MONSTER_HINTS.get(seed['hint'], DEFAULT_MONSTER_HINT)
+
+    return description
+
+
 class DungeonGenerator:
     """
     Procedural dungeon generation
@@ -21,98 +190,27 @@ class DungeonGenerator:
     reproducible dungeons.
     """
 
-    def __init__(self, game_data=None, use_narrator=True):
+    def __init__(self, game_data=None, use_narrator=True, lazy_descriptions=False, cache=None):
         """
         Initialize generator
 
         Args:
             game_data: GameData instance with monsters/items (optional)
             use_narrator: If True, use DMNarrator for atmospheric descriptions
+            lazy_descriptions: If True, rooms carry a 'description_seed' instead of
+                a rendered narrator 'description'; Room renders it on first visit
+            cache: Optional DungeonCache; seeded dungeons are served from it
+                and stored in it
         """
         self.game_data = game_data
+        self.cache = cache
         self.rng = random.Random()
         self.use_narrator = use_narrator
+        self.lazy_descriptions = lazy_descriptions
         self.narrator = DMNarrator() if use_narrator else None
         self.environment_filter = EnvironmentMonsterFilter()
 
-        # Theme-based description templates
-        self.themes = {
-            'mine': {
-                'titles': [
-                    'Abandoned Shaft', 'Mining Tunnel', 'Ore Chamber', 'Cart Storage',
-                    'Excavation Site', 'Collapsed Passage', 'Miners\' Rest', 'Tool Room',
-                    'Vein Chamber', 'Deep Shaft', 'Crystal Cavern', 'Foreman\'s Office'
-                ],
-                'descriptions': [
-                    'Wooden support beams creak ominously as you enter. Mining tools lie scattered about.',
-                    'An old mining cart sits rusted on broken tracks. The air is thick with dust.',
-                    'Pickaxes and shovels hang on the walls. A faint draft brings the smell of earth.',
-                    'Broken lanterns and rope coils litter the floor. The ceiling drips with moisture.',
-                    'Precious ore veins glimmer in the darkness. This was once a rich find.',
-                    'The passage ahead has partially collapsed, forcing a narrow squeeze through rubble.'
-                ]
-            },
-            'crypt': {
-                'titles': [
-                    'Burial Chamber', 'Tomb Entrance', 'Ossuary', 'Catacombs',
-                    'Shrine of the Dead', 'Sarcophagus Hall', 'Bone Chapel', 'Crypt Passage',
-                    'Memorial Hall', 'Ancient Vault', 'Sepulcher', 'Charnel House'
-                ],
-                'descriptions': [
-                    'Stone coffins line the walls, their lids cracked and askew. The dead do not rest easy here.',
-                    'Bones are piled in alcoves, sorted by type in macabre organization.',
-                    'Faded frescoes of death and mourning cover the walls. Candles burn with unnatural flames.',
-                    'The air is cold and still. You can almost hear whispers of those long departed.',
-                    'Elaborate tombs bear the names of forgotten nobility. Dust covers everything.',
-                    'Skeletal remains litter the floor. Whatever killed them still lurks nearby.'
-                ]
-            },
-            'cave': {
-                'titles': [
-                    'Natural Cavern', 'Limestone Grotto', 'Underground Lake', 'Stalactite Chamber',
-                    'Crystal Formation', 'Narrow Passage', 'Echo Chamber', 'Bat Roost',
-                    'Flowstone Hall', 'Fault Line', 'Cave Pool', 'Fungus Grove'
-                ],
-                'descriptions': [
-                    'Stalactites and stalagmites create a forest of stone. Water drips constantly.',
-                    'The cave walls are slick with moisture. Strange fungi glow faintly in the darkness.',
-                    'The passage narrows here, forcing you to squeeze through gaps in the rock.',
-                    'A underground stream rushes past, its source and destination unknown.',
-                    'The cave opens into a vast chamber. Bats screech overhead.',
-                    'Crystals embedded in the walls catch what little light you have, sparkling mysteriously.'
-                ]
-            },
-            'ruins': {
-                'titles': [
-                    'Ruined Hall', 'Collapsed Temple', 'Ancient Library', 'Throne Room',
-                    'Armory', 'Fallen Tower', 'Statue Garden', 'Royal Vault',
-                    'Forgotten Archive', 'Shattered Dome', 'Courtyard', 'Ceremonial Chamber'
-                ],
-                'descriptions': [
-                    'Crumbling stonework and fallen pillars show the grandeur that once was.',
-                    'Faded tapestries hang in tatters. Furniture has rotted to dust.',
-                    'Shelves that once held countless books now hold only decay and cobwebs.',
-                    'Broken statues watch over the room with vacant eyes. Rubble covers the floor.',
-                    'The ceiling has partially collapsed, letting in shafts of dim light from above.',
-                    'Intricate mosaics on the floor are barely visible under centuries of grime.'
-                ]
-            },
-            'sewer': {
-                'titles': [
-                    'Main Sluice', 'Drainage Tunnel', 'Waste Channel', 'Junction Pool',
-                    'Overflow Chamber', 'Filter Room', 'Pump Station', 'Cistern',
-                    'Grate Chamber', 'Pipe Maze', 'Settling Pool', 'Access Shaft'
-                ],
-                'descriptions': [
-                    'The stench is overwhelming. Dark water flows sluggishly through channels.',
-                    'Slime covers every surface. You can hear rats skittering in the darkness.',
-                    'Iron pipes run along the walls, some corroded and dripping foul liquid.',
-                    'A deep pool of stagnant water blocks part of the passage. Who knows what lurks within?',
-                    'The walls are carved with ancient drainage runes. They no longer function.',
-                    'A rusted grate bars further passage. Something large has forced it open from the other side.'
-                ]
-            }
-        }
+        self.themes = ROOM_THEMES
 
     def generate(self, config: DungeonConfig) -> Dict:
         """
@@ -124,6 +222,28 @@ class DungeonGenerator:
         Returns:
             Dictionary representing dungeon (compatible with JSON format)
         """
+        if self.cache is not None and config.seed is not None:
+            version = self.cache_version()
+            dungeon_data = self.cache.get(config, version)
+            if dungeon_data is None:
+                dungeon_data = self._generate(config)
+                self.cache.put(config, version, dungeon_data)
+            return dungeon_data
+
+        return self._generate(config)
+
+    def cache_version(self) -> str:
+        """Generator version plus the output options that change generated dicts"""
+        if not self.use_narrator:
+            style = 'plain'
+        elif self.lazy_descriptions:
+            style = 'lazy'
+        else:
+            style = 'narrated'
+        return f"v{GENERATOR_VERSION}{style}"
+
+    def _generate(self, config: DungeonConfig) -> Dict:
+        """Build a dungeon dictionary from scratch"""
         # Set random seed if provided (for reproducible dungeons)
         if config.seed is not None:
             self.rng.seed(config.seed)
@@ -336,7 +456,7 @@ class DungeonGenerator:
 
         # Add starting items to first room
         if config.starting_items:
-            rooms['room_001']['items'] = config.starting_items.copy()
+            rooms['room_001']['items'] = list(config.starting_items)
             rooms['room_001']['light_level'] = 'dim'
 
         return rooms
@@ -368,7 +488,9 @@ class DungeonGenerator:
         for room_id in sorted_rooms:
             room_num = int(room_id.split('_')[1])
 
-            for connected_id in room_graph[room_id]:
+            # Sorted too: set order depends on PYTHONHASHSEED, and seeded
+            # dungeons must come out the same in every process
+            for connected_id in sorted(room_graph[room_id], key=lambda r: int(r.split('_')[1])):
                 # Create a canonical pair identifier (always smaller room first)
                 pair = tuple(sorted([room_id, connected_id],
                                    key=lambda r: int(r.split('_')[1])))
@@ -567,15 +689,26 @@ class DungeonGenerator:
             rooms[room_id]['safe_rest'] = True
 
     def _add_descriptions(self, rooms: Dict, config: DungeonConfig):
-        """Add thematic titles and descriptions to rooms"""
+        """
+        Add thematic titles and descriptions to rooms
+
+        Narrator descriptions are reduced to a compact seed per room and
+        rendered by render_room_description() - right away, or on first
+        visit when lazy_descriptions is set. Their RNG sub-seeds come from a
+        separate RNG per room, so narration never shifts self.rng and a seed
+        lays out the same rooms, encounters and treasure in every mode.
+        """
+        # Unseeded dungeons still get one fixed base for all their descriptions
+        description_base = config.seed if config.seed is not None else random.getrandbits(32)
         theme = config.dungeon_theme
         theme_data = self.themes.get(theme, self.themes['mine'])
 
         titles = theme_data['titles'].copy()
-        descriptions = theme_data['descriptions'].copy()
+        description_order = list(range(len(theme_data['descriptions'])))
 
         self.rng.shuffle(titles)
-        self.rng.shuffle(descriptions)
+        self.rng.shuffle(description_order)
+        descriptions = [theme_data['descriptions'][k] for k in description_order]
 
         for i, room_id in enumerate(sorted(rooms.keys())):
             # First room gets special treatment
@@ -584,18 +717,13 @@ class DungeonGenerator:
 
                 if self.use_narrator and self.narrator:
                     # Use DMNarrator for atmospheric entrance description
-                    context = NarrativeContext(
-                        location_type="dungeon",
-                        atmosphere=[theme, "dark", "ancient"],
-                        light_level="torch"
-                    )
-                    base_desc = self.narrator.describe_room_entrance(
-                        room_type=f"{theme} entrance",
-                        size="",
-                        primary_features=[self.rng.choice(descriptions)],
-                        context=context
-                    )
-                    rooms[room_id]['description'] = base_desc
+                    self._set_description_seed(rooms[room_id], {
+                        'theme': theme,
+                        'title': rooms[room_id]['title'],
+                        'feature': description_order[self.rng.randrange(len(descriptions))],
+                        'seed': self._description_subseed(description_base, room_id),
+                        'entrance': True
+                    })
                 else:
                     # Fall back to original simple description
                     rooms[room_id]['description'] = f"The entrance to a dark {theme}. " + \
@@ -603,65 +731,46 @@ class DungeonGenerator:
             else:
                 rooms[room_id]['title'] = titles[i % len(titles)]
 
+                # Encounter hint (first encounter's lead monster)
+                hint = None
+                if rooms[room_id]['encounters']:
+                    encounter = rooms[room_id]['encounters'][0]
+                    if encounter['type'] == 'combat':
+                        hint = encounter['monsters'][0]
+
                 if self.use_narrator and self.narrator:
                     # Use DMNarrator for atmospheric room descriptions
-                    # Determine room size from title
-                    title_lower = titles[i % len(titles)].lower()
-                    if any(word in title_lower for word in ['vast', 'huge', 'grand']):
-                        size = "vast"
-                    elif any(word in title_lower for word in ['large', 'great']):
-                        size = "large"
-                    else:
-                        size = ""
-
-                    # Determine atmosphere
-                    atmosphere = [theme]
-                    if 'abandoned' in title_lower or 'ruined' in title_lower:
-                        atmosphere.append('abandoned')
-                    if 'dark' in title_lower or 'shadow' in title_lower:
-                        atmosphere.append('dark')
-                    if 'ancient' in title_lower or 'old' in title_lower:
-                        atmosphere.append('ancient')
-
-                    context = NarrativeContext(
-                        location_type="dungeon",
-                        atmosphere=atmosphere,
-                        light_level="torch"
-                    )
-
-                    # Extract room type from title
-                    room_type = titles[i % len(titles)].lower()
-
-                    rooms[room_id]['description'] = self.narrator.describe_room_entrance(
-                        room_type=room_type,
-                        size=size,
-                        primary_features=[descriptions[i % len(descriptions)]],
-                        context=context
-                    )
+                    seed = {
+                        'theme': theme,
+                        'title': rooms[room_id]['title'],
+                        'feature': description_order[i % len(descriptions)],
+                        'seed': self._description_subseed(description_base, room_id)
+                    }
+                    if hint:
+                        seed['hint'] = hint
+                    self._set_description_seed(rooms[room_id], seed)
                 else:
                     # Fall back to original simple description
                     rooms[room_id]['description'] = descriptions[i % len(descriptions)]
-
-                # Add encounter hints
-                if rooms[room_id]['encounters']:
-                    encounter = rooms[room_id]['encounters'][0]
-                    if encounter['type'] == 'combat':
-                        rooms[room_id]['description'] += self._add_monster_hint(encounter['monsters'])
+                    if hint:
+                        rooms[room_id]['description'] += self._add_monster_hint([hint])
+
+    @staticmethod
+    def _description_subseed(base: int, room_id: str) -> int:
+        """Narrator RNG sub-seed for one room (string seeds hash the same in every process)"""
+        return random.Random(f"{base}:{room_id}").getrandbits(32)
+
+    def _set_description_seed(self, room: Dict, seed: Dict):
+        """Store a description seed, or render it now unless descriptions are lazy"""
+        if self.lazy_descriptions:
+            room.pop('description', None)
+            room['description_seed'] = seed
+        else:
+            room['description'] = render_room_description(seed, self.narrator)
 
     def _add_monster_hint(self, monsters: List[str]) -> str:
         """Add subtle hint about monsters in description"""
-        monster_type = monsters[0]
-
-        hints = {
-            'kobold': ' You hear high-pitched chattering echoing from within.',
-            'goblin': ' The stench of goblin habitation is unmistakable.',
-            'orc': ' Guttural snoring echoes through the chamber.',
-            'skeleton': ' The air grows cold, and you sense something unnatural ahead.',
-            'giant_rat': ' You hear scratching and squeaking from the darkness.',
-            'ogre': ' Heavy footsteps and a foul stench warn of something massive ahead.'
-        }
-
-        return hints.get(monster_type, ' Something dangerous lurks within.')
+        return MONSTER_HINTS.get(monsters[0], DEFAULT_MONSTER_HINT)
 
     def _add_boss_encounter(self, rooms: Dict, config: DungeonConfig):
         """Add a boss encounter to the final room"""
@@ -704,7 +813,8 @@ class DungeonGenerator:
             'magic_items': magic_items_in_treasure
         }
 
-        # Update description
+        # Update description (replaces any deferred narrator description)
+        rooms[final_room].pop('description_seed', None)
         rooms[final_room]['description'] = (
             f"The final chamber of the {config.dungeon_theme}. "
             f"A massive {boss.upper()} guards a pile of glittering treasure! "
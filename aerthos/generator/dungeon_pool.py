@@ -0,0 +1,255 @@
+"""
+Pre-generated Dungeon Pool
+
+Keeps a small stock of ready-made dungeons per DungeonConfig profile,
+refilled in the background by worker processes. New games pop a ready
+dungeon instead of generating inline, so time-to-first-room stays near
+zero even when many games start at once.
+
+Workers return plain dungeon dictionaries (the generator output format),
+and every acquire() builds fresh Dungeon objects from its own dictionary,
+so pooled dungeons are never shared between games.
+"""
+
+import random
+import threading
+from collections import deque
+from dataclasses import replace
+from typing import Deque, Dict, Optional, Tuple, Union, TYPE_CHECKING
+
+from .config import DungeonConfig, EASY_DUNGEON, STANDARD_DUNGEON, HARD_DUNGEON
+from ..world.dungeon import Dungeon
+from ..world.multilevel_dungeon import MultiLevelDungeon
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+
+# Profiles kept warm by default (the presets offered by both UIs)
+DEFAULT_PROFILES = {
+    'easy': EASY_DUNGEON,
+    'standard': STANDARD_DUNGEON,
+    'hard': HARD_DUNGEON
+}
+
+PoolKey = Tuple[str, int]  # (profile name, party level)
+
+
+def generate_dungeon_data(config: DungeonConfig) -> Dict:
+    """
+    Generate one dungeon as a dictionary (runs inside a worker)
+
+    Multi-level configs (num_levels > 1) go through MultiLevelGenerator,
+    everything else through DungeonGenerator.
+    """
+    if config.num_levels > 1:
+        from .multilevel_generator import MultiLevelGenerator
+
+        return MultiLevelGenerator().generate_to_dict(
+            num_levels=config.num_levels,
+            rooms_per_level=config.num_rooms,
+            dungeon_name=f"The {config.dungeon_theme.capitalize()} Depths",
+            seed=config.seed
+        )
+
+    from .dungeon_generator import DungeonGenerator
+    return DungeonGenerator(lazy_descriptions=True).generate(config)
+
+
+def build_dungeon(dungeon_data: Dict) -> Union[Dungeon, MultiLevelDungeon]:
+    """Build a Dungeon or MultiLevelDungeon from generator output"""
+    if 'levels' in dungeon_data and 'current_level' in dungeon_data:
+        return MultiLevelDungeon.from_dict(dungeon_data)
+    return Dungeon.load_from_generator(dungeon_data)
+
+
+def _reseed_worker():
+    """
+    Give each worker process its own random state
+
+    Forked workers inherit the parent's module-level random state, which
+    MultiLevelGenerator draws its master seed from when none is given.
+    Without reseeding, every worker would produce the same dungeon.
+    """
+    random.seed()
+
+
+class DungeonPool:
+    """
+    Background pool of pre-generated dungeons
+
+    Usage:
+        pool = DungeonPool(target_size=2)
+        pool.start()                                 # Begin filling default profiles
+        dungeon = pool.acquire('standard')           # Instant if one is ready
+        dungeon = pool.acquire('hard', party_level=3)
+        pool.shutdown()
+
+    Each (profile, party_level) combination gets its own stock. Profiles are
+    warmed at their configured party level on start(); other levels are
+    stocked after their first request. A miss never blocks on the pool - it
+    generates inline exactly as before.
+    """
+
+    def __init__(self, profiles: Dict[str, DungeonConfig] = None, target_size: int = 2,
+                 max_workers: Optional[int] = None, use_processes: bool = True):
+        """
+        Initialize pool
+
+        Args:
+            profiles: Profile name -> DungeonConfig (defaults to easy/standard/hard presets)
+            target_size: Ready dungeons to keep per (profile, party level)
+            max_workers: Worker count (None = executor default)
+            use_processes: Use worker processes (True) or threads (False)
+        """
+        # Configs are immutable, so the shared presets can be used directly
+        self.profiles: Dict[str, DungeonConfig] = dict(profiles or DEFAULT_PROFILES)
+        self.target_size = target_size
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+
+        self._ready: Dict[PoolKey, Deque[Dict]] = {}
+        self._pending: Dict[PoolKey, int] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional['Executor'] = None
+        self._closed = False
+
+        self.hits = 0
+        self.misses = 0
+
+    def start(self) -> 'DungeonPool':
+        """Start workers and begin filling every profile at its configured level"""
+        if self.target_size <= 0:
+            return self
+
+        # concurrent.futures (and multiprocessing) are only imported once a pool starts
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+        with self._lock:
+            if self._executor is None and not self._closed:
+                if self.use_processes:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers, initializer=_reseed_worker)
+                else:
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+        for name, config in self.profiles.items():
+            self._refill((name, config.party_level))
+
+        return self
+
+    def acquire(self, profile: str, party_level: Optional[int] = None) -> Union[Dungeon, MultiLevelDungeon]:
+        """
+        Get a dungeon for a profile, generating inline if none is ready
+
+        Args:
+            profile: Profile name (e.g. 'standard')
+            party_level: Party level (None = the profile's configured level)
+
+        Returns:
+            Dungeon or MultiLevelDungeon instance
+
+        Raises:
+            KeyError: If the profile is not registered
+        """
+        key = self._key(profile, party_level)
+
+        with self._lock:
+            stock = self._ready.get(key)
+            dungeon_data = stock.popleft() if stock else None
+            if dungeon_data is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if dungeon_data is None:
+            dungeon_data = generate_dungeon_data(self._config_for(key))
+
+        self._refill(key)
+        return build_dungeon(dungeon_data)
+
+    def ready_count(self, profile: str, party_level: Optional[int] = None) -> int:
+        """Number of ready dungeons for a profile"""
+        key = self._key(profile, party_level)
+        with self._lock:
+            return len(self._ready.get(key, ()))
+
+    def register_profile(self, name: str, config: DungeonConfig, warm: bool = True) -> None:
+        """
+        Add (or replace) a profile
+
+        Args:
+            name: Profile name
+            config: Config to generate with
+            warm: Start filling immediately if the pool is running
+        """
+        config = replace(config)  # Fresh identity, so jobs for the old profile are dropped
+        with self._lock:
+            self.profiles[name] = config
+            for key in [k for k in self._ready if k[0] == name]:
+                del self._ready[key]
+
+        if warm:
+            self._refill((name, config.party_level))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop workers; subsequent acquire() calls generate inline"""
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _key(self, profile: str, party_level: Optional[int]) -> PoolKey:
+        if profile not in self.profiles:
+            raise KeyError(f"Unknown dungeon profile: {profile}")
+        if party_level is None:
+            party_level = self.profiles[profile].party_level
+        return (profile, party_level)
+
+    def _config_for(self, key: PoolKey) -> DungeonConfig:
+        """Config for a pool key (never mutates the registered preset)"""
+        name, party_level = key
+        config = self.profiles[name]
+        if config.party_level == party_level:
+            return config
+        return config.derive(party_level=party_level)
+
+    def _refill(self, key: PoolKey) -> None:
+        """Schedule enough background jobs to bring a key back to target size"""
+        with self._lock:
+            if self._executor is None:
+                return
+
+            ready = len(self._ready.setdefault(key, deque()))
+            pending = self._pending.get(key, 0)
+            missing = self.target_size - ready - pending
+            if missing <= 0:
+                return
+
+            profile_config = self.profiles[key[0]]
+            config = self._config_for(key)
+            self._pending[key] = pending + missing
+            futures = [self._executor.submit(generate_dungeon_data, config) for _ in range(missing)]
+
+        for future in futures:
+            future.add_done_callback(
+                lambda f, key=key, base=profile_config: self._on_generated(key, base, f))
+
+    def _on_generated(self, key: PoolKey, profile_config: DungeonConfig, future) -> None:
+        """Worker finished: stock the dungeon (or drop a failed job)"""
+        with self._lock:
+            self._pending[key] = max(0, self._pending.get(key, 0) - 1)
+
+            if future.cancelled():
+                return
+
+            error = future.exception()
+            if error is not None:
+                print(f"Warning: background dungeon generation failed for {key[0]}: {error}")
+                return
+
+            # Drop results generated for a profile that has since been replaced
+            if self.profiles.get(key[0]) is profile_config:
+                self._ready.setdefault(key, deque()).append(future.result())
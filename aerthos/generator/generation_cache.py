@@ -0,0 +1,188 @@
+"""
+Dungeon Generation Cache
+
+Seeded generation is deterministic, so a generated dungeon can be stored
+and served again instead of being rebuilt. Entries are generator output
+dictionaries saved as JSON files named after their key:
+
+    <config fingerprint>-<seed>-<generator version>.json
+
+The generator version changes whenever generation code changes, so stale
+entries are simply never looked up again and age out of the LRU.
+
+Unseeded configs are random by design and never cached.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+from .config import DungeonConfig
+
+
+# Environment override for the cache location
+ENV_CACHE_DIR = 'AERTHOS_DUNGEON_CACHE'
+
+# Entries kept on disk before the least recently used are evicted
+DEFAULT_MAX_ENTRIES = 256
+
+
+class DungeonCache:
+    """
+    On-disk LRU cache of generated dungeon dictionaries
+
+    Usage:
+        cache = DungeonCache()
+        data = cache.get(config, generator.cache_version())
+        if data is None:
+            data = generator.generate(config)
+            cache.put(config, generator.cache_version(), data)
+
+    DungeonGenerator(cache=...) does this automatically.
+    """
+
+    def __init__(self, cache_dir: str = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Args:
+            cache_dir: Directory for entries (default: $AERTHOS_DUNGEON_CACHE
+                or ~/.aerthos/dungeon_cache)
+            max_entries: Entries kept before evicting the least recently used
+        """
+        if cache_dir is None:
+            cache_dir = os.environ.get(ENV_CACHE_DIR) or Path.home() / '.aerthos' / 'dungeon_cache'
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(config: DungeonConfig, version: str) -> Optional[str]:
+        """
+        Cache key for a config (None if the config is unseeded)
+
+        Args:
+            config: Generation config
+            version: Generator version string (see DungeonGenerator.cache_version)
+        """
+        if config.seed is None:
+            return None
+        return f"{config.fingerprint()}-{config.seed}-{version}"
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, config: DungeonConfig, version: str) -> Optional[Dict]:
+        """
+        Look up a generated dungeon
+
+        Returns:
+            A fresh copy of the cached dictionary, or None on a miss
+        """
+        key = self.key(config, version)
+        if key is None:
+            return None
+
+        path = self._path(key)
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError) as e:
+            print(f"Warning: discarding unreadable dungeon cache entry {path.name}: {e}")
+            self._remove(path)
+            self.misses += 1
+            return None
+
+        # Mark as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        self.hits += 1
+        return data
+
+    def put(self, config: DungeonConfig, version: str, data: Dict) -> bool:
+        """
+        Store a generated dungeon
+
+        Written to a temporary file and renamed into place, so concurrent
+        readers never see a partial entry.
+
+        Returns:
+            True if stored (False for unseeded configs or write errors)
+        """
+        key = self.key(config, version)
+        if key is None:
+            return False
+
+        import tempfile  # Only needed when storing; keeps it off the startup path
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix='.tmp-', suffix='.json')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(data, f, separators=(',', ':'))
+                os.replace(tmp_path, self._path(key))
+            except BaseException:
+                self._remove(Path(tmp_path))
+                raise
+        except OSError as e:
+            print(f"Warning: could not write dungeon cache entry {key}: {e}")
+            return False
+
+        self._evict()
+        return True
+
+    def _entries(self):
+        return [path for path in self.cache_dir.glob('*.json') if not path.name.startswith('.tmp-')]
+
+    def _evict(self) -> None:
+        """Drop least recently used entries beyond max_entries"""
+        entries = self._entries()
+        excess = len(entries) - self.max_entries
+        if excess <= 0:
+            return
+
+        def last_used(path: Path) -> float:
+            try:
+                return path.stat().st_mtime
+            except OSError:
+                return 0.0
+
+        for path in sorted(entries, key=last_used)[:excess]:
+            self._remove(path)
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        """Remove every entry"""
+        if self.cache_dir.exists():
+            for path in self._entries():
+                self._remove(path)
+
+    def __len__(self) -> int:
+        if not self.cache_dir.exists():
+            return 0
+        return len(self._entries())
+
+
+_dungeon_cache: Optional[DungeonCache] = None
+
+
+def get_dungeon_cache() -> DungeonCache:
+    """Shared cache in the default location"""
+    global _dungeon_cache
+    if _dungeon_cache is None:
+        _dungeon_cache = DungeonCache()
+    return _dungeon_cache
@@ -1,10 +1,156 @@
 """
 Monster scaling utilities for party-level appropriate encounters
+
+Monster data is indexed once per data file and shared by every
+MonsterScaler: a sorted hit-dice index answers range queries with bisect,
+and secondary indexes cover XP value, size and environment. The default
+index is built from the compiled monster database's header, so full
+records are only parsed for monsters that are actually used.
 """
 
-import re
-from typing import List, Dict, Optional
 import json
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import List, Dict, FrozenSet, Mapping, Optional, Tuple
+
+from ..systems.monster_database import (
+    MONSTER_SOURCE, MonsterHeader, environment_tags, get_monster_database
+)
+
+
+DATA_DIR = Path(__file__).parent.parent / 'data'
+DEFAULT_MONSTERS_PATH = MONSTER_SOURCE
+
+# Used when no monster falls inside the party's HD range
+FALLBACK_POOL = ['kobold', 'goblin', 'giant_rat', 'skeleton']
+
+# Boss-worthy monsters, in order of preference
+PREFERRED_BOSSES = ['ogre', 'wight', 'troll', 'gargoyle', 'wraith',
+                    'young_dragon_white', 'basilisk', 'minotaur']
+
+
+class MonsterIndex:
+    """
+    Read-only indexes over one monsters.json file
+
+    Built once and shared between MonsterScaler instances (see
+    get_monster_index). Range queries return monsters in ascending order
+    of the indexed value; ties keep data file order.
+    """
+
+    def __init__(self, monsters: Mapping[str, Dict], environment_path: Optional[Path] = None,
+                 headers: Optional[Dict[str, MonsterHeader]] = None,
+                 environments: Optional[Dict[str, FrozenSet[str]]] = None):
+        """
+        Build indexes
+
+        Args:
+            monsters: Monster ID -> monster data
+            environment_path: monster_environments.json for the environment index
+            headers: Precompiled header entries to index instead of the full records
+            environments: Precompiled environment index (skips environment_path)
+        """
+        self.monsters = monsters
+        self.environment_path = environment_path
+
+        if headers is not None:
+            rows = [(monster_id, header.hit_dice, header.xp_value, header.size)
+                    for monster_id, header in headers.items()]
+        else:
+            rows = [(monster_id, data.get('hit_dice', '1d8'), data.get('xp_value', 0), data.get('size', 'M'))
+                    for monster_id, data in monsters.items()]
+
+        # Sorted HD index (parallel arrays for bisect)
+        by_hd = sorted(
+            (MonsterScaler.parse_hit_dice(hit_dice), position, monster_id)
+            for position, (monster_id, hit_dice, _, _) in enumerate(rows)
+        )
+        self.hd_keys: List[float] = [hd for hd, _, _ in by_hd]
+        self.hd_ids: List[str] = [monster_id for _, _, monster_id in by_hd]
+        self.hd_by_id: Dict[str, float] = {monster_id: hd for hd, _, monster_id in by_hd}
+
+        # Sorted XP index
+        by_xp = sorted(
+            (xp_value, position, monster_id)
+            for position, (monster_id, _, xp_value, _) in enumerate(rows)
+        )
+        self.xp_keys: List[int] = [xp for xp, _, _ in by_xp]
+        self.xp_ids: List[str] = [monster_id for _, _, monster_id in by_xp]
+
+        # Size index (S/M/L)
+        by_size: Dict[str, List[str]] = {}
+        for monster_id, _, _, size in rows:
+            by_size.setdefault(size, []).append(monster_id)
+        self.by_size: Dict[str, Tuple[str, ...]] = {size: tuple(ids) for size, ids in by_size.items()}
+
+        self._by_environment: Optional[Dict[str, FrozenSet[str]]] = environments
+
+        # Cached selections per (party level, party size)
+        self.pools: Dict[Tuple[int, int], Tuple[str, ...]] = {}
+        self.bosses: Dict[Tuple[int, int], str] = {}
+
+    def hd_range(self, min_hd: float, max_hd: float) -> Tuple[int, int]:
+        """Slice bounds into hd_ids for min_hd <= HD <= max_hd"""
+        return bisect_left(self.hd_keys, min_hd), bisect_right(self.hd_keys, max_hd)
+
+    def xp_range(self, min_xp: int, max_xp: int) -> Tuple[int, int]:
+        """Slice bounds into xp_ids for min_xp <= XP <= max_xp"""
+        return bisect_left(self.xp_keys, min_xp), bisect_right(self.xp_keys, max_xp)
+
+    @property
+    def by_environment(self) -> Dict[str, FrozenSet[str]]:
+        """
+        Environment -> monster IDs (built on first use)
+
+        Keys are the section names of monster_environments.json ('dungeon',
+        'wilderness', 'underwater') and their lists ('forest',
+        'fresh_water_shallow', 'never_dungeon', ...). Dungeon levels are
+        keyed 'dungeon_level_1' .. 'dungeon_level_10'.
+        """
+        if self._by_environment is None:
+            index: Dict[str, set] = {}
+            if self.environment_path is not None and self.environment_path.exists():
+                with open(self.environment_path, 'r') as f:
+                    index = environment_tags(json.load(f), self.monsters)
+
+            self._by_environment = {tag: frozenset(ids) for tag, ids in index.items()}
+
+        return self._by_environment
+
+
+# Shared indexes, one per monsters.json path
+_monster_indexes: Dict[str, MonsterIndex] = {}
+
+
+def get_monster_index(monsters_data_path=None) -> MonsterIndex:
+    """
+    Get the shared index for a monsters.json file (loaded and indexed once)
+
+    The package data file is served from the compiled monster database;
+    other files are loaded in full.
+
+    Args:
+        monsters_data_path: Path to monsters.json (default: package data file)
+
+    Returns:
+        MonsterIndex instance
+    """
+    path = Path(monsters_data_path) if monsters_data_path else DEFAULT_MONSTERS_PATH
+    key = str(path.resolve())
+
+    index = _monster_indexes.get(key)
+    if index is None:
+        if key == str(DEFAULT_MONSTERS_PATH.resolve()):
+            database = get_monster_database()
+            index = MonsterIndex(database.records, headers=database.headers,
+                                 environments=database.environment_index())
+        else:
+            with open(path, 'r') as f:
+                monsters = json.load(f)
+            index = MonsterIndex(monsters, path.parent / 'monster_environments.json')
+        _monster_indexes[key] = index
+
+    return index
 
 
 class MonsterScaler:
@@ -15,15 +161,15 @@ class MonsterScaler:
     are selected based on hit dice appropriate for party level.
     """
 
-    def __init__(self, monsters_data_path: str = "aerthos/data/monsters.json"):
+    def __init__(self, monsters_data_path: Optional[str] = None):
         """
         Initialize with monster data
 
         Args:
-            monsters_data_path: Path to monsters.json file
+            monsters_data_path: Path to monsters.json file (default: package data file)
         """
-        with open(monsters_data_path, 'r') as f:
-            self.monsters = json.load(f)
+        self.index = get_monster_index(monsters_data_path)
+        self.monsters = self.index.monsters
 
     @staticmethod
     def parse_hit_dice(hd_string: str) -> float:
@@ -101,11 +247,7 @@ class MonsterScaler:
         Returns:
             Effective hit dice as float, or 1.0 if not found
         """
-        if monster_id not in self.monsters:
-            return 1.0
-
-        hd_string = self.monsters[monster_id].get('hit_dice', '1d8')
-        return self.parse_hit_dice(hd_string)
+        return self.index.hd_by_id.get(monster_id, 1.0)
 
     def get_monsters_by_hd_range(self, min_hd: float, max_hd: float) -> List[str]:
         """
@@ -116,16 +258,50 @@ class MonsterScaler:
             max_hd: Maximum hit dice (inclusive)
 
         Returns:
-            List of monster IDs within the HD range
+            List of monster IDs within the HD range, lowest HD first
+        """
+        lo, hi = self.index.hd_range(min_hd, max_hd)
+        return self.index.hd_ids[lo:hi]
+
+    def get_monsters_by_xp_range(self, min_xp: int, max_xp: int) -> List[str]:
+        """
+        Get all monsters within an XP value range
+
+        Args:
+            min_xp: Minimum XP value (inclusive)
+            max_xp: Maximum XP value (inclusive)
+
+        Returns:
+            List of monster IDs within the XP range, lowest XP first
+        """
+        lo, hi = self.index.xp_range(min_xp, max_xp)
+        return self.index.xp_ids[lo:hi]
+
+    def get_monsters_by_size(self, size: str) -> List[str]:
         """
-        suitable_monsters = []
+        Get all monsters of a size category
 
-        for monster_id, monster_data in self.monsters.items():
-            hd = self.parse_hit_dice(monster_data.get('hit_dice', '1d8'))
-            if min_hd <= hd <= max_hd:
-                suitable_monsters.append(monster_id)
+        Args:
+            size: 'S', 'M' or 'L'
 
-        return suitable_monsters
+        Returns:
+            List of monster IDs
+        """
+        return list(self.index.by_size.get(size, ()))
+
+    def get_monsters_by_environment(self, environment: str) -> FrozenSet[str]:
+        """
+        Get all monsters listed for an environment
+
+        Args:
+            environment: 'dungeon', 'wilderness', 'underwater', a terrain or
+                water type ('forest', 'salt_water_shallow'), a category
+                ('never_dungeon') or a dungeon level ('dungeon_level_3')
+
+        Returns:
+            Frozen set of monster IDs (empty for unknown environments)
+        """
+        return self.index.by_environment.get(environment, frozenset())
 
     def get_encounter_difficulty_range(self, party_level: int, party_size: int = 4) -> tuple:
         """
@@ -184,15 +360,16 @@ class MonsterScaler:
         Returns:
             List of monster IDs appropriate for the party
         """
-        min_hd, max_hd = self.get_encounter_difficulty_range(party_level, party_size)
-        monsters = self.get_monsters_by_hd_range(min_hd, max_hd)
+        key = (party_level, party_size)
+        pool = self.index.pools.get(key)
 
-        # Ensure we always have some monsters
-        if not monsters:
-            # Fallback to basic monsters
-            monsters = ['kobold', 'goblin', 'giant_rat', 'skeleton']
+        if pool is None:
+            min_hd, max_hd = self.get_encounter_difficulty_range(party_level, party_size)
+            # Ensure we always have some monsters (fallback to basic monsters)
+            pool = tuple(self.get_monsters_by_hd_range(min_hd, max_hd)) or tuple(FALLBACK_POOL)
+            self.index.pools[key] = pool
 
-        return monsters
+        return list(pool)
 
     def get_boss_for_party(self, party_level: int, party_size: int = 4) -> str:
         """
@@ -207,30 +384,37 @@ class MonsterScaler:
         Returns:
             Monster ID for boss encounter
         """
+        key = (party_level, party_size)
+        boss = self.index.bosses.get(key)
+
+        if boss is None:
+            boss = self._select_boss(party_level, party_size)
+            self.index.bosses[key] = boss
+
+        return boss
+
+    def _select_boss(self, party_level: int, party_size: int) -> str:
+        """Pick the boss for a party (uncached)"""
         min_hd, max_hd = self.get_encounter_difficulty_range(party_level, party_size)
 
         # Boss should be at high end of range
         boss_min_hd = max(min_hd, max_hd - 1.0)
+        lo, hi = self.index.hd_range(boss_min_hd, max_hd)
 
-        bosses = self.get_monsters_by_hd_range(boss_min_hd, max_hd)
-
-        # Prefer specific boss-worthy monsters
-        preferred_bosses = ['ogre', 'wight', 'troll', 'gargoyle', 'wraith',
-                           'young_dragon_white', 'basilisk', 'minotaur']
-
-        available_preferred = [m for m in preferred_bosses if m in bosses]
-
-        if available_preferred:
-            return available_preferred[0]
-        elif bosses:
-            # Return highest HD monster from available
-            bosses_with_hd = [(m, self.get_monster_hd(m)) for m in bosses]
-            bosses_with_hd.sort(key=lambda x: x[1], reverse=True)
-            return bosses_with_hd[0][0]
-        else:
+        if lo == hi:
             # Fallback
             return 'ogre'
 
+        # Prefer specific boss-worthy monsters
+        bosses = set(self.index.hd_ids[lo:hi])
+        for monster_id in PREFERRED_BOSSES:
+            if monster_id in bosses:
+                return monster_id
+
+        # Highest HD monster in range (first in data order on ties)
+        top = bisect_left(self.index.hd_keys, self.index.hd_keys[hi - 1], lo, hi)
+        return self.index.hd_ids[top]
+
     def calculate_party_level(self, characters: List[Dict]) -> int:
         """
         Calculate average party level
@@ -4,6 +4,11 @@ Multi-Level Dungeon Generator
 Generates multi-level dungeons using the Appendix A generator for each level,
 then connects them with stairs. Implements classic megadungeon architecture
 where difficulty and rewards scale with depth.
+
+Every level gets its own sub-seed drawn from the dungeon's master seed, so
+levels can be generated independently (optionally in worker processes)
+and stitched together afterwards; the result only depends on the seed,
+never on the number of workers.
 """
 
 import random
@@ -26,6 +31,11 @@ except ImportError:
     from aerthos.world.multilevel_dungeon import MultiLevelDungeon
 
 
+def generate_level_data(config: DungeonConfig) -> Dict:
+    """Generate one level as a dictionary (runs inside a worker)"""
+    return DungeonGenerator(use_narrator=False).generate(config)
+
+
 class MultiLevelGenerator:
     """
     Generates multi-level dungeons with stairs connecting levels
@@ -37,9 +47,15 @@ class MultiLevelGenerator:
     - Thematic level naming
     """
 
-    def __init__(self):
-        """Initialize multi-level generator"""
-        self.generator = DungeonGenerator(use_narrator=False)
+    def __init__(self, cache=None):
+        """
+        Initialize multi-level generator
+
+        Args:
+            cache: Optional DungeonCache for seeded levels
+        """
+        self.generator = DungeonGenerator(use_narrator=False, cache=cache)
+        self.rng = random.Random()
 
     def generate(
         self,
@@ -47,7 +63,9 @@ class MultiLevelGenerator:
         rooms_per_level: int = 10,
         dungeon_name: str = "The Unknown Depths",
         level_names: Optional[List[str]] = None,
-        stairs_per_level: int = 2
+        stairs_per_level: int = 2,
+        seed: Optional[int] = None,
+        workers: Optional[int] = 1
     ) -> MultiLevelDungeon:
         """
         Generate a multi-level dungeon
@@ -58,31 +76,43 @@ class MultiLevelGenerator:
             dungeon_name: Overall dungeon name
             level_names: Optional list of level names (one per level)
             stairs_per_level: Number of stairways connecting each level pair
+            seed: Master seed (None = drawn from the random module)
+            workers: Worker processes for level generation (1 = generate
+                inline, None = one per CPU); does not affect the result
 
         Returns:
             MultiLevelDungeon instance
         """
-        ml_dungeon = MultiLevelDungeon(name=dungeon_name)
-
-        # Generate each level
-        for level_num in range(1, num_levels + 1):
-            # Determine level name
-            if level_names and level_num - 1 < len(level_names):
-                level_name = level_names[level_num - 1]
-            else:
-                level_name = self._generate_level_name(level_num, num_levels)
+        if seed is None:
+            seed = random.getrandbits(32)
+        self.rng.seed(seed)
 
-            # Generate the level using DungeonGenerator for predictable room counts
-            config = DungeonConfig(
+        # Level sub-seeds come first, so they don't depend on anything else
+        configs = [
+            DungeonConfig(
                 num_rooms=rooms_per_level,
                 party_level=level_num,
                 layout_type='branching',
                 dungeon_theme='ruins',
                 combat_frequency=0.4,
                 trap_frequency=0.2,
-                treasure_frequency=0.3
+                treasure_frequency=0.3,
+                seed=self.rng.getrandbits(32)
             )
-            level_dict = self.generator.generate(config)
+            for level_num in range(1, num_levels + 1)
+        ]
+
+        # Generate the levels using DungeonGenerator for predictable room counts
+        level_dicts = self._generate_levels(configs, workers)
+
+        ml_dungeon = MultiLevelDungeon(name=dungeon_name)
+
+        for level_num, level_dict in enumerate(level_dicts, start=1):
+            # Determine level name
+            if level_names and level_num - 1 < len(level_names):
+                level_name = level_names[level_num - 1]
+            else:
+                level_name = self._generate_level_name(level_num, num_levels)
 
             # Convert to Dungeon instance
             dungeon = Dungeon.load_from_generator(level_dict)
@@ -101,6 +131,42 @@ class MultiLevelGenerator:
 
         return ml_dungeon
 
+    def _generate_levels(self, configs: List[DungeonConfig], workers: Optional[int]) -> List[Dict]:
+        """
+        Generate level dictionaries, in level order
+
+        Args:
+            configs: Seeded config for each level
+            workers: Worker processes (1 = generate inline, None = one per CPU)
+
+        Returns:
+            List of dungeon dictionaries
+        """
+        if workers == 1 or len(configs) < 2:
+            return [self.generator.generate(config) for config in configs]
+
+        # Cache lookups and writes stay in this process; workers only generate
+        cache = self.generator.cache
+        version = self.generator.cache_version()
+        levels = [cache.get(config, version) if cache is not None else None for config in configs]
+        missing = [i for i, level in enumerate(levels) if level is None]
+
+        if len(missing) > 1:
+            # concurrent.futures (and multiprocessing) are only imported when fanning out
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                generated = list(executor.map(generate_level_data, [configs[i] for i in missing]))
+        else:
+            generated = [generate_level_data(configs[i]) for i in missing]
+
+        for i, level in zip(missing, generated):
+            levels[i] = level
+            if cache is not None:
+                cache.put(configs[i], version, level)
+
+        return levels
+
     def _generate_level_name(self, level_num: int, total_levels: int) -> str:
         """
         Generate a thematic name for a dungeon level
@@ -151,7 +217,7 @@ class MultiLevelGenerator:
         else:
             return f"Level {level_num}"
 
-        return random.choice(themes)
+        return self.rng.choice(themes)
 
     def _connect_levels_with_stairs(
         self,
@@ -218,8 +284,8 @@ class MultiLevelGenerator:
         if not upper_rooms or not lower_rooms:
             return  # Can't create stairs without any rooms at all
 
-        upper_room = random.choice(upper_rooms)
-        lower_room = random.choice(lower_rooms)
+        upper_room = self.rng.choice(upper_rooms)
+        lower_room = self.rng.choice(lower_rooms)
 
         # Add stairs down in upper level
         upper_room.exits["stairs_down"] = lower_room.id
@@ -232,10 +298,10 @@ class MultiLevelGenerator:
         lower_room.exits["u"] = upper_room.id  # Short alias
 
         # Update room descriptions to mention stairs
-        if "stairs" not in upper_room.description.lower():
+        if "stairs" not in upper_room.get_description().lower():
             upper_room.description += f" Stone stairs descend into the darkness below."
 
-        if "stairs" not in lower_room.description.lower():
+        if "stairs" not in lower_room.get_description().lower():
             lower_room.description += f" Stone stairs ascend to the level above."
 
     def generate_to_dict(
@@ -244,7 +310,9 @@ class MultiLevelGenerator:
         rooms_per_level: int = 10,
         dungeon_name: str = "The Unknown Depths",
         level_names: Optional[List[str]] = None,
-        stairs_per_level: int = 2
+        stairs_per_level: int = 2,
+        seed: Optional[int] = None,
+        workers: Optional[int] = 1
     ) -> Dict:
         """
         Generate multi-level dungeon and return as dictionary
@@ -255,6 +323,8 @@ class MultiLevelGenerator:
             dungeon_name: Dungeon name
             level_names: Optional level names
             stairs_per_level: Stairs per level
+            seed: Master seed (None = drawn from the random module)
+            workers: Worker processes for level generation
 
         Returns:
             Dictionary representation
@@ -264,7 +334,9 @@ class MultiLevelGenerator:
             rooms_per_level=rooms_per_level,
             dungeon_name=dungeon_name,
             level_names=level_names,
-            stairs_per_level=stairs_per_level
+            stairs_per_level=stairs_per_level,
+            seed=seed,
+            workers=workers
         )
 
         return ml_dungeon.to_dict()
@@ -276,7 +348,9 @@ def generate_multilevel_dungeon(
     rooms_per_level: int = 10,
     dungeon_name: str = "The Unknown Depths",
     level_names: Optional[List[str]] = None,
-    stairs_per_level: int = 2
+    stairs_per_level: int = 2,
+    seed: Optional[int] = None,
+    workers: Optional[int] = 1
 ) -> Dict:
     """
     Generate a multi-level dungeon
@@ -287,6 +361,8 @@ def generate_multilevel_dungeon(
         dungeon_name: Overall dungeon name
         level_names: Optional list of level names
         stairs_per_level: Number of stairways per level
+        seed: Master seed (None = drawn from the random module)
+        workers: Worker processes for level generation (None = one per CPU)
 
     Returns:
         Dictionary representation of multi-level dungeon
@@ -297,7 +373,9 @@ def generate_multilevel_dungeon(
         rooms_per_level=rooms_per_level,
         dungeon_name=dungeon_name,
         level_names=level_names,
-        stairs_per_level=stairs_per_level
+        stairs_per_level=stairs_per_level,
+        seed=seed,
+        workers=workers
     )
 
 
@@ -5,6 +5,7 @@ Manages a library of created characters that can be reused across multiple games
 """
 
 import json
+import os
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -38,7 +39,73 @@ class CharacterRoster:
         if character_id is None:
             character_id = str(uuid.uuid4())[:8]
 
-        char_data = {
+        char_data = self._serialize_character(character, character_id)
+
+        with open(self._character_path(character, character_id), 'w') as f:
+            json.dump(char_data, f, indent=2)
+
+        return character_id
+
+    def save_characters(self, characters: List[PlayerCharacter],
+                        character_ids: List[str] = None) -> List[str]:
+        """
+        Save several characters as one all-or-nothing roster update
+
+        Every character is serialized and written to a temporary file first;
+        the files are only renamed into the roster once all of them were
+        written. If anything fails, nothing is left behind in the roster.
+
+        Args:
+            characters: PlayerCharacter instances to save
+            character_ids: Optional IDs, one per character (UUIDs if not provided)
+
+        Returns:
+            Character IDs, in the same order as characters
+        """
+        if character_ids is None:
+            character_ids = [str(uuid.uuid4())[:8] for _ in characters]
+        elif len(character_ids) != len(characters):
+            raise ValueError("Characters and character IDs must be same length")
+
+        # Serialize everything before touching the disk
+        staged = [
+            (self._serialize_character(character, character_id),
+             self._character_path(character, character_id))
+            for character, character_id in zip(characters, character_ids)
+        ]
+
+        import tempfile  # Only needed for batch saves; keeps it off the startup path
+
+        temp_paths = []
+        committed = []
+        try:
+            for char_data, filepath in staged:
+                fd, temp_path = tempfile.mkstemp(dir=self.roster_dir, prefix='.tmp-', suffix='.part')
+                temp_paths.append(temp_path)
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(char_data, f, indent=2)
+
+            for temp_path, (_, filepath) in zip(temp_paths, staged):
+                os.replace(temp_path, filepath)
+                committed.append(filepath)
+        except BaseException:
+            for path in list(temp_paths) + committed:
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+            raise
+
+        return list(character_ids)
+
+    def _character_path(self, character: PlayerCharacter, character_id: str) -> Path:
+        """Roster file for a character"""
+        filename = f"{character.name.lower().replace(' ', '_')}_{character_id}.json"
+        return self.roster_dir / filename
+
+    def _serialize_character(self, character: PlayerCharacter, character_id: str) -> Dict:
+        """Build the roster record for a character"""
+        return {
             'id': character_id,
             'created': datetime.now().isoformat(),
             'name': character.name,
@@ -74,14 +141,6 @@ class CharacterRoster:
             'conditions': list(character.conditions),
         }
 
-        filename = f"{character.name.lower().replace(' ', '_')}_{character_id}.json"
-        filepath = self.roster_dir / filename
-
-        with open(filepath, 'w') as f:
-            json.dump(char_data, f, indent=2)
-
-        return character_id
-
     def load_character(self, character_id: str = None, character_name: str = None) -> Optional[PlayerCharacter]:
         """
         Load a character from the roster
@@ -47,11 +47,7 @@ class PartyManager:
         if party_id is None:
             party_id = str(uuid.uuid4())[:8]
 
-        if len(character_ids) != len(formation):
-            raise ValueError("Character IDs and formation must be same length")
-
-        if len(character_ids) < 1 or len(character_ids) > 6:
-            raise ValueError("Party must have 1-6 members")
+        self._validate_composition(character_ids, formation)
 
         party_data = {
             'id': party_id,
@@ -70,6 +66,48 @@ class PartyManager:
 
         return party_id
 
+    def create_party(self, party_name: str, characters: List,
+                     formation: List[str] = None) -> Dict:
+        """
+        Save new characters to the roster and register them as a party
+
+        Characters are written in one all-or-nothing roster update; if the
+        party itself cannot be saved, the new characters are removed again.
+
+        Args:
+            party_name: Name for this party
+            characters: PlayerCharacter instances (1-6)
+            formation: Formation positions (default: front half, back half)
+
+        Returns:
+            Dictionary with 'party_id' and 'character_ids'
+        """
+        if formation is None:
+            mid = len(characters) // 2
+            formation = ['front'] * mid + ['back'] * (len(characters) - mid)
+
+        # Validate before anything is written
+        self._validate_composition(characters, formation)
+
+        character_ids = self.character_roster.save_characters(characters)
+        try:
+            party_id = self.save_party(party_name, character_ids, formation)
+        except BaseException:
+            for char_id in character_ids:
+                self.character_roster.delete_character(char_id)
+            raise
+
+        return {'party_id': party_id, 'character_ids': character_ids}
+
+    @staticmethod
+    def _validate_composition(members: List, formation: List[str]) -> None:
+        """Raise ValueError for a party size or formation that cannot be saved"""
+        if len(members) != len(formation):
+            raise ValueError("Character IDs and formation must be same length")
+
+        if len(members) < 1 or len(members) > 6:
+            raise ValueError("Party must have 1-6 members")
+
     def load_party(self, party_id: str = None, party_name: str = None):
         """
         Load a party composition and create Party instance with actual characters
@@ -51,7 +51,7 @@ class ScenarioLibrary:
 
         if is_multilevel:
             # Calculate total rooms across all levels
-            num_rooms = sum(len(level.dungeon.rooms) for level in dungeon.levels.values())
+            num_rooms = dungeon.get_total_rooms()
             # Multi-level dungeons don't have a single start_room
             start_room = f"level_{dungeon.current_level_number}_start"
         else:
@@ -10,22 +10,102 @@ Implements all six ability score modifier tables from the Players Handbook:
 - Charisma (henchmen, loyalty, reactions)
 """
 
-import json
 import random
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from .data_cache import load_json
+
+
+# Highest score in the tables; lookups clamp into [MIN_SCORE, MAX_SCORE]
+MIN_SCORE = 3
+MAX_SCORE = 25
+MAX_NORMAL_STRENGTH = 18
+
+
+def freeze_record(record: Dict) -> Mapping:
+    """
+    Make a read-only modifier record (nested dicts are frozen too)
+
+    Records support the same lookups as the JSON dicts ([key], get, in,
+    items) but cannot be modified, so lookups can share them safely.
+    """
+    return MappingProxyType({
+        key: freeze_record(value) if isinstance(value, dict) else value
+        for key, value in record.items()
+    })
+
+
+def thaw_record(record: Mapping) -> Dict:
+    """Plain, modifiable dict copy of a frozen record (nested records included)"""
+    return {
+        key: thaw_record(value) if isinstance(value, Mapping) else value
+        for key, value in record.items()
+    }
+
+
+def _exceptional_key(percentile: int) -> str:
+    """Table key for an exceptional strength percentile (1-100)"""
+    if percentile <= 50:
+        return "18/50"
+    elif percentile <= 75:
+        return "18/75"
+    elif percentile <= 90:
+        return "18/90"
+    elif percentile <= 99:
+        return "18/99"
+    return "18/00"
 
 
 class AbilityModifierSystem:
-    """System for looking up ability score modifiers"""
+    """
+    System for looking up ability score modifiers
+
+    The JSON tables are compiled at load into dense per-ability arrays of
+    read-only records indexed by score, plus a 100-entry array for
+    exceptional strength (18/01 - 18/00), so each lookup is one index
+    operation.
+    """
 
     def __init__(self):
         """Load ability score tables from JSON"""
         data_path = Path(__file__).parent.parent / 'data' / 'ability_score_tables.json'
-        with open(data_path, 'r') as f:
-            self.tables = json.load(f)
+        self.tables = load_json(data_path)
+
+        self._compile_tables()
+
+    def _compile_tables(self):
+        """Build dense score-indexed arrays from the JSON tables"""
+        self._scores: Dict[str, List[Mapping]] = {}
+        for ability in ['intelligence', 'wisdom', 'dexterity', 'constitution', 'charisma']:
+            records = {key: freeze_record(mods) for key, mods in self.tables[ability].items()}
+            self._scores[ability] = [
+                records[str(max(MIN_SCORE, score))] for score in range(MAX_SCORE + 1)
+            ]
+
+        # Fighters use the fighter HP adjustment
+        self._constitution_fighter: List[Mapping] = []
+        for score in range(MAX_SCORE + 1):
+            mods = dict(self.tables['constitution'][str(max(MIN_SCORE, score))])
+            if 'hp_adjustment_fighter' in mods:
+                mods['hp_adjustment'] = mods['hp_adjustment_fighter']
+            self._constitution_fighter.append(freeze_record(mods))
 
-    def get_strength_modifiers(self, strength: int, exceptional: int = 0) -> Dict:
+        # Strength: 3-18, capped at 18 and floored at 3 (one record per table row)
+        strength = {key: freeze_record(mods) for key, mods in self.tables['strength'].items()}
+        self._strength: List[Mapping] = [
+            strength[str(min(MAX_NORMAL_STRENGTH, max(MIN_SCORE, score)))]
+            for score in range(MAX_NORMAL_STRENGTH + 1)
+        ]
+
+        # Exceptional strength, index = percentile - 1 (18/01 .. 18/00)
+        self._exceptional_strength: List[Mapping] = [
+            strength[_exceptional_key(percentile)]
+            for percentile in range(1, 101)
+        ]
+
+    def get_strength_modifiers(self, strength: int, exceptional: int = 0) -> Mapping:
         """
         Get strength modifiers
 
@@ -34,35 +114,15 @@ class AbilityModifierSystem:
             exceptional: Exceptional strength percentile (1-100, 0 for non-exceptional)
 
         Returns:
-            Dict with: hit_prob, damage, weight_allowance, open_doors, bend_bars_lift_gates
+            Read-only record with: hit_prob, damage, weight_allowance, open_doors, bend_bars_lift_gates
         """
         # Handle exceptional strength for Fighters
-        if strength == 18 and exceptional > 0:
-            # Map exceptional percentile to table ranges
-            if exceptional <= 50:
-                key = "18/50"
-            elif exceptional <= 75:
-                key = "18/75"
-            elif exceptional <= 90:
-                key = "18/90"
-            elif exceptional <= 99:
-                key = "18/99"
-            else:  # 100
-                key = "18/00"
-        else:
-            key = str(strength)
+        if strength == MAX_NORMAL_STRENGTH and exceptional > 0:
+            return self._exceptional_strength[min(exceptional, 100) - 1]
 
-        if key in self.tables['strength']:
-            return self.tables['strength'][key].copy()
+        return self._strength[min(MAX_NORMAL_STRENGTH, max(0, strength))]
 
-        # Cap at maximum
-        if strength > 18:
-            return self.tables['strength']['18'].copy()
-
-        # Floor at minimum
-        return self.tables['strength']['3'].copy()
-
-    def get_intelligence_modifiers(self, intelligence: int) -> Dict:
+    def get_intelligence_modifiers(self, intelligence: int) -> Mapping:
         """
         Get intelligence modifiers
 
@@ -70,18 +130,12 @@ class AbilityModifierSystem:
             intelligence: Intelligence score (3-25)
 
         Returns:
-            Dict with: additional_languages, spell_learn_chance, min_spells_per_level,
+            Read-only record with: additional_languages, spell_learn_chance, min_spells_per_level,
                       max_spells_per_level, max_spell_level
         """
-        key = str(min(25, max(3, intelligence)))
-
-        if key in self.tables['intelligence']:
-            return self.tables['intelligence'][key].copy()
-
-        # Default for very high INT
-        return self.tables['intelligence']['25'].copy()
+        return self._scores['intelligence'][min(MAX_SCORE, max(MIN_SCORE, intelligence))]
 
-    def get_wisdom_modifiers(self, wisdom: int) -> Dict:
+    def get_wisdom_modifiers(self, wisdom: int) -> Mapping:
         """
         Get wisdom modifiers
 
@@ -89,17 +143,11 @@ class AbilityModifierSystem:
             wisdom: Wisdom score (3-25)
 
         Returns:
-            Dict with: magic_attack_adjustment, spell_bonus (dict), spell_failure
+            Read-only record with: magic_attack_adjustment, spell_bonus (dict), spell_failure
         """
-        key = str(min(25, max(3, wisdom)))
+        return self._scores['wisdom'][min(MAX_SCORE, max(MIN_SCORE, wisdom))]
 
-        if key in self.tables['wisdom']:
-            return self.tables['wisdom'][key].copy()
-
-        # Default for very high WIS
-        return self.tables['wisdom']['25'].copy()
-
-    def get_dexterity_modifiers(self, dexterity: int) -> Dict:
+    def get_dexterity_modifiers(self, dexterity: int) -> Mapping:
         """
         Get dexterity modifiers
 
@@ -107,17 +155,11 @@ class AbilityModifierSystem:
             dexterity: Dexterity score (3-25)
 
         Returns:
-            Dict with: reaction_attack_adj, defensive_adj, and all thief skill modifiers
+            Read-only record with: reaction_attack_adj, defensive_adj, and all thief skill modifiers
         """
-        key = str(min(25, max(3, dexterity)))
-
-        if key in self.tables['dexterity']:
-            return self.tables['dexterity'][key].copy()
+        return self._scores['dexterity'][min(MAX_SCORE, max(MIN_SCORE, dexterity))]
 
-        # Default for very high DEX
-        return self.tables['dexterity']['25'].copy()
-
-    def get_constitution_modifiers(self, constitution: int, is_fighter: bool = False) -> Dict:
+    def get_constitution_modifiers(self, constitution: int, is_fighter: bool = False) -> Mapping:
         """
         Get constitution modifiers
 
@@ -126,26 +168,16 @@ class AbilityModifierSystem:
             is_fighter: Whether character is Fighter (gets higher HP bonus)
 
         Returns:
-            Dict with: hp_adjustment, system_shock, resurrection_survival, regeneration (if CON 20+)
+            Read-only record with: hp_adjustment, system_shock, resurrection_survival, regeneration (if CON 20+)
         """
-        key = str(min(25, max(3, constitution)))
-
-        if key in self.tables['constitution']:
-            mods = self.tables['constitution'][key].copy()
-
-            # Fighters get higher HP bonus
-            if is_fighter and 'hp_adjustment_fighter' in mods:
-                mods['hp_adjustment'] = mods['hp_adjustment_fighter']
+        score = min(MAX_SCORE, max(MIN_SCORE, constitution))
 
-            return mods
-
-        # Default for very high CON
-        mods = self.tables['constitution']['25'].copy()
+        # Fighters get higher HP bonus
         if is_fighter:
-            mods['hp_adjustment'] = mods['hp_adjustment_fighter']
-        return mods
+            return self._constitution_fighter[score]
+        return self._scores['constitution'][score]
 
-    def get_charisma_modifiers(self, charisma: int) -> Dict:
+    def get_charisma_modifiers(self, charisma: int) -> Mapping:
         """
         Get charisma modifiers
 
@@ -153,15 +185,9 @@ class AbilityModifierSystem:
             charisma: Charisma score (3-25)
 
         Returns:
-            Dict with: max_henchmen, loyalty_base, reaction_adjustment
+            Read-only record with: max_henchmen, loyalty_base, reaction_adjustment
         """
-        key = str(min(25, max(3, charisma)))
-
-        if key in self.tables['charisma']:
-            return self.tables['charisma'][key].copy()
-
-        # Default for very high CHA
-        return self.tables['charisma']['25'].copy()
+        return self._scores['charisma'][min(MAX_SCORE, max(MIN_SCORE, charisma))]
 
     def attempt_spell_learning(self, intelligence: int, spell_name: str = None) -> Tuple[bool, int]:
         """
@@ -329,8 +355,8 @@ class AbilityModifierSystem:
         if not hasattr(character, '_con_hp_bonus'):
             character._con_hp_bonus = mods['constitution']['hp_adjustment']
 
-        # Store other modifiers for reference
-        character._ability_modifiers = mods
+        # Store other modifiers for reference (plain dicts - records are shared)
+        character._ability_modifiers = {ability: thaw_record(record) for ability, record in mods.items()}
 
     def get_bonus_spells(self, wisdom: int, spell_level: int) -> int:
         """
@@ -3,95 +3,128 @@ Ability Score System - AD&D 1e
 Provides comprehensive ability score modifiers and lookups
 """
 
-import json
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Mapping, Optional
+
+from .data_cache import load_json
+from .ability_modifiers import freeze_record
+
+
+# Highest score covered by the dense lookup arrays
+MAX_SCORE = 25
+
+# Modifiers for scores outside the tables
+DEFAULT_MODS = {
+    'strength': freeze_record({"hit_prob": 0, "damage": 0, "weight_allowance": 0, "open_doors": "1-2", "bend_bars": 13}),
+    'intelligence': freeze_record({"languages": 1, "spell_chance": 45, "min_spells": 5, "max_spells": 7}),
+    'wisdom': freeze_record({"magic_defense": 0, "bonus_spells": {}, "spell_failure": 0}),
+    'dexterity': freeze_record({"reaction": 0, "ac_bonus": 0, "pick_pockets": 0, "open_locks": 0,
+                                "find_traps": 0, "move_silently": 0, "hide_shadows": 0, "hear_noise": 0,
+                                "climb_walls": 0, "read_languages": 0}),
+    'constitution': freeze_record({"hp_adj": 0, "system_shock": 65, "resurrection": 70}),
+    'charisma': freeze_record({"max_henchmen": 4, "loyalty": 0, "reaction": 0}),
+}
+
+EXCEPTIONAL_STRENGTH_KEYS = [
+    (50, "18/01-50"),
+    (75, "18/51-75"),
+    (90, "18/76-90"),
+    (99, "18/91-99"),
+    (100, "18/00"),
+]
 
 
 class AbilityScoreSystem:
-    """Manages all ability score modifiers and effects"""
+    """
+    Manages all ability score modifiers and effects
+
+    Range keys ("3-5", "9-12", "18/01-50") are compiled at load into dense
+    per-ability arrays indexed by score, plus a 100-entry array for
+    exceptional strength, holding read-only modifier records.
+    """
 
     def __init__(self):
         """Load ability modifier data from JSON"""
         data_path = Path(__file__).parent.parent / 'data' / 'ability_modifiers.json'
-        with open(data_path, 'r') as f:
-            self.modifiers = json.load(f)
+        self.modifiers = load_json(data_path)
+
+        self._compile_tables()
+
+    def _compile_tables(self):
+        """Expand range keys into score-indexed arrays of keys and records"""
+        self._range_keys: Dict[str, List[Optional[str]]] = {}
+        self._records: Dict[str, List[Mapping]] = {}
+
+        for ability, table in self.modifiers.items():
+            keys: List[Optional[str]] = [None] * (MAX_SCORE + 1)
+            for key in table:
+                if key.isdigit():
+                    low = high = int(key)
+                elif '-' in key and '/' not in key:
+                    low, high = (int(part) for part in key.split('-'))
+                else:
+                    continue
+                for score in range(max(0, low), min(MAX_SCORE, high) + 1):
+                    # Exact keys win over ranges
+                    if keys[score] is None or key == str(score):
+                        keys[score] = key
+
+            # One shared record per table row
+            records = {key: freeze_record(mods) for key, mods in table.items()}
+            self._range_keys[ability] = keys
+            self._records[ability] = [records[key] if key else DEFAULT_MODS[ability] for key in keys]
+
+            if ability == 'strength':
+                # Exceptional strength, index = percentile - 1 (18/01 .. 18/00)
+                self._exceptional_keys: List[str] = [
+                    next(key for limit, key in EXCEPTIONAL_STRENGTH_KEYS if percentile <= limit)
+                    for percentile in range(1, 101)
+                ]
+                self._exceptional_records: List[Mapping] = [
+                    records[key] for key in self._exceptional_keys
+                ]
 
     def _find_range(self, ability: str, score: int, percentile: int = 0) -> Optional[str]:
         """Find the appropriate range key for a given score"""
         # Handle exceptional strength
         if ability == 'strength' and score == 18 and percentile > 0:
-            if percentile <= 50:
-                return "18/01-50"
-            elif percentile <= 75:
-                return "18/51-75"
-            elif percentile <= 90:
-                return "18/76-90"
-            elif percentile <= 99:
-                return "18/91-99"
-            else:
-                return "18/00"
-
-        # Try exact match first
-        if str(score) in self.modifiers[ability]:
-            return str(score)
-
-        # Try range match
-        for key in self.modifiers[ability].keys():
-            if '-' in key:
-                parts = key.split('-')
-                try:
-                    low, high = int(parts[0]), int(parts[1])
-                    if low <= score <= high:
-                        return key
-                except ValueError:
-                    continue
+            return self._exceptional_keys[min(percentile, 100) - 1]
 
+        if 0 <= score <= MAX_SCORE:
+            return self._range_keys[ability][score]
         return None
 
-    def get_strength_mods(self, score: int, percentile: int = 0) -> Dict[str, Any]:
+    def _lookup(self, ability: str, score: int) -> Mapping:
+        """Modifier record for a score (defaults outside the table)"""
+        if 0 <= score <= MAX_SCORE:
+            return self._records[ability][score]
+        return DEFAULT_MODS[ability]
+
+    def get_strength_mods(self, score: int, percentile: int = 0) -> Mapping[str, Any]:
         """Get all strength modifiers"""
-        key = self._find_range('strength', score, percentile)
-        if key:
-            return self.modifiers['strength'][key]
-        return {"hit_prob": 0, "damage": 0, "weight_allowance": 0, "open_doors": "1-2", "bend_bars": 13}
+        if score == 18 and percentile > 0:
+            return self._exceptional_records[min(percentile, 100) - 1]
+        return self._lookup('strength', score)
 
-    def get_intelligence_mods(self, score: int) -> Dict[str, Any]:
+    def get_intelligence_mods(self, score: int) -> Mapping[str, Any]:
         """Get all intelligence modifiers"""
-        key = self._find_range('intelligence', score)
-        if key:
-            return self.modifiers['intelligence'][key]
-        return {"languages": 1, "spell_chance": 45, "min_spells": 5, "max_spells": 7}
+        return self._lookup('intelligence', score)
 
-    def get_wisdom_mods(self, score: int) -> Dict[str, Any]:
+    def get_wisdom_mods(self, score: int) -> Mapping[str, Any]:
         """Get all wisdom modifiers"""
-        key = self._find_range('wisdom', score)
-        if key:
-            return self.modifiers['wisdom'][key]
-        return {"magic_defense": 0, "bonus_spells": {}, "spell_failure": 0}
+        return self._lookup('wisdom', score)
 
-    def get_dexterity_mods(self, score: int) -> Dict[str, Any]:
+    def get_dexterity_mods(self, score: int) -> Mapping[str, Any]:
         """Get all dexterity modifiers"""
-        key = self._find_range('dexterity', score)
-        if key:
-            return self.modifiers['dexterity'][key]
-        return {"reaction": 0, "ac_bonus": 0, "pick_pockets": 0, "open_locks": 0,
-                "find_traps": 0, "move_silently": 0, "hide_shadows": 0, "hear_noise": 0,
-                "climb_walls": 0, "read_languages": 0}
-
-    def get_constitution_mods(self, score: int) -> Dict[str, Any]:
+        return self._lookup('dexterity', score)
+
+    def get_constitution_mods(self, score: int) -> Mapping[str, Any]:
         """Get all constitution modifiers"""
-        key = self._find_range('constitution', score)
-        if key:
-            return self.modifiers['constitution'][key]
-        return {"hp_adj": 0, "system_shock": 65, "resurrection": 70}
+        return self._lookup('constitution', score)
 
-    def get_charisma_mods(self, score: int) -> Dict[str, Any]:
+    def get_charisma_mods(self, score: int) -> Mapping[str, Any]:
         """Get all charisma modifiers"""
-        key = self._find_range('charisma', score)
-        if key:
-            return self.modifiers['charisma'][key]
-        return {"max_henchmen": 4, "loyalty": 0, "reaction": 0}
+        return self._lookup('charisma', score)
 
     def get_xp_bonus(self, char_class: str, **ability_scores) -> int:
         """
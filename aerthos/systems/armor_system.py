@@ -5,9 +5,9 @@ Loads armor database, validates class restrictions, creates armor/shield objects
 Handles AC calculations, movement rates, and encumbrance from armor.
 """
 
-import json
 from pathlib import Path
 from typing import Dict, List, Optional
+from .data_cache import load_json
 from ..entities.player import Armor, Shield, Item
 
 
@@ -17,8 +17,7 @@ class ArmorSystem:
     def __init__(self):
         """Load armor database from JSON"""
         data_path = Path(__file__).parent.parent / 'data' / 'armor.json'
-        with open(data_path, 'r') as f:
-            self.data = json.load(f)
+        self.data = load_json(data_path)
 
         self.armor_data = self.data['armor']
         self.shield_data = self.data['shields']
@@ -3,9 +3,9 @@ Class Special Abilities System for AD&D 1e
 Handles all class-specific special abilities from the Players Handbook
 """
 
-import json
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
+from .data_cache import load_json
 from ..entities.character import Character
 
 
@@ -15,8 +15,7 @@ class ClassAbilitiesSystem:
     def __init__(self):
         """Load class abilities data from class_abilities.json"""
         data_path = Path(__file__).parent.parent / 'data' / 'class_abilities.json'
-        with open(data_path, 'r') as f:
-            self.abilities = json.load(f)
+        self.abilities = load_json(data_path)
 
     def get_backstab_multiplier(self, char_class: str, level: int) -> Tuple[int, int]:
         """
@@ -0,0 +1,137 @@
+"""
+Pre-parsed Data Cache
+
+Game tables ship as JSON under aerthos/data. Parsing them on every start
+is a large part of time-to-first-prompt, so load_json() keeps a marshal
+copy of each parsed file in a cache directory and serves that instead:
+
+    ~/.aerthos/cache/data/<file>-<source sha256>-py<major><minor>.marshal
+
+The source file's hash is part of the cache file name, so an edited JSON
+file is simply a cache miss; stale entries for the same file are removed
+when the new one is written. marshal only handles plain data (dicts,
+lists, strings, numbers), which is all JSON produces, and never runs code
+on load.
+
+Package data is located with data_path(), relative to the package
+(DATA_DIR) rather than the current working directory.
+
+Environment variables:
+    AERTHOS_CACHE_DIR=/path   Cache location (default ~/.aerthos/cache)
+    AERTHOS_DATA_CACHE=0      Always parse the JSON (no cache reads or writes)
+"""
+
+import hashlib
+import json
+import marshal
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+
+DATA_DIR = Path(__file__).parent.parent / 'data'
+
+ENV_CACHE_DIR = 'AERTHOS_CACHE_DIR'
+ENV_DATA_CACHE = 'AERTHOS_DATA_CACHE'
+
+# Cached files are only valid for the interpreter version that wrote them
+_PY_TAG = f"py{sys.version_info[0]}{sys.version_info[1]}"
+
+# Resolved path -> marshal bytes, so each file is read at most once per process
+_loaded: Dict[str, bytes] = {}
+
+# (hits, misses) for the on-disk cache, for tests and benchmarks
+_stats = {'hits': 0, 'misses': 0}
+
+
+def data_path(*parts: str) -> Path:
+    """Path to a file under the package data directory"""
+    return DATA_DIR.joinpath(*parts)
+
+
+def cache_dir() -> Optional[Path]:
+    """Directory for pre-parsed data (None when caching is disabled)"""
+    if os.environ.get(ENV_DATA_CACHE, '').strip().lower() in ('0', 'false', 'no', 'off'):
+        return None
+    root = os.environ.get(ENV_CACHE_DIR)
+    return (Path(root) if root else Path.home() / '.aerthos' / 'cache') / 'data'
+
+
+def _cache_name(path: Path, digest: str) -> Tuple[str, str]:
+    """Cache file name for a source file, and the prefix shared by its versions"""
+    data_dir = DATA_DIR.resolve()
+    relative = path.relative_to(data_dir) if path.is_relative_to(data_dir) else Path(path.name)
+    prefix = '__'.join(relative.with_suffix('').parts)
+    return f"{prefix}-{digest[:16]}-{_PY_TAG}.marshal", f"{prefix}-"
+
+
+def _read_cached(directory: Path, name: str) -> Optional[bytes]:
+    try:
+        return (directory / name).read_bytes()
+    except OSError:
+        return None
+
+
+def _write_cached(directory: Path, name: str, prefix: str, payload: bytes) -> None:
+    """Atomically store a cache entry and drop older entries for the same file"""
+    import tempfile  # Only needed on a miss; keeps it off the startup path
+
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, directory / name)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        for stale in directory.glob(f"{prefix}*.marshal"):
+            if stale.name != name and stale.name[len(prefix):].count('-') == 1:
+                stale.unlink()
+    except OSError as e:
+        print(f"Warning: could not write data cache entry {name}: {e}")
+
+
+def load_json(path) -> Any:
+    """
+    Load a JSON data file, through the pre-parsed cache
+
+    Every call returns a fresh object, so callers may modify what they get
+    just as if they had parsed the file themselves.
+
+    Args:
+        path: Data file (use data_path() for files shipped with the package)
+
+    Returns:
+        Parsed JSON
+    """
+    path = Path(path).resolve()
+    key = str(path)
+
+    payload = _loaded.get(key)
+    if payload is None:
+        source = path.read_bytes()
+        directory = cache_dir()
+
+        if directory is None:
+            return json.loads(source)
+
+        name, prefix = _cache_name(path, hashlib.sha256(source).hexdigest())
+        payload = _read_cached(directory, name)
+        if payload is None:
+            _stats['misses'] += 1
+            payload = marshal.dumps(json.loads(source))
+            _write_cached(directory, name, prefix, payload)
+        else:
+            _stats['hits'] += 1
+        _loaded[key] = payload
+
+    return marshal.loads(payload)
+
+
+def clear_memory_cache() -> None:
+    """Forget files read by this process (the next load re-validates hashes)"""
+    _loaded.clear()
@@ -43,9 +43,13 @@ class EncounterDetermination:
         Initialize encounter system
 
         Args:
-            enhanced_monsters_data: Dict from monsters_enhanced.json
+            enhanced_monsters_data: Monster ID -> monster data (default: the
+                shared compiled monster database)
         """
-        self.monsters = enhanced_monsters_data or {}
+        if enhanced_monsters_data is None:
+            from .monster_database import get_monster_database
+            enhanced_monsters_data = get_monster_database().records
+        self.monsters = enhanced_monsters_data
 
         # Reaction table (DMG p. 63)
         self.reaction_table = [
@@ -482,19 +486,17 @@ def _format_encounter_description(result: EncounterResult, monsters_data: Dict)
 
 if __name__ == "__main__":
     # Test encounter determination
-    import json
+    import sys
     from pathlib import Path
 
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+    from aerthos.systems.monster_database import get_monster_database
+
     print("="*70)
     print("AD&D 1e ENCOUNTER DETERMINATION TEST")
     print("="*70)
 
-    # Load enhanced monsters
-    monsters_file = Path(__file__).parent.parent / "data" / "monsters_enhanced.json"
-    with open(monsters_file) as f:
-        monsters = json.load(f)
-
-    enc_system = EncounterDetermination(monsters)
+    enc_system = EncounterDetermination(get_monster_database().records)
 
     # Test 1: Goblin encounter
     print("\n1. GOBLIN ENCOUNTER (Wilderness)")
@@ -8,11 +8,22 @@ Implements AD&D 1e DMG Appendix C encounter logic:
 - Prevents inappropriate encounters (sprites in dungeons, fish on land, etc.)
 """
 
-import json
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 from dataclasses import dataclass
 
+from .data_cache import load_json
+
+
+# Terrains combined when a wilderness context gives no terrain
+WILDERNESS_TERRAINS = ['plain', 'forest', 'hills', 'mountains', 'swamp_marsh', 'desert']
+
+# (location, dungeon level, terrain, special setting, water type)
+EnvironmentKey = Tuple[str, Optional[int], Optional[str], Optional[str], Optional[str]]
+
+# Cached pool intersections kept per filter before the cache is reset
+MAX_CACHED_POOLS = 256
+
 
 @dataclass
 class EnvironmentContext:
@@ -25,11 +36,159 @@ class EnvironmentContext:
     special_setting: Optional[str] = None  # 'faerie_sylvan', 'prehistoric', etc.
 
 
+def environment_key(context: EnvironmentContext) -> EnvironmentKey:
+    """
+    Normalize a context to the fields that select monsters
+
+    Climate is not part of the key: the Appendix C data has no climate
+    split (tropical is listed as a terrain), so it never changes the result.
+    """
+    location = context.location_type
+    if location == 'dungeon':
+        return (location, max(1, min(10, context.dungeon_level or 1)), None, None, None)
+    if location == 'wilderness':
+        if context.special_setting == 'faerie_sylvan':
+            return (location, None, None, 'faerie_sylvan', None)
+        return (location, None, context.terrain, None, None)
+    if location == 'underwater':
+        return (location, None, None, None, context.water_type or 'fresh_shallow')
+    return (location, None, None, None, None)
+
+
+class EnvironmentIndex:
+    """
+    Precomputed monster sets for every environment in the data file
+
+    Every monster gets a bit; each environment key maps to a frozenset, a
+    sorted tuple and a bitmask of its monsters. Built once per data file
+    and shared by all filters (see get_environment_index).
+    """
+
+    def __init__(self, environment_data: Dict):
+        """
+        Build sets for every dungeon level, terrain and water type
+
+        Args:
+            environment_data: Parsed monster_environments.json
+        """
+        self.environment_data = environment_data
+
+        categories = environment_data.get("environment_categories", {})
+        self.versatile: FrozenSet[str] = frozenset(categories.get("dungeon_or_wilderness", []))
+
+        # One bit per monster named anywhere in the data (sorted for stable masks)
+        all_monsters: Set[str] = set()
+        for section in environment_data.values():
+            if isinstance(section, dict):
+                for monsters in section.values():
+                    if isinstance(monsters, list):
+                        all_monsters.update(monsters)
+        self.bit_order: Tuple[str, ...] = tuple(sorted(all_monsters))
+        self.bits: Dict[str, int] = {m: 1 << i for i, m in enumerate(self.bit_order)}
+
+        self.sets: Dict[EnvironmentKey, FrozenSet[str]] = {}
+        self.ordered: Dict[EnvironmentKey, Tuple[str, ...]] = {}
+        self.masks: Dict[EnvironmentKey, int] = {}
+
+        for level in range(1, 11):
+            self.add(('dungeon', level, None, None, None))
+        wilderness = environment_data.get("wilderness", {})
+        for terrain in [None] + [k for k in wilderness if not k.startswith('_')]:
+            self.add(('wilderness', None, terrain, None, None))
+        self.add(('wilderness', None, None, 'faerie_sylvan', None))
+        for water_type in environment_data.get("underwater", {}):
+            if not water_type.startswith('_'):
+                self.add(('underwater', None, None, None, water_type))
+
+    def add(self, key: EnvironmentKey) -> FrozenSet[str]:
+        """Compute and store the monster set for an environment key"""
+        monsters = self._compute(key)
+        self.sets[key] = monsters
+        self.ordered[key] = tuple(sorted(monsters))
+        self.masks[key] = self.mask_of(monsters)
+        return monsters
+
+    def get(self, key: EnvironmentKey) -> FrozenSet[str]:
+        """Monster set for a key (unknown terrains/water types are added on first use)"""
+        monsters = self.sets.get(key)
+        if monsters is None:
+            monsters = self.add(key)
+        return monsters
+
+    def mask_of(self, monster_ids: Iterable[str]) -> int:
+        """Bitmask for a collection of monster IDs (unknown IDs are ignored)"""
+        mask = 0
+        bits = self.bits
+        for monster_id in monster_ids:
+            mask |= bits.get(monster_id, 0)
+        return mask
+
+    def monsters_in_mask(self, mask: int) -> List[str]:
+        """Monster IDs whose bits are set in a mask (sorted)"""
+        return [m for m in self.bit_order if self.bits[m] & mask]
+
+    def _compute(self, key: EnvironmentKey) -> FrozenSet[str]:
+        location, level, terrain, special, water_type = key
+
+        if location == 'dungeon':
+            dungeon_data = self.environment_data.get("dungeon", {})
+            return frozenset(dungeon_data.get(f"level_{level}", [])) | self.versatile
+
+        if location == 'wilderness':
+            wilderness_data = self.environment_data.get("wilderness", {})
+
+            # Special settings replace terrain entirely
+            if special == 'faerie_sylvan':
+                return frozenset(wilderness_data.get("faerie_sylvan", []))
+
+            if terrain:
+                terrain_monsters = frozenset(wilderness_data.get(terrain, []))
+            else:
+                # No specific terrain - combine all wilderness monsters
+                terrain_monsters = frozenset(
+                    m for t in WILDERNESS_TERRAINS for m in wilderness_data.get(t, [])
+                )
+            return terrain_monsters | self.versatile
+
+        if location == 'underwater':
+            return frozenset(self.environment_data.get("underwater", {}).get(water_type, []))
+
+        return frozenset()
+
+
+# Shared indexes, one per data file
+_environment_indexes: Dict[str, EnvironmentIndex] = {}
+
+
+def get_environment_index(data_path: Optional[Path] = None) -> EnvironmentIndex:
+    """
+    Get the shared index for a monster_environments.json file
+
+    Args:
+        data_path: Path to monster_environments.json (default: package data file)
+
+    Returns:
+        EnvironmentIndex instance
+    """
+    if data_path is None:
+        # Default to data directory relative to this file
+        data_path = Path(__file__).parent.parent / "data" / "monster_environments.json"
+
+    key = str(Path(data_path).resolve())
+    index = _environment_indexes.get(key)
+    if index is None:
+        index = EnvironmentIndex(load_json(data_path))
+        _environment_indexes[key] = index
+
+    return index
+
+
 class EnvironmentMonsterFilter:
     """
     Filters monster encounters based on environment
 
-    Based on AD&D 1e DMG Appendix C tables.
+    Based on AD&D 1e DMG Appendix C tables. Environment sets are
+    precomputed at load; intersections with monster pools are cached.
     """
 
     def __init__(self, data_path: Optional[Path] = None):
@@ -39,12 +198,11 @@ class EnvironmentMonsterFilter:
         Args:
             data_path: Path to monster_environments.json (optional)
         """
-        if data_path is None:
-            # Default to data directory relative to this file
-            data_path = Path(__file__).parent.parent / "data" / "monster_environments.json"
+        self.index = get_environment_index(data_path)
+        self.environment_data = self.index.environment_data
 
-        with open(data_path, 'r') as f:
-            self.environment_data = json.load(f)
+        # (environment key, monster pool) -> filtered pool
+        self._pool_cache: Dict[Tuple[EnvironmentKey, Tuple[str, ...]], Tuple[str, ...]] = {}
 
     def get_appropriate_monsters(
         self,
@@ -59,26 +217,67 @@ class EnvironmentMonsterFilter:
             monster_pool: Optional list to filter. If None, returns all appropriate monsters
 
         Returns:
-            List of monster IDs appropriate for the environment
+            List of monster IDs appropriate for the environment (pool order
+            when a pool is given, otherwise sorted)
         """
-        # Get appropriate monsters based on location type
-        if context.location_type == 'dungeon':
-            appropriate = self._get_dungeon_monsters(context.dungeon_level or 1)
-        elif context.location_type == 'wilderness':
-            appropriate = self._get_wilderness_monsters(context)
-        elif context.location_type == 'underwater':
-            appropriate = self._get_underwater_monsters(context.water_type or 'fresh_shallow')
-        else:
+        if context.location_type not in ('dungeon', 'wilderness', 'underwater'):
             # Unknown location type - return empty list or monster_pool as-is
             return monster_pool or []
 
+        key = environment_key(context)
+
         # Filter the monster pool if provided
         if monster_pool:
-            # Return intersection of appropriate monsters and provided pool
-            appropriate_set = set(appropriate)
-            return [m for m in monster_pool if m in appropriate_set]
+            cache_key = (key, tuple(monster_pool))
+            filtered = self._pool_cache.get(cache_key)
+            if filtered is None:
+                env_mask = self.get_monster_mask(context)
+                bits = self.index.bits
+                filtered = tuple(m for m in monster_pool if bits.get(m, 0) & env_mask)
+                if len(self._pool_cache) >= MAX_CACHED_POOLS:
+                    self._pool_cache.clear()
+                self._pool_cache[cache_key] = filtered
+            return list(filtered)
+
+        self.index.get(key)
+        return list(self.index.ordered[key])
+
+    def get_monster_set(self, context: EnvironmentContext) -> FrozenSet[str]:
+        """
+        Get the precomputed set of monsters for an environment
+
+        Args:
+            context: Environment context
+
+        Returns:
+            Frozen set of monster IDs (shared - do not copy to mutate)
+        """
+        return self.index.get(environment_key(context))
+
+    def get_monster_mask(self, context: EnvironmentContext) -> int:
+        """
+        Get the environment's monsters as a bitmask
 
-        return appropriate
+        Combine masks with & and | for set algebra, then convert back with
+        monsters_in_mask().
+
+        Args:
+            context: Environment context
+
+        Returns:
+            Bitmask over EnvironmentIndex.bit_order
+        """
+        key = environment_key(context)
+        self.index.get(key)
+        return self.index.masks[key]
+
+    def mask_of(self, monster_ids: Iterable[str]) -> int:
+        """Bitmask for a collection of monster IDs"""
+        return self.index.mask_of(monster_ids)
+
+    def monsters_in_mask(self, mask: int) -> List[str]:
+        """Monster IDs set in a bitmask (sorted)"""
+        return self.index.monsters_in_mask(mask)
 
     def _get_dungeon_monsters(self, level: int) -> List[str]:
         """
@@ -90,16 +289,7 @@ class EnvironmentMonsterFilter:
         Returns:
             List of monster IDs
         """
-        level = max(1, min(10, level))  # Clamp to 1-10
-        level_key = f"level_{level}"
-
-        dungeon_data = self.environment_data.get("dungeon", {})
-        monsters = dungeon_data.get(level_key, [])
-
-        # Also include "dungeon_or_wilderness" monsters
-        versatile = self.environment_data.get("environment_categories", {}).get("dungeon_or_wilderness", [])
-
-        return list(set(monsters + versatile))
+        return self.get_appropriate_monsters(EnvironmentContext(location_type='dungeon', dungeon_level=level))
 
     def _get_wilderness_monsters(self, context: EnvironmentContext) -> List[str]:
         """
@@ -111,26 +301,12 @@ class EnvironmentMonsterFilter:
         Returns:
             List of monster IDs
         """
-        wilderness_data = self.environment_data.get("wilderness", {})
-
-        # Handle special settings first
-        if context.special_setting == 'faerie_sylvan':
-            return wilderness_data.get("faerie_sylvan", [])
-
-        # Get monsters for terrain type
-        if context.terrain:
-            terrain_monsters = wilderness_data.get(context.terrain, [])
-        else:
-            # No specific terrain - combine all wilderness monsters
-            terrain_monsters = []
-            for terrain in ['plain', 'forest', 'hills', 'mountains', 'swamp_marsh', 'desert']:
-                terrain_monsters.extend(wilderness_data.get(terrain, []))
-            terrain_monsters = list(set(terrain_monsters))
-
-        # Add versatile monsters
-        versatile = self.environment_data.get("environment_categories", {}).get("dungeon_or_wilderness", [])
-
-        return list(set(terrain_monsters + versatile))
+        wilderness = EnvironmentContext(
+            location_type='wilderness',
+            terrain=context.terrain,
+            special_setting=context.special_setting
+        )
+        return self.get_appropriate_monsters(wilderness)
 
     def _get_underwater_monsters(self, water_type: str) -> List[str]:
         """
@@ -142,8 +318,8 @@ class EnvironmentMonsterFilter:
         Returns:
             List of monster IDs
         """
-        underwater_data = self.environment_data.get("underwater", {})
-        return underwater_data.get(water_type, [])
+        context = EnvironmentContext(location_type='underwater', water_type=water_type)
+        return self.get_appropriate_monsters(context)
 
     def is_appropriate(
         self,
@@ -160,8 +336,9 @@ class EnvironmentMonsterFilter:
         Returns:
             True if monster can appear in this environment
         """
-        appropriate_monsters = self.get_appropriate_monsters(context)
-        return monster_id in appropriate_monsters
+        if context.location_type not in ('dungeon', 'wilderness', 'underwater'):
+            return False
+        return monster_id in self.get_monster_set(context)
 
     def filter_inappropriate(
         self,
@@ -178,7 +355,10 @@ class EnvironmentMonsterFilter:
         Returns:
             Filtered list with only appropriate monsters
         """
-        return [m for m in monster_list if self.is_appropriate(m, context)]
+        if context.location_type not in ('dungeon', 'wilderness', 'underwater'):
+            return []
+        appropriate = self.get_monster_set(context)
+        return [m for m in monster_list if m in appropriate]
 
     def get_never_dungeon_monsters(self) -> List[str]:
         """
@@ -3,52 +3,154 @@ Experience Point and Leveling System - AD&D 1e
 Handles XP tracking, level advancement, and all progression mechanics
 """
 
-import json
 import random
+from bisect import bisect_right
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
+
+from .data_cache import load_json
+
+
+@dataclass(frozen=True)
+class LevelStats:
+    """Compiled progression row for one class at one level"""
+    char_class: str
+    level: int
+    xp_required: int
+    thac0: int
+    title: str
+    spell_slots: Tuple[Tuple[int, int], ...]  # (spell level, slots)
+    attacks_per_round: float
+    backstab_multiplier: int
+    hit_die: int  # Die size ("d10" -> 10)
+    rolls_hit_die: bool  # False past max HD level (fixed HP instead)
+    hp_after_max: int
+    monk_ac: Optional[int] = None
+
+
+def _range_value(table: Dict[str, Any], level: int, default):
+    """Value for a level from a table keyed by "low-high" or single-level strings"""
+    for level_range, value in table.items():
+        if '-' in level_range:
+            low, high = map(int, level_range.split('-'))
+            if low <= level <= high:
+                return value
+        elif level == int(level_range):
+            return value
+    return default
 
 
 class ExperienceSystem:
-    """Manages XP tracking and level advancement"""
+    """
+    Manages XP tracking and level advancement
+
+    level_progression.json is compiled at load into a per-class matrix of
+    LevelStats rows (one per table level); levels past the tables are
+    built on first use and cached. XP -> level uses bisect over each
+    class's XP table.
+    """
 
     def __init__(self):
         """Load level progression data"""
         data_path = Path(__file__).parent.parent / 'data' / 'level_progression.json'
-        with open(data_path, 'r') as f:
-            self.progression = json.load(f)
+        self.progression = load_json(data_path)
 
-    def get_xp_for_level(self, char_class: str, level: int) -> int:
-        """Get XP required for a specific level"""
-        if char_class not in self.progression:
-            return 0
+        # Class -> LevelStats rows (index = level - 1)
+        self._matrix: Dict[str, List[LevelStats]] = {}
+        # (class, level) -> LevelStats for levels beyond the tables
+        self._extra_levels: Dict[Tuple[str, int], LevelStats] = {}
+
+        for char_class, data in self.progression.items():
+            self._matrix[char_class] = [
+                self._build_level_stats(char_class, level)
+                for level in range(1, len(data['xp_table']) + 1)
+            ]
 
-        xp_table = self.progression[char_class]['xp_table']
+    def _build_level_stats(self, char_class: str, level: int) -> LevelStats:
+        """Compile one progression row from the JSON tables"""
+        data = self.progression[char_class]
 
-        # Level 1 is index 0
+        # XP (beyond the table: fixed XP per additional level)
+        xp_table = data['xp_table']
         if level <= len(xp_table):
-            return xp_table[level - 1]
+            xp_required = xp_table[level - 1]
+        else:
+            xp_required = xp_table[-1] + data['xp_per_level_after_max'] * (level - len(xp_table))
+
+        # THAC0 (beyond the table: last value)
+        thac0_table = data['thac0_table']
+        thac0 = thac0_table[min(level, len(thac0_table)) - 1]
+
+        # Title (beyond defined titles: last title with level)
+        titles = data['level_titles']
+        if level <= len(titles):
+            title = titles[level - 1]
+        else:
+            title = f"{titles[-1]} ({level}th level)"
+
+        # Spell slots (beyond the table: last value)
+        spell_slots = tuple(
+            (int(spell_level), slot_list[min(level, len(slot_list)) - 1])
+            for spell_level, slot_list in data.get('spell_slots', {}).items()
+        )
+
+        monk_ac = None
+        if 'ac_progression' in data:
+            monk_ac = data['ac_progression'].get(str(level))
+
+        return LevelStats(
+            char_class=char_class,
+            level=level,
+            xp_required=xp_required,
+            thac0=thac0,
+            title=title,
+            spell_slots=spell_slots,
+            attacks_per_round=_range_value(data['attacks_per_round'], level, 1.0),
+            backstab_multiplier=_range_value(data.get('backstab_multiplier', {}), level, 1),
+            hit_die=int(data['hit_die'][1:]),
+            rolls_hit_die=level <= data['max_hd_level'],
+            hp_after_max=data['hp_after_max'],
+            monk_ac=monk_ac
+        )
+
+    def get_level_stats(self, char_class: str, level: int) -> Optional[LevelStats]:
+        """
+        Get the compiled stat block for a class and level
 
-        # Beyond the table, calculate
-        xp_per_level = self.progression[char_class]['xp_per_level_after_max']
-        last_xp = xp_table[-1]
-        additional_levels = level - len(xp_table)
-        return last_xp + (xp_per_level * additional_levels)
+        Args:
+            char_class: Character class name
+            level: Character level (1+)
+
+        Returns:
+            LevelStats, or None for unknown classes
+        """
+        rows = self._matrix.get(char_class)
+        if rows is None:
+            return None
+
+        if 1 <= level <= len(rows):
+            return rows[level - 1]
+
+        key = (char_class, level)
+        stats = self._extra_levels.get(key)
+        if stats is None:
+            stats = self._build_level_stats(char_class, level)
+            self._extra_levels[key] = stats
+        return stats
+
+    def get_xp_for_level(self, char_class: str, level: int) -> int:
+        """Get XP required for a specific level"""
+        stats = self.get_level_stats(char_class, level)
+        return stats.xp_required if stats else 0
 
     def get_level_from_xp(self, char_class: str, xp: int) -> int:
         """Determine level based on current XP"""
         if char_class not in self.progression:
             return 1
 
-        xp_table = self.progression[char_class]['xp_table']
-
-        # Check table first
-        for level in range(len(xp_table) - 1, -1, -1):
-            if xp >= xp_table[level]:
-                return level + 1
-
-        # Shouldn't happen, but return 1 if no match
-        return 1
+        # Highest table level whose threshold has been reached
+        return max(1, bisect_right(self.progression[char_class]['xp_table'], xp))
 
     def can_level_up(self, char_class: str, current_level: int, current_xp: int) -> bool:
         """Check if character has enough XP to level up"""
@@ -57,106 +159,46 @@ class ExperienceSystem:
 
     def get_thac0(self, char_class: str, level: int) -> int:
         """Get THAC0 for class and level"""
-        if char_class not in self.progression:
-            return 20
-
-        thac0_table = self.progression[char_class]['thac0_table']
-        if level <= len(thac0_table):
-            return thac0_table[level - 1]
-
-        # If beyond table, return last value
-        return thac0_table[-1]
+        stats = self.get_level_stats(char_class, level)
+        return stats.thac0 if stats else 20
 
     def get_level_title(self, char_class: str, level: int) -> str:
         """Get the title for this class and level"""
-        if char_class not in self.progression:
-            return "Adventurer"
-
-        titles = self.progression[char_class]['level_titles']
-        if level <= len(titles):
-            return titles[level - 1]
-
-        # Beyond defined titles
-        return f"{titles[-1]} ({level}th level)"
+        stats = self.get_level_stats(char_class, level)
+        return stats.title if stats else "Adventurer"
 
     def get_spell_slots(self, char_class: str, level: int) -> Dict[int, int]:
         """Get spell slots by level for this class and level"""
-        if char_class not in self.progression:
-            return {}
-
-        if 'spell_slots' not in self.progression[char_class]:
-            return {}
-
-        slots = {}
-        spell_data = self.progression[char_class]['spell_slots']
-
-        for spell_level, slot_list in spell_data.items():
-            spell_level_int = int(spell_level)
-            if level <= len(slot_list):
-                slots[spell_level_int] = slot_list[level - 1]
-            else:
-                slots[spell_level_int] = slot_list[-1]
-
-        return slots
+        stats = self.get_level_stats(char_class, level)
+        return dict(stats.spell_slots) if stats else {}
 
     def get_attacks_per_round(self, char_class: str, level: int) -> float:
         """Get number of attacks per round (can be 1, 1.5, or 2)"""
-        if char_class not in self.progression:
-            return 1.0
-
-        attack_data = self.progression[char_class]['attacks_per_round']
-
-        for level_range, attacks in attack_data.items():
-            if '-' in level_range:
-                low, high = map(int, level_range.split('-'))
-                if low <= level <= high:
-                    return attacks
-            else:
-                if level == int(level_range):
-                    return attacks
-
-        return 1.0
+        stats = self.get_level_stats(char_class, level)
+        return stats.attacks_per_round if stats else 1.0
 
     def get_backstab_multiplier(self, char_class: str, level: int) -> int:
         """Get backstab damage multiplier for thieves/assassins"""
-        if char_class not in self.progression:
-            return 1
-
-        if 'backstab_multiplier' not in self.progression[char_class]:
-            return 1
-
-        multiplier_data = self.progression[char_class]['backstab_multiplier']
-
-        for level_range, multiplier in multiplier_data.items():
-            low, high = map(int, level_range.split('-'))
-            if low <= level <= high:
-                return multiplier
-
-        return 1
+        stats = self.get_level_stats(char_class, level)
+        return stats.backstab_multiplier if stats else 1
 
     def roll_hp_for_level(self, char_class: str, level: int, constitution_mod: int) -> int:
         """
         Roll HP for a new level
         Returns HP gained (including CON modifier)
         """
-        if char_class not in self.progression:
+        stats = self.get_level_stats(char_class, level)
+        if stats is None:
             return 1
 
-        hit_die = self.progression[char_class]['hit_die']
-        max_hd_level = self.progression[char_class]['max_hd_level']
-        hp_after_max = self.progression[char_class]['hp_after_max']
-
-        # Determine die type
-        die_size = int(hit_die[1:])  # "d10" -> 10
-
         # Before max HD level: roll the die
-        if level <= max_hd_level:
-            roll = random.randint(1, die_size)
+        if stats.rolls_hit_die:
+            roll = random.randint(1, stats.hit_die)
             # Add CON modifier (minimum 1 HP per level)
             return max(1, roll + constitution_mod)
         else:
             # After max HD level: fixed bonus (no CON mod for most classes after max HD)
-            return hp_after_max
+            return stats.hp_after_max
 
     def calculate_xp_award(self, monster_hd: float, treasure_gp: int, special_bonus: int = 0) -> int:
         """
@@ -245,10 +287,10 @@ class ExperienceSystem:
         special_abilities_gained = []
 
         # Monk AC improvement
-        if character.char_class == 'Monk' and 'ac_progression' in self.progression['Monk']:
-            ac_table = self.progression['Monk']['ac_progression']
-            if str(new_level) in ac_table:
-                character.ac = ac_table[str(new_level)]
+        if character.char_class == 'Monk':
+            monk_ac = self.get_level_stats('Monk', new_level).monk_ac
+            if monk_ac is not None:
+                character.ac = monk_ac
                 special_abilities_gained.append(f"AC improved to {character.ac}")
 
         # Backstab multiplier
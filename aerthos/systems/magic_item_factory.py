@@ -5,11 +5,11 @@ Converts treasure generation dictionaries into functional magic item objects.
 Bridges the gap between treasure tables and usable game items.
 """
 
-import json
 import re
 from pathlib import Path
 from typing import Dict, Optional, Union
 
+from .data_cache import load_json
 from ..entities.player import Item, Weapon, Armor, Shield
 from ..entities.magic_items import Potion, Scroll, Ring, Wand, Staff, MiscMagic
 
@@ -38,11 +38,9 @@ class MagicItemFactory:
             base_dir = Path(__file__).parent.parent
             magic_items_path = base_dir / "data" / "magic_items.json"
 
-        with open(items_path, 'r') as f:
-            self.base_items = json.load(f)
+        self.base_items = load_json(items_path)
 
-        with open(magic_items_path, 'r') as f:
-            self.magic_items = json.load(f)
+        self.magic_items = load_json(magic_items_path)
 
     def create_from_treasure(self, treasure_dict: Dict) -> Union[Item, Potion, Scroll, Ring, Wand, Staff, MiscMagic]:
         """
@@ -0,0 +1,304 @@
+"""
+Compiled Monster Database
+
+monsters.json is the canonical monster data. The build step
+(scripts/build_monster_db.py, or compile_monster_bundle()) turns it into
+monsters.bundle: a small header index followed by the full records.
+
+    AERTHOS-MONSTERS <format version>\\n
+    <header JSON>\\n
+    <record JSON><record JSON>...
+
+The header holds what selection code needs for every monster (name, hit
+dice, XP, size, alignment, environment tags) plus each record's offset and
+length. Only the header is parsed at startup; full records, including the
+long descriptions, are read and parsed the first time a monster is used.
+
+Everything goes through one shared MonsterDatabase (get_monster_database),
+so GameData, MonsterScaler and EncounterDetermination no longer each hold
+their own full copy of the monster data.
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterator, List, Mapping, Optional, Set
+
+
+DATA_DIR = Path(__file__).parent.parent / 'data'
+MONSTER_SOURCE = DATA_DIR / 'monsters.json'
+MONSTER_ENVIRONMENTS = DATA_DIR / 'monster_environments.json'
+MONSTER_BUNDLE = DATA_DIR / 'monsters.bundle'
+
+logger = logging.getLogger(__name__)
+
+# Bump when the bundle layout changes
+BUNDLE_FORMAT = 1
+BUNDLE_MAGIC = b'AERTHOS-MONSTERS'
+
+
+@dataclass(frozen=True)
+class MonsterHeader:
+    """Index entry for one monster (always resident)"""
+    monster_id: str
+    name: str
+    hit_dice: str
+    xp_value: int
+    size: str
+    alignment: str
+    environments: FrozenSet[str]
+
+
+def environment_tags(environment_data: Dict, known_ids) -> Dict[str, Set[str]]:
+    """
+    Environment tag -> monster IDs from monster_environments.json data
+
+    Keys are the section names ('dungeon', 'wilderness', 'underwater') and
+    their lists ('forest', 'fresh_water_shallow', 'never_dungeon', ...).
+    Dungeon levels are keyed 'dungeon_level_1' .. 'dungeon_level_10'.
+
+    Args:
+        environment_data: Parsed monster_environments.json
+        known_ids: Monster IDs to keep (others are ignored)
+    """
+    index: Dict[str, Set[str]] = {}
+    for section, entries in environment_data.items():
+        if not isinstance(entries, dict) or section.startswith('_'):
+            continue
+        for key, monster_ids in entries.items():
+            if not isinstance(monster_ids, list):
+                continue
+            known = {m for m in monster_ids if m in known_ids}
+            tag = f"dungeon_{key}" if section == 'dungeon' else key
+            index.setdefault(tag, set()).update(known)
+            if section != 'environment_categories':
+                index.setdefault(section, set()).update(known)
+    return index
+
+
+def _sha256(path: Path) -> str:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return ''
+
+
+def build_monster_bundle(source: Path = MONSTER_SOURCE,
+                         environments: Path = MONSTER_ENVIRONMENTS) -> bytes:
+    """
+    Compile monster data into bundle bytes
+
+    Args:
+        source: Canonical monsters.json
+        environments: monster_environments.json for the environment tags
+
+    Returns:
+        Bundle file contents
+    """
+    source = Path(source)
+    environments = Path(environments)
+
+    with open(source, 'r') as f:
+        monsters = json.load(f)
+
+    tags_by_monster: Dict[str, List[str]] = {}
+    if environments.exists():
+        with open(environments, 'r') as f:
+            for tag, ids in environment_tags(json.load(f), monsters).items():
+                for monster_id in ids:
+                    tags_by_monster.setdefault(monster_id, []).append(tag)
+
+    records = bytearray()
+    index = {}
+    for monster_id, data in monsters.items():
+        record = json.dumps(data, separators=(',', ':')).encode('utf-8')
+        index[monster_id] = [
+            data.get('name', monster_id),
+            data.get('hit_dice', '1d8'),
+            data.get('xp_value', 0),
+            data.get('size', 'M'),
+            data.get('alignment', 'Neutral'),
+            sorted(tags_by_monster.get(monster_id, [])),
+            len(records),
+            len(record)
+        ]
+        records += record
+
+    header = {
+        'source_sha256': _sha256(source),
+        'environments_sha256': _sha256(environments),
+        'monsters': index
+    }
+
+    return b''.join([
+        BUNDLE_MAGIC, f" {BUNDLE_FORMAT}\n".encode('ascii'),
+        json.dumps(header, separators=(',', ':')).encode('utf-8'), b'\n',
+        bytes(records)
+    ])
+
+
+def compile_monster_bundle(source: Path = MONSTER_SOURCE,
+                           environments: Path = MONSTER_ENVIRONMENTS,
+                           output: Path = MONSTER_BUNDLE) -> Path:
+    """
+    Build step: compile monsters.json into monsters.bundle
+
+    Args:
+        source: Canonical monsters.json
+        environments: monster_environments.json
+        output: Bundle file to write
+
+    Returns:
+        Path written
+    """
+    output = Path(output)
+    tmp_path = output.with_name(output.name + '.tmp')
+    tmp_path.write_bytes(build_monster_bundle(source, environments))
+    tmp_path.replace(output)
+    return output
+
+
+class MonsterRecords(Mapping):
+    """
+    Read-only monster ID -> full record mapping, loaded on demand
+
+    Drop-in for the old monsters.json dict (game_data.monsters). Records
+    are shared, so callers must not modify them.
+    """
+
+    def __init__(self, database: 'MonsterDatabase'):
+        self._database = database
+
+    def __getitem__(self, monster_id: str) -> Dict:
+        return self._database.record(monster_id)
+
+    def __contains__(self, monster_id) -> bool:
+        return monster_id in self._database.headers
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._database.headers)
+
+    def __len__(self) -> int:
+        return len(self._database.headers)
+
+
+class MonsterDatabase:
+    """
+    Header index plus lazily parsed monster records
+
+    Usage:
+        db = get_monster_database()
+        db.headers['orc'].hit_dice          # Resident index
+        db.record('orc')['description']     # Parsed on first use
+        db.records['orc']                   # Same, as a Mapping
+    """
+
+    def __init__(self, bundle: bytes, path: Optional[Path] = None):
+        """
+        Args:
+            bundle: Bundle contents (see build_monster_bundle)
+            path: Bundle file the contents came from (informational)
+        """
+        first_newline = bundle.index(b'\n')
+        magic, _, version = bundle[:first_newline].partition(b' ')
+        if magic != BUNDLE_MAGIC or int(version) != BUNDLE_FORMAT:
+            raise ValueError(f"Not a format {BUNDLE_FORMAT} monster bundle: {path or '<memory>'}")
+
+        header_end = bundle.index(b'\n', first_newline + 1)
+        header = json.loads(bundle[first_newline + 1:header_end])
+
+        self.path = path
+        self.source_sha256: str = header['source_sha256']
+        self.environments_sha256: str = header['environments_sha256']
+
+        # Records stay as undecoded bytes until used
+        self._records_blob = memoryview(bundle)[header_end + 1:]
+        self._spans: Dict[str, tuple] = {}
+        self._records: Dict[str, Dict] = {}
+
+        self.headers: Dict[str, MonsterHeader] = {}
+        for monster_id, (name, hit_dice, xp_value, size, alignment, tags, offset, length) \
+                in header['monsters'].items():
+            self.headers[monster_id] = MonsterHeader(
+                monster_id, name, hit_dice, xp_value, size, alignment, frozenset(tags))
+            self._spans[monster_id] = (offset, length)
+
+        self.records = MonsterRecords(self)
+
+    @classmethod
+    def load(cls, path: Path = MONSTER_BUNDLE) -> 'MonsterDatabase':
+        """Open a bundle file"""
+        path = Path(path)
+        return cls(path.read_bytes(), path)
+
+    def is_current(self, source: Path = MONSTER_SOURCE,
+                   environments: Path = MONSTER_ENVIRONMENTS) -> bool:
+        """True if the bundle was compiled from the current source files"""
+        return (self.source_sha256 == _sha256(Path(source)) and
+                self.environments_sha256 == _sha256(Path(environments)))
+
+    def record(self, monster_id: str) -> Dict:
+        """
+        Full record for a monster (parsed on first use, then cached)
+
+        Raises:
+            KeyError: Unknown monster ID
+        """
+        record = self._records.get(monster_id)
+        if record is None:
+            offset, length = self._spans[monster_id]
+            record = json.loads(bytes(self._records_blob[offset:offset + length]))
+            self._records[monster_id] = record
+        return record
+
+    def description(self, monster_id: str) -> str:
+        """Long description for a monster"""
+        return self.record(monster_id).get('description', '')
+
+    def environment_index(self) -> Dict[str, FrozenSet[str]]:
+        """Environment tag -> monster IDs (see environment_tags)"""
+        index: Dict[str, Set[str]] = {}
+        for monster_id, header in self.headers.items():
+            for tag in header.environments:
+                index.setdefault(tag, set()).add(monster_id)
+        return {tag: frozenset(ids) for tag, ids in index.items()}
+
+    def __contains__(self, monster_id) -> bool:
+        return monster_id in self.headers
+
+    def __len__(self) -> int:
+        return len(self.headers)
+
+
+_monster_database: Optional[MonsterDatabase] = None
+
+
+def get_monster_database() -> MonsterDatabase:
+    """
+    Shared monster database
+
+    Opens monsters.bundle; if it is missing or older than monsters.json,
+    the bundle is rebuilt (in memory if the data directory is read-only).
+    """
+    global _monster_database
+    if _monster_database is None:
+        database = None
+        if MONSTER_BUNDLE.exists():
+            try:
+                database = MonsterDatabase.load(MONSTER_BUNDLE)
+            except (OSError, ValueError) as e:
+                logger.warning("Ignoring unreadable %s: %s", MONSTER_BUNDLE.name, e)
+
+        if database is None or not database.is_current():
+            logger.info("%s is missing or out of date; recompiling from %s",
+                        MONSTER_BUNDLE.name, MONSTER_SOURCE.name)
+            try:
+                database = MonsterDatabase.load(compile_monster_bundle(output=MONSTER_BUNDLE))
+            except OSError:
+                database = MonsterDatabase(build_monster_bundle())
+
+        _monster_database = database
+
+    return _monster_database
@@ -9,6 +9,8 @@ import random
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 
+from ..engine.combat_events import ATTACK, HIT, CRITICAL, FUMBLE, KILLED, render_event
+
 
 @dataclass
 class NarrativeContext:
@@ -198,7 +200,8 @@ class DMNarrator:
         room_type: str,
         size: str,
         primary_features: List[str],
-        context: NarrativeContext
+        context: NarrativeContext,
+        rng: Optional[random.Random] = None
     ) -> str:
         """
         Generate atmospheric room entrance description
@@ -208,20 +211,22 @@ class DMNarrator:
             size: Size description (small, large, vast, etc.)
             primary_features: List of notable features
             context: Narrative context
+            rng: Random source for reproducible descriptions (default: module random)
 
         Returns:
             Formatted description string
         """
-        template = random.choice(self.room_entrance_templates)
+        rng = rng or random
+        template = rng.choice(self.room_entrance_templates)
 
         # Determine article
         article = "an" if room_type[0].lower() in "aeiou" else "a"
         article_cap = article.capitalize()
 
         # Pick verb
-        verb = random.choice(self.room_verbs)
-        opens = random.choice(self.room_opens_verbs)
-        leads = random.choice(self.room_leads_verbs)
+        verb = rng.choice(self.room_verbs)
+        opens = rng.choice(self.room_opens_verbs)
+        leads = rng.choice(self.room_leads_verbs)
 
         # Add size if significant
         if size in ["large", "huge", "vast"]:
@@ -229,18 +234,18 @@ class DMNarrator:
 
         # Primary feature
         if primary_features:
-            primary_feature = random.choice(primary_features)
+            primary_feature = rng.choice(primary_features)
         else:
             primary_feature = "The room appears empty at first glance."
 
         # Secondary feature (sensory)
-        sensory = self._get_sensory_detail(context)
+        sensory = self._get_sensory_detail(context, rng)
 
         # Atmospheric detail
-        atmosphere = self._get_atmospheric_detail(context)
+        atmosphere = self._get_atmospheric_detail(context, rng)
 
         # Door type
-        door_type = random.choice(["door", "doorway", "entrance", "portal"])
+        door_type = rng.choice(["door", "doorway", "entrance", "portal"])
 
         # Format description
         description = template.format(
@@ -302,6 +307,33 @@ class DMNarrator:
 
         return f"{attacker_name} {verb} {defender_name} for {damage} damage!"
 
+    def render_event(self, event, weapon_type: str = "default") -> str:
+        """
+        Narrate a CombatEvent with DM flavour
+
+        Attacks get describe_combat_round() phrasing; other events use the
+        standard one-line rendering. Pass as the renderer to
+        CombatEventStream.render().
+
+        Args:
+            event: CombatEvent to narrate
+            weapon_type: Weapon type used to pick hit verbs
+
+        Returns:
+            Narrative string
+        """
+        if event.kind != ATTACK:
+            return render_event(event)
+
+        text = self.describe_combat_round(
+            event.actor, event.target, weapon_type,
+            hit=event.has(HIT), damage=event.damage,
+            is_critical=event.has(CRITICAL), is_fumble=event.has(FUMBLE)
+        )
+        if event.has(KILLED):
+            text += f" {event.target} is slain!"
+        return text
+
     def describe_encounter_start(
         self,
         monster_name: str,
@@ -425,14 +457,14 @@ class DMNarrator:
 
         return " ".join(descriptions)
 
-    def _get_sensory_detail(self, context: NarrativeContext) -> str:
+    def _get_sensory_detail(self, context: NarrativeContext, rng=random) -> str:
         """Get appropriate sensory detail for context"""
         details = []
 
         # Smell
         if context.location_type in self.smells:
             smell_options = self.smells[context.location_type]
-            smell = random.choice(smell_options)
+            smell = rng.choice(smell_options)
             details.append(f"You catch the scent of {smell}.")
 
         # Sound
@@ -441,24 +473,24 @@ class DMNarrator:
         elif len(context.recent_events) > 0:
             sound_type = "inhabited"
         else:
-            sound_type = random.choice(["empty", "empty", "inhabited"])  # Bias toward empty
+            sound_type = rng.choice(["empty", "empty", "inhabited"])  # Bias toward empty
 
-        sound = random.choice(self.sounds[sound_type])
+        sound = rng.choice(self.sounds[sound_type])
         details.append(f"You hear {sound}.")
 
         return " ".join(details) if details else ""
 
-    def _get_atmospheric_detail(self, context: NarrativeContext) -> str:
+    def _get_atmospheric_detail(self, context: NarrativeContext, rng=random) -> str:
         """Get atmospheric description based on context"""
         if not context.atmosphere:
             return ""
 
         # Pick one atmosphere element
-        atmosphere_type = random.choice(context.atmosphere)
+        atmosphere_type = rng.choice(context.atmosphere)
 
         if atmosphere_type in self.atmosphere_templates:
             templates = self.atmosphere_templates[atmosphere_type]
-            return random.choice(templates).capitalize() + "."
+            return rng.choice(templates).capitalize() + "."
 
         return ""
 
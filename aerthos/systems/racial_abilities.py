@@ -3,9 +3,9 @@ Racial Special Abilities System for AD&D 1e
 Handles all racial special abilities from the Players Handbook
 """
 
-import json
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
+from .data_cache import load_json
 from ..entities.character import Character
 
 
@@ -15,8 +15,7 @@ class RacialAbilitiesSystem:
     def __init__(self):
         """Load racial data from races.json"""
         data_path = Path(__file__).parent.parent / 'data' / 'races.json'
-        with open(data_path, 'r') as f:
-            self.races = json.load(f)
+        self.races = load_json(data_path)
 
     def get_level_limit(self, race: str, char_class: str, **ability_scores) -> int:
         """
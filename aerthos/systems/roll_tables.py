@@ -0,0 +1,152 @@
+"""
+Roll Table Compiler
+
+Turns ranged DMG tables (entries with "roll": "01-03", "17", "69-00", ...)
+into direct roll -> entry lookup arrays. Tables are compiled once when the
+owning system loads its data, so a roll is a single index instead of a
+scan that re-parses every range string.
+
+Compilation validates the table: every face of the die must be covered by
+exactly one entry, otherwise RollTableError names the gaps or overlaps.
+"""
+
+import random
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+class RollTableError(ValueError):
+    """Raised when a ranged table has gaps, overlaps or out-of-range entries"""
+
+
+def parse_roll_range(roll_range: str, die: int = 100) -> Tuple[int, int]:
+    """
+    Parse a roll range string
+
+    Args:
+        roll_range: Range like "1-2", "01-03", "17" or "69-00" ("00" = 100)
+        die: Die size the table is rolled on
+
+    Returns:
+        (low, high) inclusive bounds
+    """
+    def face(text: str) -> int:
+        text = text.strip()
+        # Percentile dice read "00" as 100
+        if text == "00" and die == 100:
+            return 100
+        return int(text)
+
+    if '-' in roll_range:
+        low, high = roll_range.split('-', 1)
+        return face(low), face(high)
+
+    value = face(roll_range)
+    return value, value
+
+
+class RollTable:
+    """
+    A compiled ranged table
+
+    Usage:
+        table = compile_roll_table(entries, die=100, name='potions')
+        entry = table.roll()       # Roll the die and look up the entry
+        entry = table.get(37)      # Look up a specific roll
+    """
+
+    __slots__ = ('name', 'die', 'entries', '_lookup')
+
+    def __init__(self, name: str, die: int, entries: Sequence[Dict], lookup: Tuple[Dict, ...]):
+        self.name = name
+        self.die = die
+        self.entries = entries
+        self._lookup = lookup
+
+    def get(self, roll: int, default: Optional[Dict] = None) -> Optional[Dict]:
+        """
+        Look up the entry for a roll
+
+        Args:
+            roll: Die result (1 to die)
+            default: Returned when the roll is off the table
+
+        Returns:
+            Matching table entry
+        """
+        if 1 <= roll <= self.die:
+            return self._lookup[roll - 1]
+        return default
+
+    def roll(self, rng=random) -> Dict:
+        """Roll the table's die and return the matching entry"""
+        return self._lookup[rng.randint(1, self.die) - 1]
+
+    def __len__(self) -> int:
+        return self.die
+
+    def __repr__(self) -> str:
+        return f"RollTable({self.name!r}, d{self.die}, {len(self.entries)} entries)"
+
+
+def compile_roll_table(entries: Sequence[Dict], die: Optional[int] = None,
+                       name: str = 'table', key: str = 'roll') -> RollTable:
+    """
+    Compile a ranged table into a roll -> entry lookup
+
+    Args:
+        entries: Table entries, each holding a range string under `key`
+        die: Die size (None = infer from the highest range bound)
+        name: Table name used in error messages
+        key: Entry field holding the range string
+
+    Returns:
+        Compiled RollTable
+
+    Raises:
+        RollTableError: If the table has gaps, overlaps or out-of-range entries
+    """
+    if not entries:
+        raise RollTableError(f"Roll table '{name}' has no entries")
+
+    # "00" only means 100 on percentile tables, so look for it before inferring
+    if die is None:
+        percentile = any(str(entry[key]).strip().endswith('00') for entry in entries)
+        die = 100 if percentile else 0
+
+    ranges = [parse_roll_range(str(entry[key]), die or 100) for entry in entries]
+    if not die:
+        die = max(high for _, high in ranges)
+
+    slots: List[Optional[Dict]] = [None] * die
+    overlaps = []
+    for entry, (low, high) in zip(entries, ranges):
+        if low < 1 or high > die or low > high:
+            raise RollTableError(
+                f"Roll table '{name}': range '{entry[key]}' is outside 1-{die}")
+        for roll in range(low, high + 1):
+            if slots[roll - 1] is not None:
+                overlaps.append(roll)
+            slots[roll - 1] = entry
+
+    if overlaps:
+        raise RollTableError(f"Roll table '{name}': overlapping rolls {_format_rolls(sorted(set(overlaps)))}")
+
+    gaps = [roll for roll, entry in enumerate(slots, start=1) if entry is None]
+    if gaps:
+        raise RollTableError(f"Roll table '{name}': no entry for rolls {_format_rolls(gaps)}")
+
+    return RollTable(name, die, entries, tuple(slots))
+
+
+def _format_rolls(rolls: List[int]) -> str:
+    """Format roll numbers compactly, e.g. [1, 2, 3, 7] -> '1-3, 7'"""
+    spans = []
+    start = previous = rolls[0]
+    for roll in rolls[1:] + [None]:
+        if roll is not None and roll == previous + 1:
+            previous = roll
+            continue
+        spans.append(str(start) if start == previous else f"{start}-{previous}")
+        if roll is not None:
+            start = previous = roll
+    return ', '.join(spans)
@@ -3,11 +3,82 @@ Saving Throw system for AD&D 1e
 5 categories: Poison, Rod/Staff/Wand, Petrify/Paralyze, Breath, Spell
 """
 
-import json
 import random
 from pathlib import Path
-from typing import Dict, Optional
-from ..entities.character import Character
+from typing import Dict, List, Optional, Sequence, Tuple
+from .data_cache import load_json
+from ..entities.character import Character, _get_ability_system
+from ..engine.combat_events import (
+    SAVE, SAVED, NATURAL, CombatEvent, CombatEventStream, LazyResult, render_save
+)
+
+
+class GroupSaveResult:
+    """
+    One target's result from SavingThrowResolver.make_group_save
+
+    Holds the same fields as a make_save() result dict; the narrative is
+    only built when something reads it.
+    """
+
+    __slots__ = ('character', 'category', 'success', 'roll', 'base_target',
+                 'adjusted_target', 'modifiers_applied', 'natural_20_or_1', 'final_damage')
+
+    def __init__(self, character: Character, category: str, roll: int,
+                 base_target: int, modifiers_applied: int):
+        self.character = character
+        self.category = category
+        self.roll = roll
+        self.base_target = base_target
+        self.modifiers_applied = modifiers_applied
+        self.adjusted_target = base_target - modifiers_applied
+        self.natural_20_or_1 = roll in (1, 20)
+        if self.natural_20_or_1:
+            self.success = roll == 1
+        else:
+            self.success = roll <= self.adjusted_target
+        self.final_damage: Optional[int] = None
+
+    @property
+    def narrative(self) -> str:
+        """Narrative line, identical to make_save()'s"""
+        text = render_save(self.character.name, self.category, self.roll, self.base_target,
+                           self.modifiers_applied, self.success)
+        if self.final_damage is not None:
+            text += _damage_narrative(self.success, self.final_damage)
+        return text
+
+    def to_dict(self) -> Dict:
+        """Result as a make_save()-style dict (narrative rendered on first read)"""
+        result = LazyResult({'narrative': lambda _: self.narrative}, {
+            'success': self.success,
+            'roll': self.roll,
+            'base_target': self.base_target,
+            'adjusted_target': self.adjusted_target,
+            'modifiers_applied': self.modifiers_applied,
+            'natural_20_or_1': self.natural_20_or_1
+        })
+        if self.final_damage is not None:
+            result['final_damage'] = self.final_damage
+        return result
+
+    def to_event(self) -> CombatEvent:
+        """Structured record for a CombatEventStream"""
+        flags = (SAVED if self.success else 0) | (NATURAL if self.natural_20_or_1 else 0)
+        return CombatEvent(SAVE, self.character.name, roll=self.roll, damage=self.final_damage or 0,
+                           flags=flags, detail=self.category, target_number=self.base_target,
+                           modifier=self.modifiers_applied)
+
+    def __repr__(self) -> str:
+        outcome = 'success' if self.success else 'failure'
+        return f"GroupSaveResult({self.character.name!r}, {self.category!r}, {self.roll}, {outcome})"
+
+
+def _damage_narrative(success: bool, final_damage: int) -> str:
+    """Suffix describing damage after a save for half"""
+    if success:
+        return f" Damage reduced to {final_damage}!"
+    return f" Takes full {final_damage} damage!"
 
 
 class SavingThrowResolver:
@@ -49,8 +120,17 @@ class SavingThrowResolver:
     def __init__(self):
         """Load saving throw progression tables"""
         data_path = Path(__file__).parent.parent / 'data' / 'saving_throw_tables.json'
-        with open(data_path, 'r') as f:
-            self.tables = json.load(f)
+        self.tables = load_json(data_path)
+
+        self._racial_system = None
+
+    def save_attribute(self, category: str) -> str:
+        """
+        Resolve a save category (or alias) to its Character attribute
+
+        Unknown categories default to the spell save.
+        """
+        return self.CATEGORIES.get(category.lower(), 'save_spell')
 
     def get_saves_for_level(self, char_class: str, level: int, race_bonus: int = 0) -> Dict[str, int]:
         """
@@ -109,10 +189,11 @@ class SavingThrowResolver:
         Returns:
             Bonus value (0-5)
         """
-        from ..systems.racial_abilities import RacialAbilitiesSystem
+        if self._racial_system is None:
+            from ..systems.racial_abilities import RacialAbilitiesSystem
+            self._racial_system = RacialAbilitiesSystem()
 
-        racial_system = RacialAbilitiesSystem()
-        return racial_system.get_saving_throw_bonus(character.race, character.constitution)
+        return self._racial_system.get_saving_throw_bonus(character.race, character.constitution)
 
     def get_wisdom_save_bonus(self, character: Character, save_type: str) -> int:
         """
@@ -132,11 +213,8 @@ class SavingThrowResolver:
         if save_type not in self.MENTAL_SAVES:
             return 0
 
-        # Get WIS modifiers from ability system
-        from ..systems.ability_modifiers import AbilityModifierSystem
-
-        ability_system = AbilityModifierSystem()
-        wis_mods = ability_system.get_wisdom_modifiers(character.wisdom)
+        # Get WIS modifiers from the shared ability system
+        wis_mods = _get_ability_system().get_wisdom_modifiers(character.wisdom)
 
         return wis_mods.get('magic_attack_adjustment', 0)
 
@@ -177,6 +255,32 @@ class SavingThrowResolver:
 
         return bonus
 
+    def get_standing_modifier(self, character: Character, save_type: str) -> int:
+        """
+        Modifier the character carries into every save of a type
+
+        Racial, WIS (mental saves) and magic item bonuses. These only change
+        with equipment, level or ability scores, so group saves compute them
+        once per encounter.
+
+        Args:
+            character: Character making the save
+            save_type: Save attribute name
+
+        Returns:
+            Standing modifier value
+        """
+        # Racial bonus (Dwarf/Gnome/Halfling)
+        total = self.get_racial_save_bonus(character)
+
+        # WIS bonus for mental saves
+        total += self.get_wisdom_save_bonus(character, save_type)
+
+        # Magic item bonuses
+        total += self.get_magic_item_bonus(character)
+
+        return total
+
     def calculate_total_modifier(self, character: Character, save_type: str,
                                   base_modifier: int = 0,
                                   situational: Optional[Dict] = None) -> int:
@@ -192,18 +296,25 @@ class SavingThrowResolver:
         Returns:
             Total modifier value
         """
-        total = base_modifier
+        total = base_modifier + self.get_standing_modifier(character, save_type)
 
-        # Racial bonus (Dwarf/Gnome/Halfling)
-        total += self.get_racial_save_bonus(character)
+        # Situational modifiers
+        total += self.calculate_situational_modifier(situational)
 
-        # WIS bonus for mental saves
-        total += self.get_wisdom_save_bonus(character, save_type)
+        return total
 
-        # Magic item bonuses
-        total += self.get_magic_item_bonus(character)
+    @staticmethod
+    def calculate_situational_modifier(situational: Optional[Dict]) -> int:
+        """
+        Modifier from situational conditions
 
-        # Situational modifiers
+        Args:
+            situational: Optional dict {'cover': True, 'surprised': True, 'blind': True}
+
+        Returns:
+            Modifier value
+        """
+        total = 0
         if situational:
             if situational.get('cover'):
                 total += 2  # Cover vs area effects
@@ -211,7 +322,6 @@ class SavingThrowResolver:
                 total -= 2  # Surprised penalty
             if situational.get('blind'):
                 total -= 4  # Blind penalty
-
         return total
 
     def make_save(self, character: Character, category: str,
@@ -230,13 +340,7 @@ class SavingThrowResolver:
             Dict with: success, roll, target, narrative, modifiers_applied
         """
 
-        # Normalize category name
-        category_lower = category.lower()
-        if category_lower not in self.CATEGORIES:
-            # Default to spell save if unknown
-            save_attr = 'save_spell'
-        else:
-            save_attr = self.CATEGORIES[category_lower]
+        save_attr = self.save_attribute(category)
 
         # Get base target number
         base_target = getattr(character, save_attr)
@@ -246,62 +350,78 @@ class SavingThrowResolver:
             character, save_attr, modifier, situational
         )
 
-        # Apply modifier to target (lower target = easier save)
-        adjusted_target = base_target - total_modifier
-
-        # Roll d20
-        roll = random.randint(1, 20)
-
-        # Natural 1 always succeeds
-        if roll == 1:
-            return {
-                'success': True,
-                'roll': roll,
-                'base_target': base_target,
-                'adjusted_target': adjusted_target,
-                'modifiers_applied': total_modifier,
-                'narrative': f"{character.name} rolls a NATURAL 1! Automatic success!",
-                'natural_20_or_1': True
-            }
-
-        # Natural 20 always fails
-        if roll == 20:
-            return {
-                'success': False,
-                'roll': roll,
-                'base_target': base_target,
-                'adjusted_target': adjusted_target,
-                'modifiers_applied': total_modifier,
-                'narrative': f"{character.name} rolls a NATURAL 20! Automatic failure!",
-                'natural_20_or_1': True
-            }
-
-        # Check if save succeeded (roll <= adjusted_target)
-        success = roll <= adjusted_target
-
-        # Build narrative
-        if success:
-            narrative = f"{character.name} rolls {roll} vs {category} save"
-        else:
-            narrative = f"{character.name} rolls {roll} vs {category} save"
+        # Roll d20 (natural 1 always succeeds, natural 20 always fails)
+        return GroupSaveResult(character, category, random.randint(1, 20),
+                               base_target, total_modifier).to_dict()
 
-        # Add target information
-        if total_modifier != 0:
-            narrative += f" (target {base_target}{total_modifier:+d}={adjusted_target})"
-        else:
-            narrative += f" (target {adjusted_target})"
+    def make_group_save(self, targets: Sequence[Character], category: str,
+                        modifier: int = 0, situational: Optional[Dict] = None,
+                        modifier_cache: Optional[Dict[Tuple[int, str], int]] = None,
+                        events: Optional[CombatEventStream] = None) -> List[GroupSaveResult]:
+        """
+        Make the same saving throw for many targets in one pass
 
-        narrative += ": SUCCESS!" if success else ": FAILURE!"
+        Used by area effects (breath weapons, area spells, traps). Each
+        target's standing modifier is looked up in modifier_cache, so a
+        cache kept for the length of an encounter computes it once per
+        target instead of once per save.
 
-        return {
-            'success': success,
-            'roll': roll,
-            'base_target': base_target,
-            'adjusted_target': adjusted_target,
-            'modifiers_applied': total_modifier,
-            'narrative': narrative,
-            'natural_20_or_1': False
-        }
+        Args:
+            targets: Characters making the save
+            category: Type of save (poison, rod, petrify, breath, spell)
+            modifier: Base bonus/penalty applied to every target
+            situational: Optional situational modifiers applied to every target
+            modifier_cache: Optional dict (id(target), save attribute) -> standing
+                            modifier, filled in as targets are seen
+            events: Optional stream to record one save event per target
+
+        Returns:
+            One GroupSaveResult per target, in target order
+        """
+        save_attr = self.save_attribute(category)
+        shared = self.calculate_situational_modifier(situational) + modifier
+        cache = modifier_cache if modifier_cache is not None else {}
+
+        results = []
+        for target in targets:
+            key = (id(target), save_attr)
+            standing = cache.get(key)
+            if standing is None:
+                standing = cache[key] = self.get_standing_modifier(target, save_attr)
+
+            results.append(GroupSaveResult(target, category, random.randint(1, 20),
+                                           getattr(target, save_attr), standing + shared))
+
+        if events is not None:
+            for result in results:
+                events.emit(result.to_event())
+        return results
+
+    def group_save_for_half_damage(self, targets: Sequence[Character], damage: int,
+                                   category: str = 'spell',
+                                   modifier_cache: Optional[Dict[Tuple[int, str], int]] = None,
+                                   events: Optional[CombatEventStream] = None
+                                   ) -> List[GroupSaveResult]:
+        """
+        Apply one damage roll to many targets, each saving for half
+
+        Args:
+            targets: Characters caught in the effect
+            damage: Full damage amount
+            category: Type of save
+            modifier_cache: Optional standing modifier cache (see make_group_save)
+            events: Optional stream to record one save event per target
+
+        Returns:
+            One GroupSaveResult per target with final_damage set
+        """
+        results = self.make_group_save(targets, category, modifier_cache=modifier_cache)
+        for result in results:
+            result.final_damage = damage // 2 if result.success else damage
+            result.character.take_damage(result.final_damage)
+            if events is not None:
+                events.emit(result.to_event())
+        return results
 
     def save_or_die(self, character: Character, save_type: str = 'poison') -> Dict:
         """
@@ -343,12 +463,8 @@ class SavingThrowResolver:
 
         result = self.make_save(character, save_type)
 
-        if result['success']:
-            final_damage = damage // 2
-            result['narrative'] += f" Damage reduced to {final_damage}!"
-        else:
-            final_damage = damage
-            result['narrative'] += f" Takes full {final_damage} damage!"
+        final_damage = damage // 2 if result['success'] else damage
+        result['narrative'] += _damage_narrative(result['success'], final_damage)
 
         result['final_damage'] = final_damage
         character.take_damage(final_damage)
@@ -3,9 +3,9 @@ Thief Skills and Ability Check system
 """
 
 import random
-import json
 import os
 from typing import Dict, Optional
+from .data_cache import load_json
 from ..entities.character import Character
 from ..entities.player import PlayerCharacter
 
@@ -30,8 +30,7 @@ class SkillResolver:
         data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
         tables_path = os.path.join(data_dir, 'thief_skills_tables.json')
 
-        with open(tables_path, 'r') as f:
-            self.tables = json.load(f)
+        self.tables = load_json(tables_path)
 
         self.base_skills_by_level = self.tables['base_skills_by_level']
         self.racial_adjustments = self.tables['racial_adjustments']
@@ -0,0 +1,663 @@
+"""
+Spell Effect Engine
+
+Compiles each spells.json entry into a SpellEffectPlan once, the first
+time the spell is used. The mechanics - effect kind, damage dice (with
+per-level scaling and caps), saving throw, area and target limits, the
+condition applied - come from the spell's entry in SPELL_MECHANICS; the
+spell data only supplies the name, the duration and the summary text.
+Plans are cached by spell id, and casting runs a plan through a small set
+of shared primitives (damage, healing, conditions).
+
+The spell descriptions are prose, so nothing is inferred from them: a
+spell without a SPELL_MECHANICS entry compiles to a 'utility' plan that
+narrates the effect and reports its duration.
+"""
+
+import random
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple
+
+from .data_cache import load_json
+from ..engine.combat_events import SPELL, CombatEvent, CombatEventStream
+
+
+# Effect kinds
+EFFECT_DAMAGE = 'damage'              # Dice damage, optional save for half
+EFFECT_MISSILES = 'missiles'          # Auto-hit missiles, count scales with level
+EFFECT_HEAL = 'heal'                  # Dice healing on one target
+EFFECT_REMEDY = 'remedy'              # Lifts conditions from one target
+EFFECT_HD_CONDITION = 'hd_condition'  # HD budget, weakest creatures first (Sleep)
+EFFECT_CONDITION = 'condition'        # Harmful condition, optional save to negate
+EFFECT_BUFF = 'buff'                  # Beneficial condition on one target
+EFFECT_UTILITY = 'utility'            # Narrative only
+
+# Effects cast on the caster or a party member, never on monsters
+BENEFICIAL_EFFECTS = (EFFECT_HEAL, EFFECT_REMEDY, EFFECT_BUFF)
+
+# Condition -> Monster.is_immune_to() effect name
+CONDITION_IMMUNITIES = {
+    'sleeping': 'sleep',
+    'charmed': 'charm',
+    'paralyzed': 'paralysis'
+}
+
+# Narrative for a creature that succumbs to a condition
+CONDITION_NARRATIVES = {
+    'sleeping': "falls into a magical slumber",
+    'charmed': "is charmed! They see you as a trusted friend",
+    'paralyzed': "is held fast, unable to move",
+    'confused': "staggers about in confusion",
+    'frightened': "flees in terror",
+    'blinded': "is struck blind",
+    'entangled': "is trapped",
+    'slowed': "slows to half speed",
+    'nauseated': "doubles over, helpless with nausea",
+    'stunned': "is stunned",
+    'feebleminded': "is left with the mind of a small child",
+    'slain': "is slain"
+}
+
+DURATION_PART_PATTERN = re.compile(r'(\d+)\s*(round|turn)s?(\s*/\s*level)?', re.IGNORECASE)
+
+ROUNDS_PER_TURN = 10
+
+
+@dataclass(frozen=True)
+class DiceSpec:
+    """Dice expression such as 1d4+1, optionally repeated per caster level"""
+    count: int
+    sides: int
+    bonus: int = 0
+    per_level: bool = False
+    max_levels: Optional[int] = None
+    extra_per_level: Tuple[int, int] = (0, 0)  # Extra (count, sides) rolled per level
+    level_bonus: int = 0                       # Flat amount added per caster level
+
+    def roll(self, caster_level: int = 1, rng=random) -> int:
+        """Roll the expression for a caster of the given level"""
+        times = 1
+        if self.per_level:
+            times = max(1, caster_level)
+            if self.max_levels:
+                times = min(times, self.max_levels)
+
+        total = self.bonus * times + self.level_bonus * max(1, caster_level)
+        for _ in range(self.count * times):
+            total += rng.randint(1, self.sides)
+
+        extra_count, extra_sides = self.extra_per_level
+        for _ in range(extra_count * max(1, caster_level)):
+            total += rng.randint(1, extra_sides)
+        return total
+
+
+@dataclass(frozen=True)
+class DurationSpec:
+    """Duration in rounds: base plus an amount per caster level"""
+    base_rounds: int = 0
+    rounds_per_level: int = 0
+
+    def rounds(self, caster_level: int) -> int:
+        return self.base_rounds + self.rounds_per_level * max(1, caster_level)
+
+
+@dataclass(frozen=True)
+class SpellEffectPlan:
+    """Executable effect compiled from one spell definition"""
+    spell_id: str
+    name: str
+    effect: str
+    dice: Optional[DiceSpec] = None
+    save: Optional[str] = None            # 'half' or 'negates'
+    save_category: str = 'spell'          # Saving throw category
+    area: bool = False                    # Affects every target rather than the first
+    max_targets: Optional[int] = None
+    condition: Optional[str] = None
+    persons_only: bool = False            # Only small and medium creatures
+    max_hd: Optional[int] = None          # Stronger creatures are unaffected
+    save_above_hd: Optional[int] = None   # Stronger creatures may save to negate, weaker may not
+    hp_budget: Optional[int] = None       # Total current HP affected, weakest first
+    missiles: Tuple[int, int, int] = (1, 2, 5)  # Base count, levels per extra missile, max
+    full_heal: bool = False               # Heal all damage but a roll of dice
+    cures: Tuple[str, ...] = ()           # Conditions lifted from the target
+    beneficial: bool = False              # Cast on the caster or a party member
+    duration: Optional[DurationSpec] = None
+    summary: str = ""
+
+
+# Mechanics per spells.json id (SpellEffectPlan fields, AD&D 1e rules).
+# Buffs apply a condition named after the spell unless one is given.
+SPELL_MECHANICS: Dict[str, Dict] = {
+    # Damage
+    'burning_hands': {'effect': EFFECT_DAMAGE, 'dice': DiceSpec(1, 3, level_bonus=1),
+                      'save': 'half', 'area': True},
+    'shocking_grasp': {'effect': EFFECT_DAMAGE, 'dice': DiceSpec(1, 8, level_bonus=1)},
+    'spiritual_hammer': {'effect': EFFECT_DAMAGE, 'dice': DiceSpec(1, 4, 1)},
+    'fireball': {'effect': EFFECT_DAMAGE, 'dice': DiceSpec(1, 6, per_level=True, max_levels=10),
+                 'save': 'half', 'area': True},
+    'lightning_bolt': {'effect': EFFECT_DAMAGE, 'dice': DiceSpec(1, 6, per_level=True, max_levels=10),
+                       'save': 'half', 'area': True},
+    'call_lightning': {'effect': EFFECT_DAMAGE, 'dice': DiceSpec(2, 8, extra_per_level=(1, 8)),
+                       'save': 'half', 'area': True},
+    'ice_storm': {'effect': EFFECT_DAMAGE, 'dice': DiceSpec(3, 10), 'area': True},  # Hail stones
+    'flame_strike': {'effect': EFFECT_DAMAGE, 'dice': DiceSpec(6, 8), 'save': 'half'},
+    'moonbeam': {'effect': EFFECT_DAMAGE, 'dice': DiceSpec(2, 6), 'save': 'half'},
+    'cone_of_cold': {'effect': EFFECT_DAMAGE, 'dice': DiceSpec(1, 4, 1, per_level=True),
+                     'save': 'half', 'area': True},
+    'fire_storm': {'effect': EFFECT_DAMAGE, 'dice': DiceSpec(2, 8, level_bonus=1),
+                   'save': 'half', 'area': True},
+    'delayed_blast_fireball': {'effect': EFFECT_DAMAGE,
+                               'dice': DiceSpec(1, 6, 1, per_level=True, max_levels=10),
+                               'save': 'half', 'area': True},
+    'meteor_swarm': {'effect': EFFECT_DAMAGE, 'dice': DiceSpec(10, 4),  # One sphere per creature
+                     'save': 'half', 'area': True},
+    'mordenkainens_sword': {'effect': EFFECT_DAMAGE, 'dice': DiceSpec(5, 4)},
+    'magic_missile': {'effect': EFFECT_MISSILES, 'dice': DiceSpec(1, 4, 1), 'missiles': (1, 2, 5)},
+
+    # Healing and remedies
+    'cure_light_wounds': {'effect': EFFECT_HEAL, 'dice': DiceSpec(1, 8)},
+    'cure_serious_wounds': {'effect': EFFECT_HEAL, 'dice': DiceSpec(2, 8, 1)},
+    'cure_critical_wounds': {'effect': EFFECT_HEAL, 'dice': DiceSpec(3, 8, 3)},
+    'heal': {'effect': EFFECT_HEAL, 'dice': DiceSpec(1, 4), 'full_heal': True,
+             'cures': ('blinded', 'diseased')},
+    'cure_blindness': {'effect': EFFECT_REMEDY, 'cures': ('blinded',)},
+    'cure_disease': {'effect': EFFECT_REMEDY, 'cures': ('diseased',)},
+    'neutralize_poison': {'effect': EFFECT_REMEDY, 'cures': ('poisoned',)},
+    'remove_curse': {'effect': EFFECT_REMEDY, 'cures': ('cursed',)},
+    'remove_fear': {'effect': EFFECT_REMEDY, 'cures': ('frightened',)},
+    'slow_poison': {'effect': EFFECT_UTILITY, 'beneficial': True},
+    'raise_dead': {'effect': EFFECT_UTILITY, 'beneficial': True},
+    'resurrection': {'effect': EFFECT_UTILITY, 'beneficial': True},
+    'reincarnate': {'effect': EFFECT_UTILITY, 'beneficial': True},
+    'reincarnation': {'effect': EFFECT_UTILITY, 'beneficial': True},
+    'restoration': {'effect': EFFECT_UTILITY, 'beneficial': True},
+    'regenerate': {'effect': EFFECT_UTILITY, 'beneficial': True},
+    'atonement': {'effect': EFFECT_UTILITY, 'beneficial': True},
+
+    # HD budgets, weakest creatures first
+    'sleep': {'effect': EFFECT_HD_CONDITION, 'dice': DiceSpec(2, 4), 'condition': 'sleeping'},
+    'mass_charm': {'effect': EFFECT_HD_CONDITION, 'dice': DiceSpec(0, 0, level_bonus=2),
+                   'condition': 'charmed', 'save': 'negates'},
+    'death_spell': {'effect': EFFECT_HD_CONDITION, 'dice': DiceSpec(4, 20), 'condition': 'slain',
+                    'max_hd': 8},
+
+    # Harmful conditions
+    'charm_person': {'effect': EFFECT_CONDITION, 'condition': 'charmed', 'save': 'negates',
+                     'persons_only': True},
+    'charm_person_or_mammal': {'effect': EFFECT_CONDITION, 'condition': 'charmed', 'save': 'negates'},
+    'charm_monster': {'effect': EFFECT_CONDITION, 'condition': 'charmed', 'save': 'negates'},
+    'hold_person': {'effect': EFFECT_CONDITION, 'condition': 'paralyzed', 'save': 'negates',
+                    'area': True, 'max_targets': 4, 'persons_only': True},
+    'hold_monster': {'effect': EFFECT_CONDITION, 'condition': 'paralyzed', 'save': 'negates',
+                     'area': True, 'max_targets': 4},
+    'scare': {'effect': EFFECT_CONDITION, 'condition': 'frightened', 'save': 'negates', 'max_hd': 6},
+    'fear': {'effect': EFFECT_CONDITION, 'condition': 'frightened', 'save': 'negates',
+             'area': True, 'max_hd': 12},
+    'web': {'effect': EFFECT_CONDITION, 'condition': 'entangled', 'save': 'negates', 'area': True},
+    'entangle': {'effect': EFFECT_CONDITION, 'condition': 'entangled', 'save': 'negates', 'area': True},
+    'slow': {'effect': EFFECT_CONDITION, 'condition': 'slowed', 'save': 'negates', 'area': True},
+    'blindness': {'effect': EFFECT_CONDITION, 'condition': 'blinded', 'save': 'negates'},
+    'confusion': {'effect': EFFECT_CONDITION, 'condition': 'confused', 'save': 'negates',
+                  'area': True, 'max_targets': 8},
+    'chaos': {'effect': EFFECT_CONDITION, 'condition': 'confused', 'save': 'negates', 'area': True},
+    'stinking_cloud': {'effect': EFFECT_CONDITION, 'condition': 'nauseated', 'save': 'negates',
+                       'area': True},
+    'feeblemind': {'effect': EFFECT_CONDITION, 'condition': 'feebleminded', 'save': 'negates'},
+    'power_word_stun': {'effect': EFFECT_CONDITION, 'condition': 'stunned', 'hp_budget': 90},
+    'power_word_blind': {'effect': EFFECT_CONDITION, 'condition': 'blinded', 'area': True,
+                         'hp_budget': 100},
+
+    # Slaying: every entry has a save, an HD cap or an HP budget
+    'finger_of_death': {'effect': EFFECT_CONDITION, 'condition': 'slain', 'save': 'negates'},
+    'disintegrate': {'effect': EFFECT_CONDITION, 'condition': 'slain', 'save': 'negates'},
+    'phantasmal_killer': {'effect': EFFECT_CONDITION, 'condition': 'slain', 'save': 'negates'},
+    'power_word_kill': {'effect': EFFECT_CONDITION, 'condition': 'slain', 'area': True,
+                        'hp_budget': 60},
+    'cloudkill': {'effect': EFFECT_CONDITION, 'condition': 'slain', 'area': True,
+                  'save_above_hd': 4, 'max_hd': 6, 'save_category': 'poison'},
+
+    # Buffs
+    'protection_from_evil': {'effect': EFFECT_BUFF, 'condition': 'protected_from_evil'},
+    'protection_from_evil_10_radius': {'effect': EFFECT_BUFF, 'condition': 'protected_from_evil'},
+    'shield': {'effect': EFFECT_BUFF},
+    'bless': {'effect': EFFECT_BUFF},
+    'prayer': {'effect': EFFECT_BUFF},
+    'chant': {'effect': EFFECT_BUFF},
+    'invisibility': {'effect': EFFECT_BUFF},
+    'invisibility_10_radius': {'effect': EFFECT_BUFF, 'condition': 'invisibility'},
+    'mirror_image': {'effect': EFFECT_BUFF},
+    'blur': {'effect': EFFECT_BUFF},
+    'haste': {'effect': EFFECT_BUFF},
+    'fly': {'effect': EFFECT_BUFF},
+    'levitate': {'effect': EFFECT_BUFF},
+    'spider_climb': {'effect': EFFECT_BUFF},
+    'strength': {'effect': EFFECT_BUFF},
+    'barkskin': {'effect': EFFECT_BUFF},
+    'sanctuary': {'effect': EFFECT_BUFF},
+    'infravision': {'effect': EFFECT_BUFF},
+    'water_breathing': {'effect': EFFECT_BUFF},
+    'resist_cold': {'effect': EFFECT_BUFF},
+    'resist_fire': {'effect': EFFECT_BUFF},
+    'protection_from_fire': {'effect': EFFECT_BUFF},
+    'protection_from_lightning': {'effect': EFFECT_BUFF},
+    'protection_from_normal_missiles': {'effect': EFFECT_BUFF},
+    'fire_shield': {'effect': EFFECT_BUFF},
+    'minor_globe_of_invulnerability': {'effect': EFFECT_BUFF},
+    'globe_of_invulnerability': {'effect': EFFECT_BUFF},
+    'mind_blank': {'effect': EFFECT_BUFF},
+    'tensers_transformation': {'effect': EFFECT_BUFF}
+}
+
+
+def spell_id_for(name: str) -> str:
+    """Normalise a spell name to its spells.json id ('Magic Missile' -> 'magic_missile')"""
+    return name.lower().replace(' ', '_').replace('-', '_')
+
+
+def parse_duration(text: str) -> Optional[DurationSpec]:
+    """
+    Parse a duration such as '5 rounds/level' or '1 turn + 5 rounds/level'
+
+    Returns:
+        DurationSpec, or None for instantaneous, permanent or special durations
+    """
+    base = per_level = 0
+    for amount, unit, level in DURATION_PART_PATTERN.findall(text or ''):
+        rounds = int(amount) * (ROUNDS_PER_TURN if unit.lower() == 'turn' else 1)
+        if level:
+            per_level += rounds
+        else:
+            base += rounds
+
+    if not base and not per_level:
+        return None
+    return DurationSpec(base, per_level)
+
+
+def compile_spell_plan(spell_id: str, data: Dict) -> SpellEffectPlan:
+    """
+    Compile one spell definition into an effect plan
+
+    Args:
+        spell_id: Spell id (spells.json key, looked up in SPELL_MECHANICS)
+        data: Spell definition (name, duration, description)
+
+    Returns:
+        SpellEffectPlan (utility if the spell has no SPELL_MECHANICS entry)
+    """
+    mechanics = dict(SPELL_MECHANICS.get(spell_id, {'effect': EFFECT_UTILITY}))
+    mechanics.setdefault('beneficial', mechanics['effect'] in BENEFICIAL_EFFECTS)
+    if mechanics['effect'] == EFFECT_BUFF:
+        mechanics.setdefault('condition', spell_id)
+
+    return SpellEffectPlan(spell_id=spell_id, name=data.get('name', spell_id),
+                           duration=parse_duration(data.get('duration', '')),
+                           summary=data.get('description', ''), **mechanics)
+
+
+class SpellPlans(Mapping):
+    """
+    Read-only spell id -> SpellEffectPlan mapping, compiled on demand
+
+    Each plan is compiled the first time it is looked up and then cached.
+    """
+
+    def __init__(self, spells: Dict[str, Dict]):
+        self._spells = spells
+        self._plans: Dict[str, SpellEffectPlan] = {}
+
+    def __getitem__(self, spell_id: str) -> SpellEffectPlan:
+        plan = self._plans.get(spell_id)
+        if plan is None:
+            plan = compile_spell_plan(spell_id, self._spells[spell_id])
+            self._plans[spell_id] = plan
+        return plan
+
+    def __contains__(self, spell_id) -> bool:
+        return spell_id in self._spells
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._spells)
+
+    def __len__(self) -> int:
+        return len(self._spells)
+
+
+class SpellEffectEngine:
+    """
+    Compiled spell plans plus the primitives that execute them
+
+    Usage:
+        engine = get_spell_effect_engine()
+        plan = engine.get_plan(spell)
+        result = engine.execute(plan, caster, targets, save_resolver)
+    """
+
+    def __init__(self, spells_path: Optional[Path] = None):
+        """
+        Load spells.json (plans are compiled as spells are first used)
+
+        Args:
+            spells_path: Path to spells.json (defaults to the bundled data)
+        """
+        if spells_path is None:
+            spells_path = Path(__file__).parent.parent / 'data' / 'spells.json'
+
+        spells = load_json(spells_path)
+
+        # Plans compile on first use; most sessions only ever cast a few spells
+        self.plans = SpellPlans(spells)
+        self._ids_by_name: Dict[str, str] = {
+            data.get('name', spell_id).lower(): spell_id for spell_id, data in spells.items()
+        }
+        self._by_name: Dict[str, SpellEffectPlan] = {}
+
+        self._executors = {
+            EFFECT_DAMAGE: self._run_damage,
+            EFFECT_MISSILES: self._run_missiles,
+            EFFECT_HEAL: self._run_heal,
+            EFFECT_REMEDY: self._run_remedy,
+            EFFECT_HD_CONDITION: self._run_hd_condition,
+            EFFECT_CONDITION: self._run_condition,
+            EFFECT_BUFF: self._run_buff,
+            EFFECT_UTILITY: self._run_utility
+        }
+
+    def get_plan(self, spell) -> SpellEffectPlan:
+        """
+        Get the compiled plan for a Spell (by name, then id)
+
+        Spells that are not in spells.json are compiled from their own
+        fields (mechanics still by id) on first cast and cached.
+        """
+        name = spell.name.lower()
+        spell_id = self._ids_by_name.get(name)
+        plan = self.plans[spell_id] if spell_id else self._by_name.get(name)
+        if plan is None:
+            plan = self.plans.get(spell_id_for(spell.name))
+        if plan is None:
+            plan = compile_spell_plan(spell_id_for(spell.name), {
+                'name': spell.name,
+                'duration': spell.duration,
+                'description': spell.description
+            })
+            self._by_name[spell.name.lower()] = plan
+        return plan
+
+    def execute(self, plan: SpellEffectPlan, caster, targets: List, save_resolver,
+                events: Optional[CombatEventStream] = None) -> Dict:
+        """
+        Run a plan
+
+        Args:
+            plan: Compiled spell plan
+            caster: Character casting the spell
+            targets: Potential targets
+            save_resolver: SavingThrowResolver for saves
+            events: Optional stream to record the cast in
+
+        Returns:
+            Dict with narrative, affected and effect-specific results
+        """
+        result = self._executors[plan.effect](plan, caster, targets, save_resolver)
+        if plan.duration is not None and 'duration' not in result:
+            result['duration'] = plan.duration.rounds(caster.level)
+
+        if events is not None:
+            target = targets[0].name if targets else None
+            events.emit(CombatEvent(SPELL, caster.name, target, damage=result.get('total_damage', 0),
+                                    detail=plan.name, text=result['narrative']))
+        return result
+
+    # ------------------------------------------------------------------
+    # Shared primitives
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def select_targets(plan: SpellEffectPlan, targets: List) -> List:
+        """Living targets the plan reaches (all for area spells, else the first)"""
+        living = [t for t in targets if t.is_alive]
+        if not plan.area:
+            return living[:1]
+        if plan.max_targets:
+            return living[:plan.max_targets]
+        return living
+
+    @staticmethod
+    def within_limits(plan: SpellEffectPlan, targets: List) -> Tuple[List, List]:
+        """
+        Split targets by the plan's HD cap and HP budget (weakest first)
+
+        Returns:
+            (targets within the limits, targets beyond them)
+        """
+        within, beyond = [], []
+        for target in targets:
+            (beyond if plan.max_hd is not None and target.level > plan.max_hd else within).append(target)
+
+        if plan.hp_budget is not None:
+            budget, capped = plan.hp_budget, []
+            for target in sorted(within, key=lambda t: t.hp_current):
+                if target.hp_current <= budget:
+                    budget -= target.hp_current
+                    capped.append(target)
+                else:
+                    beyond.append(target)
+            within = capped
+        return within, beyond
+
+    @staticmethod
+    def lift_conditions(target, conditions: Tuple[str, ...]) -> List[str]:
+        """Remove conditions from a target, returning the ones it had"""
+        lifted = [condition for condition in conditions if target.has_condition(condition)]
+        for condition in lifted:
+            target.remove_condition(condition)
+        return lifted
+
+    @staticmethod
+    def deal_damage(targets: List, damage: int, save: Optional[str], save_resolver) -> List[Tuple]:
+        """
+        Apply one damage roll to every target (saves rolled as one group)
+
+        Returns:
+            List of (target, damage dealt)
+        """
+        if save == 'half':
+            results = save_resolver.group_save_for_half_damage(targets, damage, 'spell')
+            return [(result.character, result.final_damage) for result in results]
+
+        for target in targets:
+            target.take_damage(damage)
+        return [(target, damage) for target in targets]
+
+    @staticmethod
+    def apply_condition(targets: List, condition: str, save: Optional[str],
+                        save_resolver, category: str = 'spell') -> Tuple[List, List]:
+        """
+        Apply a condition to every target, allowing a group save to negate
+
+        Returns:
+            (affected targets, targets that resisted or were immune)
+        """
+        immunity = CONDITION_IMMUNITIES.get(condition)
+        candidates, resisted = [], []
+        for target in targets:
+            if immunity and hasattr(target, 'is_immune_to') and target.is_immune_to(immunity):
+                resisted.append(target)
+            else:
+                candidates.append(target)
+
+        affected = candidates
+        if save == 'negates' and candidates:
+            affected = []
+            for result in save_resolver.make_group_save(candidates, category):
+                (resisted if result.success else affected).append(result.character)
+
+        for target in affected:
+            if condition == 'slain':
+                target.take_damage(target.hp_current)
+            else:
+                target.add_condition(condition)
+        return affected, resisted
+
+    # ------------------------------------------------------------------
+    # Effect executors
+    # ------------------------------------------------------------------
+
+    def _run_damage(self, plan, caster, targets, save_resolver) -> Dict:
+        chosen = self.select_targets(plan, targets)
+        if not chosen:
+            return {'narrative': "No valid target!", 'affected': [], 'total_damage': 0}
+
+        damage = plan.dice.roll(caster.level)
+        dealt = self.deal_damage(chosen, damage, plan.save, save_resolver)
+
+        affected = [f"{target.name} ({amount} dmg)" for target, amount in dealt]
+        narrative = f"{plan.name} strikes {', '.join(affected)}!"
+        slain = [target.name for target, _ in dealt if not target.is_alive]
+        if slain:
+            narrative += f" Slain: {', '.join(slain)}."
+
+        return {
+            'narrative': narrative,
+            'affected': affected,
+            'total_damage': sum(amount for _, amount in dealt)
+        }
+
+    def _run_missiles(self, plan, caster, targets, save_resolver) -> Dict:
+        if not targets or not targets[0].is_alive:
+            return {'narrative': "No valid target!", 'affected': [], 'total_damage': 0}
+
+        base, levels_per_missile, max_missiles = plan.missiles
+        num_missiles = min(max_missiles, base + (caster.level - 1) // levels_per_missile)
+
+        target = targets[0]  # Missiles all strike one creature
+        total_damage = sum(plan.dice.roll() for _ in range(num_missiles))
+        target.take_damage(total_damage)
+
+        narrative = f"{num_missiles} glowing missile{'s' if num_missiles > 1 else ''} "
+        narrative += f"strike {target.name} for {total_damage} damage!"
+        if not target.is_alive:
+            narrative += f" {target.name} is slain!"
+
+        return {'narrative': narrative, 'affected': [target.name], 'total_damage': total_damage}
+
+    def _run_heal(self, plan, caster, targets, save_resolver) -> Dict:
+        if not targets:
+            return {'narrative': "No target to heal!", 'affected': [], 'healing': 0}
+
+        target = targets[0]
+        old_hp = target.hp_current
+        if plan.full_heal:
+            target.heal(target.hp_max - target.hp_current - plan.dice.roll(caster.level))
+        else:
+            target.heal(plan.dice.roll(caster.level))
+        healing = target.hp_current - old_hp
+        cured = self.lift_conditions(target, plan.cures)
+
+        narrative = f"{target.name} is healed for {healing} HP!"
+        if cured:
+            narrative += f" No longer {', '.join(cured)}."
+
+        return {
+            'narrative': narrative,
+            'affected': [target.name],
+            'healing': healing
+        }
+
+    def _run_remedy(self, plan, caster, targets, save_resolver) -> Dict:
+        target = targets[0] if targets else caster
+        cured = self.lift_conditions(target, plan.cures)
+
+        if cured:
+            narrative = f"{target.name} is no longer {', '.join(cured)}!"
+        else:
+            narrative = f"{plan.name} finds nothing to cure in {target.name}."
+        return {'narrative': narrative, 'affected': [target.name] if cured else []}
+
+    def _run_hd_condition(self, plan, caster, targets, save_resolver) -> Dict:
+        total_hd = plan.dice.roll(caster.level)
+        immunity = CONDITION_IMMUNITIES.get(plan.condition)
+
+        # Weakest creatures are affected first
+        affected, hd_count = [], 0
+        for target in sorted(targets, key=lambda t: t.level):
+            if immunity and hasattr(target, 'is_immune_to') and target.is_immune_to(immunity):
+                continue
+            if plan.max_hd is not None and target.level > plan.max_hd:
+                continue
+            if target.is_alive and hd_count + target.level <= total_hd:
+                affected.append(target)
+                hd_count += target.level
+
+        affected, resisted = self.apply_condition(affected, plan.condition, plan.save, save_resolver,
+                                                  plan.save_category)
+
+        names = [target.name for target in affected]
+        lines = [f"{name} {CONDITION_NARRATIVES[plan.condition]}!" for name in names]
+        lines += [f"{target.name} resists the {plan.name}!" for target in resisted]
+        narrative = ' '.join(lines) or "The spell fails to affect any creatures."
+
+        return {'narrative': narrative, 'affected': names, 'hd_affected': hd_count}
+
+    def _run_condition(self, plan, caster, targets, save_resolver) -> Dict:
+        chosen = self.select_targets(plan, targets)
+        if not chosen:
+            return {'narrative': "No valid target!", 'affected': []}
+
+        if plan.persons_only:
+            persons = [t for t in chosen if t.size in ('S', 'M')]
+            if not persons:
+                return {'narrative': f"{chosen[0].name} is not a person - spell fails!", 'affected': []}
+            chosen = persons
+
+        chosen, unaffected = self.within_limits(plan, chosen)
+
+        # Creatures above save_above_hd may save; the rest get the plan's own save
+        weak = [t for t in chosen if plan.save_above_hd is None or t.level <= plan.save_above_hd]
+        strong = [t for t in chosen if t not in weak]
+        affected, resisted = self.apply_condition(weak, plan.condition, plan.save, save_resolver,
+                                                  plan.save_category)
+        if strong:
+            more_affected, more_resisted = self.apply_condition(strong, plan.condition, 'negates',
+                                                                save_resolver, plan.save_category)
+            affected += more_affected
+            resisted += more_resisted
+
+        lines = [f"{target.name} {CONDITION_NARRATIVES[plan.condition]}!" for target in affected]
+        lines += [f"{target.name} resists the {plan.name}!" for target in resisted]
+        lines += [f"{target.name} is unaffected by the {plan.name}." for target in unaffected]
+
+        return {'narrative': ' '.join(lines), 'affected': [target.name for target in affected]}
+
+    def _run_buff(self, plan, caster, targets, save_resolver) -> Dict:
+        target = targets[0] if targets else caster
+        target.add_condition(plan.condition)
+
+        return {
+            'narrative': f"{target.name} is surrounded by the power of {plan.name}! {plan.summary}",
+            'affected': [target.name]
+        }
+
+    def _run_utility(self, plan, caster, targets, save_resolver) -> Dict:
+        return {'narrative': plan.summary or f"{plan.name} takes effect.", 'affected': []}
+
+
+# Compiled engines by spells.json path
+_spell_effect_engines: Dict[str, SpellEffectEngine] = {}
+
+
+def get_spell_effect_engine(spells_path: Optional[Path] = None) -> SpellEffectEngine:
+    """Get the shared SpellEffectEngine for a spells.json path (compiled once)"""
+    if spells_path is None:
+        spells_path = Path(__file__).parent.parent / 'data' / 'spells.json'
+    key = str(Path(spells_path).resolve())
+
+    engine = _spell_effect_engines.get(key)
+    if engine is None:
+        engine = SpellEffectEngine(Path(spells_path))
+        _spell_effect_engines[key] = engine
+    return engine
@@ -8,13 +8,25 @@ Implements AD&D 1e trap mechanics:
 - Trap effects and damage
 """
 
-import json
 import random
 import re
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 
+from .data_cache import load_json
+from .roll_tables import compile_roll_table
+from ..engine.combat_events import TRAP, SAVED, CombatEvent
+
+
+# Trap save names (traps.json) -> saving throw categories
+TRAP_SAVE_CATEGORIES = {
+    "breath": "breath",
+    "breath_weapon": "breath",
+    "poison": "poison",
+    "spell": "spell"
+}
+
 
 @dataclass
 class Trap:
@@ -74,8 +86,10 @@ class TrapSystem:
             base_dir = Path(__file__).parent.parent
             trap_tables_path = base_dir / "data" / "dmg_tables" / "traps.json"
 
-        with open(trap_tables_path, 'r') as f:
-            self.tables = json.load(f)
+        self.tables = load_json(trap_tables_path)
+
+        self.trap_table = compile_roll_table(self.tables["trap_types"]["table"], die=100,
+                                             name='trap_types')
 
     def _roll_dice(self, formula: str) -> int:
         """
@@ -120,25 +134,7 @@ class TrapSystem:
             Generated Trap instance
         """
         # Roll on trap table
-        roll = random.randint(1, 100)
-
-        trap_table = self.tables["trap_types"]["table"]
-        trap_data = None
-
-        for entry in trap_table:
-            roll_range = entry["roll"]
-
-            if "-" in roll_range:
-                min_r, max_r = map(int, roll_range.split("-"))
-                if min_r <= roll <= max_r:
-                    trap_data = entry
-                    break
-            elif roll == int(roll_range):
-                trap_data = entry
-                break
-
-        if not trap_data:
-            trap_data = trap_table[0]  # Fallback
+        trap_data = self.trap_table.roll()
 
         # Select trigger
         trigger = random.choice(self.tables["trap_triggers"])
@@ -377,39 +373,119 @@ class TrapSystem:
                 result["save_made"] = True
 
         # Calculate damage
-        damage = self._roll_dice(trap.damage)
+        damage, effects = self._resolve_trap_effects(trap, self._roll_dice(trap.damage), save_made)
+        result["damage"] = damage
+        result["effects"].extend(effects)
+
+        return result
+
+    def trigger_trap_on_party(
+        self,
+        trap: Trap,
+        victims: List,
+        save_resolver=None,
+        modifier_cache: Optional[Dict] = None,
+        events=None
+    ) -> Dict:
+        """
+        Trigger a trap against several characters at once
+
+        Damage is rolled once and every victim saves in a single group save
+        (SavingThrowResolver.make_group_save) using their own save tables.
+
+        Args:
+            trap: The trap being triggered
+            victims: Characters caught by the trap
+            save_resolver: SavingThrowResolver (created if not given)
+            modifier_cache: Optional standing save modifier cache for the encounter
+            events: Optional CombatEventStream to record saves and trap hits in
+
+        Returns:
+            Dictionary with trap info plus a 'victims' list of per-character results
+        """
+        if trap.disarmed:
+            return {
+                "triggered": False,
+                "message": "Trap is disarmed and harmless."
+            }
+
+        base_damage = self._roll_dice(trap.damage)
 
-        if save_made and trap.save_type == "breath_weapon":
+        if trap.save_type != "none":
+            if save_resolver is None:
+                from .saving_throws import SavingThrowResolver
+                save_resolver = SavingThrowResolver()
+            category = TRAP_SAVE_CATEGORIES.get(trap.save_type, trap.save_type)
+            saves = save_resolver.make_group_save(victims, category, modifier_cache=modifier_cache,
+                                                  events=events)
+            saved = [save.success for save in saves]
+        else:
+            saved = [False] * len(victims)
+
+        results = []
+        for victim, save_made in zip(victims, saved):
+            damage, effects = self._resolve_trap_effects(trap, base_damage, save_made)
+            results.append({
+                "name": victim.name,
+                "save_made": save_made,
+                "damage": damage,
+                "effects": effects
+            })
+            if events is not None:
+                events.emit(CombatEvent(TRAP, trap.trap_type, victim.name, damage=damage,
+                                        flags=SAVED if save_made else 0, detail=trap.trap_type))
+
+        return {
+            "triggered": True,
+            "trap_type": trap.trap_type,
+            "description": trap.description,
+            "damage": base_damage,
+            "victims": results
+        }
+
+    def _resolve_trap_effects(self, trap: Trap, damage: int, save_made: bool) -> Tuple[int, List[str]]:
+        """
+        Apply a save result to a trap's damage and special effects
+
+        Args:
+            trap: The triggered trap
+            damage: Rolled damage
+            save_made: Whether the victim saved
+
+        Returns:
+            (damage taken, effect descriptions)
+        """
+        effects = []
+
+        if save_made and trap.save_type in ("breath", "breath_weapon"):
             # Breath weapon saves halve damage
             damage = damage // 2
-            result["effects"].append("Saved for half damage!")
+            effects.append("Saved for half damage!")
 
         elif save_made and trap.save_type == "poison":
             # Poison save negates
             damage = 0
-            result["effects"].append("Saved vs poison!")
+            effects.append("Saved vs poison!")
 
         elif trap.save_type == "poison" and not save_made:
-            result["effects"].append("Failed save vs poison - deadly!")
-
-        result["damage"] = damage
+            effects.append("Failed save vs poison - deadly!")
 
         # Special effects for certain traps
         if "gas_blinding" in trap.trap_type:
-            result["effects"].append("Blinded (-4 to hit for 2-12 rounds)")
+            effects.append("Blinded (-4 to hit for 2-12 rounds)")
 
         elif "gas_fear" in trap.trap_type:
             if not save_made:
-                result["effects"].append("Overcome by fear - must flee for 2-8 rounds")
+                effects.append("Overcome by fear - must flee for 2-8 rounds")
 
         elif "net" in trap.trap_type:
             if not save_made:
-                result["effects"].append("Entangled in net - cannot move")
+                effects.append("Entangled in net - cannot move")
 
         elif "teleporter" in trap.trap_type:
-            result["effects"].append("Teleported to random location!")
+            effects.append("Teleported to random location!")
 
-        return result
+        return damage, effects
 
     def describe_trap(self, trap: Trap, detected: bool = False) -> str:
         """
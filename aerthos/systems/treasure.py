@@ -5,13 +5,15 @@ Implements AD&D 1e treasure generation per DMG p. 121.
 Generates coins, gems, jewelry, and magic items based on treasure types.
 """
 
-import json
 import random
 import re
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass, field
 
+from .data_cache import load_json
+from .roll_tables import compile_roll_table
+
 
 @dataclass
 class TreasureHoard:
@@ -95,14 +97,26 @@ class TreasureGenerator:
             base_dir = Path(__file__).parent.parent
             magic_items_path = base_dir / "data" / "magic_items.json"
 
-        with open(treasure_tables_path, 'r') as f:
-            data = json.load(f)
-            self.treasure_types = data["treasure_types"]
-            self.gem_values = data["gem_values"]
-            self.jewelry_values = data["jewelry_values"]
+        data = load_json(treasure_tables_path)
+        self.treasure_types = data["treasure_types"]
+        self.gem_values = data["gem_values"]
+        self.jewelry_values = data["jewelry_values"]
+
+        self.magic_items = load_json(magic_items_path)
+
+        # Ranged d100 tables compiled to roll -> entry lookups
+        self.gem_table = compile_roll_table(self.gem_values, die=100, name='gem_values', key='roll_d100')
+        self.jewelry_table = compile_roll_table(self.jewelry_values, die=100, name='jewelry_values',
+                                                key='roll_d100')
+        self.magic_tables = {
+            'potions': compile_roll_table(self.magic_items['potions'], die=100, name='potions'),
+            'swords': compile_roll_table(self.magic_items['weapons']['swords'], die=100, name='swords'),
+            'armor': compile_roll_table(self.magic_items['armor'], die=100, name='armor'),
+            'rings': compile_roll_table(self.magic_items['rings'], die=100, name='rings')
+        }
 
-        with open(magic_items_path, 'r') as f:
-            self.magic_items = json.load(f)
+        # Parsed treasure type entries ('1-8 :50%' -> ('1-8', 50)), filled on first use
+        self._parsed_entries: Dict[str, Tuple[str, int]] = {}
 
         # Initialize magic item factory
         from .magic_item_factory import MagicItemFactory
@@ -115,6 +129,14 @@ class TreasureGenerator:
         Returns:
             (dice_formula, percentage_chance)
         """
+        parsed = self._parsed_entries.get(entry_str)
+        if parsed is None:
+            parsed = self._parse_treasure_entry_uncached(entry_str)
+            self._parsed_entries[entry_str] = parsed
+        return parsed
+
+    def _parse_treasure_entry_uncached(self, entry_str: str) -> Tuple[str, int]:
+        """Parse a treasure table entry (see _parse_treasure_entry)"""
         if entry_str == "nil" or not entry_str:
             return None, 0
 
@@ -187,56 +209,37 @@ class TreasureGenerator:
 
     def _generate_gem(self) -> Dict:
         """Generate a single gem"""
-        roll = random.randint(1, 100)
-
-        for entry in self.gem_values:
-            # Parse range like "01-20"
-            range_parts = entry["roll_d100"].split('-')
-            min_roll = int(range_parts[0])
-            max_roll = int(range_parts[1])
+        entry = self.gem_table.roll()
 
-            if min_roll <= roll <= max_roll:
-                gem_type = random.choice(entry["types"])
-                value = entry["value_gp"]
+        gem_type = random.choice(entry["types"])
+        value = entry["value_gp"]
 
-                # Add variation (50% to 150% of base value)
-                variation = random.randint(50, 150) / 100
-                final_value = int(value * variation)
+        # Add variation (50% to 150% of base value)
+        variation = random.randint(50, 150) / 100
+        final_value = int(value * variation)
 
-                return {
-                    "type": gem_type,
-                    "value": final_value,
-                    "description": f"a {gem_type} worth {final_value}gp"
-                }
-
-        # Fallback (shouldn't happen)
-        return {"type": "quartz", "value": 10, "description": "a quartz worth 10gp"}
+        return {
+            "type": gem_type,
+            "value": final_value,
+            "description": f"a {gem_type} worth {final_value}gp"
+        }
 
     def _generate_jewelry(self) -> Dict:
         """Generate a single piece of jewelry"""
-        roll = random.randint(1, 100)
-
-        for entry in self.jewelry_values:
-            range_parts = entry["roll_d100"].split('-')
-            min_roll = int(range_parts[0])
-            max_roll = int(range_parts[1])
-
-            if min_roll <= roll <= max_roll:
-                item_type = random.choice(entry["types"])
-                base_value = entry["base_value_gp"]
+        entry = self.jewelry_table.roll()
 
-                # Add variation (80% to 120% of base value)
-                variation = random.randint(80, 120) / 100
-                final_value = int(base_value * variation)
+        item_type = random.choice(entry["types"])
+        base_value = entry["base_value_gp"]
 
-                return {
-                    "type": item_type,
-                    "value": final_value,
-                    "description": f"a {item_type} worth {final_value}gp"
-                }
+        # Add variation (80% to 120% of base value)
+        variation = random.randint(80, 120) / 100
+        final_value = int(base_value * variation)
 
-        # Fallback
-        return {"type": "silver necklace", "value": 100, "description": "a silver necklace worth 100gp"}
+        return {
+            "type": item_type,
+            "value": final_value,
+            "description": f"a {item_type} worth {final_value}gp"
+        }
 
     def _roll_for_gems(self, entry_str: str) -> List[Dict]:
         """Roll for gems from treasure table entry"""
@@ -291,19 +294,13 @@ class TreasureGenerator:
 
         # Generate from appropriate table
         if category == "potions":
-            roll = random.randint(1, 100)
-            for entry in self.magic_items["potions"]:
-                roll_range = entry["roll"]
-                parts = roll_range.split("-")
-                min_r = int(parts[0])
-                max_r = int(parts[1]) if parts[1] != "00" else 100
-                if min_r <= roll <= max_r:
-                    return {
-                        "type": "potion",
-                        "name": f"Potion of {entry['name']}",
-                        "xp_value": entry["xp"],
-                        "gp_value": entry["gp"]
-                    }
+            entry = self.magic_tables["potions"].roll()
+            return {
+                "type": "potion",
+                "name": f"Potion of {entry['name']}",
+                "xp_value": entry["xp"],
+                "gp_value": entry["gp"]
+            }
 
         elif category == "scrolls":
             # Simplified: protection scrolls
@@ -317,49 +314,31 @@ class TreasureGenerator:
 
         elif category == "weapons" or category == "swords":
             # Roll for sword
-            roll = random.randint(1, 100)
-            for entry in self.magic_items["weapons"]["swords"]:
-                roll_range = entry["roll"]
-                parts = roll_range.split("-")
-                min_r = int(parts[0])
-                max_r = int(parts[1]) if parts[1] != "00" else 100
-                if min_r <= roll <= max_r:
-                    return {
-                        "type": "weapon",
-                        "name": entry["name"],
-                        "xp_value": entry["xp"],
-                        "gp_value": entry["gp"]
-                    }
+            entry = self.magic_tables["swords"].roll()
+            return {
+                "type": "weapon",
+                "name": entry["name"],
+                "xp_value": entry["xp"],
+                "gp_value": entry["gp"]
+            }
 
         elif category == "armor":
-            roll = random.randint(1, 100)
-            for entry in self.magic_items["armor"]:
-                roll_range = entry["roll"]
-                parts = roll_range.split("-")
-                min_r = int(parts[0])
-                max_r = int(parts[1]) if parts[1] != "00" else 100
-                if min_r <= roll <= max_r:
-                    return {
-                        "type": "armor",
-                        "name": entry["name"],
-                        "xp_value": entry["xp"],
-                        "gp_value": entry["gp"]
-                    }
+            entry = self.magic_tables["armor"].roll()
+            return {
+                "type": "armor",
+                "name": entry["name"],
+                "xp_value": entry["xp"],
+                "gp_value": entry["gp"]
+            }
 
         elif category == "rings":
-            roll = random.randint(1, 100)
-            for entry in self.magic_items["rings"]:
-                roll_range = entry["roll"]
-                parts = roll_range.split("-")
-                min_r = int(parts[0])
-                max_r = int(parts[1]) if parts[1] != "00" else 100
-                if min_r <= roll <= max_r:
-                    return {
-                        "type": "ring",
-                        "name": entry["name"],
-                        "xp_value": entry["xp"],
-                        "gp_value": entry["gp"]
-                    }
+            entry = self.magic_tables["rings"].roll()
+            return {
+                "type": "ring",
+                "name": entry["name"],
+                "xp_value": entry["xp"],
+                "gp_value": entry["gp"]
+            }
 
         elif category == "misc_magic":
             item = random.choice(self.magic_items["misc_magic"])
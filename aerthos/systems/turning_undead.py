@@ -3,11 +3,12 @@ Turning Undead System for AD&D 1e
 Handles cleric/paladin ability to turn or destroy undead
 """
 
-import json
 import random
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from .data_cache import load_json
+
 
 class TurningUndeadSystem:
     """Manages turning undead mechanics"""
@@ -15,11 +16,10 @@ class TurningUndeadSystem:
     def __init__(self):
         """Load turning undead tables"""
         data_path = Path(__file__).parent.parent / 'data' / 'turning_undead.json'
-        with open(data_path, 'r') as f:
-            data = json.load(f)
-            self.undead_types = data['undead_types']
-            self.turning_table = data['turning_table']
-            self.result_explanations = data['result_explanations']
+        data = load_json(data_path)
+        self.undead_types = data['undead_types']
+        self.turning_table = data['turning_table']
+        self.result_explanations = data['result_explanations']
 
     def get_effective_turning_level(self, char_class: str, level: int) -> int:
         """
@@ -8,11 +8,26 @@ Implements AD&D 1e weapon proficiency mechanics including:
 - Weapon groups for broader proficiency
 """
 
-import json
 import os
-from typing import List, Set, Dict
+from typing import List, Set, Dict, FrozenSet, Iterable, Optional, Tuple
 from pathlib import Path
 
+from .data_cache import load_json
+
+
+DEFAULT_NON_PROFICIENCY_PENALTY = -5
+
+# Shared instance used by combat (the data never changes at runtime)
+_weapon_proficiency_system: Optional['WeaponProficiencySystem'] = None
+
+
+def get_weapon_proficiency_system() -> 'WeaponProficiencySystem':
+    """Get singleton WeaponProficiencySystem instance"""
+    global _weapon_proficiency_system
+    if _weapon_proficiency_system is None:
+        _weapon_proficiency_system = WeaponProficiencySystem()
+    return _weapon_proficiency_system
+
 
 class WeaponProficiencySystem:
     """Handles weapon proficiency calculations and tracking"""
@@ -20,13 +35,59 @@ class WeaponProficiencySystem:
     def __init__(self):
         """Load weapon proficiency data from JSON"""
         data_path = Path(__file__).parent.parent / 'data' / 'weapon_proficiencies.json'
-        with open(data_path, 'r') as f:
-            self.data = json.load(f)
+        self.data = load_json(data_path)
 
         self.proficiency_by_class = self.data['proficiency_by_class']
         self.weapon_groups = self.data['weapon_groups']
         self.weapon_categories = self.data['weapon_categories']
 
+        # Compiled once: group -> every weapon it covers, class -> penalty
+        self._group_members = self._compile_group_members()
+        self._penalties: Dict[str, int] = {
+            char_class: class_data.get('non_proficiency_penalty', DEFAULT_NON_PROFICIENCY_PENALTY)
+            for char_class, class_data in self.proficiency_by_class.items()
+        }
+        self._resolved: Dict[Tuple[str, ...], FrozenSet[str]] = {}
+
+    def _compile_group_members(self) -> Dict[str, FrozenSet[str]]:
+        """
+        Expand each weapon group into the set of weapons it grants
+
+        A group covers the weapons listed under it in weapon_groups plus any
+        weapon whose category points at it (e.g. Club -> maces).
+        """
+        members: Dict[str, Set[str]] = {
+            group: set(weapons) for group, weapons in self.weapon_groups.items()
+        }
+        for weapon, group in self.weapon_categories.items():
+            if weapon.startswith('_'):
+                continue
+            members.setdefault(group, set()).add(weapon)
+        return {group: frozenset(weapons) for group, weapons in members.items()}
+
+    def resolve_proficient_weapons(self, proficiencies: Iterable[str]) -> FrozenSet[str]:
+        """
+        Resolve proficiencies into the full set of weapon names they cover
+
+        Groups are expanded to their weapons; the entries themselves are kept
+        so direct matches still work. Results are cached per proficiency list.
+
+        Args:
+            proficiencies: List of proficiencies (weapons or groups)
+
+        Returns:
+            Frozenset of every weapon name the character is proficient with
+        """
+        key = tuple(proficiencies)
+        resolved = self._resolved.get(key)
+        if resolved is None:
+            weapons = set(key)
+            for prof in key:
+                weapons.update(self._group_members.get(prof, ()))
+            resolved = frozenset(weapons)
+            self._resolved[key] = resolved
+        return resolved
+
     def get_initial_slots(self, char_class: str) -> int:
         """
         Get initial weapon proficiency slots for a class
@@ -63,8 +124,7 @@ class WeaponProficiencySystem:
         Returns:
             Penalty to attack rolls (negative number)
         """
-        class_data = self.proficiency_by_class.get(char_class, {})
-        return class_data.get('non_proficiency_penalty', -5)
+        return self._penalties.get(char_class, DEFAULT_NON_PROFICIENCY_PENALTY)
 
     def calculate_total_slots(self, char_class: str, level: int) -> int:
         """
@@ -99,22 +159,7 @@ class WeaponProficiencySystem:
         Returns:
             True if proficient (either specific weapon or via group)
         """
-        # Direct weapon proficiency
-        if weapon_name in proficiencies:
-            return True
-
-        # Check if proficient via weapon group
-        weapon_group = self.weapon_categories.get(weapon_name)
-        if weapon_group and weapon_group in proficiencies:
-            return True
-
-        # Check if group name is in proficiencies (e.g., "swords")
-        for prof in proficiencies:
-            if prof in self.weapon_groups:
-                if weapon_name in self.weapon_groups[prof]:
-                    return True
-
-        return False
+        return weapon_name in self.resolve_proficient_weapons(proficiencies)
 
     def get_available_weapons_for_proficiency(self) -> Dict[str, List[str]]:
         """
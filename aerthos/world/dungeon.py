@@ -5,6 +5,7 @@ Dungeon class - manages the game world and navigation
 import json
 from typing import Dict, Optional, List
 from pathlib import Path
+from .encounter import RoomEncounterIndex
 from .room import Room
 
 
@@ -16,6 +17,7 @@ class Dungeon:
         self.start_room_id = start_room_id
         self.rooms = rooms
         self.room_data = room_data or {}  # Store raw room data for encounter info
+        self.encounter_index = RoomEncounterIndex(self.room_data)  # Compiled once per dungeon
 
     @classmethod
     def load_from_file(cls, filepath: str) -> 'Dungeon':
@@ -71,11 +73,12 @@ class Dungeon:
             room = Room(
                 id=room_data['id'],
                 title=room_data['title'],
-                description=room_data['description'],
+                description=room_data.get('description', ''),
                 light_level=room_data.get('light_level', 'dark'),
                 exits=room_data.get('exits', {}),
                 items=room_data.get('items', []),
-                is_safe_for_rest=room_data.get('safe_rest', False)
+                is_safe_for_rest=room_data.get('safe_rest', False),
+                description_seed=room_data.get('description_seed')
             )
             rooms[room_id] = room
 
@@ -127,15 +130,22 @@ class Dungeon:
             'name': self.name,
             'start_room_id': self.start_room_id,
             'room_states': {
-                room_id: {
-                    'is_explored': room.is_explored,
-                    'items': room.items,
-                    'encounters_completed': room.encounters_completed
-                }
+                room_id: self._room_state(room)
                 for room_id, room in self.rooms.items()
             }
         }
 
+    @staticmethod
+    def _room_state(room: Room) -> Dict:
+        """Saved state for one room (completed encounters only when there are any)"""
+        state = {
+            'is_explored': room.is_explored,
+            'items': room.items
+        }
+        if room.encounters_completed:
+            state['encounters_completed'] = sorted(room.encounters_completed)
+        return state
+
     def to_dict(self) -> Dict:
         """
         Convert dungeon to full dictionary representation for scenario saving
@@ -147,20 +157,28 @@ class Dungeon:
             'name': self.name,
             'start_room': self.start_room_id,  # Note: 'start_room' for compatibility with load_from_generator
             'rooms': {
-                room_id: {
-                    'id': room.id,
-                    'title': room.title,
-                    'description': room.description,
-                    'light_level': room.light_level,
-                    'exits': room.exits,
-                    'items': room.items,
-                    'safe_rest': room.is_safe_for_rest,
-                    'encounters': self.room_data.get(room_id, {}).get('encounters', []) if self.room_data else []
-                }
+                room_id: self._room_to_dict(room_id, room)
                 for room_id, room in self.rooms.items()
             }
         }
 
+    def _room_to_dict(self, room_id: str, room: Room) -> Dict:
+        """Full room dictionary (unvisited rooms keep their description seed)"""
+        room_dict = {
+            'id': room.id,
+            'title': room.title,
+            'light_level': room.light_level,
+            'exits': room.exits,
+            'items': room.items,
+            'safe_rest': room.is_safe_for_rest,
+            'encounters': self.room_data.get(room_id, {}).get('encounters', []) if self.room_data else []
+        }
+        if room.description_seed is not None:
+            room_dict['description_seed'] = room.description_seed
+        else:
+            room_dict['description'] = room.description
+        return room_dict
+
     @classmethod
     def deserialize(cls, data: Dict, original_dungeon_file: str) -> 'Dungeon':
         """
@@ -184,6 +202,6 @@ class Dungeon:
                 room = dungeon.rooms[room_id]
                 room.is_explored = state.get('is_explored', False)
                 room.items = state.get('items', [])
-                room.encounters_completed = state.get('encounters_completed', [])
+                room.restore_encounters_completed(state.get('encounters_completed'))
 
         return dungeon
@@ -2,7 +2,7 @@
 Encounter system - handles combat encounters, traps, and puzzles
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 
 
@@ -64,6 +64,97 @@ class TreasureEncounter(Encounter):
         self.encounter_type = 'treasure'
 
 
+def compile_encounter(room_id: str, index: int, enc_data: Dict) -> Optional[Encounter]:
+    """
+    Build the Encounter for one entry of a room's 'encounters' list
+
+    Args:
+        room_id: Room the encounter belongs to
+        index: Position in the room's encounter list (part of the ID)
+        enc_data: Encounter dictionary from JSON
+
+    Returns:
+        Encounter, or None for unsupported types
+    """
+    encounter_id = f"{room_id}_encounter_{index}"
+    enc_type = enc_data.get('type', 'combat')
+
+    if enc_type == 'combat':
+        return CombatEncounter(
+            encounter_id=encounter_id,
+            encounter_type='combat',  # Required by parent class
+            monster_ids=enc_data.get('monsters', []),
+            is_boss=enc_data.get('boss', False),
+            trigger=enc_data.get('trigger', 'on_enter')
+        )
+    if enc_type == 'trap':
+        return TrapEncounter(
+            encounter_id=encounter_id,
+            encounter_type='trap',  # Required by parent class
+            trap_type=enc_data.get('trap_type', 'pit'),
+            damage=enc_data.get('damage', '1d6'),
+            detect_difficulty=enc_data.get('detect_difficulty', 20),
+            trigger=enc_data.get('trigger', 'on_search')
+        )
+    if enc_type == 'puzzle':
+        return PuzzleEncounter(
+            encounter_id=encounter_id,
+            encounter_type='puzzle',  # Required by parent class
+            puzzle_type=enc_data.get('puzzle_type', 'locked_chest'),
+            difficulty=enc_data.get('difficulty', 30),
+            reward=enc_data.get('reward'),
+            trigger=enc_data.get('trigger', 'manual')
+        )
+    return None
+
+
+class RoomEncounterIndex:
+    """
+    Every room's encounters, compiled once and bucketed by trigger
+
+    Built when a dungeon is loaded. Looking up a (room, trigger) pair is a
+    single dict lookup, and rooms with nothing to trigger (most of them)
+    return an empty tuple.
+    """
+
+    def __init__(self, room_data: Dict[str, Dict]):
+        """
+        Args:
+            room_data: Room ID -> room dictionary (with optional 'encounters')
+        """
+        self._by_room: Dict[str, Tuple[Encounter, ...]] = {}
+        self._buckets: Dict[Tuple[str, str], Tuple[Encounter, ...]] = {}
+
+        for room_id, data in room_data.items():
+            encounters = [
+                encounter for encounter in (
+                    compile_encounter(room_id, i, enc_data)
+                    for i, enc_data in enumerate(data.get('encounters') or ())
+                )
+                if encounter is not None
+            ]
+            if not encounters:
+                continue
+
+            self._by_room[room_id] = tuple(encounters)
+            buckets: Dict[str, List[Encounter]] = {}
+            for encounter in encounters:
+                buckets.setdefault(encounter.trigger, []).append(encounter)
+            for trigger, bucket in buckets.items():
+                self._buckets[(room_id, trigger)] = tuple(bucket)
+
+    def for_room(self, room_id: str) -> Tuple[Encounter, ...]:
+        """All encounters in a room"""
+        return self._by_room.get(room_id, ())
+
+    def triggered_by(self, room_id: str, trigger_type: str) -> Tuple[Encounter, ...]:
+        """Encounters in a room with the given trigger ('on_enter', 'on_search', ...)"""
+        return self._buckets.get((room_id, trigger_type), ())
+
+    def __len__(self) -> int:
+        return sum(len(encounters) for encounters in self._by_room.values())
+
+
 class EncounterManager:
     """Manages encounter resolution"""
 
@@ -74,6 +165,9 @@ class EncounterManager:
         """
         Load encounters from room JSON data
 
+        Dungeons compile these once (Dungeon.encounter_index); this is for
+        one-off room dictionaries.
+
         Args:
             room_data: Room dictionary from JSON
 
@@ -81,47 +175,10 @@ class EncounterManager:
             List of Encounter objects
         """
 
-        encounters = []
-
         if 'encounters' not in room_data:
-            return encounters
-
-        for i, enc_data in enumerate(room_data['encounters']):
-            encounter_id = f"{room_data['id']}_encounter_{i}"
-            enc_type = enc_data.get('type', 'combat')
-
-            if enc_type == 'combat':
-                encounter = CombatEncounter(
-                    encounter_id=encounter_id,
-                    encounter_type='combat',  # Required by parent class
-                    monster_ids=enc_data.get('monsters', []),
-                    is_boss=enc_data.get('boss', False),
-                    trigger=enc_data.get('trigger', 'on_enter')
-                )
-            elif enc_type == 'trap':
-                encounter = TrapEncounter(
-                    encounter_id=encounter_id,
-                    encounter_type='trap',  # Required by parent class
-                    trap_type=enc_data.get('trap_type', 'pit'),
-                    damage=enc_data.get('damage', '1d6'),
-                    detect_difficulty=enc_data.get('detect_difficulty', 20),
-                    trigger=enc_data.get('trigger', 'on_search')
-                )
-            elif enc_type == 'puzzle':
-                encounter = PuzzleEncounter(
-                    encounter_id=encounter_id,
-                    encounter_type='puzzle',  # Required by parent class
-                    puzzle_type=enc_data.get('puzzle_type', 'locked_chest'),
-                    difficulty=enc_data.get('difficulty', 30),
-                    reward=enc_data.get('reward'),
-                    trigger=enc_data.get('trigger', 'manual')
-                )
-            else:
-                continue
-
-            encounters.append(encounter)
+            return []
 
-        return encounters
+        return list(RoomEncounterIndex({room_data['id']: room_data}).for_room(room_data['id']))
 
     def get_triggered_encounters(self, encounters: List[Encounter],
                                 trigger_type: str) -> List[Encounter]:
@@ -2,10 +2,11 @@
 Guild system for class-specific services and quests
 """
 
-import json
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 
+from ..systems.data_cache import data_path, load_json
+
 
 @dataclass
 class GuildService:
@@ -103,9 +104,8 @@ class Guild:
 class GuildManager:
     """Manages all guilds in the game"""
 
-    def __init__(self, guilds_data_path: str = "aerthos/data/guilds.json"):
-        with open(guilds_data_path, 'r') as f:
-            data = json.load(f)
+    def __init__(self, guilds_data_path: Optional[str] = None):
+        data = load_json(guilds_data_path or data_path('guilds.json'))
 
         self.guilds = {
             guild_id: Guild(guild_id, guild_data)
@@ -2,10 +2,11 @@
 Inn system for rest, food, and lodging
 """
 
-import json
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 
+from ..systems.data_cache import data_path, load_json
+
 
 @dataclass
 class InnRoom:
@@ -142,9 +143,8 @@ class Inn:
 class InnManager:
     """Manages all inns in the game"""
 
-    def __init__(self, inns_data_path: str = "aerthos/data/inns.json"):
-        with open(inns_data_path, 'r') as f:
-            data = json.load(f)
+    def __init__(self, inns_data_path: Optional[str] = None):
+        data = load_json(inns_data_path or data_path('inns.json'))
 
         self.inns = {
             inn_id: Inn(inn_id, inn_data)
@@ -7,18 +7,64 @@ difficulty increases with depth.
 """
 
 from typing import Dict, Optional, List, Tuple
-from dataclasses import dataclass, field
 from .dungeon import Dungeon
 from .room import Room
 
 
-@dataclass
 class DungeonLevel:
-    """A single level within a multi-level dungeon"""
-    level_number: int  # 1, 2, 3, etc. (deeper = higher number)
-    name: str  # "Level 1: The Entrance", "Level 2: Kobold Warrens", etc.
-    dungeon: Dungeon  # The actual dungeon data for this level
-    difficulty_tier: int = 1  # 1=Easy, 2=Standard, 3=Hard, 4=Deadly
+    """
+    A single level within a multi-level dungeon
+
+    Levels loaded from a scenario or save keep their dungeon as the saved
+    dictionary (dungeon_data) and only build the Dungeon and its rooms the
+    first time `dungeon` is accessed. Until then the dictionary is written
+    back unchanged when the dungeon is saved.
+    """
+
+    def __init__(
+        self,
+        level_number: int,
+        name: str,
+        dungeon: Optional[Dungeon] = None,
+        difficulty_tier: int = 1,
+        dungeon_data: Optional[Dict] = None
+    ):
+        self.level_number = level_number  # 1, 2, 3, etc. (deeper = higher number)
+        self.name = name  # "Level 1: The Entrance", "Level 2: Kobold Warrens", etc.
+        self.difficulty_tier = difficulty_tier  # 1=Easy, 2=Standard, 3=Hard, 4=Deadly
+        self._dungeon = dungeon
+        self.dungeon_data = None if dungeon is not None else dungeon_data
+
+    @property
+    def dungeon(self) -> Dungeon:
+        """The actual dungeon data for this level (built on first access)"""
+        if self._dungeon is None:
+            self._dungeon = Dungeon.load_from_generator(self.dungeon_data)
+            self.dungeon_data = None
+        return self._dungeon
+
+    @dungeon.setter
+    def dungeon(self, dungeon: Dungeon) -> None:
+        self._dungeon = dungeon
+        self.dungeon_data = None
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the Dungeon for this level has been built"""
+        return self._dungeon is not None
+
+    @property
+    def num_rooms(self) -> int:
+        """Number of rooms, without building the level"""
+        if self._dungeon is None:
+            return len(self.dungeon_data['rooms'])
+        return len(self._dungeon.rooms)
+
+    def dungeon_dict(self) -> Dict:
+        """Full dungeon dictionary (the saved one, as is, if never built)"""
+        if self._dungeon is None:
+            return self.dungeon_data
+        return self._dungeon.to_dict()
 
 
 class MultiLevelDungeon:
@@ -47,18 +93,20 @@ class MultiLevelDungeon:
     def add_level(
         self,
         level_number: int,
-        dungeon: Dungeon,
+        dungeon: Optional[Dungeon],
         level_name: str = None,
-        difficulty_tier: int = None
+        difficulty_tier: int = None,
+        dungeon_data: Optional[Dict] = None
     ):
         """
         Add a level to the dungeon
 
         Args:
             level_number: Level number (1, 2, 3, etc.)
-            dungeon: Dungeon instance for this level
+            dungeon: Dungeon instance for this level (None to build it from dungeon_data)
             level_name: Optional name for this level
             difficulty_tier: Difficulty tier (1-4), defaults to level_number
+            dungeon_data: Saved dungeon dictionary, built into a Dungeon on first use
         """
         if level_name is None:
             level_name = f"Level {level_number}"
@@ -70,7 +118,8 @@ class MultiLevelDungeon:
             level_number=level_number,
             name=level_name,
             dungeon=dungeon,
-            difficulty_tier=difficulty_tier
+            difficulty_tier=difficulty_tier,
+            dungeon_data=dungeon_data
         )
 
         self.levels[level_number] = level
@@ -201,17 +250,16 @@ class MultiLevelDungeon:
 
     def get_total_rooms(self) -> int:
         """Get total number of rooms across all levels"""
-        total = 0
-        for level in self.levels.values():
-            total += len(level.dungeon.rooms)
-        return total
+        return sum(level.num_rooms for level in self.levels.values())
 
     def get_explored_rooms(self) -> int:
         """Get count of explored rooms across all levels"""
-        total = 0
-        for level in self.levels.values():
-            total += len(level.dungeon.get_explored_rooms())
-        return total
+        # Levels that were never built have not been explored since loading
+        return sum(
+            len(level.dungeon.get_explored_rooms())
+            for level in self.levels.values()
+            if level.is_loaded
+        )
 
     def get_level_names(self) -> List[str]:
         """Get list of all level names in order"""
@@ -236,7 +284,7 @@ class MultiLevelDungeon:
                     "level_number": level.level_number,
                     "name": level.name,
                     "difficulty_tier": level.difficulty_tier,
-                    "dungeon": level.dungeon.to_dict()
+                    "dungeon": level.dungeon_dict()
                 }
                 for level_number, level in sorted(self.levels.items())
             ]
@@ -247,6 +295,8 @@ class MultiLevelDungeon:
         """
         Deserialize multi-level dungeon from dictionary
 
+        Levels are built lazily, when first entered or otherwise accessed.
+
         Args:
             data: Dictionary from to_dict()
 
@@ -258,12 +308,12 @@ class MultiLevelDungeon:
         ml_dungeon.current_level_number = data.get("current_level", 1)
 
         for level_data in data["levels"]:
-            dungeon = Dungeon.load_from_generator(level_data["dungeon"])
             ml_dungeon.add_level(
                 level_number=level_data["level_number"],
-                dungeon=dungeon,
+                dungeon=None,
                 level_name=level_data["name"],
-                difficulty_tier=level_data.get("difficulty_tier", level_data["level_number"])
+                difficulty_tier=level_data.get("difficulty_tier", level_data["level_number"]),
+                dungeon_data=level_data["dungeon"]
             )
 
         return ml_dungeon
@@ -279,7 +329,7 @@ class MultiLevelDungeon:
                     "level_number": level.level_number,
                     "name": level.name,
                     "difficulty_tier": level.difficulty_tier,
-                    "dungeon_state": level.dungeon.to_dict()  # Use to_dict() for full structure
+                    "dungeon_state": level.dungeon_dict()  # Full structure, as in to_dict()
                 }
                 for level_number, level in self.levels.items()
             }
@@ -290,6 +340,8 @@ class MultiLevelDungeon:
         """
         Deserialize from serialize() format (for game saves)
 
+        Levels are built lazily, when first entered or otherwise accessed.
+
         Args:
             data: Dictionary from serialize()
 
@@ -304,14 +356,12 @@ class MultiLevelDungeon:
         for level_number_str, level_data in data["levels"].items():
             level_number = int(level_number_str)
 
-            # Deserialize the dungeon (use Dungeon.load_from_generator for consistency)
-            dungeon = Dungeon.load_from_generator(level_data["dungeon_state"])
-
             ml_dungeon.add_level(
                 level_number=level_number,
-                dungeon=dungeon,
+                dungeon=None,
                 level_name=level_data["name"],
-                difficulty_tier=level_data.get("difficulty_tier", level_number)
+                difficulty_tier=level_data.get("difficulty_tier", level_number),
+                dungeon_data=level_data["dungeon_state"]
             )
 
         return ml_dungeon
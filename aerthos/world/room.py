@@ -2,7 +2,7 @@
 Room class - represents a single location in the dungeon
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Set
 from dataclasses import dataclass, field
 
 
@@ -19,8 +19,24 @@ class Room:
     is_explored: bool = False
     is_safe_for_rest: bool = False
 
-    # Encounter tracking
-    encounters_completed: List[str] = field(default_factory=list)
+    # Encounter tracking (IDs of completed encounters)
+    encounters_completed: Set[str] = field(default_factory=set)
+
+    # Deferred narrator description (rendered on first visit, then cached)
+    description_seed: Optional[Dict] = None
+
+    def get_description(self) -> str:
+        """
+        Get the base room description, rendering a deferred one if needed
+
+        Returns:
+            Description text
+        """
+        if self.description_seed is not None:
+            from ..generator.dungeon_generator import render_room_description
+            self.description = render_room_description(self.description_seed)
+            self.description_seed = None
+        return self.description
 
     def on_enter(self, has_light: bool, player=None) -> str:
         """
@@ -79,18 +95,20 @@ class Room:
     def _get_modified_description(self) -> str:
         """Get room description modified for completed encounters"""
 
+        base_description = self.get_description()
+
         # If there are completed encounters, modify description to reflect defeated monsters
         if not self.encounters_completed:
-            return self.description
+            return base_description
 
         # Check if any completed encounters look like combat encounters
         has_completed_combat = any('encounter' in enc_id for enc_id in self.encounters_completed)
 
         if not has_completed_combat:
-            return self.description
+            return base_description
 
         # Modify description to show defeated monsters instead of threatening ones
-        modified = self.description
+        modified = base_description
 
         # Common replacements for defeated monsters
         replacements = {
@@ -169,8 +187,11 @@ class Room:
 
     def mark_encounter_completed(self, encounter_id: str):
         """Mark an encounter as completed"""
-        if encounter_id not in self.encounters_completed:
-            self.encounters_completed.append(encounter_id)
+        self.encounters_completed.add(encounter_id)
+
+    def restore_encounters_completed(self, encounter_ids: Optional[Iterable[str]]):
+        """Restore completed encounters from a save (list, or None for none)"""
+        self.encounters_completed = set(encounter_ids or ())
 
     def is_encounter_completed(self, encounter_id: str) -> bool:
         """Check if an encounter has been completed"""
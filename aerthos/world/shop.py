@@ -2,10 +2,11 @@
 Shop system for buying and selling items
 """
 
-import json
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 
+from ..systems.data_cache import data_path, load_json
+
 
 @dataclass
 class ShopItem:
@@ -34,26 +35,30 @@ class Shop:
         self.items = [ShopItem(**item) for item in data.get('items', [])]
         self.services = [ShopService(**svc) for svc in data.get('services', [])]
 
+        # Lookup indexes (first entry wins, like a front-to-back scan)
+        self._items_by_id: Dict[str, ShopItem] = {}
+        for item in self.items:
+            self._items_by_id.setdefault(item.id, item)
+        self._services_by_name: Dict[str, ShopService] = {}
+        for service in self.services:
+            self._services_by_name.setdefault(service.name, service)
+
     def get_item_price(self, item_id: str) -> Optional[int]:
         """Get the price of an item"""
-        for item in self.items:
-            if item.id == item_id:
-                return item.price
-        return None
+        item = self._items_by_id.get(item_id)
+        return item.price if item else None
 
     def has_item(self, item_id: str) -> bool:
         """Check if shop has an item in stock"""
-        for item in self.items:
-            if item.id == item_id and item.stock > 0:
-                return True
-        return False
+        item = self._items_by_id.get(item_id)
+        return item is not None and item.stock > 0
 
     def buy_item(self, item_id: str) -> bool:
         """Buy an item from the shop (reduces stock)"""
-        for item in self.items:
-            if item.id == item_id and item.stock > 0:
-                item.stock -= 1
-                return True
+        item = self._items_by_id.get(item_id)
+        if item is not None and item.stock > 0:
+            item.stock -= 1
+            return True
         return False
 
     def sell_item(self, item_id: str, value: int) -> int:
@@ -65,10 +70,8 @@ class Shop:
 
     def get_service_price(self, service_name: str) -> Optional[int]:
         """Get the price of a service"""
-        for service in self.services:
-            if service.name == service_name:
-                return service.price
-        return None
+        service = self._services_by_name.get(service_name)
+        return service.price if service else None
 
     def list_items(self) -> List[Dict]:
         """List all items available for purchase"""
@@ -97,9 +100,8 @@ class Shop:
 class ShopManager:
     """Manages all shops in the game"""
 
-    def __init__(self, shops_data_path: str = "aerthos/data/shops.json"):
-        with open(shops_data_path, 'r') as f:
-            data = json.load(f)
+    def __init__(self, shops_data_path: Optional[str] = None):
+        data = load_json(shops_data_path or data_path('shops.json'))
 
         self.shops = {
             shop_id: Shop(shop_id, shop_data)
@@ -2,7 +2,9 @@
 Village system - Towns with shops, inns, and services
 """
 
-from typing import Dict, List, Optional, Tuple
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
 
 
@@ -13,6 +15,7 @@ class ShopItem:
     item_name: str
     price: int  # in GP
     stock: int = -1  # -1 means unlimited
+    category: str = "general"
 
 
 @dataclass
@@ -30,6 +33,41 @@ class Shop:
     buy_price_multiplier: float = 0.5  # Shops buy at 50% of retail
     sell_price_multiplier: float = 1.0  # Shops sell at full price
 
+    def __post_init__(self):
+        # Guards stock so a trade is validated and applied as one step
+        self._lock = threading.Lock()
+        self.reindex()
+
+    def reindex(self) -> None:
+        """
+        Rebuild the catalog indexes
+
+        Appending to inventory is picked up automatically; call this after
+        replacing or reordering inventory entries in place.
+        """
+        self._by_id: Dict[str, ShopItem] = {}
+        self._by_category: Dict[str, List[ShopItem]] = {}
+        for shop_item in self.inventory:
+            # First entry wins, like the old front-to-back scan
+            self._by_id.setdefault(shop_item.item_id, shop_item)
+            self._by_category.setdefault(shop_item.category, []).append(shop_item)
+        self._indexed_count = len(self.inventory)
+
+    def _catalog(self) -> Dict[str, ShopItem]:
+        """Item ID index, rebuilt if items were added to inventory"""
+        if self._indexed_count != len(self.inventory):
+            self.reindex()
+        return self._by_id
+
+    def get_item(self, item_id: str) -> Optional[ShopItem]:
+        """Get a catalog entry by item ID (in stock or not)"""
+        return self._catalog().get(item_id)
+
+    def items_in_category(self, category: str) -> List[ShopItem]:
+        """Catalog entries in a category, in inventory order"""
+        self._catalog()
+        return list(self._by_category.get(category, []))
+
     def get_sell_price(self, item_id: str, item_name: str, base_cost: int) -> int:
         """Get price to sell this item to player"""
         return int(base_cost * self.sell_price_multiplier)
@@ -40,10 +78,8 @@ class Shop:
 
     def has_item(self, item_id: str) -> bool:
         """Check if shop has this item in stock"""
-        for shop_item in self.inventory:
-            if shop_item.item_id == item_id:
-                return shop_item.stock != 0
-        return False
+        shop_item = self._catalog().get(item_id)
+        return shop_item is not None and shop_item.stock != 0
 
     def purchase_item(self, item_id: str) -> Optional[ShopItem]:
         """
@@ -52,16 +88,89 @@ class Shop:
         Returns:
             ShopItem if successful, None if out of stock
         """
-        for shop_item in self.inventory:
-            if shop_item.item_id == item_id:
-                if shop_item.stock == -1:  # Unlimited
-                    return shop_item
-                elif shop_item.stock > 0:
-                    shop_item.stock -= 1
-                    return shop_item
-                else:
-                    return None
-        return None
+        shop_item = self._catalog().get(item_id)
+        if shop_item is None:
+            return None
+
+        with self._lock:
+            if shop_item.stock == -1:  # Unlimited
+                return shop_item
+            elif shop_item.stock > 0:
+                shop_item.stock -= 1
+                return shop_item
+            return None
+
+    def trade(
+        self,
+        buy: Union[Iterable[str], Dict[str, int]] = (),
+        sell: Iterable[Tuple[str, str, int]] = (),
+        gold: int = 0
+    ) -> Dict:
+        """
+        Buy and sell a whole basket of items in one transaction
+
+        The basket is priced and validated as a whole before any stock
+        changes: either every purchase and sale goes through, or none do.
+        Proceeds from the sales count towards the purchases. Sold items
+        the shop stocks in limited numbers go back into its stock.
+
+        Args:
+            buy: Item IDs to buy (repeat an ID for several), or {item_id: quantity}
+            sell: (item_id, item_name, base_cost) for each item sold to the shop
+            gold: Gold the buyer has
+
+        Returns:
+            Dict with: success, message, cost, proceeds, gold (remaining),
+            bought (list of ShopItem, one per unit)
+        """
+        wanted = Counter(buy)
+        sold = list(sell)
+        catalog = self._catalog()
+
+        def failed(message: str) -> Dict:
+            return {'success': False, 'message': message, 'cost': 0, 'proceeds': 0,
+                    'gold': gold, 'bought': []}
+
+        for item_id, quantity in wanted.items():
+            if item_id not in catalog:
+                return failed(f"{self.name} doesn't sell '{item_id}'.")
+            if quantity < 0:
+                return failed(f"Invalid quantity for '{item_id}'.")
+
+        proceeds = sum(self.get_buy_price(item_id, item_name, base_cost)
+                       for item_id, item_name, base_cost in sold)
+
+        with self._lock:
+            cost = 0
+            for item_id, quantity in wanted.items():
+                shop_item = catalog[item_id]
+                if shop_item.stock != -1 and shop_item.stock < quantity:
+                    return failed(f"{self.name} only has {shop_item.stock} {shop_item.item_name} left.")
+                cost += quantity * self.get_sell_price(item_id, shop_item.item_name, shop_item.price)
+
+            if cost > gold + proceeds:
+                return failed(f"That comes to {cost} gp, but you only have {gold + proceeds} gp.")
+
+            bought = []
+            for item_id, quantity in wanted.items():
+                shop_item = catalog[item_id]
+                if shop_item.stock != -1:
+                    shop_item.stock -= quantity
+                bought.extend([shop_item] * quantity)
+
+            for item_id, item_name, base_cost in sold:
+                shop_item = catalog.get(item_id)
+                if shop_item is not None and shop_item.stock != -1:
+                    shop_item.stock += 1
+
+        return {
+            'success': True,
+            'message': f"Bought {len(bought)} item(s) for {cost} gp, sold {len(sold)} for {proceeds} gp.",
+            'cost': cost,
+            'proceeds': proceeds,
+            'gold': gold - cost + proceeds,
+            'bought': bought
+        }
 
 
 @dataclass
@@ -132,11 +241,11 @@ def create_starting_village() -> Village:
         name="Thornwood General Store",
         description="A well-stocked shop selling basic adventuring supplies.",
         inventory=[
-            ShopItem("torch", "Torch", 1, -1),
-            ShopItem("rations", "Rations (1 day)", 5, -1),
-            ShopItem("rope_50ft", "Rope (50 ft)", 10, -1),
-            ShopItem("lantern", "Lantern", 100, -1),
-            ShopItem("potion_healing", "Potion of Healing", 500, 5),
+            ShopItem("torch", "Torch", 1, -1, "supplies"),
+            ShopItem("rations", "Rations (1 day)", 5, -1, "supplies"),
+            ShopItem("rope_50ft", "Rope (50 ft)", 10, -1, "supplies"),
+            ShopItem("lantern", "Lantern", 100, -1, "supplies"),
+            ShopItem("potion_healing", "Potion of Healing", 500, 5, "potions"),
         ]
     )
 
@@ -145,15 +254,15 @@ def create_starting_village() -> Village:
         name="Ironforge Armory",
         description="A smithy and armorer selling weapons and armor.",
         inventory=[
-            ShopItem("dagger", "Dagger", 20, -1),
-            ShopItem("shortsword", "Shortsword", 100, -1),
-            ShopItem("longsword", "Longsword", 150, -1),
-            ShopItem("mace", "Mace", 80, -1),
-            ShopItem("staff", "Staff", 10, -1),
-            ShopItem("leather_armor", "Leather Armor", 50, -1),
-            ShopItem("chain_mail", "Chain Mail", 750, -1),
-            ShopItem("plate_mail", "Plate Mail", 4000, 2),
-            ShopItem("shield", "Shield", 100, -1),
+            ShopItem("dagger", "Dagger", 20, -1, "weapons"),
+            ShopItem("shortsword", "Shortsword", 100, -1, "weapons"),
+            ShopItem("longsword", "Longsword", 150, -1, "weapons"),
+            ShopItem("mace", "Mace", 80, -1, "weapons"),
+            ShopItem("staff", "Staff", 10, -1, "weapons"),
+            ShopItem("leather_armor", "Leather Armor", 50, -1, "armor"),
+            ShopItem("chain_mail", "Chain Mail", 750, -1, "armor"),
+            ShopItem("plate_mail", "Plate Mail", 4000, 2, "armor"),
+            ShopItem("shield", "Shield", 100, -1, "armor"),
         ]
     )
 
@@ -162,12 +271,12 @@ def create_starting_village() -> Village:
         name="Mystical Emporium",
         description="A mysterious shop dealing in magical items and curiosities.",
         inventory=[
-            ShopItem("potion_healing", "Potion of Healing", 500, 10),
-            ShopItem("longsword_plus1", "Longsword +1", 2000, 1),
-            ShopItem("shortsword_plus1", "Shortsword +1", 1500, 1),
-            ShopItem("dagger_plus1", "Dagger +1", 1000, 2),
-            ShopItem("chain_mail_plus1", "Chain Mail +1", 3000, 1),
-            ShopItem("shield_plus1", "Shield +1", 1500, 1),
+            ShopItem("potion_healing", "Potion of Healing", 500, 10, "potions"),
+            ShopItem("longsword_plus1", "Longsword +1", 2000, 1, "magic_weapons"),
+            ShopItem("shortsword_plus1", "Shortsword +1", 1500, 1, "magic_weapons"),
+            ShopItem("dagger_plus1", "Dagger +1", 1000, 2, "magic_weapons"),
+            ShopItem("chain_mail_plus1", "Chain Mail +1", 3000, 1, "magic_armor"),
+            ShopItem("shield_plus1", "Shield +1", 1500, 1, "magic_armor"),
         ],
         sell_price_multiplier=1.2  # Magic shop charges 20% premium
     )
@@ -0,0 +1,16 @@
+"""
+Performance benchmarks for Aerthos hot paths
+
+The correctness suite lives in tests/. This package measures speed:
+timing helpers and baseline comparison live in harness.py, the
+benchmark definitions in hot_paths.py. Run via run_benchmarks.py.
+"""
+
+from .harness import Benchmark, BenchmarkResult, BenchmarkRunner, compare_results
+
+__all__ = [
+    'Benchmark',
+    'BenchmarkResult',
+    'BenchmarkRunner',
+    'compare_results'
+]
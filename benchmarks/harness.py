@@ -0,0 +1,260 @@
+"""
+Benchmark harness - timing, JSON baselines and regression detection
+
+A Benchmark wraps a setup context manager that yields the callable to time.
+Setup and teardown (loading data, building dungeons, temp directories) are
+never included in the measurement.
+"""
+
+import gc
+import importlib.util
+import json
+import platform
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, ContextManager, Dict, List, Optional
+
+
+# Default regression threshold: flag anything more than 25% slower than baseline
+DEFAULT_THRESHOLD = 0.25
+
+
+@dataclass
+class Benchmark:
+    """A single named benchmark"""
+
+    name: str
+    setup: Callable[[], ContextManager[Callable[[], object]]]  # Yields the timed callable
+    loops: int = 10  # Calls per timed sample
+    repeat: int = 5  # Number of timed samples
+    group: str = 'core'
+    requires: Optional[str] = None  # Optional module needed (e.g. 'flask')
+    description: str = ''
+
+    def is_available(self) -> bool:
+        """Check whether the optional dependency (if any) is installed"""
+        if not self.requires:
+            return True
+        return importlib.util.find_spec(self.requires) is not None
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing result for one benchmark (all times are seconds per call)"""
+
+    name: str
+    loops: int
+    repeat: int
+    best: float
+    median: float
+    mean: float
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'BenchmarkResult':
+        return cls(
+            name=data['name'],
+            loops=data.get('loops', 1),
+            repeat=data.get('repeat', 1),
+            best=data['best'],
+            median=data['median'],
+            mean=data.get('mean', data['median'])
+        )
+
+
+@dataclass
+class Comparison:
+    """Result of comparing a benchmark against its baseline"""
+
+    name: str
+    current: float
+    baseline: Optional[float]
+    status: str  # 'ok', 'regression', 'improved', 'new'
+
+    @property
+    def ratio(self) -> Optional[float]:
+        """current / baseline (None if there is no baseline)"""
+        if not self.baseline:
+            return None
+        return self.current / self.baseline
+
+
+class BenchmarkRunner:
+    """Runs benchmarks and collects per-call timings"""
+
+    def __init__(self, benchmarks: List[Benchmark], quick: bool = False):
+        """
+        Args:
+            benchmarks: Benchmarks to run
+            quick: If True, run every benchmark once (smoke test, no timing value)
+        """
+        self.benchmarks = benchmarks
+        self.quick = quick
+        self.skipped: List[str] = []
+
+    def select(self, names: Optional[List[str]] = None,
+               groups: Optional[List[str]] = None) -> List[Benchmark]:
+        """Select benchmarks by name substring and/or group"""
+        selected = []
+        for bench in self.benchmarks:
+            if groups and bench.group not in groups:
+                continue
+            if names and not any(n in bench.name for n in names):
+                continue
+            selected.append(bench)
+        return selected
+
+    def run(self, names: Optional[List[str]] = None,
+            groups: Optional[List[str]] = None,
+            progress: Optional[Callable[[BenchmarkResult], None]] = None) -> List[BenchmarkResult]:
+        """
+        Run the selected benchmarks
+
+        Args:
+            names: Only run benchmarks whose name contains one of these
+            groups: Only run benchmarks in these groups
+            progress: Optional callback invoked after each benchmark
+
+        Returns:
+            List of BenchmarkResult (skipped benchmarks are listed in self.skipped)
+        """
+        results = []
+        self.skipped = []
+
+        for bench in self.select(names, groups):
+            if not bench.is_available():
+                self.skipped.append(f"{bench.name} (requires {bench.requires})")
+                continue
+
+            result = self.run_one(bench)
+            results.append(result)
+            if progress:
+                progress(result)
+
+        return results
+
+    def run_one(self, bench: Benchmark) -> BenchmarkResult:
+        """Time a single benchmark"""
+        loops = 1 if self.quick else bench.loops
+        repeat = 1 if self.quick else bench.repeat
+
+        with bench.setup() as func:
+            # Warm-up call so one-time lazy initialisation is not measured
+            if not self.quick:
+                func()
+
+            samples = []
+            gc_was_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    for _ in range(loops):
+                        func()
+                    samples.append((time.perf_counter() - start) / loops)
+            finally:
+                if gc_was_enabled:
+                    gc.enable()
+
+        return BenchmarkResult(
+            name=bench.name,
+            loops=loops,
+            repeat=repeat,
+            best=min(samples),
+            median=statistics.median(samples),
+            mean=statistics.fmean(samples)
+        )
+
+
+@contextmanager
+def no_setup(func: Callable[[], object]):
+    """Setup helper for benchmarks that need no preparation"""
+    yield func
+
+
+def save_baseline(results: List[BenchmarkResult], path: Path) -> None:
+    """
+    Write results to a JSON baseline file
+
+    Existing entries for benchmarks that were not run are preserved,
+    so a partial run only refreshes the benchmarks it measured.
+    """
+    path = Path(path)
+    existing = load_baseline(path) if path.exists() else {}
+    existing.update({r.name: r for r in results})
+
+    data = {
+        'meta': {
+            'recorded': datetime.now().isoformat(),
+            'python': sys.version.split()[0],
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'platform': platform.platform()
+        },
+        'results': {name: result.to_dict() for name, result in sorted(existing.items())}
+    }
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+
+
+def load_baseline(path: Path) -> Dict[str, BenchmarkResult]:
+    """Load a JSON baseline file written by save_baseline()"""
+    with open(path, 'r') as f:
+        data = json.load(f)
+
+    return {
+        name: BenchmarkResult.from_dict(entry)
+        for name, entry in data.get('results', {}).items()
+    }
+
+
+def compare_results(current: List[BenchmarkResult],
+                    baseline: Dict[str, BenchmarkResult],
+                    threshold: float = DEFAULT_THRESHOLD) -> List[Comparison]:
+    """
+    Compare current results to a baseline using median time per call
+
+    Args:
+        current: Results from this run
+        baseline: Results loaded from a baseline file
+        threshold: Allowed slowdown fraction (0.25 = 25% slower is tolerated)
+
+    Returns:
+        List of Comparison, one per current result
+    """
+    comparisons = []
+
+    for result in current:
+        base = baseline.get(result.name)
+        if base is None or base.median <= 0:
+            comparisons.append(Comparison(result.name, result.median, None, 'new'))
+            continue
+
+        if result.median > base.median * (1 + threshold):
+            status = 'regression'
+        elif result.median < base.median / (1 + threshold):
+            status = 'improved'
+        else:
+            status = 'ok'
+
+        comparisons.append(Comparison(result.name, result.median, base.median, status))
+
+    return comparisons
+
+
+def format_time(seconds: float) -> str:
+    """Format a per-call time with a sensible unit"""
+    if seconds >= 1:
+        return f"{seconds:.3f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.3f} ms"
+    return f"{seconds * 1e6:.1f} µs"
@@ -0,0 +1,559 @@
+"""
+Hot-path benchmark definitions
+
+Each benchmark is registered with @benchmark and provides a setup context
+manager yielding the callable to time. Everything is seeded so successive
+runs measure the same work.
+
+Groups:
+    data      - JSON data loading
+    startup   - interpreter start to first prompt
+    generator - dungeon generation
+    engine    - combat, parser, command execution
+    web       - web UI serialisation (requires Flask)
+    world     - auto-map rendering
+    storage   - roster/session listing at scale
+"""
+
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import List
+from unittest.mock import patch
+
+from .harness import Benchmark
+
+# Make the repository root importable when run from elsewhere
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from aerthos.engine.game_state import GameState, GameData
+from aerthos.engine.parser import CommandParser
+from aerthos.engine.combat import CombatResolver
+from aerthos.entities.party import Party
+from aerthos.engine.time_tracker import TimeTracker
+from aerthos.entities.player import Inventory, Item, LightSource, Weapon
+from aerthos.generator.appendix_a_generator import AppendixAGenerator
+from aerthos.generator.config import DungeonConfig
+from aerthos.generator.dungeon_generator import DungeonGenerator
+from aerthos.generator.generation_cache import DungeonCache
+from aerthos.generator.multilevel_generator import MultiLevelGenerator
+from aerthos.storage.character_roster import CharacterRoster
+from aerthos.systems.saving_throws import SavingThrowResolver
+from aerthos.storage.session_manager import SessionManager
+from aerthos.systems.data_cache import ENV_CACHE_DIR, ENV_DATA_CACHE, clear_memory_cache
+from aerthos.ui.character_creation import CharacterCreator
+from aerthos.world.automap import AutoMap
+from aerthos.world.dungeon import Dungeon
+from aerthos.world.multilevel_dungeon import MultiLevelDungeon
+from aerthos.world.village import Shop, ShopItem
+
+
+DATA_DIR = str(REPO_ROOT / 'aerthos' / 'data')
+SEED = 1977
+
+BENCHMARKS: List[Benchmark] = []
+
+
+def benchmark(name: str, loops: int = 10, repeat: int = 5, group: str = 'core',
+              requires: str = None):
+    """Register a setup context manager as a benchmark"""
+
+    def decorator(setup_func):
+        BENCHMARKS.append(Benchmark(
+            name=name,
+            setup=contextmanager(setup_func),
+            loops=loops,
+            repeat=repeat,
+            group=group,
+            requires=requires,
+            description=(setup_func.__doc__ or '').strip()
+        ))
+        return setup_func
+
+    return decorator
+
+
+# ============================================================================
+# Shared fixtures
+# ============================================================================
+
+_game_data = None
+
+
+def _shared_game_data() -> GameData:
+    """GameData loaded once and reused by every benchmark"""
+    global _game_data
+    if _game_data is None:
+        _game_data = GameData.load_all(DATA_DIR)
+    return _game_data
+
+
+def _build_party(game_data: GameData) -> Party:
+    """Standard four-member party"""
+    random.seed(SEED)
+    creator = CharacterCreator(game_data)
+    return Party(members=[
+        creator.quick_create("Thorin", "Dwarf", "Fighter"),
+        creator.quick_create("Elara", "Elf", "Magic-User"),
+        creator.quick_create("Cedric", "Human", "Cleric"),
+        creator.quick_create("Shadow", "Halfling", "Thief")
+    ])
+
+
+def _peaceful_config(num_rooms: int) -> DungeonConfig:
+    """Seeded config without encounters, so commands never enter combat"""
+    return DungeonConfig(
+        seed=SEED,
+        num_rooms=num_rooms,
+        layout_type='network',
+        loops=num_rooms // 10,
+        combat_frequency=0.0,
+        trap_frequency=0.0,
+        include_boss=False
+    )
+
+
+def _build_game_state(num_rooms: int = 12, explored: bool = False) -> GameState:
+    """GameState with a party in a seeded, encounter-free dungeon"""
+    game_data = _shared_game_data()
+    generator = DungeonGenerator(game_data)
+    dungeon = Dungeon.load_from_generator(generator.generate(_peaceful_config(num_rooms)))
+
+    party = _build_party(game_data)
+    game_state = GameState(party.members[0], dungeon)
+    game_state.party = party
+    game_state.game_data = game_data
+
+    if explored:
+        for room in dungeon.rooms.values():
+            room.is_explored = True
+
+    return game_state
+
+
+# ============================================================================
+# Data loading
+# ============================================================================
+
+def _fresh_load_all():
+    """GameData.load_all as a newly started process sees it"""
+    clear_memory_cache()
+    return GameData.load_all(DATA_DIR)
+
+
+@benchmark('data.GameData.load_all', loops=5, group='data')
+def bench_load_all():
+    """Load classes, races, monsters and spells from the pre-parsed data cache"""
+    with _temp_storage() as root:
+        with patch.dict(os.environ, {ENV_CACHE_DIR: str(root / 'cache')}):
+            _fresh_load_all()  # Prime the cache
+            yield _fresh_load_all
+    clear_memory_cache()
+
+
+@benchmark('data.GameData.load_all[json parse]', loops=5, group='data')
+def bench_load_all_uncached():
+    """Parse classes, races, monsters and spells JSON (data cache disabled)"""
+    with patch.dict(os.environ, {ENV_DATA_CACHE: '0'}):
+        yield _fresh_load_all
+    clear_memory_cache()
+
+
+@benchmark('startup.import main + load_all[subprocess]', loops=1, repeat=3, group='startup')
+def bench_cold_start():
+    """New interpreter: import the terminal UI and load game data (time to first prompt)"""
+    command = [sys.executable, '-c',
+               'import main; from aerthos.engine.game_state import GameData; GameData.load_all()']
+    yield lambda: subprocess.run(command, cwd=REPO_ROOT, check=True, stdout=subprocess.DEVNULL)
+
+
+# ============================================================================
+# Generation
+# ============================================================================
+
+def _dungeon_generate(num_rooms: int, lazy_descriptions: bool = False):
+    generator = DungeonGenerator(_shared_game_data(), lazy_descriptions=lazy_descriptions)
+    config = DungeonConfig(seed=SEED, num_rooms=num_rooms, layout_type='branching')
+    return lambda: generator.generate(config)
+
+
+@benchmark('generator.DungeonGenerator.generate[10]', loops=20, group='generator')
+def bench_generate_10():
+    """Generate a 10-room seeded dungeon"""
+    yield _dungeon_generate(10)
+
+
+@benchmark('generator.DungeonGenerator.generate[100]', loops=5, group='generator')
+def bench_generate_100():
+    """Generate a 100-room seeded dungeon"""
+    yield _dungeon_generate(100)
+
+
+@benchmark('generator.DungeonGenerator.generate[1000]', loops=1, repeat=3, group='generator')
+def bench_generate_1000():
+    """Generate a 1000-room seeded dungeon"""
+    yield _dungeon_generate(1000)
+
+
+@benchmark('generator.DungeonGenerator.generate[1000, lazy descriptions]', loops=1, repeat=3,
+           group='generator')
+def bench_generate_1000_lazy():
+    """Generate a 1000-room seeded dungeon with descriptions deferred to first visit"""
+    yield _dungeon_generate(1000, lazy_descriptions=True)
+
+
+@benchmark('generator.DungeonGenerator.generate[1000, cache hit]', loops=3, repeat=3,
+           group='generator')
+def bench_generate_1000_cached():
+    """Serve a 1000-room seeded dungeon from the on-disk generation cache"""
+    with _temp_storage() as root:
+        generator = DungeonGenerator(_shared_game_data(), lazy_descriptions=True,
+                                     cache=DungeonCache(root / 'dungeon_cache'))
+        config = DungeonConfig(seed=SEED, num_rooms=1000, layout_type='branching')
+        generator.generate(config)  # Prime the cache
+        yield lambda: generator.generate(config)
+
+
+@benchmark('generator.AppendixAGenerator.generate_dungeon[1000]', loops=1, repeat=3, group='generator')
+def bench_appendix_a_1000():
+    """Lay out a 1000-room Appendix A level on the occupancy grid"""
+    generator = AppendixAGenerator()
+
+    def run():
+        random.seed(SEED)
+        return generator.generate_dungeon(target_rooms=1000)
+
+    yield run
+
+
+@benchmark('generator.MultiLevelGenerator.generate[3x10]', loops=3, group='generator')
+def bench_multilevel_generate():
+    """Generate a 3-level dungeon with 10 rooms per level"""
+    generator = MultiLevelGenerator()
+
+    def run():
+        random.seed(SEED)
+        return generator.generate(num_levels=3, rooms_per_level=10)
+
+    yield run
+
+
+@benchmark('generator.MultiLevelGenerator.generate[10x100]', loops=1, repeat=3, group='generator')
+def bench_multilevel_generate_large():
+    """Generate a 10-level, 100-rooms-per-level campaign dungeon inline"""
+    generator = MultiLevelGenerator()
+    yield lambda: generator.generate(num_levels=10, rooms_per_level=100, seed=SEED)
+
+
+@benchmark('generator.MultiLevelGenerator.generate[10x100, process pool]', loops=1, repeat=3,
+           group='generator')
+def bench_multilevel_generate_pooled():
+    """Same dungeon with levels fanned out over one worker process per CPU"""
+    generator = MultiLevelGenerator()
+    yield lambda: generator.generate(num_levels=10, rooms_per_level=100, seed=SEED, workers=None)
+
+
+# ============================================================================
+# Engine
+# ============================================================================
+
+@benchmark('engine.CombatResolver.resolve_combat_round[4v6]', loops=200, group='engine')
+def bench_combat_round():
+    """One combat round: four PCs against six orcs, HP restored between calls"""
+    game_state = _build_game_state()
+    party = game_state.party
+    monsters = [game_state._create_monster_from_id('orc') for _ in range(6)]
+    combatants = party.members + monsters
+    resolver = CombatResolver()
+    random.seed(SEED)
+
+    def run():
+        for c in combatants:
+            c.hp_current = c.hp_max
+            c.is_alive = True
+        return resolver.resolve_combat_round(party.members, monsters, party)
+
+    yield run
+
+
+@benchmark('engine.CombatResolver.mass_combat_round[300v300]', loops=10, group='engine')
+def bench_mass_combat_round():
+    """One mass-combat round: 300 orcs against 300 goblins, HP restored between calls"""
+    game_state = _build_game_state()
+    orcs = [game_state._create_monster_from_id('orc') for _ in range(300)]
+    goblins = [game_state._create_monster_from_id('goblin') for _ in range(300)]
+    resolver = CombatResolver()
+    random.seed(SEED)
+
+    def run():
+        for c in orcs + goblins:
+            c.hp_current = c.hp_max
+            c.is_alive = True
+        return resolver.resolve_combat_round(orcs, goblins)
+
+    yield run
+
+
+PARSER_INPUTS = [
+    'north', 'go east', 'attack the orc with sword', 'cast sleep on kobolds',
+    'carefully search for traps', 'take torch', 'drink potion of healing',
+    'equip longsword', 'inventory', 'look', 'memorize magic missile', 'rest'
+]
+
+
+@benchmark('engine.SavingThrowResolver.make_group_save[100]', loops=50, group='engine')
+def bench_group_save():
+    """Breath weapon saves for 100 orcs, standing modifiers cached per encounter"""
+    game_state = _build_game_state()
+    orcs = [game_state._create_monster_from_id('orc') for _ in range(100)]
+    resolver = SavingThrowResolver()
+    cache = {}
+    random.seed(SEED)
+
+    yield lambda: resolver.make_group_save(orcs, 'breath', modifier_cache=cache)
+
+
+@benchmark('engine.Inventory.lookups[1000 items]', loops=200, group='engine')
+def bench_inventory_lookups():
+    """Weight check plus exact and partial lookups on a 1000-item haul"""
+    inventory = Inventory(max_weight=10000)
+    for i in range(1000):
+        inventory.add_item(Item(name=f"Gem #{i % 250}", item_type='treasure', weight=0.1))
+        inventory.add_item(Weapon(name=f"Dagger {i}", weight=1.0))
+
+    def run():
+        inventory.current_weight
+        inventory.is_encumbered
+        inventory.get_item('gem #249')
+        inventory.get_item('dagger 999')
+        inventory.get_item('999')
+
+    yield run
+
+
+@benchmark('engine.CommandParser.parse', loops=200, group='engine')
+def bench_parser():
+    """Parse a mix of twelve typical commands"""
+    parser = CommandParser()
+
+    def run():
+        for text in PARSER_INPUTS:
+            parser.parse(text)
+
+    yield run
+
+
+def _execute_command(game_state: GameState, text: str, undo_text: str = None):
+    """Timed callable executing one command (optionally undoing a move)"""
+    parser = CommandParser()
+    command = parser.parse(text)
+    undo = parser.parse(undo_text) if undo_text else None
+    start_room = game_state.current_room
+
+    def run():
+        result = game_state.execute_command(command)
+        if undo:
+            game_state.execute_command(undo)
+            game_state.current_room = start_room
+        return result
+
+    return run
+
+
+COMMAND_ACTIONS = ['look', 'inventory', 'status', 'map', 'search', 'spells']
+
+
+def _register_command_benchmark(action: str):
+    def setup():
+        yield _execute_command(_build_game_state(), action)
+
+    setup.__doc__ = f"Execute '{action}' in the start room"
+    benchmark(f'engine.GameState.execute_command[{action}]', loops=50, group='engine')(setup)
+
+
+for _action in COMMAND_ACTIONS:
+    _register_command_benchmark(_action)
+
+
+@benchmark('engine.GameState.execute_command[move]', loops=50, group='engine')
+def bench_execute_move():
+    """Step out of the start room and back (two moves per call)"""
+    game_state = _build_game_state()
+    direction = next(iter(game_state.current_room.exits))
+    opposites = {'north': 'south', 'south': 'north', 'east': 'west', 'west': 'east'}
+    yield _execute_command(game_state, direction, opposites[direction])
+
+
+@benchmark('engine.GameState._check_encounters[1000 rooms]', loops=5, group='engine')
+def bench_check_encounters():
+    """on_enter and on_search checks in every room of a cleared 1000-room dungeon"""
+    game_state = _build_game_state()
+    config = DungeonConfig(seed=SEED, num_rooms=1000, layout_type='branching')
+    dungeon = Dungeon.load_from_generator(DungeonGenerator(_shared_game_data()).generate(config))
+    for room in dungeon.rooms.values():
+        for encounter in dungeon.encounter_index.for_room(room.id):
+            room.mark_encounter_completed(encounter.encounter_id)
+    game_state.dungeon = dungeon
+    rooms = list(dungeon.rooms.values())
+
+    def run():
+        for room in rooms:
+            game_state.current_room = room
+            game_state._check_encounters('on_enter')
+            game_state._check_encounters('on_search')
+
+    yield run
+
+
+@benchmark('engine.TimeTracker.advance[30 days]', loops=20, group='engine')
+def bench_time_advance():
+    """Pass 30 days burning through 30 day-long lanterns, with hunger warnings"""
+    player = _build_game_state().player
+    days = 30
+
+    def run():
+        player.equipment.light_source = None
+        player.inventory.items = [LightSource(name="Lantern", burn_time_turns=144) for _ in range(days)]
+        player.equip_light(player.inventory.items[0])
+        return TimeTracker().advance(days * 144, player)
+
+    yield run
+
+
+# ============================================================================
+# Web UI serialisation (Flask required to import web_ui.app)
+# ============================================================================
+
+@benchmark('web.get_game_state_json[100 rooms]', loops=20, group='web', requires='flask')
+def bench_game_state_json():
+    """Full /api/command state payload for a party in an explored 100-room dungeon"""
+    from web_ui.app import get_game_state_json
+    game_state = _build_game_state(num_rooms=100, explored=True)
+    yield lambda: get_game_state_json(game_state)
+
+
+@benchmark('web.build_map_data[100 rooms]', loops=20, group='web', requires='flask')
+def bench_build_map_data():
+    """Map payload for an explored 100-room dungeon"""
+    from web_ui.app import build_map_data
+    game_state = _build_game_state(num_rooms=100, explored=True)
+    yield lambda: build_map_data(game_state)
+
+
+# ============================================================================
+# World
+# ============================================================================
+
+@benchmark('world.MultiLevelDungeon.load+save[10x50 rooms]', loops=10, group='world')
+def bench_multilevel_load_save():
+    """Restore a 10-level save, enter the current level and save again"""
+    random.seed(SEED)
+    saved = MultiLevelGenerator().generate(num_levels=10, rooms_per_level=50).serialize()
+
+    def run():
+        ml_dungeon = MultiLevelDungeon.deserialize(saved)
+        ml_dungeon.get_current_dungeon()
+        return ml_dungeon.serialize()
+
+    yield run
+
+
+@benchmark('world.Shop.trade[party restock, 500-item catalog]', loops=50, group='world')
+def bench_shop_trade():
+    """Price, validate and buy a 4-character restock basket, selling loot back"""
+    shop = Shop(name="Emporium", description="Everything",
+                inventory=[ShopItem(f"item_{i}", f"Item {i}", 1 + i % 50, -1, f"category_{i % 10}")
+                           for i in range(500)])
+    basket = [f"item_{i}" for i in range(480, 500)] * 4
+    loot = [(f"loot_{i}", f"Loot {i}", 100) for i in range(20)]
+
+    yield lambda: shop.trade(buy=basket, sell=loot, gold=10000)
+
+
+@benchmark('world.AutoMap.generate_map[100 rooms, cold]', loops=10, group='world')
+def bench_automap_cold():
+    """First map render (position layout + ASCII) for an explored 100-room dungeon"""
+    game_state = _build_game_state(num_rooms=100, explored=True)
+    room_id = game_state.current_room.id
+    yield lambda: AutoMap().generate_map(room_id, game_state.dungeon)
+
+
+@benchmark('world.AutoMap.generate_map[100 rooms, cached]', loops=50, group='world')
+def bench_automap_cached():
+    """Repeat map render with cached positions"""
+    game_state = _build_game_state(num_rooms=100, explored=True)
+    room_id = game_state.current_room.id
+    automap = AutoMap()
+    yield lambda: automap.generate_map(room_id, game_state.dungeon)
+
+
+# ============================================================================
+# Storage
+# ============================================================================
+
+NUM_CHARACTERS = 200
+NUM_SESSIONS = 50
+
+
+@contextmanager
+def _temp_storage():
+    """Temporary .aerthos-style storage tree"""
+    root = Path(tempfile.mkdtemp(prefix='aerthos_bench_'))
+    try:
+        yield root
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def _fill_roster(roster: CharacterRoster, count: int) -> List[str]:
+    game_data = _shared_game_data()
+    random.seed(SEED)
+    creator = CharacterCreator(game_data)
+    classes = ['Fighter', 'Cleric', 'Magic-User', 'Thief']
+    return [
+        roster.save_character(creator.quick_create(f"Hero {i:03d}", 'Human', classes[i % 4]))
+        for i in range(count)
+    ]
+
+
+@benchmark(f'storage.CharacterRoster.list_characters[{NUM_CHARACTERS}]', loops=3,
+           group='storage')
+def bench_list_characters():
+    """List a roster of 200 saved characters"""
+    with _temp_storage() as root:
+        roster = CharacterRoster(roster_dir=str(root / 'characters'))
+        _fill_roster(roster, NUM_CHARACTERS)
+        yield roster.list_characters
+
+
+@benchmark(f'storage.SessionManager.list_sessions[{NUM_SESSIONS}]', loops=1, repeat=3,
+           group='storage')
+def bench_list_sessions():
+    """List 50 sessions, each referencing a 4-member party and a scenario"""
+    with _temp_storage() as root:
+        session_mgr = SessionManager(
+            sessions_dir=str(root / 'sessions'),
+            character_roster_dir=str(root / 'characters'),
+            party_manager_dir=str(root / 'parties'),
+            scenario_library_dir=str(root / 'scenarios')
+        )
+        char_ids = _fill_roster(session_mgr.character_roster, 4 * NUM_SESSIONS)
+
+        generator = DungeonGenerator(_shared_game_data())
+        dungeon = Dungeon.load_from_generator(generator.generate(_peaceful_config(12)))
+
+        for i in range(NUM_SESSIONS):
+            members = char_ids[i * 4:(i + 1) * 4]
+            party_id = session_mgr.party_manager.save_party(
+                f"Party {i:03d}", members, ['front', 'front', 'back', 'back'])
+            scenario_id = session_mgr.scenario_library.save_scenario(dungeon, f"Scenario {i:03d}")
+            session_mgr.create_session(party_id=party_id, scenario_id=scenario_id)
+
+        yield session_mgr.list_sessions
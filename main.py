@@ -16,10 +16,13 @@ from aerthos.entities.player import PlayerCharacter
 from aerthos.entities.party import Party
 from aerthos.generator.dungeon_generator import DungeonGenerator
 from aerthos.generator.config import DungeonConfig, EASY_DUNGEON, STANDARD_DUNGEON, HARD_DUNGEON
+from aerthos.generator.dungeon_pool import DungeonPool
+from aerthos.generator.generation_cache import get_dungeon_cache
 from aerthos.storage.character_roster import CharacterRoster
 from aerthos.storage.party_manager import PartyManager
 from aerthos.storage.scenario_library import ScenarioLibrary
 from aerthos.storage.session_manager import SessionManager
+from aerthos.systems.data_cache import data_path
 
 
 def show_main_menu(display: Display) -> str:
@@ -89,8 +92,14 @@ def ask_player_level() -> int:
             print("Invalid input. Please enter a number.")
 
 
-def start_new_game(game_data: GameData) -> tuple:
-    """Start a new game with character creation"""
+def start_new_game(game_data: GameData, dungeon_pool: DungeonPool = None) -> tuple:
+    """
+    Start a new game with character creation
+
+    Args:
+        game_data: Loaded game data
+        dungeon_pool: Optional pool of pre-generated preset dungeons
+    """
 
     # Character creation
     creator = CharacterCreator(game_data)
@@ -109,37 +118,29 @@ def start_new_game(game_data: GameData) -> tuple:
     try:
         if dungeon_choice == '1':
             # Fixed starter dungeon
-            dungeon = Dungeon.load_from_file('aerthos/data/dungeons/starter_dungeon.json')
+            dungeon = Dungeon.load_from_file(data_path('dungeons', 'starter_dungeon.json'))
             print(f"✓ Loaded: {dungeon.name}")
 
         elif dungeon_choice in ['2', '3', '4']:
             # Preset dungeons (Easy/Standard/Hard) - Ask for level first
             player_level = ask_player_level()
 
-            # Generate dungeon with appropriate difficulty
-            generator = DungeonGenerator(game_data)
-
             if dungeon_choice == '2':
-                config = EASY_DUNGEON
+                profile = 'easy'
                 print(f"✓ Generating Easy Dungeon (Level {player_level})...")
             elif dungeon_choice == '3':
-                config = STANDARD_DUNGEON
+                profile = 'standard'
                 print(f"✓ Generating Standard Dungeon (Level {player_level})...")
             else:  # '4'
-                config = HARD_DUNGEON
+                profile = 'hard'
                 print(f"✓ Generating Hard Dungeon (Level {player_level})...")
 
-            # Update config with player level
-            config.party_level = player_level
-
-            # Generate single-level dungeon
-            dungeon_data = generator.generate(config)
-            dungeon = Dungeon.load_from_generator(dungeon_data)
+            # Take a pre-generated dungeon if one is ready (generates inline otherwise)
+            if dungeon_pool is None:
+                dungeon_pool = DungeonPool(target_size=0)
+            dungeon = dungeon_pool.acquire(profile, party_level=player_level)
             print(f"✓ Generated: {dungeon.name}")
 
-            if config.seed:
-                print(f"  Seed: {config.seed} (use this seed to replay this exact dungeon)")
-
         else:  # '5' - Custom (includes multi-level and party-aware)
             # Custom configuration with party-aware interview
             config, num_levels, dungeon_name = create_custom_config()
@@ -149,19 +150,20 @@ def start_new_game(game_data: GameData) -> tuple:
                 from aerthos.generator.multilevel_generator import MultiLevelGenerator
 
                 print(f"✓ Generating Multi-Level Dungeon ({num_levels} levels)...")
-                ml_generator = MultiLevelGenerator()
+                ml_generator = MultiLevelGenerator(cache=get_dungeon_cache())
 
                 # Generate multi-level dungeon
                 dungeon = ml_generator.generate(
                     num_levels=num_levels,
                     rooms_per_level=config.num_rooms,
-                    dungeon_name=dungeon_name
+                    dungeon_name=dungeon_name,
+                    seed=config.seed
                 )
                 print(f"✓ Generated: {dungeon.name} ({dungeon.num_levels} levels)")
             else:
                 # Single-level custom dungeon
                 print(f"✓ Generating Custom Dungeon...")
-                generator = DungeonGenerator(game_data)
+                generator = DungeonGenerator(game_data, lazy_descriptions=True, cache=get_dungeon_cache())
                 dungeon_data = generator.generate(config)
                 dungeon = Dungeon.load_from_generator(dungeon_data)
                 print(f"✓ Generated: {dungeon.name}")
@@ -247,10 +249,12 @@ def create_custom_config() -> tuple:
     config = DungeonConfig.from_interview(interview_results)
 
     # Apply custom settings that weren't in interview
-    config.seed = seed
-    config.num_rooms = num_rooms
-    config.layout_type = layout_type
-    config.dungeon_theme = theme
+    config = config.derive(
+        seed=seed,
+        num_rooms=num_rooms,
+        layout_type=layout_type,
+        dungeon_theme=theme
+    )
 
     # Generate dungeon name based on theme and levels
     if num_levels > 1:
@@ -460,7 +464,7 @@ def restore_game_from_save(save_data: dict, game_data: GameData) -> tuple:
                 print("Use 'spells' to see your spells, 'memorize <spell>' to prepare them.\n")
 
         # Load dungeon
-        dungeon = Dungeon.load_from_file('aerthos/data/dungeons/starter_dungeon.json')
+        dungeon = Dungeon.load_from_file(data_path('dungeons', 'starter_dungeon.json'))
 
         # Restore dungeon state
         dungeon_state = save_data['dungeon_state']
@@ -471,7 +475,7 @@ def restore_game_from_save(save_data: dict, game_data: GameData) -> tuple:
                 room = dungeon.rooms[room_id]
                 room.is_explored = state.get('is_explored', False)
                 room.items = state.get('items', [])
-                room.encounters_completed = state.get('encounters_completed', [])
+                room.restore_encounters_completed(state.get('encounters_completed'))
 
         return player, dungeon
 
@@ -822,7 +826,7 @@ def manage_scenarios(game_data: GameData):
             # Generate and save new scenario
             dungeon_choice = choose_dungeon_type()
 
-            generator = DungeonGenerator(game_data)
+            generator = DungeonGenerator(game_data, cache=get_dungeon_cache())
             config = None
             dungeon = None
             difficulty = 'medium'
@@ -848,8 +852,8 @@ def manage_scenarios(game_data: GameData):
                     difficulty = 'hard'
                     print(f"\nGenerating Hard Dungeon (Level {player_level})...")
 
-                # Update config with player level
-                config.party_level = player_level
+                # Adjust a copy of the preset for the player level
+                config = config.derive(party_level=player_level)
 
                 # Generate single-level dungeon
                 dungeon_data = generator.generate(config)
@@ -868,13 +872,14 @@ def manage_scenarios(game_data: GameData):
                     from aerthos.generator.multilevel_generator import MultiLevelGenerator
 
                     print(f"\nGenerating Multi-Level Dungeon ({num_levels} levels)...")
-                    ml_generator = MultiLevelGenerator()
+                    ml_generator = MultiLevelGenerator(cache=get_dungeon_cache())
 
                     # Generate multi-level dungeon
                     dungeon = ml_generator.generate(
                         num_levels=num_levels,
                         rooms_per_level=config.num_rooms,
-                        dungeon_name=dungeon_name
+                        dungeon_name=dungeon_name,
+                        seed=config.seed
                     )
                     print(f"✓ Generated: {dungeon.name} ({dungeon.num_levels} levels)")
                     difficulty = 'multilevel_custom'
@@ -1345,8 +1350,12 @@ def main():
         choice = show_main_menu(display)
 
         if choice == '1':
-            # New Game
-            player, dungeon = start_new_game(game_data)
+            # New Game - pre-generate preset dungeons while the character is created
+            dungeon_pool = DungeonPool(target_size=1, max_workers=2).start()
+            try:
+                player, dungeon = start_new_game(game_data, dungeon_pool)
+            finally:
+                dungeon_pool.shutdown(wait=False)
             if player and dungeon:
                 run_game(player, dungeon, game_data)
             break
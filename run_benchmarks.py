@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Aerthos Benchmark Runner
+
+Times the hot paths (data loading, generation, combat, parsing, command
+execution, web serialisation, auto-map, storage) and compares them to a
+recorded JSON baseline. Run this before and after any optimization work.
+
+Usage:
+    python run_benchmarks.py                      # Run all, compare to baseline if present
+    python run_benchmarks.py --save               # Run all and record as the new baseline
+    python run_benchmarks.py --group generator    # Run one group (repeatable)
+    python run_benchmarks.py -k combat -k parse   # Run benchmarks whose name matches
+    python run_benchmarks.py --threshold 0.10     # Flag anything >10% slower
+    python run_benchmarks.py --quick              # Run each benchmark once (smoke test)
+    python run_benchmarks.py --list               # List available benchmarks
+
+Exit code is 1 when any benchmark regressed beyond the threshold.
+"""
+
+import sys
+import os
+import argparse
+from pathlib import Path
+
+from benchmarks.harness import (
+    BenchmarkRunner, DEFAULT_THRESHOLD, compare_results, format_time,
+    load_baseline, save_baseline
+)
+from benchmarks.hot_paths import BENCHMARKS
+
+
+DEFAULT_BASELINE = Path(__file__).parent / 'benchmarks' / 'baseline.json'
+
+STATUS_COLORS = {
+    'ok': '\033[92m',
+    'improved': '\033[96m',
+    'regression': '\033[91m',
+    'new': '\033[93m'
+}
+
+
+def print_result(result):
+    """Print one benchmark result as it completes"""
+    print(f"  {result.name:<58} {format_time(result.median):>12}  "
+          f"(best {format_time(result.best)}, {result.repeat}x{result.loops})")
+
+
+def print_comparison(comparisons, threshold):
+    """Print baseline comparison table, return number of regressions"""
+    print(f"\n{'='*70}")
+    print(f"BASELINE COMPARISON (threshold: +{threshold:.0%})")
+    print(f"{'='*70}\n")
+
+    regressions = 0
+    for comp in comparisons:
+        color = STATUS_COLORS.get(comp.status, '')
+        if comp.ratio is None:
+            change = "no baseline"
+        else:
+            change = f"{comp.ratio:.2f}x"
+        print(f"{color}{comp.status.upper():<11}\033[0m {comp.name:<58} {change:>11}")
+        if comp.status == 'regression':
+            regressions += 1
+
+    print(f"\n{'='*70}")
+    if regressions:
+        print(f"\033[91m✗ {regressions} BENCHMARK(S) REGRESSED\033[0m")
+    else:
+        print("\033[92m✓ NO REGRESSIONS\033[0m")
+    print(f"{'='*70}\n")
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run Aerthos performance benchmarks')
+    parser.add_argument('-k', dest='names', action='append',
+                        help='Only run benchmarks whose name contains this text')
+    parser.add_argument('--group', dest='groups', action='append',
+                        help='Only run this group (data, startup, generator, engine, web, world, storage)')
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE,
+                        help=f'Baseline JSON file (default: {DEFAULT_BASELINE.name})')
+    parser.add_argument('--save', action='store_true',
+                        help='Record results as the new baseline')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Allowed slowdown before flagging a regression (default: 0.25)')
+    parser.add_argument('--quick', action='store_true',
+                        help='Run each benchmark once without timing value (smoke test)')
+    parser.add_argument('--list', action='store_true',
+                        help='List all available benchmarks')
+
+    args = parser.parse_args()
+
+    # Data paths such as "aerthos/data" are relative to the repository root
+    os.chdir(Path(__file__).parent)
+
+    runner = BenchmarkRunner(BENCHMARKS, quick=args.quick)
+
+    if args.list:
+        print("Available benchmarks:")
+        for bench in runner.select(args.names, args.groups):
+            extra = f" [requires {bench.requires}]" if bench.requires else ""
+            print(f"  - {bench.name}{extra}")
+            if bench.description:
+                print(f"      {bench.description}")
+        return 0
+
+    print(f"\n{'='*70}")
+    print("AERTHOS BENCHMARKS (median time per call)")
+    print(f"{'='*70}\n")
+
+    results = runner.run(args.names, args.groups, progress=print_result)
+
+    for skipped in runner.skipped:
+        print(f"  \033[93m⊘ SKIP\033[0m {skipped}")
+
+    if not results:
+        print("\nNo benchmarks matched!")
+        return 1
+
+    if args.quick:
+        print("\n✓ Quick run complete (timings not compared)")
+        return 0
+
+    if args.save:
+        save_baseline(results, args.baseline)
+        print(f"\n✓ Baseline saved to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"\nNo baseline at {args.baseline} - run with --save to record one.")
+        return 0
+
+    comparisons = compare_results(results, load_baseline(args.baseline), args.threshold)
+    regressions = print_comparison(comparisons, args.threshold)
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -182,7 +182,23 @@ def main():
             ('Magic Functionality Tests', 'test_magic_functionality.py'),
             ('Phase 3 Integration Tests', 'test_phase3_integration.py'),
             ('Village System Tests', 'test_village_system.py'),
-            ('Multi-Level Dungeon Tests', 'test_multilevel_dungeons.py')
+            ('Multi-Level Dungeon Tests', 'test_multilevel_dungeons.py'),
+            ('Monster Scaling Tests', 'test_monster_scaling.py'),
+            ('Environment Filter Tests', 'test_environment_filter.py'),
+            ('Experience System Tests', 'test_experience_system.py'),
+            ('Dungeon Pool Tests', 'test_dungeon_pool.py'),
+            ('Benchmark Harness Tests', 'test_benchmarks.py'),
+            ('Roll Table Tests', 'test_roll_tables.py'),
+            ('Appendix A Generator Tests', 'test_appendix_a_generator.py'),
+            ('Spell Effect Tests', 'test_spell_effects.py'),
+            ('Combat Event Tests', 'test_combat_events.py'),
+            ('Profiling Tests', 'test_profiling.py'),
+            ('Generation Cache Tests', 'test_generation_cache.py'),
+            ('Monster Database Tests', 'test_monster_database.py'),
+            ('Data Cache Tests', 'test_data_cache.py'),
+            ('Inventory Tests', 'test_inventory.py'),
+            ('Room Encounter Tests', 'test_room_encounters.py'),
+            ('Time Tracker Tests', 'test_time_tracker.py')
         ]
 
         for suite_name, pattern in unit_tests:
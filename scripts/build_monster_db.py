@@ -0,0 +1,31 @@
+"""
+Compile the monster database
+
+Builds aerthos/data/monsters.bundle from the canonical monsters.json and
+monster_environments.json. Run this after editing either file:
+
+    python scripts/build_monster_db.py
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from aerthos.systems.monster_database import (
+    MONSTER_BUNDLE, MONSTER_SOURCE, MonsterDatabase, compile_monster_bundle
+)
+
+
+def main():
+    """Compile and report"""
+    print(f"Compiling {MONSTER_SOURCE.name}...")
+    path = compile_monster_bundle()
+    database = MonsterDatabase.load(path)
+
+    print(f"  ✓ {len(database)} monsters")
+    print(f"  ✓ Wrote {path} ({path.stat().st_size // 1024} KB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -205,6 +205,7 @@ def main():
     print("  1. Review monsters_merged.json")
     print("  2. Backup: cp monsters.json monsters_backup.json")
     print("  3. Replace: mv monsters_merged.json monsters.json")
+    print("  4. Rebuild the compiled database: python scripts/build_monster_db.py")
 
 
 if __name__ == "__main__":
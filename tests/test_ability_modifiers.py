@@ -10,8 +10,12 @@ Tests all six ability score tables and their modifiers:
 - Charisma (henchmen, loyalty, reactions)
 """
 
+import copy
+import json
+import pickle
 import unittest
 from aerthos.systems.ability_modifiers import AbilityModifierSystem
+from aerthos.systems.ability_scores import AbilityScoreSystem
 from aerthos.entities.character import Character
 
 
@@ -317,6 +321,76 @@ class TestAbilityModifierSystem(unittest.TestCase):
         can_learn = self.system.can_learn_spell_level(18, 9)
         self.assertTrue(can_learn)
 
+    def test_out_of_range_scores_clamp(self):
+        """Test scores outside the tables use the nearest table entry"""
+        self.assertEqual(self.system.get_strength_modifiers(1), self.system.get_strength_modifiers(3))
+        self.assertEqual(self.system.get_strength_modifiers(21), self.system.get_strength_modifiers(18))
+        self.assertEqual(self.system.get_dexterity_modifiers(30), self.system.get_dexterity_modifiers(25))
+        self.assertEqual(self.system.get_wisdom_modifiers(0), self.system.get_wisdom_modifiers(3))
+
+    def test_records_are_shared_and_read_only(self):
+        """Test lookups return the same immutable record without copying"""
+        mods = self.system.get_strength_modifiers(18, 63)
+
+        self.assertIs(mods, self.system.get_strength_modifiers(18, 70))
+        with self.assertRaises(TypeError):
+            mods['hit_prob'] = 99
+        with self.assertRaises(TypeError):
+            self.system.get_wisdom_modifiers(18)['spell_bonus']['1'] = 5
+
+    def test_character_copies_are_plain_dicts(self):
+        """Modifiers stored on a character can be copied, pickled and saved"""
+        char = Character(name="Test", race="Human", char_class="Cleric", wisdom=18)
+        self.system.apply_modifiers_to_character(char)
+        stored = char._ability_modifiers
+
+        self.assertIs(type(stored['wisdom']['spell_bonus']), dict)
+        self.assertEqual(copy.deepcopy(stored), stored)
+        self.assertEqual(pickle.loads(pickle.dumps(stored)), stored)
+        self.assertEqual(json.loads(json.dumps(stored)), stored)
+
+        stored['wisdom']['spell_bonus']['1'] = 99
+        self.assertNotEqual(self.system.get_wisdom_modifiers(18)['spell_bonus']['1'], 99)
+
+    def test_constitution_fighter_record(self):
+        """Test fighters get their own record with the fighter HP adjustment"""
+        normal = self.system.get_constitution_modifiers(18)
+        fighter = self.system.get_constitution_modifiers(18, is_fighter=True)
+
+        self.assertEqual(fighter['hp_adjustment'], normal['hp_adjustment_fighter'])
+        self.assertNotEqual(normal['hp_adjustment'], fighter['hp_adjustment'])
+
+
+class TestAbilityScoreSystem(unittest.TestCase):
+    """Test range-keyed modifier lookups (ability_modifiers.json)"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.system = AbilityScoreSystem()
+
+    def test_range_keys_resolve(self):
+        """Test scores inside range keys find the range"""
+        self.assertEqual(self.system._find_range('strength', 10), '9-12')
+        self.assertEqual(self.system._find_range('strength', 13), '13')
+        self.assertEqual(self.system._find_range('intelligence', 5), '3-7')
+        self.assertIsNone(self.system._find_range('intelligence', 2))
+        self.assertIsNone(self.system._find_range('charisma', 40))
+
+    def test_exceptional_strength_bands(self):
+        """Test every percentile maps to its 18/xx band"""
+        bands = {1: '18/01-50', 50: '18/01-50', 51: '18/51-75', 90: '18/76-90',
+                 99: '18/91-99', 100: '18/00'}
+        for percentile, key in bands.items():
+            self.assertEqual(self.system._find_range('strength', 18, percentile), key)
+            self.assertEqual(self.system.get_strength_mods(18, percentile),
+                             self.system.modifiers['strength'][key])
+
+    def test_defaults_outside_tables(self):
+        """Test scores missing from the tables get default modifiers"""
+        self.assertEqual(self.system.get_system_shock_chance(2), 65)
+        self.assertEqual(self.system.get_max_henchmen(30), 4)
+        self.assertEqual(self.system.get_bonus_spells(25), {})
+
 
 class TestCharacterAbilityIntegration(unittest.TestCase):
     """Test Character class integration with ability modifiers"""
@@ -0,0 +1,97 @@
+"""
+Test suite for the Appendix A dungeon generator
+
+Covers the spatial layout: room footprints, non-overlapping placement,
+passage bookkeeping and reaching the requested size.
+"""
+
+import random
+import unittest
+
+from aerthos.generator.appendix_a_generator import AppendixAGenerator, PASSAGE
+
+
+def claimed_cells(dungeon):
+    """Map every grid square to the room or passage occupying it, failing on overlap"""
+    cells = {}
+    for room_id, room in dungeon['rooms'].items():
+        x0, y0 = room['position']
+        width, height = room['footprint']
+        for x in range(x0, x0 + width):
+            for y in range(y0, y0 + height):
+                if (x, y) in cells:
+                    raise AssertionError(f"{room_id} overlaps {cells[(x, y)]} at {(x, y)}")
+                cells[(x, y)] = room_id
+
+    for passage in dungeon['passages']:
+        for cell in map(tuple, passage['cells']):
+            if cell in cells:
+                raise AssertionError(f"Passage {passage['from']}->{passage['to']} crosses {cells[cell]}")
+            cells[cell] = PASSAGE
+    return cells
+
+
+class TestAppendixALayout(unittest.TestCase):
+    """Test the occupancy grid layout"""
+
+    def setUp(self):
+        self.generator = AppendixAGenerator()
+
+    def generate(self, target_rooms, seed=7):
+        random.seed(seed)
+        return self.generator.generate_dungeon(target_rooms=target_rooms)
+
+    def test_reaches_target_size(self):
+        """Test small and large targets are met exactly"""
+        self.assertEqual(len(self.generate(12)['rooms']), 12)
+        self.assertEqual(len(self.generate(300)['rooms']), 300)
+
+    def test_rooms_and_passages_never_overlap(self):
+        """Test no grid square is claimed twice"""
+        for seed in range(5):
+            claimed_cells(self.generate(200, seed=seed))
+
+    def test_footprint_matches_size(self):
+        """Test footprints come from the size table in 10' squares"""
+        for room in self.generate(100)['rooms'].values():
+            if room['size'] != 'varies':
+                width, height = (int(part) // 10 for part in room['size'].split('x'))
+                self.assertEqual(room['footprint'], [width, height])
+
+    def test_exits_are_linked_both_ways(self):
+        """Test every room exit points at a room that links back"""
+        rooms = self.generate(150)['rooms']
+
+        for room_id, room in rooms.items():
+            for target in room['exits'].values():
+                if target.startswith('stairs_'):
+                    continue
+                self.assertIn(room_id, rooms[target]['exits'].values())
+
+    def test_passages_join_their_rooms(self):
+        """Test each passage starts beside its origin room and ends beside the new room"""
+        dungeon = self.generate(50)
+
+        def touches(room, cell):
+            x0, y0 = room['position']
+            width, height = room['footprint']
+            return (x0 - 1 <= cell[0] <= x0 + width) and (y0 - 1 <= cell[1] <= y0 + height)
+
+        for passage in dungeon['passages']:
+            self.assertTrue(touches(dungeon['rooms'][passage['from']], passage['cells'][0]))
+            self.assertTrue(touches(dungeon['rooms'][passage['to']], passage['cells'][-1]))
+
+    def test_seeded_generation_is_repeatable(self):
+        """Test the same seed lays out the same dungeon"""
+        self.assertEqual(self.generate(80, seed=3), self.generate(80, seed=3))
+
+    def test_large_level(self):
+        """Test a 1000-room level lays out without overlaps"""
+        dungeon = self.generate(1000)
+
+        self.assertEqual(len(dungeon['rooms']), 1000)
+        claimed_cells(dungeon)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+"""
+Test suite for the benchmark harness
+
+Covers baseline recording and regression detection. The timings themselves
+are not asserted - only that the harness measures, stores and compares them.
+"""
+
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+from benchmarks.harness import (
+    Benchmark, BenchmarkResult, BenchmarkRunner, compare_results,
+    load_baseline, save_baseline, no_setup
+)
+from benchmarks.hot_paths import BENCHMARKS
+
+
+def make_result(name, median):
+    return BenchmarkResult(name=name, loops=1, repeat=1, best=median, median=median, mean=median)
+
+
+class TestBenchmarkRunner(unittest.TestCase):
+    """Test running benchmarks"""
+
+    def test_run_records_per_call_time(self):
+        """Test runner calls the benchmark loops x repeat times (plus warm-up)"""
+        calls = []
+        bench = Benchmark(name='counter', setup=lambda: no_setup(lambda: calls.append(1)),
+                          loops=4, repeat=3)
+
+        results = BenchmarkRunner([bench]).run()
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(len(calls), 4 * 3 + 1)
+        self.assertGreaterEqual(results[0].median, results[0].best)
+
+    def test_quick_mode_runs_once(self):
+        """Test quick mode skips warm-up and runs a single call"""
+        calls = []
+        bench = Benchmark(name='counter', setup=lambda: no_setup(lambda: calls.append(1)),
+                          loops=10, repeat=5)
+
+        BenchmarkRunner([bench], quick=True).run()
+
+        self.assertEqual(len(calls), 1)
+
+    def test_missing_dependency_is_skipped(self):
+        """Test benchmarks needing an unavailable module are skipped, not failed"""
+        bench = Benchmark(name='needs_module', setup=lambda: no_setup(lambda: None),
+                          requires='aerthos_no_such_module')
+        runner = BenchmarkRunner([bench])
+
+        self.assertEqual(runner.run(), [])
+        self.assertEqual(len(runner.skipped), 1)
+
+    def test_select_by_name_and_group(self):
+        """Test filtering benchmarks by name substring and group"""
+        runner = BenchmarkRunner(BENCHMARKS)
+
+        generator_benches = runner.select(groups=['generator'])
+        self.assertTrue(generator_benches)
+        self.assertTrue(all(b.group == 'generator' for b in generator_benches))
+
+        parse_benches = runner.select(names=['CommandParser'])
+        self.assertEqual([b.name for b in parse_benches], ['engine.CommandParser.parse'])
+
+    def test_hot_path_benchmarks_run(self):
+        """Smoke test: cheap hot-path benchmarks run end to end"""
+        runner = BenchmarkRunner(BENCHMARKS, quick=True)
+        results = runner.run(names=['CommandParser', 'execute_command[look]',
+                                    'generate[10]', 'resolve_combat_round'])
+
+        self.assertEqual(len(results), 4)
+
+
+class TestBaselineComparison(unittest.TestCase):
+    """Test baseline persistence and regression detection"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.baseline_path = Path(self.test_dir) / 'baseline.json'
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_save_and_load_round_trip(self):
+        """Test baseline JSON round-trips results"""
+        save_baseline([make_result('a', 0.002), make_result('b', 0.5)], self.baseline_path)
+
+        loaded = load_baseline(self.baseline_path)
+
+        self.assertEqual(set(loaded), {'a', 'b'})
+        self.assertEqual(loaded['b'].median, 0.5)
+
+    def test_partial_save_preserves_other_entries(self):
+        """Test saving a subset keeps baselines for benchmarks not re-run"""
+        save_baseline([make_result('a', 0.002), make_result('b', 0.5)], self.baseline_path)
+        save_baseline([make_result('a', 0.001)], self.baseline_path)
+
+        loaded = load_baseline(self.baseline_path)
+
+        self.assertEqual(loaded['a'].median, 0.001)
+        self.assertEqual(loaded['b'].median, 0.5)
+
+    def test_compare_flags_regression_beyond_threshold(self):
+        """Test status classification against the threshold"""
+        baseline = {
+            'slower': make_result('slower', 1.0),
+            'same': make_result('same', 1.0),
+            'faster': make_result('faster', 1.0)
+        }
+        current = [
+            make_result('slower', 1.3),
+            make_result('same', 1.1),
+            make_result('faster', 0.5),
+            make_result('brand_new', 0.1)
+        ]
+
+        statuses = {c.name: c.status for c in compare_results(current, baseline, threshold=0.25)}
+
+        self.assertEqual(statuses, {
+            'slower': 'regression',
+            'same': 'ok',
+            'faster': 'improved',
+            'brand_new': 'new'
+        })
+
+
+if __name__ == '__main__':
+    unittest.main()
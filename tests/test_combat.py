@@ -7,7 +7,7 @@ Critical for both CLI and Web UI game mechanics.
 
 import unittest
 from unittest.mock import Mock, patch
-from aerthos.engine.combat import DiceRoller, CombatResolver
+from aerthos.engine.combat import DiceRoller, CombatResolver, CombatSide
 from aerthos.entities.character import Character
 from aerthos.entities.player import PlayerCharacter, Weapon
 
@@ -294,5 +294,79 @@ class TestCombatIntegration(unittest.TestCase):
         self.assertLess(rounds, max_rounds)
 
 
+def make_combatant(name, hp=8):
+    """Plain Character combatant"""
+    return Character(name=name, race="Orc", char_class="Monster", level=1,
+                     hp_max=hp, hp_current=hp, ac=6, thac0=19)
+
+
+class TestMassCombat(unittest.TestCase):
+    """Test incremental side tracking for large battles"""
+
+    def setUp(self):
+        self.resolver = CombatResolver()
+
+    def test_side_remove_tracks_standing(self):
+        """Removing the dead keeps targets and the standing counter in step"""
+        members = [make_combatant(f"Orc {i}") for i in range(5)]
+        side = CombatSide(members)
+
+        for member in (members[0], members[4], members[2]):
+            member.take_damage(100)
+            side.remove(member)
+        side.remove(members[2])  # Removing twice is harmless
+
+        self.assertEqual(sorted(m.name for m in side.targets), ["Orc 1", "Orc 3"])
+        self.assertEqual(side.standing, 2)
+        self.assertFalse(side.eliminated)
+
+    def test_incapacitated_standing_but_untargetable(self):
+        """Held party members cannot be attacked but keep the side in the fight"""
+        members = [make_combatant("Held"), make_combatant("Free")]
+        members[0].add_condition('paralyzed')
+
+        side = CombatSide(members, require_active=True)
+
+        self.assertEqual([m.name for m in side.targets], ["Free"])
+        self.assertEqual(side.standing, 2)
+
+    def test_round_reports_elimination(self):
+        """A round ends as soon as one side is wiped out"""
+        party = [make_combatant("Hero", hp=500)]
+        monsters = [make_combatant("Rat", hp=1)]
+
+        with patch.object(self.resolver.dice_roller, 'roll_d20', return_value=20):
+            result = self.resolver.resolve_combat_round(party, monsters)
+
+        self.assertTrue(result['party_won'])
+        self.assertFalse(monsters[0].is_alive)
+
+    def test_battle_with_hundreds(self):
+        """Large battles run to a decision with consistent living counts"""
+        party = [make_combatant(f"Guard {i}", hp=12) for i in range(150)]
+        monsters = [make_combatant(f"Orc {i}") for i in range(300)]
+
+        battle = self.resolver.resolve_battle(party, monsters, max_rounds=200)
+
+        self.assertTrue(battle['party_won'] or battle['monsters_won'])
+        winners = party if battle['party_won'] else monsters
+        losers = monsters if battle['party_won'] else party
+        self.assertTrue(any(c.is_alive for c in winners))
+        self.assertFalse(any(c.is_alive for c in losers))
+
+    def test_one_targeting_ai_per_resolver(self):
+        """Monster targeting reuses the resolver's AI"""
+        ai = self.resolver.targeting_ai
+        party = [make_combatant("Hero", hp=500)]
+        monsters = [make_combatant(f"Orc {i}", hp=500) for i in range(3)]
+        party_obj = Mock(formation=['front'], get_front_line=Mock(return_value=party),
+                         get_back_line=Mock(return_value=[]))
+
+        with patch.object(ai, 'select_target', wraps=ai.select_target) as select:
+            self.resolver.resolve_combat_round(party, monsters, party_obj=party_obj)
+
+        self.assertIs(self.resolver.targeting_ai, ai)
+        self.assertEqual(select.call_count, 3)
+
 if __name__ == '__main__':
     unittest.main()
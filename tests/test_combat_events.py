@@ -0,0 +1,196 @@
+"""
+Test suite for the combat event stream
+
+Tests structured attack/save/spell/trap events, lazy narrative rendering
+and stream bookkeeping.
+"""
+
+import copy
+import json
+import unittest
+from unittest.mock import patch
+
+from aerthos.engine.combat import CombatResolver
+from aerthos.engine.combat_events import (
+    ATTACK, SAVE, TRAP, HIT, CRITICAL, KILLED, SAVED,
+    CombatEvent, CombatEventStream, LazyResult, render_event
+)
+from aerthos.entities.character import Character
+from aerthos.systems.narrator import DMNarrator
+from aerthos.systems.saving_throws import SavingThrowResolver
+from aerthos.systems.traps import Trap, TrapSystem
+
+
+def make_character(name, hp=10):
+    character = Character(name=name, race="Human", char_class="Fighter", level=1,
+                          hp_max=hp, hp_current=hp, ac=6, thac0=19)
+    SavingThrowResolver().update_character_saves(character)
+    return character
+
+
+class TestAttackEvents(unittest.TestCase):
+    """Test attack_roll events and lazily rendered narratives"""
+
+    def setUp(self):
+        self.resolver = CombatResolver()
+        self.stream = CombatEventStream()
+        self.hero = make_character("Hero")
+        self.orc = make_character("Orc", hp=3)
+
+    def attack(self, roll):
+        with patch.object(self.resolver.dice_roller, 'roll_d20', return_value=roll):
+            return self.resolver.attack_roll(self.hero, self.orc, events=self.stream)
+
+    def test_attack_records_event(self):
+        """Each attack emits one structured event"""
+        result = self.attack(15)
+        event = list(self.stream)[0]
+
+        self.assertIs(result['event'], event)
+        self.assertEqual((event.kind, event.actor, event.target, event.roll),
+                         (ATTACK, "Hero", "Orc", 15))
+        self.assertTrue(event.has(HIT))
+        self.assertEqual(event.target_number, 19 - 6)
+
+    def test_narrative_rendered_on_read(self):
+        """The narrative is only built when accessed, and matches the classic text"""
+        self.orc.hp_current = 1
+        result = self.attack(20)
+
+        self.assertFalse(dict.__contains__(result, 'narrative'))
+        self.assertIn('narrative', result)
+        self.assertEqual(result['narrative'],
+                         f"Hero scores a CRITICAL HIT on Orc for {result['damage']} damage! Orc falls dead!")
+        self.assertTrue(result['event'].has(CRITICAL | KILLED))
+
+    def test_miss_and_fumble_text(self):
+        """Misses and fumbles render like before"""
+        self.assertEqual(self.attack(1)['narrative'], "Hero fumbles the attack!")
+        self.assertEqual(self.attack(2)['narrative'], "Hero misses Orc.")
+
+    def test_round_events_and_actions(self):
+        """Rounds expose their events and render actions on demand"""
+        party = [make_character("Hero", hp=100)]
+        monsters = [make_character("Rat", hp=1)]
+
+        # Hero acts first, so the forced natural 20 kills the Rat before it swings
+        with patch.object(self.resolver.dice_roller, 'roll_d20', return_value=20), \
+                patch.object(self.resolver, '_calculate_initiative',
+                             side_effect=lambda character: 1 if character.name == "Hero" else 6):
+            result = self.resolver.resolve_combat_round(party, monsters, events=self.stream)
+
+        self.assertEqual(len(self.stream), 1)
+        self.assertEqual(result['actions'], [render_event(list(self.stream)[0])])
+
+    def test_round_actions_stop_at_round_end(self):
+        """On a shared stream, a round's actions exclude later rounds"""
+        party = [make_character("Hero", hp=100)]
+        monsters = [make_character("Ogre", hp=100)]
+
+        with patch.object(self.resolver.dice_roller, 'roll_d20', return_value=2):
+            first = self.resolver.resolve_combat_round(party, monsters, events=self.stream)
+            emitted = self.stream.emitted
+            self.resolver.resolve_combat_round(party, monsters, events=self.stream)
+
+        self.assertGreater(self.stream.emitted, emitted)
+        self.assertEqual(len(first['actions']), emitted)
+
+
+class TestEventStream(unittest.TestCase):
+    """Test stream marks, bounds and serialisation"""
+
+    def test_bounded_stream_and_marks(self):
+        """Old events fall off; marks still select later events"""
+        stream = CombatEventStream(max_events=3)
+        for i in range(5):
+            stream.emit(CombatEvent(ATTACK, f"A{i}", "B"))
+        mark = stream.mark()
+        stream.emit(CombatEvent(ATTACK, "Last", "B"))
+
+        self.assertEqual([e.actor for e in stream], ["A3", "A4", "Last"])
+        self.assertEqual([e.actor for e in stream.events(since=mark)], ["Last"])
+        self.assertEqual(len(stream.events(since=1)), 3)
+
+    def test_to_dicts(self):
+        """Events serialise to plain JSON-friendly dicts"""
+        stream = CombatEventStream()
+        stream.emit(CombatEvent(ATTACK, "Hero", "Orc", roll=18, damage=6, flags=HIT | KILLED))
+
+        record = stream.to_dicts()[0]
+
+        self.assertEqual(record['flags'], ['hit', 'killed'])
+        self.assertEqual(record['damage'], 6)
+
+    def test_narrator_renderer(self):
+        """DMNarrator can render attack events with flavour text"""
+        stream = CombatEventStream()
+        stream.emit(CombatEvent(ATTACK, "Hero", "Orc", roll=18, damage=6, flags=HIT))
+
+        line = stream.render(DMNarrator().render_event)[0]
+
+        self.assertIn("Hero", line)
+        self.assertIn("6 damage", line)
+
+    def test_lazy_result(self):
+        """LazyResult computes missing keys once"""
+        calls = []
+        result = LazyResult({'text': lambda r: calls.append(1) or f"v={r['v']}"}, {'v': 2})
+
+        self.assertEqual(result.get('text'), "v=2")
+        self.assertEqual(result['text'], "v=2")
+        self.assertEqual(len(calls), 1)
+        self.assertIsNone(result.get('other'))
+
+    def test_lazy_result_behaves_like_dict(self):
+        """Lazy keys show up in iteration, copies and JSON like plain keys"""
+        expected = {'v': 2, 'text': "v=2"}
+
+        def make():
+            return LazyResult({'text': lambda r: f"v={r['v']}"}, {'v': 2})
+
+        self.assertEqual(list(make()), ['v', 'text'])
+        self.assertEqual(len(make()), 2)
+        self.assertEqual(set(make().keys()), set(expected))
+        self.assertEqual(dict(make().items()), expected)
+        self.assertEqual(sorted(make().values(), key=str), [2, "v=2"])
+        self.assertEqual(dict(make()), expected)
+        self.assertEqual(make().copy(), expected)
+        self.assertEqual(copy.copy(make()), expected)
+        self.assertEqual(make(), expected)
+        self.assertEqual(json.loads(json.dumps(make())), expected)
+        self.assertEqual(json.loads(json.dumps(make(), indent=2)), expected)
+
+
+class TestSaveAndTrapEvents(unittest.TestCase):
+    """Test saving throw and trap events"""
+
+    def setUp(self):
+        self.stream = CombatEventStream()
+        self.group = [make_character("Ann"), make_character("Bob")]
+
+    def test_group_save_events(self):
+        """Group saves emit one event per target with save narratives"""
+        resolver = SavingThrowResolver()
+        with patch('random.randint', side_effect=[3, 19]):
+            results = resolver.make_group_save(self.group, 'breath', events=self.stream)
+
+        events = list(self.stream)
+        self.assertEqual([e.kind for e in events], [SAVE, SAVE])
+        self.assertEqual([e.has(SAVED) for e in events], [True, False])
+        self.assertEqual(render_event(events[0]), results[0].narrative)
+
+    def test_trap_events(self):
+        """Party traps record saves and per-victim hits"""
+        trap = Trap(trap_type="pit", damage="1d6", save_type="none",
+                    description="A pit", trigger="floor")
+
+        with patch('random.randint', return_value=4):
+            TrapSystem().trigger_trap_on_party(trap, self.group, events=self.stream)
+
+        self.assertEqual([(e.kind, e.target, e.damage) for e in self.stream],
+                         [(TRAP, "Ann", 4), (TRAP, "Bob", 4)])
+        self.assertEqual(render_event(list(self.stream)[0]), "Ann triggers a pit trap and takes 4 damage!")
+
+
+if __name__ == '__main__':
+    unittest.main()
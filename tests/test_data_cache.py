@@ -0,0 +1,139 @@
+"""
+Test suite for the pre-parsed data cache and package-relative data loading
+
+Tests cache hits/misses, hash validation, fresh copies per load, the
+disable switch, loading from another working directory and lazily
+compiled spell plans.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from aerthos.engine.game_state import GameData
+from aerthos.systems import data_cache
+from aerthos.systems.data_cache import (
+    ENV_CACHE_DIR, ENV_DATA_CACHE, clear_memory_cache, data_path, load_json
+)
+from aerthos.systems.spell_effects import SpellEffectEngine
+from aerthos.world.guild import GuildManager
+from aerthos.world.inn import InnManager
+from aerthos.world.shop import ShopManager
+
+
+class TestDataCache(unittest.TestCase):
+    """Test load_json and the on-disk cache"""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.source = self.test_dir / 'tables.json'
+        self.source.write_text(json.dumps({'orc': {'hp': [1, 2, 3]}, 'name': 'Tables'}))
+
+        self.env = patch.dict(os.environ, {ENV_CACHE_DIR: str(self.test_dir / 'cache')})
+        self.env.start()
+        clear_memory_cache()
+
+    def tearDown(self):
+        self.env.stop()
+        clear_memory_cache()
+        shutil.rmtree(self.test_dir)
+
+    def cache_files(self):
+        return sorted(p.name for p in (self.test_dir / 'cache' / 'data').glob('*.marshal'))
+
+    def test_matches_json(self):
+        """Cached and uncached loads both equal json.load"""
+        expected = json.loads(self.source.read_text())
+
+        self.assertEqual(load_json(self.source), expected)
+        clear_memory_cache()
+        self.assertEqual(load_json(self.source), expected)
+        self.assertEqual(len(self.cache_files()), 1)
+
+    def test_fresh_copy_per_load(self):
+        """Callers may modify what they get without affecting later loads"""
+        first = load_json(self.source)
+        first['orc']['hp'].append(99)
+
+        self.assertEqual(load_json(self.source)['orc']['hp'], [1, 2, 3])
+
+    def test_hit_after_restart(self):
+        """A new process (empty memory cache) is served from disk"""
+        load_json(self.source)
+        misses = data_cache._stats['misses']
+        hits = data_cache._stats['hits']
+
+        clear_memory_cache()
+        load_json(self.source)
+
+        self.assertEqual(data_cache._stats['misses'], misses)
+        self.assertEqual(data_cache._stats['hits'], hits + 1)
+
+    def test_edited_source_invalidates(self):
+        """A changed file is re-parsed and its old cache entry removed"""
+        load_json(self.source)
+        old_entries = self.cache_files()
+
+        self.source.write_text(json.dumps({'name': 'Edited'}))
+        clear_memory_cache()
+
+        self.assertEqual(load_json(self.source), {'name': 'Edited'})
+        self.assertEqual(len(self.cache_files()), 1)
+        self.assertNotEqual(self.cache_files(), old_entries)
+
+    def test_disabled(self):
+        """AERTHOS_DATA_CACHE=0 parses directly and writes nothing"""
+        with patch.dict(os.environ, {ENV_DATA_CACHE: '0'}):
+            self.assertEqual(load_json(self.source)['name'], 'Tables')
+
+        self.assertEqual(self.cache_files(), [])
+
+
+class TestPackageRelativeData(unittest.TestCase):
+    """Test that data loads no matter where the game is started"""
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.test_dir = tempfile.mkdtemp()
+        os.chdir(self.test_dir)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.test_dir)
+
+    def test_loaders_outside_repo(self):
+        """GameData and the village managers find the package data"""
+        game_data = GameData.load_all()
+
+        self.assertIn('fighter', {name.lower() for name in game_data.classes})
+        self.assertIn('orc', game_data.monsters)
+        self.assertTrue(ShopManager().shops)
+        self.assertTrue(InnManager().inns)
+        self.assertTrue(GuildManager().guilds)
+
+    def test_data_path(self):
+        """data_path points into the installed package"""
+        self.assertTrue(data_path('spells.json').is_file())
+
+
+class TestLazySpellPlans(unittest.TestCase):
+    """Test that spell plans compile on first use"""
+
+    def test_plans_compiled_on_demand(self):
+        """Only the spells looked up are compiled"""
+        engine = SpellEffectEngine()
+
+        self.assertEqual(engine.plans._plans, {})
+        self.assertIn('sleep', engine.plans)
+        self.assertEqual(engine.plans['sleep'].name, 'Sleep')
+        self.assertIs(engine.plans['sleep'], engine.plans['sleep'])
+        self.assertEqual(list(engine.plans._plans), ['sleep'])
+        self.assertEqual(len(engine.plans), len(load_json(data_path('spells.json'))))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+"""
+Test suite for the pre-generated dungeon pool
+
+Tests background stocking, inline fallback on a miss, per-level stock and
+multi-level profiles.
+"""
+
+import time
+import unittest
+
+from aerthos.generator.config import DungeonConfig, STANDARD_DUNGEON
+from aerthos.generator.dungeon_pool import DungeonPool, generate_dungeon_data, build_dungeon
+from aerthos.world.dungeon import Dungeon
+from aerthos.world.multilevel_dungeon import MultiLevelDungeon
+
+
+def wait_for_stock(pool, profile, count, party_level=None, timeout=10.0):
+    """Poll until the pool holds `count` ready dungeons for a profile"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if pool.ready_count(profile, party_level) >= count:
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestDungeonPool(unittest.TestCase):
+    """Test pool stocking and acquisition (thread workers for speed)"""
+
+    def setUp(self):
+        self.pool = DungeonPool(
+            profiles={'small': DungeonConfig(num_rooms=5, party_level=1, layout_type='linear')},
+            target_size=2,
+            use_processes=False
+        )
+
+    def tearDown(self):
+        self.pool.shutdown()
+
+    def test_start_fills_profiles(self):
+        """Test start() stocks each profile up to target size"""
+        self.pool.start()
+        self.assertTrue(wait_for_stock(self.pool, 'small', 2))
+
+    def test_acquire_hit_returns_fresh_dungeon_and_refills(self):
+        """Test a ready dungeon is handed out and the stock is topped up again"""
+        self.pool.start()
+        self.assertTrue(wait_for_stock(self.pool, 'small', 2))
+
+        dungeon = self.pool.acquire('small')
+
+        self.assertIsInstance(dungeon, Dungeon)
+        self.assertEqual(len(dungeon.rooms), 5)
+        self.assertEqual(self.pool.hits, 1)
+        self.assertTrue(wait_for_stock(self.pool, 'small', 2))
+
+    def test_acquired_dungeons_are_independent(self):
+        """Test two acquired dungeons never share room objects"""
+        self.pool.start()
+        self.assertTrue(wait_for_stock(self.pool, 'small', 2))
+
+        first = self.pool.acquire('small')
+        second = self.pool.acquire('small')
+
+        first.get_start_room().items.append('marker')
+        self.assertNotIn('marker', second.get_start_room().items)
+
+    def test_miss_generates_inline(self):
+        """Test acquire works without a running pool (no workers at all)"""
+        dungeon = self.pool.acquire('small')
+
+        self.assertEqual(len(dungeon.rooms), 5)
+        self.assertEqual(self.pool.misses, 1)
+        self.assertEqual(self.pool.ready_count('small'), 0)
+
+    def test_party_level_has_separate_stock(self):
+        """Test other party levels are stocked after their first request"""
+        self.pool.start()
+        self.pool.acquire('small', party_level=3)
+
+        self.assertTrue(wait_for_stock(self.pool, 'small', 2, party_level=3))
+        self.assertEqual(self.pool.profiles['small'].party_level, 1)
+
+    def test_unknown_profile_raises(self):
+        """Test unknown profiles are rejected"""
+        with self.assertRaises(KeyError):
+            self.pool.acquire('nonexistent')
+
+    def test_presets_are_not_mutated(self):
+        """Test other party levels derive new configs from the shared presets"""
+        pool = DungeonPool(target_size=0)
+
+        pool.acquire('standard', party_level=4)
+        self.assertEqual(STANDARD_DUNGEON.party_level, 1)
+
+    def test_disabled_pool_never_stocks(self):
+        """Test target_size=0 keeps generating inline"""
+        pool = DungeonPool(profiles={'small': DungeonConfig(num_rooms=5, layout_type='linear')},
+                           target_size=0).start()
+
+        pool.acquire('small')
+
+        self.assertEqual(pool.ready_count('small'), 0)
+        pool.shutdown()
+
+
+class TestDungeonPoolGeneration(unittest.TestCase):
+    """Test worker-side generation helpers"""
+
+    def test_multilevel_profile(self):
+        """Test configs with num_levels > 1 produce multi-level dungeons"""
+        config = DungeonConfig(num_rooms=5, num_levels=2, dungeon_theme='crypt')
+
+        dungeon = build_dungeon(generate_dungeon_data(config))
+
+        self.assertIsInstance(dungeon, MultiLevelDungeon)
+        self.assertEqual(dungeon.num_levels, 2)
+        self.assertEqual(dungeon.name, "The Crypt Depths")
+
+    def test_process_workers(self):
+        """Test the default process-based workers stock dungeons"""
+        pool = DungeonPool(profiles={'small': DungeonConfig(num_rooms=5, layout_type='linear')},
+                           target_size=1, max_workers=1).start()
+        try:
+            self.assertTrue(wait_for_stock(pool, 'small', 1, timeout=30.0))
+            self.assertEqual(len(pool.acquire('small').rooms), 5)
+        finally:
+            pool.shutdown()
+
+
+if __name__ == '__main__':
+    unittest.main()
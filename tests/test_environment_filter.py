@@ -0,0 +1,96 @@
+"""
+Test suite for environment-based monster filtering
+
+Tests the precomputed environment sets, bitmasks and cached pool
+intersections.
+"""
+
+import unittest
+
+from aerthos.systems.environment_filter import (
+    EnvironmentContext, EnvironmentMonsterFilter, environment_key, get_environment_index
+)
+
+
+class TestEnvironmentFilter(unittest.TestCase):
+    """Test environment filtering"""
+
+    def setUp(self):
+        self.filter = EnvironmentMonsterFilter()
+        self.dungeon_1 = EnvironmentContext(location_type='dungeon', dungeon_level=1)
+
+    def test_index_is_shared(self):
+        """Test filters share one precomputed index"""
+        self.assertIs(EnvironmentMonsterFilter().index, self.filter.index)
+        self.assertIs(get_environment_index(), self.filter.index)
+
+    def test_dungeon_set_includes_versatile_monsters(self):
+        """Test dungeon levels include dungeon_or_wilderness monsters"""
+        categories = self.filter.environment_data['environment_categories']
+        monsters = self.filter.get_monster_set(self.dungeon_1)
+
+        self.assertIn('kobold', monsters)
+        self.assertTrue(set(categories['dungeon_or_wilderness']) <= monsters)
+
+    def test_level_is_clamped(self):
+        """Test out-of-range dungeon levels share the level 1/10 sets"""
+        deep = EnvironmentContext(location_type='dungeon', dungeon_level=15)
+        level_10 = EnvironmentContext(location_type='dungeon', dungeon_level=10)
+
+        self.assertEqual(environment_key(deep), environment_key(level_10))
+        self.assertIs(self.filter.get_monster_set(deep), self.filter.get_monster_set(level_10))
+
+    def test_pool_filter_keeps_pool_order(self):
+        """Test pool intersection drops inappropriate monsters and keeps order"""
+        pool = ['sprite', 'kobold', 'dolphin', 'goblin']
+
+        result = self.filter.get_appropriate_monsters(self.dungeon_1, pool)
+
+        self.assertEqual(result, ['kobold', 'goblin'])
+
+    def test_pool_intersection_is_cached(self):
+        """Test repeated pools reuse the cached intersection (callers get copies)"""
+        pool = ['kobold', 'goblin', 'sprite']
+
+        first = self.filter.get_appropriate_monsters(self.dungeon_1, pool)
+        first.append('dolphin')
+        second = self.filter.get_appropriate_monsters(self.dungeon_1, pool)
+
+        self.assertEqual(second, ['kobold', 'goblin'])
+        self.assertEqual(len(self.filter._pool_cache), 1)
+
+    def test_bitmask_set_algebra(self):
+        """Test masks round-trip and intersect like sets"""
+        forest = EnvironmentContext(location_type='wilderness', terrain='forest')
+
+        both = self.filter.get_monster_mask(self.dungeon_1) & self.filter.get_monster_mask(forest)
+
+        expected = self.filter.get_monster_set(self.dungeon_1) & self.filter.get_monster_set(forest)
+        self.assertEqual(set(self.filter.monsters_in_mask(both)), expected)
+        self.assertEqual(self.filter.mask_of(['kobold', 'not_a_monster']),
+                         self.filter.mask_of(['kobold']))
+
+    def test_faerie_setting_replaces_terrain(self):
+        """Test faerie/sylvan setting ignores terrain"""
+        faerie = EnvironmentContext(location_type='wilderness', terrain='desert',
+                                    special_setting='faerie_sylvan')
+
+        self.assertEqual(set(self.filter.get_appropriate_monsters(faerie)),
+                         set(self.filter.environment_data['wilderness']['faerie_sylvan']))
+
+    def test_unknown_terrain_added_on_demand(self):
+        """Test unknown terrains fall back to versatile monsters"""
+        swamp = EnvironmentContext(location_type='wilderness', terrain='lava_fields')
+
+        self.assertEqual(self.filter.get_monster_set(swamp), self.filter.index.versatile)
+
+    def test_unknown_location_passes_pool_through(self):
+        """Test unsupported locations leave the pool unfiltered"""
+        city = EnvironmentContext(location_type='city')
+
+        self.assertEqual(self.filter.get_appropriate_monsters(city, ['orc']), ['orc'])
+        self.assertFalse(self.filter.is_appropriate('orc', city))
+
+
+if __name__ == '__main__':
+    unittest.main()
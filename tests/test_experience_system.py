@@ -0,0 +1,96 @@
+"""
+Test suite for the level progression system
+
+Tests the compiled class/level matrix, XP -> level lookup and cached
+stat blocks.
+"""
+
+import unittest
+
+from aerthos.systems.experience import ExperienceSystem, LevelStats
+
+
+class TestLevelStats(unittest.TestCase):
+    """Test compiled per-(class, level) stat blocks"""
+
+    def setUp(self):
+        self.system = ExperienceSystem()
+
+    def test_stat_block_matches_tables(self):
+        """Test a row carries the JSON table values for its level"""
+        stats = self.system.get_level_stats('Fighter', 7)
+        fighter = self.system.progression['Fighter']
+
+        self.assertIsInstance(stats, LevelStats)
+        self.assertEqual(stats.xp_required, fighter['xp_table'][6])
+        self.assertEqual(stats.thac0, fighter['thac0_table'][6])
+        self.assertEqual(stats.title, fighter['level_titles'][6])
+        self.assertEqual(stats.attacks_per_round, 1.5)
+        self.assertEqual(stats.hit_die, 10)
+        self.assertTrue(stats.rolls_hit_die)
+
+    def test_stat_blocks_are_cached(self):
+        """Test repeated lookups return the same block, including past the table"""
+        self.assertIs(self.system.get_level_stats('Thief', 3), self.system.get_level_stats('Thief', 3))
+        self.assertIs(self.system.get_level_stats('Thief', 25), self.system.get_level_stats('Thief', 25))
+
+    def test_levels_beyond_table(self):
+        """Test levels past the tables extrapolate XP and keep the last values"""
+        fighter = self.system.progression['Fighter']
+        table_max = len(fighter['xp_table'])
+
+        stats = self.system.get_level_stats('Fighter', table_max + 2)
+
+        self.assertEqual(stats.xp_required, fighter['xp_table'][-1] + 2 * fighter['xp_per_level_after_max'])
+        self.assertEqual(stats.thac0, fighter['thac0_table'][-1])
+        self.assertFalse(stats.rolls_hit_die)
+        self.assertEqual(self.system.roll_hp_for_level('Fighter', table_max + 2, 3), fighter['hp_after_max'])
+
+    def test_spell_slots_are_fresh_dicts(self):
+        """Test callers can adjust their spell slots without touching the matrix"""
+        slots = self.system.get_spell_slots('Cleric', 5)
+        slots[1] += 10
+
+        self.assertEqual(self.system.get_spell_slots('Cleric', 5)[1], slots[1] - 10)
+
+    def test_unknown_class_defaults(self):
+        """Test unknown classes fall back to defaults"""
+        self.assertIsNone(self.system.get_level_stats('Gardener', 1))
+        self.assertEqual(self.system.get_thac0('Gardener', 5), 20)
+        self.assertEqual(self.system.get_level_title('Gardener', 5), "Adventurer")
+        self.assertEqual(self.system.get_spell_slots('Gardener', 5), {})
+        self.assertEqual(self.system.get_level_from_xp('Gardener', 99999), 1)
+
+
+class TestLevelFromXP(unittest.TestCase):
+    """Test XP -> level lookup"""
+
+    def setUp(self):
+        self.system = ExperienceSystem()
+
+    def test_thresholds(self):
+        """Test exact thresholds reach the level, one XP less does not"""
+        xp_table = self.system.progression['Magic-User']['xp_table']
+
+        for level, threshold in enumerate(xp_table, start=1):
+            self.assertEqual(self.system.get_level_from_xp('Magic-User', threshold), level)
+            if level > 1:
+                self.assertEqual(self.system.get_level_from_xp('Magic-User', threshold - 1), level - 1)
+
+    def test_bounds(self):
+        """Test XP below zero and past the table"""
+        xp_table = self.system.progression['Thief']['xp_table']
+
+        self.assertEqual(self.system.get_level_from_xp('Thief', -10), 1)
+        self.assertEqual(self.system.get_level_from_xp('Thief', xp_table[-1] * 10), len(xp_table))
+
+    def test_can_level_up(self):
+        """Test level-up check against the next level's threshold"""
+        needed = self.system.get_xp_for_level('Cleric', 2)
+
+        self.assertTrue(self.system.can_level_up('Cleric', 1, needed))
+        self.assertFalse(self.system.can_level_up('Cleric', 1, needed - 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+"""
+Test suite for immutable dungeon configs and the generation cache
+
+Tests derive(), fingerprints, cache hits/misses, LRU eviction and
+DungeonGenerator integration.
+"""
+
+import dataclasses
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from aerthos.generator.config import DungeonConfig, STANDARD_DUNGEON
+from aerthos.generator.dungeon_generator import DungeonGenerator
+from aerthos.generator.generation_cache import DungeonCache
+
+
+class TestImmutableConfig(unittest.TestCase):
+    """Test frozen presets, derive() and fingerprint()"""
+
+    def test_presets_are_frozen(self):
+        """Presets cannot be changed in place"""
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            STANDARD_DUNGEON.party_level = 5
+
+        self.assertIsInstance(STANDARD_DUNGEON.monster_pool, tuple)
+
+    def test_derive(self):
+        """derive() returns a validated copy"""
+        config = STANDARD_DUNGEON.derive(party_level=4, seed=7)
+
+        self.assertEqual((config.party_level, config.seed), (4, 7))
+        self.assertEqual(STANDARD_DUNGEON.party_level, 1)
+        self.assertIsNone(STANDARD_DUNGEON.seed)
+
+        with self.assertRaises(ValueError):
+            STANDARD_DUNGEON.derive(layout_type='spiral')
+
+    def test_lists_become_tuples(self):
+        """Sequence fields accept lists and compare equal to tuple configs"""
+        config = DungeonConfig(monster_pool=['orc', 'ogre'])
+
+        self.assertEqual(config.monster_pool, ('orc', 'ogre'))
+        self.assertEqual(config, DungeonConfig(monster_pool=('orc', 'ogre')))
+
+    def test_fingerprint(self):
+        """Fingerprints ignore the seed but nothing else"""
+        base = DungeonConfig(num_rooms=10)
+
+        self.assertEqual(base.fingerprint(), DungeonConfig(num_rooms=10).fingerprint())
+        self.assertEqual(base.fingerprint(), base.derive(seed=99).fingerprint())
+        self.assertNotEqual(base.fingerprint(), base.derive(party_level=2).fingerprint())
+        self.assertNotEqual(base.fingerprint(), base.derive(monster_pool=['orc']).fingerprint())
+
+
+class TestDungeonCache(unittest.TestCase):
+    """Test the on-disk cache"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.cache = DungeonCache(self.test_dir)
+        self.config = DungeonConfig(num_rooms=5, seed=42)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_round_trip(self):
+        """Stored dungeons come back as fresh copies"""
+        data = {'name': 'Test', 'rooms': {'room_001': {'items': ['torch']}}}
+
+        self.assertIsNone(self.cache.get(self.config, 'v1'))
+        self.assertTrue(self.cache.put(self.config, 'v1', data))
+
+        first = self.cache.get(self.config, 'v1')
+        first['rooms']['room_001']['items'].append('sword')
+
+        self.assertEqual(self.cache.get(self.config, 'v1'), data)
+        self.assertEqual((self.cache.hits, self.cache.misses), (2, 1))
+
+    def test_key_includes_seed_and_version(self):
+        """Different seeds or generator versions never share entries"""
+        self.cache.put(self.config, 'v1', {'name': 'A'})
+
+        self.assertIsNone(self.cache.get(self.config.derive(seed=43), 'v1'))
+        self.assertIsNone(self.cache.get(self.config, 'v2'))
+
+    def test_unseeded_not_cached(self):
+        """Random configs are never stored"""
+        config = self.config.derive(seed=None)
+
+        self.assertFalse(self.cache.put(config, 'v1', {'name': 'A'}))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted first"""
+        cache = DungeonCache(self.test_dir, max_entries=2)
+        configs = [self.config.derive(seed=seed) for seed in (1, 2, 3)]
+
+        cache.put(configs[0], 'v1', {'name': 'one'})
+        cache.put(configs[1], 'v1', {'name': 'two'})
+
+        # Make entry one older, then use it so entry two becomes the oldest
+        for path in Path(self.test_dir).glob('*.json'):
+            os.utime(path, (time.time() - 60, time.time() - 60))
+        cache.get(configs[0], 'v1')
+        cache.put(configs[2], 'v1', {'name': 'three'})
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNotNone(cache.get(configs[0], 'v1'))
+        self.assertIsNone(cache.get(configs[1], 'v1'))
+
+    def test_corrupt_entry_discarded(self):
+        """Unreadable entries count as misses and are removed"""
+        key = DungeonCache.key(self.config, 'v1')
+        (Path(self.test_dir) / f"{key}.json").write_text('{not json')
+
+        with patch('builtins.print'):
+            self.assertIsNone(self.cache.get(self.config, 'v1'))
+        self.assertEqual(len(self.cache), 0)
+
+
+class TestGeneratorCache(unittest.TestCase):
+    """Test DungeonGenerator with a cache attached"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.cache = DungeonCache(self.test_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_cached_matches_fresh(self):
+        """A cache hit returns exactly what generation would"""
+        config = STANDARD_DUNGEON.derive(seed=1234, party_level=3)
+        generator = DungeonGenerator(cache=self.cache)
+
+        generated = generator.generate(config)
+        cached = generator.generate(config)
+
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(cached, generated)
+        self.assertEqual(cached, DungeonGenerator().generate(config))
+
+    def test_output_options_cached_separately(self):
+        """Lazy and rendered descriptions do not share entries"""
+        config = DungeonConfig(num_rooms=5, seed=3)
+
+        DungeonGenerator(cache=self.cache).generate(config)
+        lazy = DungeonGenerator(lazy_descriptions=True, cache=self.cache).generate(config)
+
+        self.assertEqual(self.cache.hits, 0)
+        self.assertIn('description_seed', lazy['rooms']['room_002'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+"""
+Test suite for the character Inventory
+
+Tests stacking of identical items, the running weight total and the
+exact/prefix/substring name lookups.
+"""
+
+import unittest
+
+from aerthos.entities.player import Inventory, Item, LightSource, Weapon
+
+
+def ration():
+    return Item(name="Rations (1 day)", item_type="consumable", weight=0.1, properties={'healing': '0'})
+
+
+class TestInventoryStacks(unittest.TestCase):
+    """Test stacking and the items view"""
+
+    def setUp(self):
+        self.inventory = Inventory(max_weight=10)
+
+    def test_identical_items_stack(self):
+        """Identical plain items share one stack; items lists every unit"""
+        for _ in range(3):
+            self.inventory.add_item(ration())
+        self.inventory.add_item(Item(name="Rope_50ft", weight=7.5))
+
+        self.assertEqual([(s.item.name, s.quantity) for s in self.inventory.stacks],
+                         [("Rations (1 day)", 3), ("Rope_50ft", 1)])
+        self.assertEqual(self.inventory.list_items(), ["Rations (1 day)"] * 3 + ["Rope_50ft"])
+        self.assertEqual(self.inventory.quantity("rations (1 day)"), 3)
+
+    def test_different_items_do_not_stack(self):
+        """Same name but different fields, or stateful items, stay separate"""
+        self.inventory.add_item(ration())
+        self.inventory.add_item(Item(name="Rations (1 day)", item_type="consumable", weight=0.2))
+        first = LightSource(name="Torch", weight=0.1)
+        second = LightSource(name="Torch", weight=0.1)
+        self.inventory.add_item(first)
+        self.inventory.add_item(second)
+
+        self.assertEqual(len(self.inventory.stacks), 4)
+        self.assertIs(self.inventory.items[2], first)
+        self.assertIs(self.inventory.items[3], second)
+
+    def test_remove_from_stack(self):
+        """Removing from a stack returns a separate copy of the item"""
+        self.inventory.add_item(ration())
+        self.inventory.add_item(ration())
+        kept = self.inventory.get_item("rations")
+
+        removed = self.inventory.remove_item("rations")
+        removed.properties['healing'] = '1d4'
+
+        self.assertIsNot(removed, kept)
+        self.assertEqual(kept.properties, {'healing': '0'})
+        self.assertEqual(self.inventory.quantity("Rations (1 day)"), 1)
+        self.assertIs(self.inventory.remove_item("rations"), kept)
+        self.assertFalse(self.inventory.has_item("Rations (1 day)"))
+        self.assertEqual(self.inventory.items, [])
+
+    def test_items_assignment(self):
+        """Assigning items rebuilds the stacks and weight"""
+        self.inventory.items = [ration(), ration()]
+
+        self.assertEqual(len(self.inventory.stacks), 1)
+        self.assertAlmostEqual(self.inventory.current_weight, 0.2)
+
+
+class TestInventoryWeight(unittest.TestCase):
+    """Test the running weight total"""
+
+    def test_weight_tracks_changes(self):
+        """current_weight matches the sum of the items after any change"""
+        inventory = Inventory(max_weight=20)
+        inventory.add_item(Weapon(name="Long Sword", weight=6.0))
+        for _ in range(5):
+            inventory.add_item(ration())
+        inventory.add_item(Item(name="Iron Rations", weight=7.5))
+
+        for name in ("rations", "long sword", "iron"):
+            self.assertAlmostEqual(inventory.current_weight, sum(i.weight for i in inventory.items))
+            inventory.remove_item(name)
+
+        self.assertAlmostEqual(inventory.current_weight, 0.4)
+
+    def test_encumbrance(self):
+        """is_encumbered follows the running total"""
+        inventory = Inventory(max_weight=10)
+        inventory.add_item(Item(name="Anvil", weight=11))
+        self.assertTrue(inventory.is_encumbered)
+
+        inventory.remove_item("anvil")
+        self.assertFalse(inventory.is_encumbered)
+        self.assertEqual(inventory.current_weight, 0.0)
+
+
+class TestInventoryLookup(unittest.TestCase):
+    """Test name lookups"""
+
+    def setUp(self):
+        self.inventory = Inventory()
+        self.ceremonial = Weapon(name="Ceremonial Dagger", weight=1.0)
+        self.dagger = Weapon(name="Dagger", weight=1.0)
+        self.rope = Item(name="rope_50ft", weight=7.5)
+        for item in (self.ceremonial, self.dagger, self.rope):
+            self.inventory.add_item(item)
+
+    def test_exact_before_partial(self):
+        """An exact name wins over an earlier partial match"""
+        self.assertIs(self.inventory.get_item("DAGGER"), self.dagger)
+
+    def test_prefix_before_substring(self):
+        """Names starting with the term win over names merely containing it"""
+        self.assertIs(self.inventory.get_item("dag"), self.dagger)
+        self.assertIs(self.inventory.get_item("agger"), self.ceremonial)
+
+    def test_underscores_match_spaces(self):
+        """'rope 50ft' finds 'rope_50ft'; has_item stays exact"""
+        self.assertIs(self.inventory.get_item("Rope 50ft"), self.rope)
+        self.assertTrue(self.inventory.has_item("ROPE_50FT"))
+        self.assertFalse(self.inventory.has_item("rope 50ft"))
+        self.assertIsNone(self.inventory.get_item("lantern"))
+
+    def test_remove_same_name_in_order(self):
+        """Items with the same name are removed oldest first"""
+        second = Weapon(name="Dagger", weight=1.0)
+        self.inventory.add_item(second)
+
+        self.assertIs(self.inventory.remove_item("dagger"), self.dagger)
+        self.assertIs(self.inventory.remove_item("dagger"), second)
+        self.assertIs(self.inventory.remove_item("dagger"), self.ceremonial)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+"""
+Test suite for the compiled monster database
+
+Tests the bundle build step, header index, lazily parsed records and the
+systems that share the database.
+"""
+
+import io
+import json
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest.mock import patch
+
+from aerthos.engine.game_state import GameData
+from aerthos.generator.monster_scaling import MonsterScaler, get_monster_index
+from aerthos.systems.encounters import EncounterDetermination
+from aerthos.systems import monster_database
+from aerthos.systems.monster_database import (
+    MONSTER_BUNDLE, MONSTER_SOURCE, MonsterDatabase, build_monster_bundle,
+    compile_monster_bundle, get_monster_database
+)
+
+
+class TestMonsterBundle(unittest.TestCase):
+    """Test compiling and reading bundles"""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.source = self.test_dir / 'monsters.json'
+        self.environments = self.test_dir / 'monster_environments.json'
+
+        self.monsters = {
+            'kobold': {'name': 'Kobold', 'hit_dice': '1d4', 'xp_value': 5, 'size': 'S',
+                       'alignment': 'Lawful evil', 'description': 'Small and mean.'},
+            'ogre': {'name': 'Ogre', 'hit_dice': '4+1', 'xp_value': 90, 'size': 'L',
+                     'alignment': 'Chaotic evil', 'description': 'Big and mean.'}
+        }
+        self.source.write_text(json.dumps(self.monsters))
+        self.environments.write_text(json.dumps({
+            'dungeon': {'level_1': ['kobold', 'unknown']},
+            'wilderness': {'hills': ['ogre']}
+        }))
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def compile(self):
+        path = compile_monster_bundle(self.source, self.environments, self.test_dir / 'monsters.bundle')
+        return MonsterDatabase.load(path)
+
+    def test_header_index(self):
+        """Headers carry the selection fields and environment tags"""
+        database = self.compile()
+        ogre = database.headers['ogre']
+
+        self.assertEqual((ogre.name, ogre.hit_dice, ogre.xp_value, ogre.size, ogre.alignment),
+                         ('Ogre', '4+1', 90, 'L', 'Chaotic evil'))
+        self.assertEqual(ogre.environments, frozenset({'hills', 'wilderness'}))
+        self.assertEqual(database.environment_index()['dungeon_level_1'], frozenset({'kobold'}))
+
+    def test_records_parsed_on_demand(self):
+        """Full records are only parsed when asked for, then cached"""
+        database = self.compile()
+
+        self.assertEqual(database._records, {})
+        self.assertEqual(database.record('kobold'), self.monsters['kobold'])
+        self.assertEqual(database.description('ogre'), 'Big and mean.')
+        self.assertIs(database.records['kobold'], database.record('kobold'))
+        self.assertEqual(len(database._records), 2)
+
+    def test_records_mapping(self):
+        """records behaves like the monsters.json dict"""
+        records = self.compile().records
+
+        self.assertEqual(list(records), ['kobold', 'ogre'])
+        self.assertIn('ogre', records)
+        self.assertNotIn('dragon', records)
+        self.assertEqual(dict(records), self.monsters)
+        with self.assertRaises(KeyError):
+            records['dragon']
+
+    def test_staleness_detected(self):
+        """Editing the source makes the bundle out of date"""
+        database = self.compile()
+        self.assertTrue(database.is_current(self.source, self.environments))
+
+        self.source.write_text(json.dumps({'kobold': self.monsters['kobold']}))
+        self.assertFalse(database.is_current(self.source, self.environments))
+
+    def test_rejects_other_files(self):
+        """Bundles of another format are refused"""
+        with self.assertRaises(ValueError):
+            MonsterDatabase(b'SOMETHING-ELSE 1\n{}\n')
+
+
+class TestSharedDatabase(unittest.TestCase):
+    """Test the package database and the systems using it"""
+
+    def test_shipped_bundle_is_current(self):
+        """monsters.bundle matches monsters.json (run scripts/build_monster_db.py)"""
+        self.assertTrue(MonsterDatabase.load(MONSTER_BUNDLE).is_current())
+
+    def test_matches_source(self):
+        """Every record round-trips exactly"""
+        with open(MONSTER_SOURCE) as f:
+            source = json.load(f)
+
+        database = MonsterDatabase(build_monster_bundle())
+
+        self.assertEqual(list(database.records), list(source))
+        self.assertEqual(dict(database.records), source)
+
+    def test_missing_bundle_recompiles_quietly(self):
+        """A missing bundle is rebuilt without writing to stdout"""
+        test_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, test_dir)
+        bundle = test_dir / 'monsters.bundle'
+        output = io.StringIO()
+
+        with patch.object(monster_database, 'MONSTER_BUNDLE', bundle), \
+                patch.object(monster_database, '_monster_database', None), \
+                redirect_stdout(output), \
+                self.assertLogs(monster_database.logger, 'INFO'):
+            database = get_monster_database()
+
+        self.assertEqual(output.getvalue(), '')
+        self.assertTrue(bundle.exists())
+        self.assertIn('orc', database.records)
+
+    def test_systems_share_one_database(self):
+        """GameData, MonsterScaler and EncounterDetermination read the same records"""
+        database = get_monster_database()
+
+        self.assertIs(GameData.load_all().monsters['orc'], database.record('orc'))
+        self.assertIs(MonsterScaler().monsters['orc'], database.record('orc'))
+        self.assertIs(EncounterDetermination().monsters['orc'], database.record('orc'))
+        self.assertIs(get_monster_index().monsters, database.records)
+
+
+if __name__ == '__main__':
+    unittest.main()
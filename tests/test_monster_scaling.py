@@ -0,0 +1,104 @@
+"""
+Test suite for party-level monster scaling
+
+Tests the shared hit-dice/XP/size/environment indexes and the cached
+party pools.
+"""
+
+import os
+import tempfile
+import unittest
+
+from aerthos.generator.monster_scaling import MonsterScaler, get_monster_index
+
+
+class TestMonsterIndex(unittest.TestCase):
+    """Test index-backed queries"""
+
+    def setUp(self):
+        self.scaler = MonsterScaler()
+
+    def test_index_is_shared(self):
+        """Test scalers share one index (monsters.json parsed once)"""
+        self.assertIs(MonsterScaler().index, self.scaler.index)
+        self.assertIs(get_monster_index(), self.scaler.index)
+
+    def test_hd_range_matches_full_scan(self):
+        """Test bisect range queries return exactly the monsters in range"""
+        for min_hd, max_hd in [(0.5, 1.5), (1.0, 2.0), (2.5, 7.2), (4.5, 4.5), (50, 60)]:
+            expected = {
+                monster_id for monster_id, data in self.scaler.monsters.items()
+                if min_hd <= MonsterScaler.parse_hit_dice(data.get('hit_dice', '1d8')) <= max_hd
+            }
+            result = self.scaler.get_monsters_by_hd_range(min_hd, max_hd)
+
+            self.assertEqual(set(result), expected)
+            hds = [self.scaler.get_monster_hd(m) for m in result]
+            self.assertEqual(hds, sorted(hds))
+
+    def test_xp_range(self):
+        """Test XP range queries"""
+        result = self.scaler.get_monsters_by_xp_range(100, 500)
+
+        self.assertTrue(result)
+        for monster_id in result:
+            self.assertTrue(100 <= self.scaler.monsters[monster_id]['xp_value'] <= 500)
+
+    def test_size_index(self):
+        """Test size index covers every monster once"""
+        sizes = ['S', 'M', 'L']
+        total = sum(len(self.scaler.get_monsters_by_size(size)) for size in sizes)
+
+        self.assertEqual(total, len(self.scaler.monsters))
+        self.assertIn('kobold', self.scaler.get_monsters_by_size('S'))
+
+    def test_environment_index(self):
+        """Test environment index by section, list and dungeon level"""
+        self.assertIn('kobold', self.scaler.get_monsters_by_environment('dungeon_level_1'))
+        self.assertIn('kobold', self.scaler.get_monsters_by_environment('dungeon'))
+        self.assertEqual(self.scaler.get_monsters_by_environment('no_such_place'), frozenset())
+
+
+class TestPartyPools(unittest.TestCase):
+    """Test cached pool and boss selection"""
+
+    def setUp(self):
+        self.scaler = MonsterScaler()
+
+    def test_pool_within_party_range(self):
+        """Test pool members fall inside the party's HD range"""
+        min_hd, max_hd = self.scaler.get_encounter_difficulty_range(2, 4)
+
+        for monster_id in self.scaler.get_monster_pool_for_party(2, 4):
+            self.assertTrue(min_hd <= self.scaler.get_monster_hd(monster_id) <= max_hd)
+
+    def test_pool_is_cached_but_copied(self):
+        """Test pools are cached per (level, size) and callers get their own list"""
+        pool = self.scaler.get_monster_pool_for_party(3, 5)
+        pool.append('not_a_monster')
+
+        self.assertIn((3, 5), self.scaler.index.pools)
+        self.assertNotIn('not_a_monster', self.scaler.get_monster_pool_for_party(3, 5))
+
+    def test_boss_prefers_boss_monsters(self):
+        """Test boss selection prefers the boss-worthy list"""
+        self.assertEqual(self.scaler.get_boss_for_party(4, 4), 'ogre')
+
+    def test_custom_data_path(self):
+        """Test an explicit monsters.json path gets its own index and fallbacks"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'monsters.json')
+            with open(path, 'w') as f:
+                f.write('{"blob": {"hit_dice": "20d8", "xp_value": 5000, "size": "L"}}')
+
+            scaler = MonsterScaler(path)
+
+            self.assertIsNot(scaler.index, self.scaler.index)
+            self.assertEqual(scaler.get_monster_pool_for_party(1),
+                             ['kobold', 'goblin', 'giant_rat', 'skeleton'])
+            self.assertEqual(scaler.get_boss_for_party(1), 'ogre')
+            self.assertEqual(scaler.get_monsters_by_environment('dungeon'), frozenset())
+
+
+if __name__ == '__main__':
+    unittest.main()
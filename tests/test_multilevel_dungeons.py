@@ -2,7 +2,12 @@
 Tests for multi-level dungeon system
 """
 
+import os
+import random
+import subprocess
+import sys
 import unittest
+from pathlib import Path
 from aerthos.entities.player import PlayerCharacter
 from aerthos.world.multilevel_dungeon import MultiLevelDungeon
 from aerthos.world.dungeon import Dungeon
@@ -148,6 +153,90 @@ class TestMultiLevelGenerator(unittest.TestCase):
 
         self.assertTrue(has_stairs_down, "Level 1 should have stairs going down")
 
+    def test_seed_fixes_whole_dungeon(self):
+        """Same master seed, same levels, names and stairs"""
+        first = MultiLevelGenerator().generate_to_dict(num_levels=3, rooms_per_level=8, seed=42)
+        second = MultiLevelGenerator().generate_to_dict(num_levels=3, rooms_per_level=8, seed=42)
+        other = MultiLevelGenerator().generate_to_dict(num_levels=3, rooms_per_level=8, seed=43)
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other)
+
+    def test_worker_count_does_not_change_output(self):
+        """Levels generated in worker processes match inline generation"""
+        generator = MultiLevelGenerator()
+        inline = generator.generate_to_dict(num_levels=3, rooms_per_level=8, seed=7, workers=1)
+        pooled = generator.generate_to_dict(num_levels=3, rooms_per_level=8, seed=7, workers=2)
+
+        self.assertEqual(pooled, inline)
+
+    def test_output_independent_of_hash_seed(self):
+        """Seeded dungeons are identical in processes with different hash seeds"""
+        script = (
+            "import json\n"
+            "from aerthos.generator.config import DungeonConfig\n"
+            "from aerthos.generator.dungeon_generator import DungeonGenerator\n"
+            "from aerthos.generator.multilevel_generator import MultiLevelGenerator\n"
+            "network = DungeonGenerator(use_narrator=False).generate("
+            "DungeonConfig(num_rooms=30, layout_type='network', seed=42))\n"
+            "levels = MultiLevelGenerator().generate_to_dict(num_levels=2, rooms_per_level=12, seed=42)\n"
+            "print(json.dumps([network, levels], sort_keys=True))\n"
+        )
+        root = Path(__file__).resolve().parent.parent
+
+        outputs = set()
+        for hash_seed in ('1', '2', '4'):
+            env = dict(os.environ, PYTHONHASHSEED=hash_seed, PYTHONPATH=str(root))
+            result = subprocess.run([sys.executable, '-c', script], cwd=root, env=env,
+                                    capture_output=True, text=True, check=True)
+            outputs.add(result.stdout)
+
+        self.assertEqual(len(outputs), 1)
+
+
+class TestLazyLevels(unittest.TestCase):
+    """Test that loaded levels are only built when entered"""
+
+    def setUp(self):
+        random.seed(11)
+        self.ml_dungeon = MultiLevelGenerator().generate(num_levels=4, rooms_per_level=6)
+        self.saved = self.ml_dungeon.serialize()
+
+    def test_only_current_level_built(self):
+        """Loading builds nothing; stats don't build other levels"""
+        for loaded in (MultiLevelDungeon.deserialize(self.saved),
+                       MultiLevelDungeon.from_dict(self.ml_dungeon.to_dict())):
+            self.assertFalse(any(level.is_loaded for level in loaded.levels.values()))
+
+            self.assertEqual(loaded.get_total_rooms(), self.ml_dungeon.get_total_rooms())
+            loaded.get_current_dungeon()
+            self.assertEqual([n for n, level in loaded.levels.items() if level.is_loaded], [1])
+
+    def test_untouched_levels_saved_as_is(self):
+        """Unvisited levels are written back as the very dictionaries loaded"""
+        loaded = MultiLevelDungeon.deserialize(self.saved)
+        loaded.get_current_dungeon()
+        resaved = loaded.serialize()
+
+        for level_number in (2, 3, 4):
+            self.assertIs(resaved['levels'][level_number]['dungeon_state'],
+                          self.saved['levels'][level_number]['dungeon_state'])
+        self.assertEqual(resaved, self.saved)
+        self.assertEqual(loaded.to_dict(), self.ml_dungeon.to_dict())
+
+    def test_stairs_build_target_level(self):
+        """Taking the stairs down builds the level below"""
+        loaded = MultiLevelDungeon.deserialize(self.saved)
+        stairs = next(room for room in loaded.get_current_dungeon().rooms.values()
+                      if 'stairs_down' in room.exits)
+
+        room, level_number, message = loaded.move(stairs.id, 'stairs_down')
+
+        self.assertEqual(level_number, 2)
+        self.assertIs(room, loaded.levels[2].dungeon.get_room(stairs.exits['stairs_down']))
+        self.assertTrue(loaded.levels[2].is_loaded)
+        self.assertFalse(loaded.levels[3].is_loaded)
+
 
 if __name__ == '__main__':
     unittest.main()
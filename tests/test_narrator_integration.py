@@ -3,9 +3,10 @@ Test suite for DMNarrator integration with dungeon generation
 """
 
 import unittest
-from aerthos.generator.dungeon_generator import DungeonGenerator
+from aerthos.generator.dungeon_generator import DungeonGenerator, render_room_description
 from aerthos.generator.config import DungeonConfig
 from aerthos.systems.narrator import DMNarrator, NarrativeContext
+from aerthos.world.dungeon import Dungeon
 
 
 class TestNarratorIntegration(unittest.TestCase):
@@ -159,6 +160,104 @@ class TestNarratorIntegration(unittest.TestCase):
             # (This is handled by _add_monster_hint)
 
 
+class TestLazyRoomDescriptions(unittest.TestCase):
+    """Test deferred narrator descriptions rendered on first visit"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.config = DungeonConfig(
+            num_rooms=8,
+            layout_type='linear',
+            dungeon_theme='crypt',
+            combat_frequency=0.6,
+            monster_pool=['kobold', 'goblin', 'orc'],
+            include_boss=True,
+            seed=4242
+        )
+
+    def test_seeded_descriptions_are_reproducible(self):
+        """Test the same seed renders the same narrator descriptions"""
+        first = DungeonGenerator().generate(self.config)
+        second = DungeonGenerator().generate(self.config)
+
+        for room_id, room_data in first['rooms'].items():
+            self.assertEqual(room_data['description'], second['rooms'][room_id]['description'])
+
+    def test_lazy_rooms_carry_seed_not_text(self):
+        """Test lazy generation stores a description seed instead of text"""
+        dungeon = DungeonGenerator(lazy_descriptions=True).generate(self.config)
+        final_room = sorted(dungeon['rooms'])[-1]
+
+        for room_id, room_data in dungeon['rooms'].items():
+            if room_id == final_room:
+                # Boss lair description is fixed text
+                self.assertIn('description', room_data)
+                self.assertNotIn('description_seed', room_data)
+            else:
+                self.assertNotIn('description', room_data)
+                self.assertIn('seed', room_data['description_seed'])
+
+    def test_lazy_matches_eager_output(self):
+        """Test descriptions rendered on first visit match eager generation"""
+        eager = DungeonGenerator().generate(self.config)
+        lazy = Dungeon.load_from_generator(
+            DungeonGenerator(lazy_descriptions=True).generate(self.config))
+
+        for room_id, room in lazy.rooms.items():
+            self.assertEqual(room.get_description(), eager['rooms'][room_id]['description'])
+
+    def test_narration_does_not_change_layout(self):
+        """Test a seed gives the same rooms, encounters and treasure with or without the narrator"""
+        def structure(dungeon):
+            return {room_id: (room['title'], room['exits'], room['encounters'], room.get('items'),
+                              room.get('treasure'), room.get('safe_rest'))
+                    for room_id, room in dungeon['rooms'].items()}
+
+        for seed in (1, 42, 1977, 4242):
+            config = DungeonConfig(seed=seed, num_rooms=15)
+            plain = structure(DungeonGenerator(use_narrator=False).generate(config))
+            with self.subTest(seed=seed):
+                self.assertEqual(structure(DungeonGenerator().generate(config)), plain)
+                self.assertEqual(
+                    structure(DungeonGenerator(lazy_descriptions=True).generate(config)), plain)
+
+        # Output of the generator before narrator descriptions were seeded
+        final_room = DungeonGenerator().generate(DungeonConfig(seed=1977, num_rooms=15))['rooms']['room_014']
+        self.assertEqual(final_room['title'], "Orc Lair")
+        self.assertEqual(final_room['encounters'][0]['monsters'], ['orc'])
+        self.assertEqual(final_room['treasure'],
+                         {'gold': 100, 'gems': 5, 'magic_items': ['potion_healing', 'chain_mail_plus1']})
+
+    def test_description_rendered_once_on_enter(self):
+        """Test on_enter materializes the description and caches it"""
+        dungeon = Dungeon.load_from_generator(
+            DungeonGenerator(lazy_descriptions=True).generate(self.config))
+        room = dungeon.get_start_room()
+
+        text = room.on_enter(has_light=True)
+
+        self.assertIsNone(room.description_seed)
+        self.assertIn(room.description, text)
+        self.assertEqual(room.on_enter(has_light=True), text)
+
+    def test_to_dict_keeps_unvisited_rooms_lazy(self):
+        """Test saving keeps seeds for unvisited rooms and text for visited ones"""
+        data = DungeonGenerator(lazy_descriptions=True).generate(self.config)
+        dungeon = Dungeon.load_from_generator(data)
+        start = dungeon.get_start_room()
+        start.on_enter(has_light=True)
+
+        saved = dungeon.to_dict()
+
+        self.assertEqual(saved['rooms'][start.id]['description'], start.description)
+        self.assertEqual(saved['rooms']['room_002']['description_seed'],
+                         data['rooms']['room_002']['description_seed'])
+
+        reloaded = Dungeon.load_from_generator(saved)
+        self.assertEqual(reloaded.get_room('room_002').get_description(),
+                         render_room_description(data['rooms']['room_002']['description_seed']))
+
+
 class TestNarrativeContext(unittest.TestCase):
     """Test NarrativeContext dataclass"""
 
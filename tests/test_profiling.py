@@ -0,0 +1,157 @@
+"""
+Test suite for session profiling hooks
+
+Tests cProfile capture, memory diffs, slow-command logging, dump formats
+and the GameState integration.
+"""
+
+import os
+import pstats
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from aerthos.engine.game_state import GameState
+from aerthos.engine.parser import Command
+from aerthos.engine.profiling import SessionProfiler, ENV_PROFILE, ENV_SLOW_COMMAND_MS
+from aerthos.entities.player import PlayerCharacter
+from aerthos.world.dungeon import Dungeon
+from aerthos.world.room import Room
+
+
+def busy_work(n=2000):
+    """Something with a few nested calls to profile"""
+    return sorted(str(i) for i in range(n))
+
+
+class TestSessionProfiler(unittest.TestCase):
+    """Test the profiler on its own"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_call_returns_result_and_counts(self):
+        """Commands run normally and are counted"""
+        profiler = SessionProfiler()
+
+        self.assertEqual(profiler.call('work', busy_work, 3), ['0', '1', '2'])
+        self.assertEqual(profiler.commands, 1)
+        self.assertEqual(profiler.stats_text(), '')  # cProfile not enabled
+
+    def test_cprofile_dumps(self):
+        """Captured profiles dump as pstats, text and folded stacks"""
+        profiler = SessionProfiler(cprofile=True)
+        profiler.call('work', busy_work)
+
+        path = profiler.dump_stats(Path(self.test_dir) / 'session.prof')
+        stats = pstats.Stats(str(path))
+        self.assertTrue(any(func[2] == 'busy_work' for func in stats.stats))
+
+        self.assertIn('busy_work', profiler.stats_text())
+
+        lines = profiler.folded_stacks().splitlines()
+        self.assertTrue(lines)
+        for line in lines:
+            stack, weight = line.rsplit(' ', 1)
+            self.assertTrue(stack.startswith('busy_work'))
+            self.assertGreater(int(weight), 0)
+
+    def test_slow_commands_logged(self):
+        """Commands over the threshold are recorded"""
+        profiler = SessionProfiler(slow_threshold_ms=0)
+
+        with patch('builtins.print'):
+            profiler.call('look', busy_work, 10)
+
+        self.assertEqual(profiler.slow_commands[0]['command'], 'look')
+
+    def test_memory_diffs(self):
+        """Tracing records an allocation diff per command"""
+        profiler = SessionProfiler(trace_memory=True)
+        try:
+            keep = profiler.call('allocate', lambda: [bytearray(1000) for _ in range(100)])
+            self.assertEqual(len(keep), 100)
+        finally:
+            profiler.close()
+
+        diff = profiler.memory_diffs[0]
+        self.assertEqual(diff['command'], 'allocate')
+        self.assertTrue(diff['top'])
+        self.assertFalse(profiler.tracing)
+
+    def test_shared_tracemalloc(self):
+        """One session stopping leaves tracemalloc running for the others"""
+        import tracemalloc
+        first = SessionProfiler(trace_memory=True)
+        second = SessionProfiler(trace_memory=True)
+        try:
+            first.close()
+            self.assertTrue(tracemalloc.is_tracing())
+            second.call('allocate', busy_work)
+            self.assertEqual(len(second.memory_diffs), 1)
+
+            # Stopped behind the profilers' backs: commands still run
+            tracemalloc.stop()
+            self.assertEqual(second.call('work', busy_work, 2), ['0', '1'])
+        finally:
+            second.close()
+            first.close()
+
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_from_env(self):
+        """Environment variables switch profiling on"""
+        with patch.dict(os.environ, {ENV_PROFILE: '', ENV_SLOW_COMMAND_MS: ''}):
+            self.assertIsNone(SessionProfiler.from_env())
+
+        with patch.dict(os.environ, {ENV_PROFILE: '1', ENV_SLOW_COMMAND_MS: '250'}):
+            profiler = SessionProfiler.from_env()
+
+        self.assertTrue(profiler.cprofile_enabled)
+        self.assertEqual(profiler.slow_threshold_ms, 250.0)
+
+
+class TestGameStateProfiling(unittest.TestCase):
+    """Test profiling attached to a game session"""
+
+    def setUp(self):
+        player = PlayerCharacter(
+            name="Tester", race="Human", char_class="Fighter", level=1,
+            strength=15, dexterity=14, constitution=13, intelligence=12, wisdom=11, charisma=10,
+            hp_current=10, hp_max=10
+        )
+        room = Room(id='room_001', title='Test Room', description='A test room.',
+                    exits={}, light_level='torch')
+        dungeon = Dungeon(name='Test Dungeon', start_room_id='room_001', rooms={'room_001': room})
+        self.game_state = GameState(player, dungeon)
+
+    def test_off_by_default(self):
+        """No profiler unless asked for"""
+        self.assertIsNone(self.game_state.profiler)
+
+    def test_commands_profiled(self):
+        """Enabled sessions profile every command"""
+        profiler = self.game_state.enable_profiling()
+
+        result = self.game_state.execute_command(Command(action='look'))
+
+        self.assertIn('message', result)
+        self.assertEqual(profiler.commands, 1)
+        self.assertIn('_handle_look', profiler.stats_text(limit=50))
+
+    def test_disable(self):
+        """Disabling detaches the profiler"""
+        self.game_state.enable_profiling(trace_memory=True)
+        self.game_state.disable_profiling()
+
+        self.assertIsNone(self.game_state.profiler)
+        self.game_state.execute_command(Command(action='look'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+Test suite for the roll table compiler
+
+Covers range parsing, lookup, table validation and the compiled tables used
+by treasure, trap and Appendix A generation.
+"""
+
+import unittest
+
+from aerthos.systems.roll_tables import (
+    RollTableError, compile_roll_table, parse_roll_range
+)
+from aerthos.systems.treasure import TreasureGenerator
+from aerthos.systems.traps import TrapSystem
+from aerthos.generator.appendix_a_generator import AppendixAGenerator
+
+
+class TestRollRanges(unittest.TestCase):
+    """Test range string parsing"""
+
+    def test_ranges_and_single_values(self):
+        """Test 'low-high' and single-value ranges"""
+        self.assertEqual(parse_roll_range("11-13", die=20), (11, 13))
+        self.assertEqual(parse_roll_range("17", die=20), (17, 17))
+        self.assertEqual(parse_roll_range("01-03"), (1, 3))
+
+    def test_double_zero_is_one_hundred(self):
+        """Test '00' reads as 100 on percentile tables"""
+        self.assertEqual(parse_roll_range("96-00"), (96, 100))
+        self.assertEqual(parse_roll_range("00"), (100, 100))
+
+
+class TestCompileRollTable(unittest.TestCase):
+    """Test compiling and validating tables"""
+
+    def setUp(self):
+        self.entries = [
+            {"roll": "1-2", "result": "low"},
+            {"roll": "3", "result": "middle"},
+            {"roll": "4-6", "result": "high"}
+        ]
+
+    def test_lookup_by_roll(self):
+        """Test every face maps to its entry"""
+        table = compile_roll_table(self.entries, die=6)
+
+        self.assertEqual([table.get(r)["result"] for r in range(1, 7)],
+                         ["low", "low", "middle", "high", "high", "high"])
+        self.assertIsNone(table.get(7))
+
+    def test_die_inferred_from_ranges(self):
+        """Test the die size defaults to the highest bound"""
+        self.assertEqual(compile_roll_table(self.entries).die, 6)
+        percentile = compile_roll_table([{"roll": "01-50"}, {"roll": "51-00"}])
+        self.assertEqual(percentile.die, 100)
+
+    def test_gap_rejected(self):
+        """Test uncovered rolls raise with the missing range"""
+        with self.assertRaises(RollTableError) as ctx:
+            compile_roll_table([{"roll": "1-2"}, {"roll": "5-6"}], die=6, name='gappy')
+
+        self.assertIn('gappy', str(ctx.exception))
+        self.assertIn('3-4', str(ctx.exception))
+
+    def test_overlap_rejected(self):
+        """Test rolls covered twice raise"""
+        with self.assertRaises(RollTableError) as ctx:
+            compile_roll_table([{"roll": "1-4"}, {"roll": "3-6"}], die=6)
+
+        self.assertIn('3-4', str(ctx.exception))
+
+    def test_out_of_range_rejected(self):
+        """Test ranges past the die size raise"""
+        with self.assertRaises(RollTableError):
+            compile_roll_table([{"roll": "1-21"}], die=20)
+
+    def test_custom_key(self):
+        """Test tables whose range lives under another key"""
+        table = compile_roll_table([{"roll_d100": "01-00", "type": "gem"}], key='roll_d100')
+
+        self.assertEqual(table.get(100)["type"], "gem")
+
+
+class TestCompiledGameTables(unittest.TestCase):
+    """Test the shipped DMG tables compile and cover every roll"""
+
+    def test_treasure_tables(self):
+        """Test top-of-table percentile rolls reach the last entry"""
+        generator = TreasureGenerator()
+
+        self.assertEqual(generator.gem_table.get(100), generator.gem_values[-1])
+        self.assertEqual(generator.jewelry_table.get(100), generator.jewelry_values[-1])
+        for name in ('potions', 'swords', 'armor', 'rings'):
+            self.assertEqual(generator.magic_tables[name].die, 100)
+
+    def test_trap_table(self):
+        """Test the trap table covers d100"""
+        system = TrapSystem()
+
+        self.assertEqual(system.trap_table.get(100), system.tables["trap_types"]["table"][-1])
+
+    def test_appendix_a_tables(self):
+        """Test every Appendix A table compiles as a d20 table"""
+        generator = AppendixAGenerator()
+
+        self.assertIn('periodic_check', generator.roll_tables)
+        self.assertIn('chamber_size.room_table', generator.roll_tables)
+        self.assertTrue(all(table.die == 20 for table in generator.roll_tables.values()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+Test suite for compiled room encounters
+
+Tests the per-room, per-trigger encounter index, set-based completion
+tracking and its save format.
+"""
+
+import random
+import unittest
+from unittest.mock import patch
+
+from aerthos.engine.game_state import GameState, GameData
+from aerthos.engine.parser import CommandParser
+from aerthos.generator.multilevel_generator import MultiLevelGenerator
+from aerthos.ui.character_creation import CharacterCreator
+from aerthos.world.dungeon import Dungeon
+from aerthos.world.encounter import (
+    CombatEncounter, EncounterManager, PuzzleEncounter, RoomEncounterIndex, TrapEncounter
+)
+
+
+def dungeon_data():
+    """Three rooms: one quiet, one guarded, one with a trap and a chest"""
+    return {
+        'name': 'Test Dungeon',
+        'start_room': 'room_001',
+        'rooms': {
+            'room_001': {'id': 'room_001', 'title': 'Entrance', 'description': 'Quiet.',
+                         'exits': {'north': 'room_002'}},
+            'room_002': {'id': 'room_002', 'title': 'Guard Room', 'description': 'Orcs.',
+                         'exits': {'south': 'room_001', 'east': 'room_003'},
+                         'encounters': [{'type': 'combat', 'monsters': ['orc', 'orc']}]},
+            'room_003': {'id': 'room_003', 'title': 'Vault', 'description': 'Dusty.',
+                         'exits': {'west': 'room_002'},
+                         'encounters': [
+                             {'type': 'trap', 'trap_type': 'arrow', 'damage': '1d6'},
+                             {'type': 'riddle'},
+                             {'type': 'puzzle', 'puzzle_type': 'locked_chest'},
+                             {'type': 'combat', 'monsters': ['kobold'], 'trigger': 'on_search'}
+                         ]}
+        }
+    }
+
+
+class TestRoomEncounterIndex(unittest.TestCase):
+    """Test compiling and bucketing"""
+
+    def setUp(self):
+        self.index = RoomEncounterIndex(dungeon_data()['rooms'])
+
+    def test_buckets_by_trigger(self):
+        """Each (room, trigger) pair gets its own bucket"""
+        self.assertEqual(self.index.triggered_by('room_001', 'on_enter'), ())
+        self.assertEqual(self.index.triggered_by('room_002', 'on_search'), ())
+
+        guards, = self.index.triggered_by('room_002', 'on_enter')
+        self.assertIsInstance(guards, CombatEncounter)
+        self.assertEqual(guards.monster_ids, ['orc', 'orc'])
+
+        trap, kobolds = self.index.triggered_by('room_003', 'on_search')
+        self.assertIsInstance(trap, TrapEncounter)
+        self.assertIsInstance(kobolds, CombatEncounter)
+        self.assertIsInstance(self.index.triggered_by('room_003', 'manual')[0], PuzzleEncounter)
+
+    def test_ids_match_room_loader(self):
+        """IDs keep the list position, skipping unknown types like before"""
+        room = dungeon_data()['rooms']['room_003']
+        loaded = EncounterManager().load_room_encounters(room)
+
+        self.assertEqual([e.encounter_id for e in self.index.for_room('room_003')],
+                         ['room_003_encounter_0', 'room_003_encounter_2', 'room_003_encounter_3'])
+        self.assertEqual(loaded, list(self.index.for_room('room_003')))
+        self.assertEqual(len(self.index), 4)
+
+
+class TestEncounterCompletion(unittest.TestCase):
+    """Test triggering, completion sets and saves"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.game_data = GameData.load_all()
+
+    def setUp(self):
+        random.seed(7)
+        self.dungeon = Dungeon.load_from_generator(dungeon_data())
+        player = CharacterCreator(self.game_data).quick_create("Thorin", "Dwarf", "Fighter")
+        self.game_state = GameState(player, self.dungeon)
+        self.game_state.game_data = self.game_data
+
+    def test_triggers_once_without_rebuilding(self):
+        """Moves use the compiled index and each combat starts only once"""
+        self.game_state.current_room = self.dungeon.rooms['room_002']
+
+        with patch.object(EncounterManager, 'load_room_encounters', side_effect=AssertionError):
+            self.assertIn('COMBAT', self.game_state._check_encounters('on_enter'))
+            self.assertIsNone(self.game_state._check_encounters('on_enter'))
+
+        self.assertEqual(self.dungeon.rooms['room_002'].encounters_completed, {'room_002_encounter_0'})
+
+    def test_save_round_trip(self):
+        """Only rooms with completed encounters save them, as a sorted list"""
+        room = self.dungeon.rooms['room_003']
+        room.mark_encounter_completed('room_003_encounter_3')
+        room.mark_encounter_completed('room_003_encounter_0')
+
+        states = self.dungeon.serialize()['room_states']
+        self.assertNotIn('encounters_completed', states['room_001'])
+        self.assertEqual(states['room_003']['encounters_completed'],
+                         ['room_003_encounter_0', 'room_003_encounter_3'])
+
+        restored = Dungeon.load_from_generator(dungeon_data()).rooms['room_003']
+        restored.restore_encounters_completed(states['room_003']['encounters_completed'])
+        self.assertTrue(restored.is_encounter_completed('room_003_encounter_3'))
+
+    def test_multilevel_move(self):
+        """Encounter checks use the current level's dungeon"""
+        random.seed(3)
+        dungeon = MultiLevelGenerator().generate(num_levels=2, rooms_per_level=5)
+        game_state = GameState(self.game_state.player, dungeon)
+        game_state.game_data = self.game_data
+        direction = next(iter(game_state.current_room.exits))
+
+        result = game_state.execute_command(CommandParser().parse(f"go {direction}"))
+        self.assertTrue(result['success'])
+
+
+if __name__ == '__main__':
+    unittest.main()
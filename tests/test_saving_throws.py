@@ -7,6 +7,7 @@ from unittest.mock import patch
 from aerthos.entities.character import Character
 from aerthos.entities.player import PlayerCharacter, Equipment, Armor, Shield
 from aerthos.systems.saving_throws import SavingThrowResolver
+from aerthos.systems.traps import Trap, TrapSystem
 
 
 class TestBasicSavingThrows(unittest.TestCase):
@@ -616,5 +617,80 @@ class TestSaveForHalfDamage(unittest.TestCase):
             self.assertEqual(self.character.hp_current, 0)  # 12 - 20 = 0 (dead)
 
 
+class TestGroupSaves(unittest.TestCase):
+    """Test batched saves for area effects"""
+
+    def setUp(self):
+        """Create a mixed group"""
+        self.save_system = SavingThrowResolver()
+
+        def make(name, race, constitution, wisdom):
+            character = Character(
+                name=name, race=race, char_class="Fighter", level=1,
+                strength=12, dexterity=12, constitution=constitution,
+                intelligence=10, wisdom=wisdom, charisma=10,
+                hp_max=20, hp_current=20, ac=5, thac0=20
+            )
+            self.save_system.update_character_saves(character)
+            return character
+
+        self.group = [
+            make("Human", "Human", 12, 10),
+            make("Dwarf", "Dwarf", 18, 10),
+            make("Sage", "Human", 12, 18)
+        ]
+
+    def test_matches_individual_saves(self):
+        """Group results carry the same targets, modifiers and narratives as make_save"""
+        for category in ('spell', 'breath', 'poison'):
+            with patch('random.randint', return_value=12):
+                group = self.save_system.make_group_save(self.group, category, situational={'cover': True})
+                single = [self.save_system.make_save(c, category, situational={'cover': True})
+                          for c in self.group]
+
+            for result, expected in zip(group, single):
+                self.assertEqual(result.to_dict(), expected)
+                self.assertEqual(result.narrative, expected['narrative'])
+
+    def test_natural_rolls(self):
+        """Natural 1 and 20 apply to group saves"""
+        with patch('random.randint', return_value=20):
+            self.assertFalse(any(r.success for r in self.save_system.make_group_save(self.group, 'spell')))
+        with patch('random.randint', return_value=1):
+            self.assertTrue(all(r.success for r in self.save_system.make_group_save(self.group, 'spell')))
+
+    def test_modifier_cache_reused(self):
+        """Standing modifiers are computed once per target and save type"""
+        cache = {}
+        with patch.object(self.save_system, 'get_standing_modifier',
+                          wraps=self.save_system.get_standing_modifier) as standing:
+            self.save_system.make_group_save(self.group, 'spell', modifier_cache=cache)
+            self.save_system.make_group_save(self.group, 'magic', modifier_cache=cache)
+
+        self.assertEqual(standing.call_count, 3)
+        self.assertEqual(cache[(id(self.group[1]), 'save_spell')], 5)
+
+    def test_group_save_for_half_damage(self):
+        """Each target takes full or half damage from one roll"""
+        with patch('random.randint', side_effect=[2, 19, 2]):
+            results = self.save_system.group_save_for_half_damage(self.group, 10, 'breath')
+
+        self.assertEqual([r.final_damage for r in results], [5, 10, 5])
+        self.assertEqual([c.hp_current for c in self.group], [15, 10, 15])
+        self.assertIn("Damage reduced to 5!", results[0].narrative)
+
+    def test_trap_on_party(self):
+        """Traps roll damage once and save per victim"""
+        trap = Trap(trap_type="gas_breath", damage="2d6", save_type="breath",
+                    description="A jet of flame", trigger="pressure plate")
+
+        with patch('random.randint', side_effect=[4, 4, 2, 19, 2]):
+            result = TrapSystem().trigger_trap_on_party(trap, self.group, self.save_system)
+
+        self.assertEqual(result['damage'], 8)
+        self.assertEqual([v['damage'] for v in result['victims']], [4, 8, 4])
+        self.assertEqual([v['save_made'] for v in result['victims']], [True, False, True])
+
+
 if __name__ == '__main__':
     unittest.main()
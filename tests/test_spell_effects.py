@@ -0,0 +1,330 @@
+"""
+Test suite for compiled spell effect plans
+
+Covers dice and duration specs, the plans compiled from SPELL_MECHANICS,
+plan caching, casting through MagicSystem, and the save, target cap,
+damage and kill rules of named spells.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from aerthos.entities.monster import Monster
+from aerthos.entities.player import PlayerCharacter, Spell, SpellSlot
+from aerthos.systems.magic import MagicSystem
+from aerthos.systems.spell_effects import (
+    EFFECT_BUFF, EFFECT_CONDITION, EFFECT_DAMAGE, EFFECT_HD_CONDITION, EFFECT_HEAL,
+    EFFECT_MISSILES, EFFECT_REMEDY, EFFECT_UTILITY, SPELL_MECHANICS, DiceSpec, DurationSpec,
+    get_spell_effect_engine, parse_duration
+)
+
+
+def make_goblin(name="Goblin", hp=5):
+    return Monster(name=name, race="Goblin", char_class="Monster", level=1,
+                   hp_current=hp, hp_max=hp, ac=6, thac0=20)
+
+
+def make_monster(name, level, hp):
+    return Monster(name=name, race=name, char_class="Monster", level=level,
+                   hp_current=hp, hp_max=hp, ac=5, thac0=15)
+
+
+def make_caster(level=3):
+    return PlayerCharacter(name="Test Wizard", char_class="Magic-User", race="Human",
+                           level=level, strength=10, dexterity=12, constitution=10,
+                           intelligence=16, wisdom=10, charisma=10, hp_current=10, hp_max=10)
+
+
+class MaxRoll:
+    """Stand-in RNG that rolls the highest face"""
+
+    @staticmethod
+    def randint(low, high):
+        return high
+
+
+class TestDiceAndDuration(unittest.TestCase):
+    """Test dice and duration specs"""
+
+    def test_dice_with_level_cap(self):
+        """Test per-level dice scale with the caster and stop at the cap"""
+        dice = DiceSpec(1, 6, per_level=True, max_levels=10)
+
+        self.assertEqual(dice.roll(4, MaxRoll), 24)
+        self.assertEqual(dice.roll(14, MaxRoll), 60)
+
+    def test_dice_with_extra_per_level(self):
+        """Test 2d8+1d8/level adds extra dice per level"""
+        self.assertEqual(DiceSpec(2, 8, extra_per_level=(1, 8)).roll(3, MaxRoll), 40)
+
+    def test_dice_level_bonus(self):
+        """Test flat bonuses are added once and level bonuses per level"""
+        self.assertEqual(DiceSpec(1, 4, 1).roll(5, MaxRoll), 5)
+        self.assertEqual(DiceSpec(1, 3, level_bonus=1).roll(5, MaxRoll), 8)
+
+    def test_duration(self):
+        """Test turns convert to rounds and per-level parts are separated"""
+        self.assertEqual(parse_duration("1 turn + 5 rounds/level"), DurationSpec(10, 5))
+        self.assertEqual(parse_duration("5 rounds/level").rounds(3), 15)
+        self.assertIsNone(parse_duration("Instantaneous"))
+
+
+class TestSpellPlans(unittest.TestCase):
+    """Test the compiled plans for spells.json"""
+
+    def setUp(self):
+        self.engine = get_spell_effect_engine()
+
+    def test_plan_kinds(self):
+        """Test representative spells compile to the expected effect"""
+        expected = {
+            'sleep': EFFECT_HD_CONDITION,
+            'magic_missile': EFFECT_MISSILES,
+            'cure_light_wounds': EFFECT_HEAL,
+            'fireball': EFFECT_DAMAGE,
+            'charm_person': EFFECT_CONDITION,
+            'hold_person': EFFECT_CONDITION,
+            'protection_from_evil': EFFECT_BUFF,
+            'detect_magic': EFFECT_UTILITY,
+            'heal': EFFECT_HEAL,
+            'cure_disease': EFFECT_REMEDY,
+            'ice_storm': EFFECT_DAMAGE,
+            'delayed_blast_fireball': EFFECT_DAMAGE,
+            'meteor_swarm': EFFECT_DAMAGE,
+            'stinking_cloud': EFFECT_CONDITION,
+            'disintegrate': EFFECT_CONDITION,
+            'light': EFFECT_UTILITY
+        }
+        for spell_id, effect in expected.items():
+            with self.subTest(spell=spell_id):
+                self.assertEqual(self.engine.plans[spell_id].effect, effect)
+
+    def test_area_and_save(self):
+        """Test area damage and save-for-half are detected"""
+        fireball = self.engine.plans['fireball']
+
+        self.assertTrue(fireball.area)
+        self.assertEqual(fireball.save, 'half')
+        self.assertEqual(self.engine.plans['hold_person'].max_targets, 4)
+
+    def test_beneficial_plans(self):
+        """Test healing, remedies, buffs and restorative utilities are cast on allies"""
+        for spell_id in ('heal', 'cure_disease', 'cure_blindness', 'neutralize_poison',
+                         'remove_curse', 'raise_dead', 'haste'):
+            with self.subTest(spell=spell_id):
+                self.assertTrue(self.engine.plans[spell_id].beneficial)
+
+        for spell_id in ('fireball', 'hold_monster', 'delayed_blast_fireball', 'light'):
+            with self.subTest(spell=spell_id):
+                self.assertFalse(self.engine.plans[spell_id].beneficial)
+
+    def test_engine_and_plans_cached(self):
+        """Test the engine is shared and spells without mechanics compile once, as utility"""
+        self.assertIs(get_spell_effect_engine(), self.engine)
+
+        spell = Spell(name="Homebrew Bolt", level=1, school="evocation", casting_time="1",
+                      range="60 feet", duration="Instantaneous", area_of_effect="1 creature",
+                      saving_throw="None", components="V", description="Deals 2d6 damage.")
+        plan = self.engine.get_plan(spell)
+
+        self.assertEqual(plan.effect, EFFECT_UTILITY)
+        self.assertIs(self.engine.get_plan(spell), plan)
+
+
+class TestSpellCasting(unittest.TestCase):
+    """Test casting compiled plans through MagicSystem"""
+
+    def setUp(self):
+        self.magic = MagicSystem()
+        self.caster = make_caster()
+
+    def cast(self, spell_id, targets):
+        plan = self.magic.effects.plans[spell_id]
+        return self.magic.effects.execute(plan, self.caster, targets, self.magic.save_resolver)
+
+    def test_sleep_affects_goblins(self):
+        """Test Sleep puts low-HD creatures to sleep"""
+        goblins = [make_goblin(f"Goblin {i}") for i in range(2)]
+
+        result = self.cast('sleep', goblins)
+
+        self.assertEqual(len(result['affected']), 2)
+        self.assertTrue(all(g.has_condition('sleeping') for g in goblins))
+        self.assertEqual(result['duration'], 15)
+
+    def test_magic_missile_damages_target(self):
+        """Test missiles scale with level and hit the first target"""
+        goblin = make_goblin(hp=50)
+
+        result = self.cast('magic_missile', [goblin])
+
+        self.assertIn("2 glowing missiles", result['narrative'])
+        self.assertEqual(goblin.hp_current, 50 - result['total_damage'])
+        self.assertTrue(4 <= result['total_damage'] <= 10)
+
+    def test_cast_spell_uses_slot(self):
+        """Test cast_spell resolves a memorized spell through its plan"""
+        spell = Spell(name="Magic Missile", level=1, school="evocation", casting_time="1 segment",
+                      range="60 feet", duration="Instantaneous", area_of_effect="1 creature",
+                      saving_throw="None", components="V,S", description="1d4+1 damage per missile")
+        self.caster.spells_memorized = [SpellSlot(level=1, spell=spell, is_used=False)]
+
+        result = self.magic.cast_spell(self.caster, "Magic Missile", [make_goblin(hp=50)])
+
+        self.assertTrue(result['success'])
+        self.assertGreater(result['effect_results']['total_damage'], 0)
+
+    def test_every_spell_resolves(self):
+        """Test every spell in spells.json executes without error"""
+        for spell_id, plan in self.magic.effects.plans.items():
+            with self.subTest(spell=spell_id):
+                targets = [make_goblin(hp=20), make_goblin(hp=20)]
+                result = self.cast(spell_id, targets)
+                self.assertIn('narrative', result)
+
+
+class TestSpellRules(unittest.TestCase):
+    """Test damage and kill rules that must not drift with the spell text"""
+
+    def setUp(self):
+        self.magic = MagicSystem()
+        self.engine = self.magic.effects
+
+    def cast(self, spell_id, targets, caster_level=9):
+        plan = self.engine.plans[spell_id]
+        return self.engine.execute(plan, make_caster(caster_level), targets, self.magic.save_resolver)
+
+    def test_burning_hands_deals_level_plus_d3(self):
+        """Test Burning Hands deals caster level + 1d3 to each target, save for half"""
+        spell = Spell(name="Burning Hands", level=1, school="alteration", casting_time="1 segment",
+                      range="0", duration="Instantaneous", area_of_effect="Cone",
+                      saving_throw="Half", components="V,S",
+                      description="1d3+1 damage per level of the caster")
+        goblins = [make_goblin(f"Goblin {i}", hp=50) for i in range(2)]
+
+        # d3 rolls 2 for 5 + 2 damage, then both saves roll a natural 20 and fail
+        with patch('random.randint', side_effect=[2, 20, 20]):
+            self.magic._execute_spell_effect(spell, make_caster(5), goblins)
+
+        self.assertEqual([g.hp_current for g in goblins], [43, 43])
+
+    def test_power_word_kill_hp_budget(self):
+        """Test Power Word, Kill slays up to 60 current HP, weakest first"""
+        orc, ogre = make_monster("Orc", 1, 8), make_monster("Ogre", 4, 55)
+        giant = make_monster("Giant", 12, 61)
+
+        result = self.cast('power_word_kill', [giant, ogre, orc])
+
+        self.assertFalse(orc.is_alive)
+        self.assertTrue(ogre.is_alive)
+        self.assertTrue(giant.is_alive)
+        self.assertEqual(result['affected'], ["Orc"])
+
+        self.cast('power_word_kill', [giant])
+        self.assertEqual(giant.hp_current, 61)
+
+    def test_cloudkill_hd_limits(self):
+        """Test Cloudkill slays up to 4 HD outright, lets 5-6 HD save vs. poison, spares the rest"""
+        for roll, strong_survives in ((1, True), (20, False)):
+            with self.subTest(save_roll=roll):
+                weak, strong = make_monster("Gnoll", 2, 10), make_monster("Troll", 6, 40)
+                giant = make_monster("Giant", 8, 60)
+
+                with patch('random.randint', return_value=roll):
+                    self.cast('cloudkill', [weak, strong, giant])
+
+                self.assertFalse(weak.is_alive)
+                self.assertEqual(strong.is_alive, strong_survives)
+                self.assertEqual(giant.hp_current, 60)
+
+    def test_slaying_spells_are_limited(self):
+        """Test every slaying spell has a save, HD cap or HP budget"""
+        for spell_id, mechanics in SPELL_MECHANICS.items():
+            if mechanics.get('condition') == 'slain':
+                with self.subTest(spell=spell_id):
+                    self.assertTrue(mechanics.get('save') or mechanics.get('max_hd')
+                                    or mechanics.get('hp_budget'))
+
+        self.assertEqual(self.engine.plans['death_spell'].max_hd, 8)
+
+    def test_hold_monster_saves_and_target_cap(self):
+        """Test Hold Monster holds at most 4 creatures, each allowed a save"""
+        for roll, held in ((1, 0), (20, 4)):
+            with self.subTest(save_roll=roll):
+                ogres = [make_monster(f"Ogre {i}", 4, 30) for i in range(5)]
+
+                with patch('random.randint', return_value=roll):
+                    self.cast('hold_monster', ogres)
+
+                self.assertEqual(sum(o.has_condition('paralyzed') for o in ogres), held)
+                self.assertFalse(ogres[4].has_condition('paralyzed'))
+
+    def test_fear_and_charm_monster_allow_saves(self):
+        """Test Fear and Charm Monster are negated by a successful save"""
+        for spell_id, condition in (('fear', 'frightened'), ('charm_monster', 'charmed')):
+            with self.subTest(spell=spell_id):
+                ogres = [make_monster(f"Ogre {i}", 4, 30) for i in range(4)]
+
+                with patch('random.randint', return_value=1):
+                    self.cast(spell_id, ogres)
+
+                self.assertFalse(any(o.has_condition(condition) for o in ogres))
+
+    def test_ice_storm_deals_hail_damage(self):
+        """Test Ice Storm deals 3d10 to every target and blinds nobody"""
+        goblins = [make_goblin(f"Goblin {i}", hp=50) for i in range(3)]
+
+        with patch('random.randint', return_value=10):
+            result = self.cast('ice_storm', goblins)
+
+        self.assertEqual([g.hp_current for g in goblins], [20, 20, 20])
+        self.assertEqual(result['total_damage'], 90)
+        self.assertFalse(any(g.has_condition('blinded') for g in goblins))
+
+    def test_delayed_blast_fireball_damages_enemies(self):
+        """Test Delayed Blast Fireball deals 1d6+1 per level (max 10 dice), never buffs"""
+        ogre = make_monster("Ogre", 4, 100)
+
+        with patch('random.randint', side_effect=[6] * 10 + [20]):  # Dice maxed, save fails
+            self.cast('delayed_blast_fireball', [ogre], caster_level=14)
+
+        self.assertEqual(ogre.hp_current, 100 - 10 * 7)
+        self.assertEqual(ogre.conditions, [])
+
+    def test_stinking_cloud_allows_save(self):
+        """Test Stinking Cloud nauseates only creatures that fail their save"""
+        ogres = [make_monster(f"Ogre {i}", 4, 30) for i in range(2)]
+
+        with patch('random.randint', side_effect=[1, 20]):
+            self.cast('stinking_cloud', ogres)
+
+        self.assertEqual([o.has_condition('nauseated') for o in ogres], [False, True])
+
+    def test_disintegrate_allows_save(self):
+        """Test Disintegrate slays one target unless it saves"""
+        for roll, survives in ((1, True), (20, False)):
+            with self.subTest(save_roll=roll):
+                ogre, orc = make_monster("Ogre", 4, 30), make_monster("Orc", 1, 8)
+
+                with patch('random.randint', return_value=roll):
+                    self.cast('disintegrate', [ogre, orc])
+
+                self.assertEqual(ogre.is_alive, survives)
+                self.assertTrue(orc.is_alive)
+
+    def test_heal_restores_all_but_d4(self):
+        """Test Heal restores all but 1d4 HP and cures blindness"""
+        fighter = make_caster()
+        fighter.hp_current = 1
+        fighter.add_condition('blinded')
+
+        with patch('random.randint', return_value=3):
+            self.engine.execute(self.engine.plans['heal'], make_caster(11), [fighter],
+                                self.magic.save_resolver)
+
+        self.assertEqual(fighter.hp_current, fighter.hp_max - 3)
+        self.assertFalse(fighter.has_condition('blinded'))
+
+
+if __name__ == '__main__':
+    unittest.main()
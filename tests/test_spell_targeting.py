@@ -274,6 +274,71 @@ class TestSpellTargeting(unittest.TestCase):
         # Goblin HP should be unchanged
         self.assertEqual(goblin.hp_current, 3)
 
+    def test_buff_in_combat_targets_caster(self):
+        """Test that buffs are chosen by their effect, not their name, and skip monsters"""
+        goblin = Monster(name="Goblin", race="Goblin", char_class="Monster",
+                        level=1, hp_current=3, hp_max=5, ac=6, thac0=20)
+
+        self.game_state.active_monsters = [goblin]
+        self.game_state.in_combat = True
+
+        haste_spell = Spell(
+            name="Haste",
+            level=3,
+            school="alteration",
+            casting_time="3 segments",
+            range="60 feet",
+            duration="3 rounds + 1 round/level",
+            area_of_effect="1 creature/level",
+            saving_throw="None",
+            components="standard",
+            description="Doubles movement and attacks."
+        )
+
+        self.player.spells_memorized = [
+            SpellSlot(level=3, spell=haste_spell, is_used=False)
+        ]
+
+        result = self.game_state.execute_command(Command('cast', 'haste'))
+
+        self.assertTrue(result['success'])
+        self.assertTrue(self.player.has_condition('haste'))
+        self.assertFalse(goblin.has_condition('haste'))
+
+    def test_heal_in_combat_targets_caster(self):
+        """Test that remedy spells like Heal are treated as beneficial and skip monsters"""
+        goblin = Monster(name="Goblin", race="Goblin", char_class="Monster",
+                        level=1, hp_current=3, hp_max=5, ac=6, thac0=20)
+
+        self.game_state.active_monsters = [goblin]
+        self.game_state.in_combat = True
+
+        heal_spell = Spell(
+            name="Heal",
+            level=6,
+            school="necromancy",
+            casting_time="1 round",
+            range="Touch",
+            duration="Permanent",
+            area_of_effect="1 creature",
+            saving_throw="None",
+            components="standard",
+            description="Cures all diseases, blindness, and restores all HP except 1d4."
+        )
+
+        self.player.spells_memorized = [
+            SpellSlot(level=6, spell=heal_spell, is_used=False)
+        ]
+        self.player.hp_current = 1
+        self.player.add_condition('blinded')
+
+        result = self.game_state.execute_command(Command('cast', 'heal'))
+
+        self.assertTrue(result['success'])
+        self.assertGreaterEqual(self.player.hp_current, self.player.hp_max - 4)
+        self.assertFalse(self.player.has_condition('blinded'))
+        self.assertEqual(goblin.hp_current, 3)
+
 
 class TestOtherSingleTargetSpells(unittest.TestCase):
     """Test targeting for other single-target spells"""
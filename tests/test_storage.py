@@ -5,11 +5,13 @@ Tests character roster, party manager, scenario library, and session manager.
 These are used by BOTH CLI and Web UI for persistence.
 """
 
+import os
 import unittest
 import tempfile
 import shutil
 from pathlib import Path
 import json
+from unittest.mock import patch
 
 from aerthos.storage.character_roster import CharacterRoster
 from aerthos.storage.party_manager import PartyManager
@@ -151,6 +153,38 @@ class TestCharacterRoster(unittest.TestCase):
         self.assertEqual(loaded2.name, "Char2")
         self.assertEqual(loaded2.hp_current, 15)
 
+    def test_save_characters_batch(self):
+        """Test saving a whole party in one roster update"""
+        chars = [self.create_test_character(name=f"Member {i}") for i in range(4)]
+
+        ids = self.roster.save_characters(chars)
+
+        self.assertEqual(len(set(ids)), 4)
+        self.assertEqual([self.roster.load_character(i).name for i in ids],
+                         [c.name for c in chars])
+        self.assertEqual(len(list(Path(self.test_dir).iterdir())), 4)  # No temp files left
+
+    def test_save_characters_all_or_nothing(self):
+        """Test a failed batch leaves the roster untouched"""
+        existing_id = self.roster.save_character(self.create_test_character(name="Existing"))
+        chars = [self.create_test_character(name=f"Member {i}") for i in range(3)]
+
+        real_replace = os.replace
+        calls = []
+
+        def failing_replace(src, dst):
+            calls.append(dst)
+            if len(calls) == 2:
+                raise OSError("disk full")
+            real_replace(src, dst)
+
+        with patch('aerthos.storage.character_roster.os.replace', side_effect=failing_replace):
+            with self.assertRaises(OSError):
+                self.roster.save_characters(chars)
+
+        self.assertEqual([c['id'] for c in self.roster.list_characters()], [existing_id])
+        self.assertEqual(len(list(Path(self.test_dir).iterdir())), 1)
+
 
 class TestPartyManager(unittest.TestCase):
     """Test party persistence"""
@@ -279,6 +313,39 @@ class TestPartyManager(unittest.TestCase):
         # Verify gone
         self.assertFalse(party_file.exists())
 
+    def test_create_party(self):
+        """Test creating characters and their party in one call"""
+        chars = [self.create_test_character(name=name) for name in ("Ann", "Bob", "Cid")]
+
+        result = self.party_manager.create_party("New Party", chars)
+
+        loaded = self.party_manager.load_party(result['party_id'])
+        self.assertEqual([m.name for m in loaded['party'].members], ["Ann", "Bob", "Cid"])
+        self.assertEqual(loaded['party'].formation, ['front', 'back', 'back'])
+        self.assertEqual(len(result['character_ids']), 3)
+
+    def test_create_party_invalid_writes_nothing(self):
+        """Test invalid parties are rejected before any character is saved"""
+        chars = [self.create_test_character(name=f"C{i}") for i in range(7)]
+
+        with self.assertRaises(ValueError):
+            self.party_manager.create_party("Too Big", chars)
+
+        with self.assertRaises(ValueError):
+            self.party_manager.create_party("Bad Formation", chars[:2], formation=['front'])
+
+        self.assertEqual(self.roster.list_characters(), [])
+
+    def test_create_party_rolls_back_characters(self):
+        """Test characters are removed again if the party cannot be saved"""
+        chars = [self.create_test_character(name="Ann")]
+
+        with patch.object(self.party_manager, 'save_party', side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                self.party_manager.create_party("Doomed", chars)
+
+        self.assertEqual(self.roster.list_characters(), [])
+
 
 class TestScenarioLibrary(unittest.TestCase):
     """Test dungeon/scenario persistence"""
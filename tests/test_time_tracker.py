@@ -0,0 +1,102 @@
+"""
+Test suite for the TimeTracker fast-forward
+
+Tests that advance(n) matches n calls to advance_turn() - messages, light
+burn-down across spares, hour rollovers and hunger - and that resting
+still passes 8 hours.
+"""
+
+import random
+import unittest
+from unittest.mock import patch
+
+from aerthos.engine.game_state import GameState, GameData
+from aerthos.engine.parser import CommandParser
+from aerthos.engine.time_tracker import TimeTracker
+from aerthos.entities.player import Item, LightSource
+from aerthos.ui.character_creation import CharacterCreator
+from aerthos.world.dungeon import Dungeon
+
+
+def make_state(game_data, turns_elapsed, total_hours, burn_times, lit_remaining):
+    """A tracker and player with the given clock, spare lights and lit light"""
+    player = CharacterCreator(game_data).quick_create("Thorin", "Dwarf", "Fighter")
+    player.equipment.light_source = None
+    lights = [LightSource(name=f"Torch {i}", burn_time_turns=t) for i, t in enumerate(burn_times)]
+    player.inventory.items = [Item(name="Rope_50ft", weight=7.5)] + lights
+    if lights and lit_remaining is not None:
+        lights[0].turns_remaining = lit_remaining
+        player.equip_light(lights[0])
+
+    tracker = TimeTracker()
+    tracker.turns_elapsed = turns_elapsed
+    tracker.total_hours = total_hours
+    return tracker, player
+
+
+def snapshot(tracker, player):
+    light = player.equipment.light_source
+    return (tracker.turns_elapsed, tracker.total_hours,
+            light and (light.name, light.turns_remaining), player.inventory.list_items())
+
+
+class TestTimeAdvance(unittest.TestCase):
+    """Test advance() against the turn-by-turn loop"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.game_data = GameData.load_all()
+
+    def assert_matches_loop(self, n_turns, *state):
+        looped_tracker, looped_player = make_state(self.game_data, *state)
+        expected = []
+        for _ in range(n_turns):
+            expected.extend(looped_tracker.advance_turn(looped_player))
+
+        tracker, player = make_state(self.game_data, *state)
+        self.assertEqual(tracker.advance(n_turns, player), expected)
+        self.assertEqual(snapshot(tracker, player), snapshot(looped_tracker, looped_player))
+
+    def test_matches_loop(self):
+        """Same messages and end state for many lengths and starting states"""
+        rng = random.Random(1977)
+        for _ in range(60):
+            burn_times = [rng.choice([1, 2, 3, 4, 6, 13]) for _ in range(rng.randint(0, 4))]
+            state = (rng.randint(0, 50), rng.randint(0, 20), burn_times,
+                     rng.choice([None, -1, 0, 1, 2, 3, 4, 5, 9]))
+            n_turns = rng.randint(0, 200)
+            with self.subTest(n_turns=n_turns, state=state):
+                self.assert_matches_loop(n_turns, *state)
+
+    def test_long_fast_forward(self):
+        """A month in darkness gives one hunger warning per 8 hours"""
+        tracker, player = make_state(self.game_data, 0, 0, [], None)
+        messages = tracker.advance(30 * 24 * 6, player)
+
+        self.assertEqual(len(messages), 30 * 3)
+        self.assertEqual((tracker.turns_elapsed, tracker.total_hours), (4320, 720))
+
+    def test_rest_passes_eight_hours(self):
+        """Resting advances 48 turns and burns the torch down"""
+        dungeon = Dungeon.load_from_generator({
+            'name': 'Test Dungeon', 'start_room': 'room_001',
+            'rooms': {'room_001': {'id': 'room_001', 'title': 'Shrine', 'description': 'Calm.',
+                                   'exits': {}, 'safe_rest': True}}
+        })
+        tracker, player = make_state(self.game_data, 0, 0, [60], 60)
+        player.inventory.add_item(Item(name="Rations (1 day)", item_type="consumable", weight=0.1))
+        game_state = GameState(player, dungeon)
+        game_state.game_data = self.game_data
+
+        with patch('random.random', return_value=0.99):
+            result = game_state.execute_command(CommandParser().parse("rest"))
+
+        self.assertTrue(result['success'], result['message'])
+        self.assertEqual(game_state.time_tracker.turns_elapsed, 48)
+        self.assertEqual(game_state.time_tracker.total_hours, 8)
+        self.assertEqual(player.equipment.light_source.turns_remaining, 12)
+        self.assertIn("hungry", result['message'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -137,6 +137,60 @@ class TestShop(unittest.TestCase):
         self.assertEqual(price, 1200)  # 1000 * 1.2
 
 
+class TestShopCatalog(unittest.TestCase):
+    """Test catalog indexes and bulk trades"""
+
+    def setUp(self):
+        """Set up test shop"""
+        self.shop = Shop(
+            name="Test Shop",
+            description="A test shop",
+            inventory=[
+                ShopItem("torch", "Torch", 10, 5, "supplies"),
+                ShopItem("rope", "Rope", 20, -1, "supplies"),
+                ShopItem("sword", "Sword", 100, 1, "weapons")
+            ]
+        )
+
+    def test_category_index(self):
+        """Items are indexed by category, and appended items are picked up"""
+        self.assertEqual([i.item_id for i in self.shop.items_in_category("supplies")], ["torch", "rope"])
+
+        self.shop.inventory.append(ShopItem("axe", "Axe", 50, 2, "weapons"))
+        self.assertEqual([i.item_id for i in self.shop.items_in_category("weapons")], ["sword", "axe"])
+        self.assertTrue(self.shop.has_item("axe"))
+        self.assertEqual(self.shop.items_in_category("potions"), [])
+
+    def test_trade_basket(self):
+        """A basket is priced in one go, with sales counting towards purchases"""
+        result = self.shop.trade(buy=["torch", "torch", "rope"], sell=[("dagger", "Dagger", 20)], gold=35)
+
+        self.assertTrue(result['success'], result['message'])
+        self.assertEqual((result['cost'], result['proceeds'], result['gold']), (40, 10, 5))
+        self.assertEqual([i.item_id for i in result['bought']], ["torch", "torch", "rope"])
+        self.assertEqual(self.shop.get_item("torch").stock, 3)
+        self.assertEqual(self.shop.get_item("rope").stock, -1)
+
+    def test_trade_is_all_or_nothing(self):
+        """A basket failing on any line changes no stock"""
+        too_many = self.shop.trade(buy={"torch": 2, "sword": 2}, gold=1000)
+        too_poor = self.shop.trade(buy={"torch": 2, "sword": 1}, gold=119)
+        unknown = self.shop.trade(buy=["torch", "lantern"], gold=1000)
+
+        for result in (too_many, too_poor, unknown):
+            self.assertFalse(result['success'])
+            self.assertEqual(result['bought'], [])
+        self.assertEqual((self.shop.get_item("torch").stock, self.shop.get_item("sword").stock), (5, 1))
+
+    def test_sold_items_restock(self):
+        """Selling an item the shop stocks in limited numbers adds to its stock"""
+        self.shop.purchase_item("sword")
+        result = self.shop.trade(sell=[("sword", "Sword", 100)])
+
+        self.assertEqual(result['gold'], 50)
+        self.assertTrue(self.shop.has_item("sword"))
+
+
 class TestInn(unittest.TestCase):
     """Test Inn functionality"""
 
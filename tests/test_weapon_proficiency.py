@@ -3,7 +3,7 @@ Test suite for Weapon Proficiency System (Task 2.3)
 """
 
 import unittest
-from aerthos.systems.weapon_proficiency import WeaponProficiencySystem
+from aerthos.systems.weapon_proficiency import WeaponProficiencySystem, get_weapon_proficiency_system
 from aerthos.entities.player import PlayerCharacter, Weapon
 from aerthos.engine.combat import CombatResolver
 
@@ -172,6 +172,59 @@ class TestProficiencyChecks(unittest.TestCase):
         self.assertFalse(self.prof_system.is_proficient(proficiencies, 'Battle Axe'))
 
 
+class TestResolvedProficiencies(unittest.TestCase):
+    """Test precomputed proficiency sets"""
+
+    def setUp(self):
+        self.prof_system = WeaponProficiencySystem()
+        self.character = PlayerCharacter(
+            name="TestFighter", char_class="Fighter", race="Human", level=1,
+            strength=16, dexterity=10, constitution=14,
+            intelligence=10, wisdom=10, charisma=10
+        )
+
+    def test_groups_expand_to_weapons(self):
+        """Test groups resolve to their weapons, including category-only entries"""
+        resolved = self.prof_system.resolve_proficient_weapons(['swords', 'maces', 'Dagger'])
+
+        self.assertIsInstance(resolved, frozenset)
+        self.assertIn('Long Sword', resolved)
+        self.assertIn('Club', resolved)  # Categorised as maces but not listed in the group
+        self.assertIn('Dagger', resolved)
+        self.assertNotIn('Short Bow', resolved)
+
+    def test_resolution_is_shared_per_list(self):
+        """Test identical proficiency lists reuse the same frozenset"""
+        first = self.prof_system.resolve_proficient_weapons(['axes'])
+        second = self.prof_system.resolve_proficient_weapons(['axes'])
+
+        self.assertIs(first, second)
+
+    def test_singleton(self):
+        """Test the shared system is created once"""
+        self.assertIs(get_weapon_proficiency_system(), get_weapon_proficiency_system())
+
+    def test_character_set_follows_appends(self):
+        """Test the cached character set is rebuilt after an in-place change"""
+        self.character.weapon_proficiencies = ['Long Sword']
+        self.assertFalse(self.character.is_proficient_with('Battle Axe'))
+
+        self.character.weapon_proficiencies.append('axes')
+
+        self.assertTrue(self.character.is_proficient_with('Battle Axe'))
+        self.assertTrue(self.character.is_proficient_with('Long Sword'))
+
+    def test_character_set_follows_reassignment(self):
+        """Test reassigning the list invalidates the cached set"""
+        self.character.weapon_proficiencies = ['swords']
+        self.assertTrue(self.character.is_proficient_with('Broad Sword'))
+
+        self.character.weapon_proficiencies = ['bows']
+
+        self.assertFalse(self.character.is_proficient_with('Broad Sword'))
+        self.assertTrue(self.character.is_proficient_with('Long Bow'))
+
+
 class TestCombatIntegration(unittest.TestCase):
     """Test weapon proficiency integration with combat system"""
 
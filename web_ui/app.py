@@ -9,6 +9,7 @@ from flask import Flask, render_template, request, jsonify, session
 import json
 import sys
 import os
+import threading
 
 # Add parent directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -21,6 +22,8 @@ from aerthos.ui.party_creation import PartyCreator
 from aerthos.ui.character_creation import CharacterCreator
 from aerthos.generator.dungeon_generator import DungeonGenerator
 from aerthos.generator.config import DungeonConfig, STANDARD_DUNGEON
+from aerthos.generator.dungeon_pool import DungeonPool
+from aerthos.generator.generation_cache import get_dungeon_cache
 from aerthos.storage.character_roster import CharacterRoster
 from aerthos.storage.party_manager import PartyManager
 from aerthos.storage.scenario_library import ScenarioLibrary
@@ -32,6 +35,35 @@ app.secret_key = 'aerthos_secret_key_change_in_production'
 # Store active game sessions (in production, use proper session management)
 active_games = {}
 
+# Pre-generated dungeons for instant new games, refilled by worker processes.
+# AERTHOS_DUNGEON_POOL_SIZE sets dungeons kept ready per profile (0 = generate inline)
+_dungeon_pool = None
+_dungeon_pool_lock = threading.Lock()
+
+
+def get_dungeon_pool() -> DungeonPool:
+    """Get the shared dungeon pool, starting its workers on first use"""
+    global _dungeon_pool
+    with _dungeon_pool_lock:
+        if _dungeon_pool is None:
+            pool_size = int(os.environ.get('AERTHOS_DUNGEON_POOL_SIZE', '2'))
+            _dungeon_pool = DungeonPool(target_size=pool_size).start()
+        return _dungeon_pool
+
+
+# Game data shared by the character/party endpoints (read-only after loading)
+_game_data = None
+_game_data_lock = threading.Lock()
+
+
+def get_game_data() -> GameData:
+    """Get the shared game data, loading it on first use"""
+    global _game_data
+    with _game_data_lock:
+        if _game_data is None:
+            _game_data = GameData.load_all()
+        return _game_data
+
 
 @app.route('/')
 def index():
@@ -121,11 +153,8 @@ def new_game():
 
         party = Party(members=[player1, player2, player3, player4])
 
-        # Generate dungeon
-        generator = DungeonGenerator(game_data)
-        config = STANDARD_DUNGEON
-        dungeon_data = generator.generate(config)
-        dungeon = Dungeon.load_from_generator(dungeon_data)
+        # Take a pre-generated standard dungeon (generated inline if none is ready)
+        dungeon = get_dungeon_pool().acquire('standard')
 
         # Create game state
         game_state = GameState(party.members[0], dungeon)  # Use first member as main
@@ -171,12 +200,14 @@ def execute_command():
         parser = CommandParser()
         command = parser.parse(command_text)
 
+        combat_mark = game_state.combat_log.mark()
         result = game_state.execute_command(command)
 
         return jsonify({
             'success': True,
             'message': result.get('message', ''),
             'state': get_game_state_json(game_state),
+            'combat_events': game_state.combat_log.to_dicts(since=combat_mark),
             'active_character': active_character_index
         })
 
@@ -208,6 +239,80 @@ def get_game_state():
         return jsonify({'success': False, 'error': str(e)})
 
 
+@app.route('/api/profiling', methods=['POST'])
+def configure_profiling():
+    """
+    Turn profiling on, off or reconfigure it for an active session
+
+    Body: {session_id, enabled (default true), cprofile, trace_memory, slow_threshold_ms}
+    """
+    try:
+        data = request.json or {}
+        game_state = active_games.get(data.get('session_id', 'default'))
+        if not game_state:
+            return jsonify({'success': False, 'error': 'No active game session found'})
+
+        if not data.get('enabled', True):
+            game_state.disable_profiling()
+            return jsonify({'success': True, 'profiling': None})
+
+        profiler = game_state.enable_profiling(
+            cprofile=data.get('cprofile', True),
+            trace_memory=data.get('trace_memory', False),
+            slow_threshold_ms=data.get('slow_threshold_ms')
+        )
+        return jsonify({'success': True, 'profiling': profiler.report(limit=0)})
+
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return jsonify({'success': False, 'error': str(e)})
+
+
+@app.route('/api/profiling/<session_id>', methods=['GET'])
+def get_profiling_report(session_id):
+    """Slow commands, memory diffs and the top of the cProfile report"""
+    game_state = active_games.get(session_id)
+    if not game_state or game_state.profiler is None:
+        return jsonify({'success': False, 'error': 'Profiling is not enabled for this session'})
+
+    limit = request.args.get('limit', 30, type=int)
+    return jsonify({'success': True, 'profiling': game_state.profiler.report(limit=limit)})
+
+
+@app.route('/api/profiling/<session_id>/dump', methods=['GET'])
+def dump_profiling(session_id):
+    """
+    Download captured profile data
+
+    ?format=pstats (binary, for snakeviz/pstats), folded (flamegraph.pl,
+    speedscope) or text (pstats report)
+    """
+    game_state = active_games.get(session_id)
+    if not game_state or game_state.profiler is None:
+        return jsonify({'success': False, 'error': 'Profiling is not enabled for this session'})
+
+    profiler = game_state.profiler
+    output_format = request.args.get('format', 'pstats')
+
+    if output_format == 'folded':
+        return app.response_class(profiler.folded_stacks(), mimetype='text/plain')
+    if output_format == 'text':
+        return app.response_class(profiler.stats_text(limit=request.args.get('limit', 100, type=int)),
+                                  mimetype='text/plain')
+
+    import tempfile
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = profiler.dump_stats(os.path.join(temp_dir, f'{session_id}.prof'))
+        if path is None:
+            return jsonify({'success': False, 'error': 'No profile data captured yet'})
+        payload = path.read_bytes()
+
+    response = app.response_class(payload, mimetype='application/octet-stream')
+    response.headers['Content-Disposition'] = f'attachment; filename={session_id}.prof'
+    return response
+
+
 def get_game_state_json(game_state):
     """
     Convert game state to JSON for frontend
@@ -350,7 +455,7 @@ def get_game_state_json(game_state):
         'room': {
             'id': game_state.current_room.id,
             'title': game_state.current_room.title,
-            'description': game_state.current_room.description,
+            'description': game_state.current_room.get_description(),
             'exits': game_state.current_room.exits,
             'light_level': game_state.current_room.light_level,
             'items': room_items  # NEW: Items in room for context-aware actions
@@ -486,7 +591,7 @@ def create_character():
         if char_class not in valid_classes:
             return jsonify({'success': False, 'error': f'Class "{char_class}" not implemented. Available: {", ".join(valid_classes)}'})
 
-        game_data = GameData.load_all()
+        game_data = get_game_data()
         creator = CharacterCreator(game_data)
 
         # Quick create character
@@ -566,7 +671,7 @@ def get_available_races():
         data = request.json
         stats = data.get('stats', {})
 
-        game_data = GameData.load_all()
+        game_data = get_game_data()
         from aerthos.ui.character_creation import CharacterCreator
         creator = CharacterCreator(game_data)
 
@@ -612,7 +717,7 @@ def get_available_classes():
         stats = data.get('stats', {})
         race = data.get('race', 'Human')
 
-        game_data = GameData.load_all()
+        game_data = get_game_data()
         from aerthos.ui.character_creation import CharacterCreator
         creator = CharacterCreator(game_data)
 
@@ -679,7 +784,7 @@ def get_available_alignments():
             return jsonify({'success': False, 'error': 'Class required'})
 
         # Load class data
-        game_data = load_game_data()
+        game_data = get_game_data()
         class_data = game_data.classes.get(char_class)
 
         if not class_data:
@@ -700,143 +805,223 @@ def get_available_alignments():
         return jsonify({'success': False, 'error': str(e)})
 
 
+def build_character(data: dict, game_data: GameData, creator: CharacterCreator) -> PlayerCharacter:
+    """
+    Roll up a level 1 character from a creation request
+
+    Args:
+        data: Request fields (name, race, char_class, alignment, stats)
+        game_data: Loaded game data
+        creator: CharacterCreator for equipment, spells and bonuses
+
+    Returns:
+        New PlayerCharacter (not yet saved)
+
+    Raises:
+        ValueError: Unknown race/class or an alignment the class cannot take
+    """
+    name = data.get('name', 'Adventurer')
+    race = data.get('race', 'Human')
+    char_class = data.get('char_class', 'Fighter')
+    alignment = data.get('alignment', 'True Neutral')
+    base_stats = data.get('stats', {})
+
+    if race not in game_data.races:
+        raise ValueError(f'Unknown race: {race}')
+    if char_class not in game_data.classes:
+        raise ValueError(f'Unknown class: {char_class}')
+
+    from aerthos.engine.combat import DiceRoller
+
+    # Get base stats
+    strength = base_stats.get('str', 10)
+    dexterity = base_stats.get('dex', 10)
+    constitution = base_stats.get('con', 10)
+    intelligence = base_stats.get('int', 10)
+    wisdom = base_stats.get('wis', 10)
+    charisma = base_stats.get('cha', 10)
+
+    # Apply racial modifiers
+    race_data = game_data.races[race]
+    for ability, modifier in race_data.get('ability_modifiers', {}).items():
+        if ability == 'strength':
+            strength += modifier
+        elif ability == 'dexterity':
+            dexterity += modifier
+        elif ability == 'constitution':
+            constitution += modifier
+        elif ability == 'intelligence':
+            intelligence += modifier
+        elif ability == 'wisdom':
+            wisdom += modifier
+        elif ability == 'charisma':
+            charisma += modifier
+
+    # Apply racial maximums
+    maximums = race_data.get('ability_maximums', {})
+    if 'strength' in maximums:
+        strength = min(strength, maximums['strength'])
+    if 'dexterity' in maximums:
+        dexterity = min(dexterity, maximums['dexterity'])
+    if 'constitution' in maximums:
+        constitution = min(constitution, maximums['constitution'])
+    if 'intelligence' in maximums:
+        intelligence = min(intelligence, maximums['intelligence'])
+    if 'wisdom' in maximums:
+        wisdom = min(wisdom, maximums['wisdom'])
+    if 'charisma' in maximums:
+        charisma = min(charisma, maximums['charisma'])
+
+    # Handle exceptional strength for Fighters
+    strength_percentile = 0
+    if char_class == 'Fighter' and strength == 18:
+        import random
+        strength_percentile = random.randint(1, 100)
+
+    # Validate alignment for class
+    class_data = game_data.classes[char_class]
+    from aerthos.systems.alignment import validate_class_alignment
+    if not validate_class_alignment(char_class, alignment, class_data):
+        raise ValueError(f'{alignment} is not a valid alignment for {char_class}')
+
+    # Roll HP
+    hit_die = class_data['hit_die']
+    hp = max(1, DiceRoller.roll(hit_die))
+
+    # Apply CON bonus
+    con_bonus = creator._get_con_bonus(constitution)
+    hp = max(1, hp + con_bonus)
+
+    # Get class-specific data
+    saves = class_data['saves']
+    thac0 = class_data['thac0_base']
+
+    # Get XP needed for level 2
+    from aerthos.entities.player import XP_TABLES
+    xp_to_level_2 = XP_TABLES.get(char_class, [0, 2000])[1]
+
+    # Create character
+    player = PlayerCharacter(
+        name=name,
+        race=race,
+        char_class=char_class,
+        alignment=alignment,
+        level=1,
+        strength=strength,
+        dexterity=dexterity,
+        constitution=constitution,
+        intelligence=intelligence,
+        wisdom=wisdom,
+        charisma=charisma,
+        strength_percentile=strength_percentile,
+        hp_current=hp,
+        hp_max=hp,
+        ac=10,
+        thac0=thac0,
+        save_poison=saves['poison'],
+        save_rod_staff_wand=saves['rod_staff_wand'],
+        save_petrify_paralyze=saves['petrify_paralyze'],
+        save_breath=saves['breath'],
+        save_spell=saves['spell'],
+        xp=0,
+        xp_to_next_level=xp_to_level_2
+    )
+
+    # Add starting equipment
+    creator._add_starting_equipment(player, char_class)
+
+    # Add skills for skill-based classes
+    if char_class in ['Thief', 'Assassin', 'Bard']:
+        player.thief_skills = class_data.get('skills', {}).copy()
+
+    # Add spell slots if spellcaster
+    if char_class in ['Magic-User', 'Illusionist', 'Cleric', 'Druid', 'Ranger', 'Paladin', 'Bard']:
+        spell_slots_key = 'spell_slots_level_1'
+        if spell_slots_key in class_data:
+            num_slots = class_data[spell_slots_key][0]
+            if num_slots > 0:
+                for _ in range(num_slots):
+                    player.add_spell_slot(1)
+
+                # Give starting spells (CRITICAL: must match CLI character_creation.py)
+                creator._add_starting_spells(player, char_class)
+
+    return player
+
+
 @app.route('/api/character/create', methods=['POST'])
 def create_character_full():
     """Create a character with full stat rolling"""
     try:
         data = request.json
-        name = data.get('name', 'Adventurer')
-        race = data.get('race', 'Human')
-        char_class = data.get('char_class', 'Fighter')
-        alignment = data.get('alignment', 'True Neutral')
-        base_stats = data.get('stats', {})
+        game_data = get_game_data()
+        player = build_character(data, game_data, CharacterCreator(game_data))
 
-        game_data = GameData.load_all()
-        from aerthos.ui.character_creation import CharacterCreator
-        from aerthos.engine.combat import DiceRoller
-        creator = CharacterCreator(game_data)
+        # Save character
+        roster = CharacterRoster()
+        char_id = roster.save_character(player)
 
-        # Get base stats
-        strength = base_stats.get('str', 10)
-        dexterity = base_stats.get('dex', 10)
-        constitution = base_stats.get('con', 10)
-        intelligence = base_stats.get('int', 10)
-        wisdom = base_stats.get('wis', 10)
-        charisma = base_stats.get('cha', 10)
+        return jsonify({'success': True, 'character_id': char_id, 'name': player.name})
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)})
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return jsonify({'success': False, 'error': str(e)})
 
-        # Apply racial modifiers
-        race_data = game_data.races[race]
-        for ability, modifier in race_data.get('ability_modifiers', {}).items():
-            if ability == 'strength':
-                strength += modifier
-            elif ability == 'dexterity':
-                dexterity += modifier
-            elif ability == 'constitution':
-                constitution += modifier
-            elif ability == 'intelligence':
-                intelligence += modifier
-            elif ability == 'wisdom':
-                wisdom += modifier
-            elif ability == 'charisma':
-                charisma += modifier
 
-        # Apply racial maximums
-        maximums = race_data.get('ability_maximums', {})
-        if 'strength' in maximums:
-            strength = min(strength, maximums['strength'])
-        if 'dexterity' in maximums:
-            dexterity = min(dexterity, maximums['dexterity'])
-        if 'constitution' in maximums:
-            constitution = min(constitution, maximums['constitution'])
-        if 'intelligence' in maximums:
-            intelligence = min(intelligence, maximums['intelligence'])
-        if 'wisdom' in maximums:
-            wisdom = min(wisdom, maximums['wisdom'])
-        if 'charisma' in maximums:
-            charisma = min(charisma, maximums['charisma'])
-
-        # Handle exceptional strength for Fighters
-        strength_percentile = 0
-        if char_class == 'Fighter' and strength == 18:
-            import random
-            strength_percentile = random.randint(1, 100)
-
-        # Validate alignment for class
-        class_data = game_data.classes[char_class]
-        from aerthos.systems.alignment import validate_class_alignment
-        if not validate_class_alignment(char_class, alignment, class_data):
-            return jsonify({
-                'success': False,
-                'error': f'{alignment} is not a valid alignment for {char_class}'
-            })
+@app.route('/api/party/create', methods=['POST'])
+def create_party_full():
+    """
+    Create a whole party in one request
 
-        # Roll HP
-        hit_die = class_data['hit_die']
-        hp = max(1, DiceRoller.roll(hit_die))
-
-        # Apply CON bonus
-        con_bonus = creator._get_con_bonus(constitution)
-        hp = max(1, hp + con_bonus)
-
-        # Get class-specific data
-        saves = class_data['saves']
-        thac0 = class_data['thac0_base']
-
-        # Get XP needed for level 2
-        from aerthos.entities.player import XP_TABLES
-        xp_to_level_2 = XP_TABLES.get(char_class, [0, 2000])[1]
-
-        # Create character
-        player = PlayerCharacter(
-            name=name,
-            race=race,
-            char_class=char_class,
-            alignment=alignment,
-            level=1,
-            strength=strength,
-            dexterity=dexterity,
-            constitution=constitution,
-            intelligence=intelligence,
-            wisdom=wisdom,
-            charisma=charisma,
-            strength_percentile=strength_percentile,
-            hp_current=hp,
-            hp_max=hp,
-            ac=10,
-            thac0=thac0,
-            save_poison=saves['poison'],
-            save_rod_staff_wand=saves['rod_staff_wand'],
-            save_petrify_paralyze=saves['petrify_paralyze'],
-            save_breath=saves['breath'],
-            save_spell=saves['spell'],
-            xp=0,
-            xp_to_next_level=xp_to_level_2
-        )
+    Body:
+        characters: List of character creation requests (as /api/character/create)
+        party_name: Optional; if given, the party is also saved via PartyManager
+        formation: Optional formation positions ('front'/'back'), one per character
 
-        # Add starting equipment
-        creator._add_starting_equipment(player, char_class)
+    Every character is validated before anything is written, and all of them
+    are saved in one roster update.
+    """
+    try:
+        data = request.json
+        specs = data.get('characters', [])
 
-        # Add skills for skill-based classes
-        if char_class in ['Thief', 'Assassin', 'Bard']:
-            player.thief_skills = class_data.get('skills', {}).copy()
+        if not 1 <= len(specs) <= 6:
+            return jsonify({'success': False, 'error': 'Party must have 1-6 members'})
 
-        # Add spell slots if spellcaster
-        if char_class in ['Magic-User', 'Illusionist', 'Cleric', 'Druid', 'Ranger', 'Paladin', 'Bard']:
-            spell_slots_key = 'spell_slots_level_1'
-            if spell_slots_key in class_data:
-                num_slots = class_data[spell_slots_key][0]
-                if num_slots > 0:
-                    for _ in range(num_slots):
-                        player.add_spell_slot(1)
+        game_data = get_game_data()
+        creator = CharacterCreator(game_data)
 
-                    # Give starting spells (CRITICAL: must match CLI character_creation.py)
-                    creator._add_starting_spells(player, char_class)
+        players = []
+        for index, spec in enumerate(specs):
+            try:
+                players.append(build_character(spec, game_data, creator))
+            except ValueError as e:
+                return jsonify({'success': False, 'error': f'Character {index + 1}: {e}'})
 
-        # Save character
         roster = CharacterRoster()
-        char_id = roster.save_character(player)
+        party_name = data.get('party_name')
+
+        if party_name:
+            party_mgr = PartyManager(character_roster=roster)
+            result = party_mgr.create_party(party_name, players, data.get('formation'))
+            character_ids = result['character_ids']
+            party_id = result['party_id']
+        else:
+            character_ids = roster.save_characters(players)
+            party_id = None
 
-        return jsonify({'success': True, 'character_id': char_id, 'name': name})
+        return jsonify({
+            'success': True,
+            'party_id': party_id,
+            'characters': [
+                {'character_id': char_id, 'name': player.name}
+                for char_id, player in zip(character_ids, players)
+            ]
+        })
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)})
     except Exception as e:
         import traceback
         traceback.print_exc()
@@ -952,7 +1137,7 @@ def create_scenario():
         if dungeon_type == '1':
             return jsonify({'success': False, 'error': 'Cannot save fixed starter dungeon'})
 
-        generator = DungeonGenerator(game_data)
+        generator = DungeonGenerator(game_data, cache=get_dungeon_cache())
         config = None
         dungeon = None
         difficulty = 'medium'
@@ -973,8 +1158,8 @@ def create_scenario():
                 config = HARD_DUNGEON
                 difficulty = 'hard'
 
-            # Update config with party level
-            config.party_level = party_level
+            # Adjust a copy of the preset (presets are shared between requests)
+            config = config.derive(party_level=party_level)
 
             # Generate single-level dungeon
             dungeon_data = generator.generate(config)
@@ -1006,10 +1191,12 @@ def create_scenario():
             config = DungeonConfig.from_interview(interview_results)
 
             # Apply custom settings
-            config.seed = seed
-            config.num_rooms = num_rooms
-            config.layout_type = layout_type
-            config.dungeon_theme = dungeon_theme
+            config = config.derive(
+                seed=seed,
+                num_rooms=num_rooms,
+                layout_type=layout_type,
+                dungeon_theme=dungeon_theme
+            )
 
             # Generate dungeon name
             if num_levels > 1:
@@ -1021,11 +1208,12 @@ def create_scenario():
             if num_levels > 1:
                 from aerthos.generator.multilevel_generator import MultiLevelGenerator
 
-                ml_generator = MultiLevelGenerator()
+                ml_generator = MultiLevelGenerator(cache=get_dungeon_cache())
                 dungeon = ml_generator.generate(
                     num_levels=num_levels,
                     rooms_per_level=config.num_rooms,
-                    dungeon_name=dungeon_name
+                    dungeon_name=dungeon_name,
+                    seed=config.seed
                 )
                 difficulty = 'multilevel_custom'
             else:
@@ -1236,4 +1424,11 @@ if __name__ == '__main__':
     print("=" * 70)
     print()
 
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # Warm the dungeon pool before the first request arrives. With the debug
+    # reloader, only the child process that serves requests needs one (the
+    # pool is otherwise started on first acquire)
+    debug = True
+    if not debug or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        get_dungeon_pool()
+
+    app.run(debug=debug, host='0.0.0.0', port=5000)